@@ -92,6 +92,7 @@ from .runtime import (
     SimpleCostModel,
     InMemoryStatisticsManager,
     QueryOptimizer,
+    QueryPlanPipeline,
     QueryCache,
     get_global_cache,
     set_global_cache,
@@ -148,6 +149,7 @@ class XWQuery:
             **kwargs: Additional execution options
                 - use_cache: Enable caching (default: True, respects config)
                 - variables: Query variables
+                - optimize: Run the query planner/optimizer (default: config.enable_optimization)
         Returns:
             ExecutionResult with query results
         Example:
@@ -222,6 +224,20 @@ class XWQuery:
                 query_cache = create_cache(capacity=1024, namespace='xwquery.compiler', name='query_cache')
                 cache_key = compute_checksum((query, format) if format else (query,), algorithm='sha256')
                 query_cache.put(cache_key, actions_tree)
+        # Step 1b: Plan and optimize (logical plan → rules → physical plan → QueryAction)
+        from .runtime.optimization.pipeline import is_optimization_enabled, optimize_action_tree
+        optimized = actions_tree is not None and is_optimization_enabled(kwargs)
+        if optimized:
+            optimized_tree = None
+            if use_cache:
+                plan_cache = create_cache(capacity=1024, namespace='xwquery.compiler', name='plan_cache')
+                plan_key = compute_checksum((query, format) if format else (query,), algorithm='sha256')
+                optimized_tree = plan_cache.get(plan_key)
+            if optimized_tree is None:
+                optimized_tree = optimize_action_tree(actions_tree)
+                if use_cache:
+                    plan_cache.put(plan_key, optimized_tree)
+            actions_tree = optimized_tree
         # Step 2: Select appropriate engine based on data type
         if engine is None:
             # Check if data is a file path (serialization source)
@@ -265,7 +281,8 @@ class XWQuery:
         context = ExecutionContext(
             node=data,  # Native Python OR XWNode OR database connection
             variables=kwargs.get('variables', {}),
-            options=kwargs
+            options=kwargs,
+            metadata={'optimized': optimized}
         )
         # Step 4: Execute QueryAction AST
         return engine.execute_tree(actions_tree, context)
@@ -566,6 +583,7 @@ __all__ = [
     'SimpleCostModel',
     'InMemoryStatisticsManager',
     'QueryOptimizer',
+    'QueryPlanPipeline',
     'QueryCache',
     'get_global_cache',
     'set_global_cache',
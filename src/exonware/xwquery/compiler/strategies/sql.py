@@ -192,32 +192,24 @@ class SQLStrategy(GrammarBasedStrategy, AStructuredQueryStrategy):
         else:
             # Unknown format - return empty
             return []
+        from ...runtime.executors.expressions import compile_expression, split_alias
+        # Parse the column expression (e.g., "age - 5 AS perfect_age") once
+        expr, alias = split_alias(columns_expr)
+        if alias is None:
+            # Infer alias from expression
+            alias = expr.replace(' ', '_').replace('-', '_').replace('+', '_')
+        try:
+            evaluate = compile_expression(expr)
+        except XWQueryValueError:
+            return []
         # Execute SELECT expression on each row
         results = []
         for row in table_data if isinstance(table_data, list) else [table_data]:
             if not isinstance(row, dict):
                 continue
-            # Parse column expression (e.g., "age - 5 AS perfect_age")
-            # Extract alias if present
-            if ' AS ' in columns_expr.upper():
-                expr, alias = columns_expr.rsplit(' AS ', 1)
-                alias = alias.strip()
-            else:
-                expr = columns_expr
-                # Try to infer alias from expression
-                alias = expr.strip().replace(' ', '_').replace('-', '_').replace('+', '_')
-            # Evaluate expression (simple arithmetic for now)
-            # Replace field names with values from row
-            eval_expr = expr
-            for field_name, field_value in row.items():
-                # Replace field references in expression
-                eval_expr = re.sub(rf'\b{re.escape(field_name)}\b', str(field_value), eval_expr)
-            # Evaluate the expression (basic arithmetic only)
             try:
-                # Safe evaluation of arithmetic expressions
-                result_value = eval(eval_expr, {"__builtins__": {}}, {})
-                results.append({alias: result_value})
-            except Exception:
+                results.append({alias: evaluate(row)})
+            except (TypeError, ValueError, ArithmeticError):
                 # If evaluation fails, skip this row
                 continue
         return results
@@ -71,6 +71,7 @@ class XWQueryConfig:
     enable_optimization: bool = True
     enable_parallel_execution: bool = False
     max_workers: int = 4
+    parallel_min_rows: int = 50_000  # WINDOW/GROUP BY inputs below this stay on one worker
     # --- Security Limits ---
     max_result_size: int = 1_000_000
     enable_sql_injection_protection: bool = True
@@ -81,6 +82,11 @@ class XWQueryConfig:
     # --- Memory Management ---
     enable_result_streaming: bool = False
     result_batch_size: int = 1000
+    sort_memory_budget_mb: int = 256  # ORDER BY spills sorted runs to disk beyond this (0 = never)
+    join_memory_budget_mb: int = 256  # JOIN hash tables beyond this use on-disk partitions (0 = never)
+    spill_directory: str = ''  # Temp directory for spilled runs and partitions ('' = system default)
+    file_index_directory: str = ''  # Where JSONL line/id indexes are persisted ('' = next to the data file)
+    max_open_file_indexes: int = 16  # JSONL indexes kept in memory (least recently used are dropped)
     # --- Monitoring ---
     enable_metrics: bool = True
     enable_query_logging: bool = True
@@ -119,6 +125,14 @@ class XWQueryConfig:
             raise XWQueryValueError("conversion_cache_size must be positive")
         if self.max_workers <= 0:
             raise XWQueryValueError("max_workers must be positive")
+        if self.parallel_min_rows < 0:
+            raise XWQueryValueError("parallel_min_rows must not be negative")
+        if self.sort_memory_budget_mb < 0:
+            raise XWQueryValueError("sort_memory_budget_mb must not be negative")
+        if self.join_memory_budget_mb < 0:
+            raise XWQueryValueError("join_memory_budget_mb must not be negative")
+        if self.max_open_file_indexes <= 0:
+            raise XWQueryValueError("max_open_file_indexes must be positive")
 
 
 def get_config() -> XWQueryConfig:
@@ -566,6 +566,23 @@ class IOperationsExecutionEngine(Protocol):
     def out_v(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
         """outV operation - Get target vertex from edge."""
         ...
+    # Graph Analytics Operations (4)
+
+    def pagerank(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
+        """PAGERANK operation - Rank vertices by PageRank."""
+        ...
+
+    def betweenness(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
+        """BETWEENNESS operation - Betweenness centrality of vertices."""
+        ...
+
+    def triangle_count(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
+        """TRIANGLE_COUNT operation - Count triangles per vertex."""
+        ...
+
+    def k_core(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
+        """K_CORE operation - k-core decomposition."""
+        ...
     # ========================================================================
     # DATA Operations (4)
     # ========================================================================
@@ -204,7 +204,9 @@ GRAPH_OPERATIONS = [
     "CREATE_EDGE", "DELETE_EDGE", "DETACH_DELETE", "UPDATE_EDGE",
     "DEGREE", "EXPAND", "EXTRACT_PATH", "NEIGHBORS",
     "PATH_LENGTH", "PROPERTIES", "SET", "SHORTEST_PATH",
-    "SIMPLE_PATH", "SUBGRAPH", "TRAVERSAL", "VARIABLE_PATH"
+    "SIMPLE_PATH", "SUBGRAPH", "TRAVERSAL", "VARIABLE_PATH",
+    # Graph analytics
+    "PAGERANK", "BETWEENNESS", "TRIANGLE_COUNT", "K_CORE"
 ]
 # Ordering operations
 ORDERING_OPERATIONS = [
@@ -32,6 +32,7 @@ from .optimization import (
     SimpleCostModel,
     InMemoryStatisticsManager,
     QueryOptimizer,
+    QueryPlanPipeline,
     QueryCache,
     get_global_cache,
     set_global_cache,
@@ -63,6 +64,7 @@ __all__ = [
     "SimpleCostModel",
     "InMemoryStatisticsManager",
     "QueryOptimizer",
+    "QueryPlanPipeline",
     "QueryCache",
     "get_global_cache",
     "set_global_cache",
@@ -10,6 +10,7 @@ Compilation / parsing concerns live in `exonware.xwquery.compiler.base`.
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from typing import Any
 from ..contracts import (
     IOperationExecutor,
@@ -19,7 +20,8 @@ from ..contracts import (
     ExecutionResult,
 )
 from ..defs import OperationCapability
-from ..errors import UnsupportedOperationError, XWQueryValueError
+from ..errors import UnsupportedOperationError, XWQueryExecutionError, XWQueryValueError
+from .streaming import RowStream, iter_batches, resolve_batch_size, is_streaming_enabled
 
 
 class AOperationExecutor(IOperationExecutor):
@@ -37,6 +39,8 @@ class AOperationExecutor(IOperationExecutor):
     SUPPORTED_NODE_TYPES: list[Any] = []
     # Required capabilities
     REQUIRED_CAPABILITIES: OperationCapability = OperationCapability.NONE
+    # Whether _iter_execute() is implemented natively (pull-based, batch at a time)
+    SUPPORTS_STREAMING: bool = False
 
     def __init__(self) -> None:
         """Initialize operation executor."""
@@ -78,6 +82,57 @@ class AOperationExecutor(IOperationExecutor):
                 error=str(e),
                 execution_time=execution_time,
             )
+
+    def iter_execute(self, action: QueryAction, context: ExecutionContext) -> Iterator[list[Any]]:
+        """
+        Execute operation lazily, yielding row batches (Volcano/pull model).
+        `context.node` may be a RowStream produced by the previous stage; it is
+        only pulled as far as this stage needs, so a downstream LIMIT stops
+        the upstream scan early.
+        Executors with SUPPORTS_STREAMING implement `_iter_execute()`; all
+        others fall back to `execute()` and have their materialized result
+        re-batched. Batches keep the input stream's size unless the
+        `batch_size` option sets one (see `resolve_batch_size()`).
+        Raises:
+            XWQueryExecutionError: If validation or execution fails
+        """
+        if not self.validate(action, context):
+            raise XWQueryValueError(f"Invalid action: {action.type}")
+        self.validate_capability_or_raise(context)
+        batch_size = resolve_batch_size(context.options, context.node)
+        if self.SUPPORTS_STREAMING:
+            self._execution_count += 1
+            yield from self._iter_execute(action, context, batch_size)
+            return
+        if isinstance(context.node, RowStream):
+            context.node = context.node.materialize()
+        result = self.execute(action, context)
+        if not result.success:
+            raise XWQueryExecutionError(result.error or f"Operation '{action.type}' failed")
+        if isinstance(result.data, list):
+            yield from iter_batches(result.data, batch_size)
+        elif result.data is not None:
+            yield [result.data]
+
+    def _iter_execute(
+        self,
+        action: QueryAction,
+        context: ExecutionContext,
+        batch_size: int,
+    ) -> Iterator[list[Any]]:
+        """
+        Streaming implementation (overridden by executors with SUPPORTS_STREAMING).
+        Default re-batches the result of `_do_execute()`.
+        """
+        if isinstance(context.node, RowStream):
+            context.node = context.node.materialize()
+        result = self._do_execute(action, context)
+        if not result.success:
+            raise XWQueryExecutionError(result.error or f"Operation '{action.type}' failed")
+        if isinstance(result.data, list):
+            yield from iter_batches(result.data, batch_size)
+        elif result.data is not None:
+            yield [result.data]
     @abstractmethod
 
     def _do_execute(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
@@ -177,12 +232,43 @@ class AOperationsExecutionEngine(IOperationsExecutionEngine, ABC):
         Returns:
             Execution result
         """
+        # Plan-then-execute: let the engine rewrite the tree before running it
+        action = self._optimize_action_tree(action, context)
+        # Pull-based execution: chain streaming stages lazily
+        if is_streaming_enabled(context.options):
+            return self._execute_streaming(action, context)
         # Handle structural nodes (ROOT, PROGRAM) - these are containers, not operations
         if action.type in ("ROOT", "PROGRAM"):
             return self._execute_root(action, context)
         # Execute single action with its children
         return self._execute_action_tree(action, context)
 
+    def iter_tree(self, action: QueryAction, context: ExecutionContext) -> Iterator[list[Any]]:
+        """
+        Execute a QueryAction tree lazily, yielding result row batches.
+        Streaming-capable stages are chained as generators; the caller drives
+        execution by pulling batches, so stopping early (e.g. after the first
+        page) stops the upstream scan as well.
+        Args:
+            action: QueryAction tree (ROOT/PROGRAM or single action)
+            context: Execution context
+        Yields:
+            Row batches
+        Raises:
+            XWQueryExecutionError: If a blocking stage fails
+        """
+        stream, result = self._build_stream(action, context)
+        if stream is not None:
+            try:
+                yield from stream.batches()
+            finally:
+                stream.close()
+            return
+        if result is not None and isinstance(result.data, list):
+            yield from iter_batches(result.data, resolve_batch_size(context.options))
+        elif result is not None and result.data is not None:
+            yield [result.data]
+
     def execute_operation(
         self,
         action: QueryAction,
@@ -407,6 +493,19 @@ class AOperationsExecutionEngine(IOperationsExecutionEngine, ABC):
 
     def out_v(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
         return self._execute_action_tree(action, context)
+    # Graph Analytics Operations (4)
+
+    def pagerank(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
+        return self._execute_action_tree(action, context)
+
+    def betweenness(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
+        return self._execute_action_tree(action, context)
+
+    def triangle_count(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
+        return self._execute_action_tree(action, context)
+
+    def k_core(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
+        return self._execute_action_tree(action, context)
     # DATA Operations (4)
 
     def load(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
@@ -522,6 +621,132 @@ class AOperationsExecutionEngine(IOperationsExecutionEngine, ABC):
                 )
         return results[-1]
 
+    def _execute_streaming(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
+        """
+        Execute a tree through the streaming pipeline and materialize the output.
+        Args:
+            action: QueryAction tree (ROOT/PROGRAM or single action)
+            context: Execution context
+        Returns:
+            Execution result; `data` is the list of rows produced by the last
+            streaming stage, or the result of a trailing blocking stage.
+        """
+        try:
+            stream, result = self._build_stream(action, context)
+            if stream is None:
+                return result or ExecutionResult(
+                    success=False,
+                    data=None,
+                    error="No actions to execute",
+                    action_type=action.type,
+                )
+            rows = stream.materialize()
+        except Exception as e:  # noqa: BLE001 - surface as failed result like execute()
+            return ExecutionResult(
+                success=False,
+                data=None,
+                error=str(e),
+                action_type=action.type,
+            )
+        return ExecutionResult(
+            success=True,
+            data=rows,
+            action_type=action.type,
+            affected_count=len(rows),
+            metadata={'streamed': True},
+        )
+
+    def _build_stream(
+        self,
+        action: QueryAction,
+        context: ExecutionContext,
+    ) -> tuple[RowStream | None, ExecutionResult | None]:
+        """
+        Chain pipeline stages into a lazy RowStream.
+        ROOT/PROGRAM children are stages (each stage's output is the next
+        stage's input, as in `_execute_root`); any other action is a single
+        stage. Leaf stages whose executor supports streaming are wired as
+        generators. Blocking stages (no streaming support, or nested
+        children) materialize their input and run through
+        `_execute_action_tree()`.
+        Returns:
+            (stream, None) when the pipeline ends in a streaming stage, or
+            (None, result) when it ends in a blocking stage.
+        Raises:
+            XWQueryExecutionError: If a blocking stage fails
+        """
+        if action.type in ("ROOT", "PROGRAM"):
+            stages = action.children if hasattr(action, 'children') else action.get_children() if hasattr(action, 'get_children') else []
+        else:
+            stages = [action]
+        current_context = context
+        stream: RowStream | None = None
+        result: ExecutionResult | None = None
+        for stage in stages:
+            stage_children = stage.children if hasattr(stage, 'children') else []
+            executor = None if stage_children else self._get_streaming_executor(stage)
+            if executor is not None:
+                stage_context = ExecutionContext(
+                    node=stream if stream is not None else current_context.node,
+                    variables=current_context.variables,
+                    options=current_context.options,
+                    parent_context=current_context,
+                    metadata=current_context.metadata.copy(),
+                    engine_type=current_context.engine_type,
+                )
+                stream = RowStream(
+                    executor.iter_execute(stage, stage_context),
+                    resolve_batch_size(stage_context.options, stage_context.node)
+                )
+                result = None
+                current_context = stage_context
+                continue
+            # Blocking stage: materialize upstream rows as its input
+            if stream is not None:
+                current_context = ExecutionContext(
+                    node=stream.materialize(),
+                    variables=current_context.variables,
+                    options=current_context.options,
+                    parent_context=current_context,
+                    metadata=current_context.metadata.copy(),
+                    engine_type=current_context.engine_type,
+                )
+                stream = None
+            result = self._execute_action_tree(stage, current_context)
+            if not result.success:
+                raise XWQueryExecutionError(result.error or f"Operation '{stage.type}' failed")
+            if result.data is not None:
+                current_context = ExecutionContext(
+                    node=result.data,
+                    variables=current_context.variables,
+                    options=current_context.options,
+                    parent_context=current_context,
+                    metadata=current_context.metadata.copy(),
+                    engine_type=current_context.engine_type,
+                )
+        return stream, result
+
+    def _optimize_action_tree(self, action: QueryAction, context: ExecutionContext) -> QueryAction:
+        """
+        Rewrite an action tree before execution.
+        Default implementation executes the tree as written; engines that run
+        the query planner/optimizer override this.
+        Args:
+            action: QueryAction tree
+            context: Execution context
+        Returns:
+            QueryAction tree to execute
+        """
+        return action
+
+    def _get_streaming_executor(self, action: QueryAction) -> AOperationExecutor | None:
+        """
+        Get the executor for an action if it can run as a streaming stage.
+        Engines backed by an operation registry override this; the default
+        treats every stage as blocking.
+        """
+        return None
+
     def _execute_action_tree(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
         """
         Execute QueryAction with depth-first traversal.
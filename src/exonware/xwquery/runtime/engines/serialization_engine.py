@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any, TYPE_CHECKING
 from ...contracts import QueryAction, ExecutionContext, ExecutionResult
 from ..base import AOperationsExecutionEngine
+from ..executors.file_columnar import columnar_format
 from ..executors.registry import get_operation_registry, OperationRegistry
 from ...errors import XWQueryValueError
 if TYPE_CHECKING:
@@ -40,6 +41,8 @@ class SerializationOperationsExecutionEngine(AOperationsExecutionEngine):
     - NDJSON / JSON Lines (jsonl, ndjson)
     - XWJSON (xwjson)
     - And any other format implementing ISerialization
+    FILE_SOURCE on CSV/TSV, Parquet and Arrow IPC files is executed by the
+    FILE_SOURCE executor, which reads only the columns the query references.
     """
     _instance: 'SerializationOperationsExecutionEngine' | None = None
     _lock = threading.Lock()
@@ -133,6 +136,13 @@ class SerializationOperationsExecutionEngine(AOperationsExecutionEngine):
             'bson': 'bson',
             'xwjson': 'xwjson',
             'xwj': 'xwjson',  # Short extension for XWJSON
+            'csv': 'csv',
+            'tsv': 'csv',  # Tab-separated CSV
+            'parquet': 'parquet',
+            'pq': 'parquet',
+            'arrow': 'arrow',  # Arrow IPC (file or stream)
+            'arrows': 'arrow',
+            'feather': 'arrow',  # Feather v2 is the Arrow IPC file format
         }
         return mapping.get(ext.lower(), ext.lower())
 
@@ -362,6 +372,10 @@ class SerializationOperationsExecutionEngine(AOperationsExecutionEngine):
                 error="FILE_SOURCE operation requires 'path', 'source', or 'file' parameter",
                 action_type="FILE_SOURCE"
             )
+        # Columnar sources are scanned column-pruned instead of loaded whole
+        if columnar_format(str(source), format_hint) is not None:
+            scan = QueryAction(type='FILE_SOURCE', params={**params, 'source': source}, id=action.id)
+            return self._registry.get('FILE_SOURCE').execute(scan, context)
         # Use LOAD logic
         return self._execute_load(action, {'source': source, 'format': format_hint}, context)
 
@@ -41,7 +41,8 @@ from .graph import (
     DetachDeleteExecutor, DegreeExecutor, ExpandExecutor, ExtractPathExecutor,
     NeighborsExecutor, PathLengthExecutor, PropertiesExecutor, SetExecutor,
     ShortestPathExecutor, SimplePathExecutor, SubgraphExecutor,
-    TraversalExecutor, UpdateEdgeExecutor, VariablePathExecutor
+    TraversalExecutor, UpdateEdgeExecutor, VariablePathExecutor,
+    PageRankExecutor, BetweennessExecutor, TriangleCountExecutor, KCoreExecutor
 )
 from .data import LoadExecutor, StoreExecutor, MergeExecutor, AlterExecutor, FileSourceExecutor
 from .array import SlicingExecutor, IndexingExecutor
@@ -126,6 +127,11 @@ _registry.register('SUBGRAPH', SubgraphExecutor)
 _registry.register('TRAVERSAL', TraversalExecutor)
 _registry.register('UPDATE_EDGE', UpdateEdgeExecutor)
 _registry.register('VARIABLE_PATH', VariablePathExecutor)
+# Graph analytics
+_registry.register('PAGERANK', PageRankExecutor)
+_registry.register('BETWEENNESS', BetweennessExecutor)
+_registry.register('TRIANGLE_COUNT', TriangleCountExecutor)
+_registry.register('K_CORE', KCoreExecutor)
 # Register DATA operations (5)
 _registry.register('LOAD', LoadExecutor)
 _registry.register('STORE', StoreExecutor)
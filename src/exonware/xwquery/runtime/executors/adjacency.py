@@ -0,0 +1,557 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/src/exonware/xwquery/runtime/executors/adjacency.py
+Shared graph adjacency: compressed sparse row (CSR) snapshots.
+Root cause: every graph executor called `list(node.get_neighbors(v))` for
+each visited vertex - a Python method dispatch plus a list allocation per hop
+- and kept visited sets, parent maps and path lists keyed by vertex ids.
+Solution: number the vertices once and store the adjacency in three arrays:
+`offsets` (vertex i's edges are `targets[offsets[i]:offsets[i + 1]]`),
+`targets` (neighbor indexes) and `weights`, filled in per vertex as
+searches expand it. Traversals keep
+their visited/parent state on integer indexes and iterate zero-copy
+memoryview slices of `targets`.
+- `csr_snapshot()` builds the snapshot once per graph version and caches it
+  (weakly, per graph object). Graphs report their version through
+  `graph_version`/`get_graph_version()` or an integer `version`; executors
+  that mutate a graph call `mark_graph_changed()`.
+- Graphs without a version (or without `get_all_vertices()`) cannot be
+  validated, so `adjacency()` wraps them in a `LazyAdjacency` that fetches
+  and numbers each vertex's neighbors once per query instead.
+- `transpose()` (incoming edges) and `symmetric()` (both directions) are
+  derived from a snapshot in O(V + E) and cached with it.
+- `vertex_labels()`, `vertex_properties()`, `edge_type()` and
+  `edge_properties()` read labels and properties through the graph's optional
+  vertex/edge API, so executors do not each probe for method names.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.9.0.5
+Generation Date: 17-Oct-2026
+"""
+
+from __future__ import annotations
+import threading
+import weakref
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+# Cached snapshots (graph objects); older snapshots are dropped first
+_MAX_SNAPSHOTS = 8
+_snapshots: dict[int, tuple[weakref.ref, Any, CSRGraph]] = {}
+_changes: dict[int, int] = {}
+_lock = threading.Lock()
+
+
+def _fetcher(get_neighbors: Callable[[Any], Iterable[Any]]) -> Callable[[Any], Iterable[Any]]:
+    """Neighbor lookup that treats a failing vertex as having no neighbors."""
+    def fetch(vertex: Any) -> Iterable[Any]:
+        try:
+            return get_neighbors(vertex) or ()
+        except Exception:
+            return ()
+    return fetch
+
+
+def _index_code(size: int) -> str:
+    """Smallest array typecode for vertex indexes of a graph with `size` vertices."""
+    return 'i' if size < 2 ** 31 else 'q'
+
+
+class CSRGraph:
+    """
+    Immutable adjacency snapshot in compressed sparse row form.
+    Vertex i is `vertices[i]`; its out-neighbors are the indexes in
+    `out(i)` (a memoryview slice, no copy).
+    """
+
+    def __init__(self, vertices: list[Any], offsets: array, targets: array):
+        self.vertices = vertices
+        self.index = {vertex: position for position, vertex in enumerate(vertices)}
+        self.offsets = offsets
+        self.targets = targets
+        self._targets = memoryview(targets)
+        self._weights: memoryview | None = None
+        self._weighed = bytearray()  # 1 for vertices whose weights are filled in
+        self._weight_of: Any = None
+        self._transpose: CSRGraph | None = None
+        self._symmetric: CSRGraph | None = None
+        # Derived data that lives as long as the snapshot (e.g. pattern statistics)
+        self.cache: dict[Any, Any] = {}
+
+    @classmethod
+    def build(cls, vertices: Iterable[Any], get_neighbors: Callable[[Any], Iterable[Any]]) -> CSRGraph:
+        """
+        Snapshot the graph reachable from `vertices`.
+        Neighbors that were not listed become vertices too (and are asked for
+        their own neighbors), so the snapshot is closed under traversal.
+        """
+        fetch = _fetcher(get_neighbors)
+        order: list[Any] = []
+        index: dict[Any, int] = {}
+        for vertex in vertices:
+            if vertex not in index:
+                index[vertex] = len(order)
+                order.append(vertex)
+        offsets = array('q', [0])
+        targets = array('q')
+        position = 0
+        while position < len(order):
+            for neighbor in fetch(order[position]):
+                target = index.get(neighbor)
+                if target is None:
+                    target = index[neighbor] = len(order)
+                    order.append(neighbor)
+                targets.append(target)
+            offsets.append(len(targets))
+            position += 1
+        return cls(order, offsets, array(_index_code(len(order)), targets))
+
+    @classmethod
+    def from_edges(cls, vertices: list[Any], edges: Sequence[tuple[int, int]]) -> CSRGraph:
+        """Snapshot from (source index, target index) pairs, grouped by counting sort."""
+        counts = [0] * (len(vertices) + 1)
+        for source, _ in edges:
+            counts[source + 1] += 1
+        for position in range(len(vertices)):
+            counts[position + 1] += counts[position]
+        offsets = array('q', counts)
+        cursor = counts[:-1]
+        placed = [0] * len(edges)
+        for source, target in edges:
+            placed[cursor[source]] = target
+            cursor[source] += 1
+        return cls(vertices, offsets, array(_index_code(len(vertices)), placed))
+
+    def __len__(self) -> int:
+        return len(self.vertices)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def index_of(self, vertex: Any) -> int | None:
+        """Index of a vertex (None when it is not in the graph)."""
+        return self.index.get(vertex)
+
+    def out(self, position: int) -> memoryview:
+        """Neighbor indexes of vertex `position`."""
+        return self._targets[self.offsets[position]:self.offsets[position + 1]]
+
+    def degree(self, position: int) -> int:
+        return self.offsets[position + 1] - self.offsets[position]
+
+    def neighbors(self, vertex: Any) -> list[Any]:
+        """Neighbor vertices of `vertex` (empty for unknown vertices)."""
+        position = self.index.get(vertex)
+        if position is None:
+            return []
+        vertices = self.vertices
+        return [vertices[target] for target in self.out(position)]
+
+    def _weight_slots(self, weight_of: Callable[[Any, Any], Any] | None) -> memoryview:
+        """Weights array for `weight_of`, reset when a different weight function is asked for."""
+        if self._weights is None or self._weight_of != weight_of:
+            self._weights = memoryview(array('d', [1.0]) * len(self.targets))
+            self._weighed = bytearray(len(self.vertices))
+            self._weight_of = weight_of
+        return self._weights
+
+    def out_weights(self, position: int, weight_of: Callable[[Any, Any], Any] | None = None) -> Sequence[float]:
+        """
+        Edge weights aligned with `out(position)`: `weight_of(source, target)`
+        (falsy weights count as 1), evaluated the first time the vertex is
+        expanded and kept with the snapshot until a different weight function
+        is asked for. Weight functions are compared by equality, so pass a
+        stable one (see `weight_function()`), not a fresh closure per query.
+        """
+        weights = self._weight_slots(weight_of)
+        start, stop = self.offsets[position], self.offsets[position + 1]
+        if weight_of is not None and not self._weighed[position]:
+            source, vertices, targets = self.vertices[position], self.vertices, self.targets
+            for edge in range(start, stop):
+                weights[edge] = float(weight_of(source, vertices[targets[edge]]) or 1)
+            self._weighed[position] = 1
+        return weights[start:stop]
+
+    def edge_weights(self, weight_of: Callable[[Any, Any], Any] | None = None) -> memoryview:
+        """Weights of all edges, aligned with `targets` (see `out_weights()`)."""
+        weights = self._weight_slots(weight_of)
+        if weight_of is not None and 0 in self._weighed:
+            for position in range(len(self.vertices)):
+                self.out_weights(position, weight_of)
+        return weights
+
+    def edges(self) -> Iterable[tuple[int, int]]:
+        """All (source, target) index pairs."""
+        offsets, targets = self.offsets, self.targets
+        for source in range(len(self.vertices)):
+            for edge in range(offsets[source], offsets[source + 1]):
+                yield source, targets[edge]
+
+    def transpose(self) -> CSRGraph:
+        """Snapshot of the incoming edges (cached)."""
+        if self._transpose is None:
+            self._transpose = CSRGraph.from_edges(self.vertices, [(target, source) for source, target in self.edges()])
+            self._transpose._transpose = self
+        return self._transpose
+
+    def symmetric(self) -> CSRGraph:
+        """Snapshot with every edge in both directions, without duplicates (cached)."""
+        if self._symmetric is None:
+            pairs = dict.fromkeys(
+                pair for source, target in self.edges() for pair in ((source, target), (target, source))
+            )
+            self._symmetric = CSRGraph.from_edges(self.vertices, list(pairs))
+        return self._symmetric
+
+
+class LazyAdjacency:
+    """
+    CSRGraph-compatible adjacency that fetches neighbors on demand.
+    Used for graphs whose version is unknown: each vertex's neighbors are
+    fetched and numbered once per query, never cached across queries.
+    """
+
+    def __init__(self, get_neighbors: Callable[[Any], Iterable[Any]]):
+        self._fetch = _fetcher(get_neighbors)
+        self._weight_of: Any = None
+        self.vertices: list[Any] = []
+        self.index: dict[Any, int] = {}
+        self._out: dict[int, list[int]] = {}
+        self._weights: dict[int, list[float]] = {}
+
+    def __len__(self) -> int:
+        return len(self.vertices)
+
+    def index_of(self, vertex: Any) -> int:
+        """Index of a vertex; unseen vertices are numbered on first use."""
+        position = self.index.get(vertex)
+        if position is None:
+            position = self.index[vertex] = len(self.vertices)
+            self.vertices.append(vertex)
+        return position
+
+    def out(self, position: int) -> list[int]:
+        targets = self._out.get(position)
+        if targets is None:
+            index_of = self.index_of
+            targets = self._out[position] = [index_of(neighbor) for neighbor in self._fetch(self.vertices[position])]
+        return targets
+
+    def degree(self, position: int) -> int:
+        return len(self.out(position))
+
+    def neighbors(self, vertex: Any) -> list[Any]:
+        return [self.vertices[target] for target in self.out(self.index_of(vertex))]
+
+    def out_weights(self, position: int, weight_of: Callable[[Any, Any], Any] | None = None) -> list[float]:
+        if self._weight_of != weight_of:
+            self._weights, self._weight_of = {}, weight_of
+        weights = self._weights.get(position)
+        if weights is None:
+            source = self.vertices[position]
+            weights = [
+                float(weight_of(source, self.vertices[target]) or 1) if weight_of else 1.0
+                for target in self.out(position)
+            ]
+            self._weights[position] = weights
+        return weights
+
+
+def graph_version(node: Any) -> Any:
+    """
+    Version token of a graph, or None when it cannot be validated.
+    Combines the graph's own version (`graph_version`, `get_graph_version()`
+    or an integer `version`) with changes reported by `mark_graph_changed()`.
+    Graphs without a version of their own stay None: changes made directly
+    through their API would go unnoticed.
+    """
+    version = None
+    for name in ('graph_version', 'get_graph_version', 'version'):
+        value = getattr(node, name, None)
+        if callable(value):
+            try:
+                value = value()
+            except Exception:
+                value = None
+        if name == 'version' and (not isinstance(value, int) or isinstance(value, bool)):
+            value = None
+        if value is not None:
+            version = value
+            break
+    if version is None:
+        return None
+    return version, _changes.get(id(node), 0)
+
+
+def mark_graph_changed(node: Any) -> None:
+    """Invalidate the cached snapshot of a graph that was just mutated."""
+    with _lock:
+        _changes[id(node)] = _changes.get(id(node), 0) + 1
+        _snapshots.pop(id(node), None)
+
+
+def _forget(key: int) -> None:
+    with _lock:
+        _snapshots.pop(key, None)
+        _changes.pop(key, None)
+
+
+def csr_snapshot(node: Any) -> CSRGraph | None:
+    """
+    Cached CSR snapshot of a versioned graph (None when it cannot be cached).
+    A snapshot is rebuilt only when the graph's version changes.
+    """
+    if not callable(getattr(node, 'get_all_vertices', None)) or not callable(getattr(node, 'get_neighbors', None)):
+        return None
+    version = graph_version(node)
+    if version is None:
+        return None
+    key = id(node)
+    with _lock:
+        entry = _snapshots.get(key)
+        if entry is not None and entry[0]() is node and entry[1] == version:
+            return entry[2]
+    try:
+        reference = weakref.ref(node, lambda _, key=key: _forget(key))
+        vertices = list(node.get_all_vertices())
+    except Exception:
+        return None
+    snapshot = CSRGraph.build(vertices, node.get_neighbors)
+    with _lock:
+        _snapshots.pop(key, None)
+        while len(_snapshots) >= _MAX_SNAPSHOTS:
+            _snapshots.pop(next(iter(_snapshots)))
+        _snapshots[key] = (reference, version, snapshot)
+    return snapshot
+
+
+def full_snapshot(node: Any) -> CSRGraph | None:
+    """
+    CSR snapshot of the whole graph for whole-graph algorithms: the cached
+    snapshot when the graph is versioned, else one built for this query.
+    None when the graph cannot list its vertices.
+    """
+    snapshot = csr_snapshot(node)
+    if snapshot is not None:
+        return snapshot
+    if not callable(getattr(node, 'get_all_vertices', None)) or not callable(getattr(node, 'get_neighbors', None)):
+        return None
+    try:
+        vertices = list(node.get_all_vertices())
+    except Exception:
+        return None
+    return CSRGraph.build(vertices, node.get_neighbors)
+
+
+def adjacency(node: Any, direction: str = 'out') -> CSRGraph | LazyAdjacency:
+    """
+    Adjacency for a traversal over `node` in `direction` ('out', 'in', 'both').
+    Cached CSR snapshot when the graph is versioned, else a LazyAdjacency.
+    """
+    direction = str(direction or 'out').lower()
+    snapshot = csr_snapshot(node)
+    if snapshot is not None:
+        if direction == 'in':
+            return snapshot.transpose()
+        if direction == 'both':
+            return snapshot.symmetric()
+        return snapshot
+    get_neighbors = node.get_neighbors
+    get_incoming = getattr(node, 'get_incoming_neighbors', None)
+    if direction == 'in' and callable(get_incoming):
+        return LazyAdjacency(get_incoming)
+    if direction == 'both' and callable(get_incoming):
+        fetch_out, fetch_in = _fetcher(get_neighbors), _fetcher(get_incoming)
+        return LazyAdjacency(lambda vertex: dict.fromkeys([*fetch_out(vertex), *fetch_in(vertex)]))
+    return LazyAdjacency(get_neighbors)
+
+
+def reverse_adjacency(node: Any, graph: CSRGraph | LazyAdjacency) -> CSRGraph | LazyAdjacency | None:
+    """
+    Incoming-edge adjacency sharing `graph`'s vertex numbering, for searches
+    that also walk backwards from the target (None when unavailable).
+    """
+    if isinstance(graph, CSRGraph):
+        return graph.transpose()
+    get_incoming = getattr(node, 'get_incoming_neighbors', None)
+    if not callable(get_incoming):
+        return None
+    reverse = LazyAdjacency(get_incoming)
+    # Share the vertex numbering with the forward adjacency
+    reverse.vertices, reverse.index = graph.vertices, graph.index
+    return reverse
+
+
+class _PropertyWeight:
+    """Weight read from a named edge property; equal for the same graph and property."""
+    __slots__ = ('get_property', 'name')
+
+    def __init__(self, get_property: Callable[[Any, Any, str], Any], name: str):
+        self.get_property = get_property
+        self.name = name
+
+    def __call__(self, source: Any, target: Any) -> Any:
+        return self.get_property(source, target, self.name)
+
+    def __eq__(self, other: Any) -> bool:
+        return (isinstance(other, _PropertyWeight) and self.name == other.name
+                and self.get_property == other.get_property)
+
+    def __hash__(self) -> int:
+        return hash((self.get_property, self.name))
+
+
+class _ReversedWeight:
+    """Weight of the reversed edge (for searches over incoming edges)."""
+    __slots__ = ('weight_of',)
+
+    def __init__(self, weight_of: Callable[[Any, Any], Any]):
+        self.weight_of = weight_of
+
+    def __call__(self, source: Any, target: Any) -> Any:
+        return self.weight_of(target, source)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _ReversedWeight) and self.weight_of == other.weight_of
+
+    def __hash__(self) -> int:
+        return hash((_ReversedWeight, self.weight_of))
+
+
+def weight_function(node: Any, weight_property: str = 'weight') -> Callable[[Any, Any], Any] | None:
+    """
+    Edge weight lookup for weighted searches: `get_edge_property(u, v, name)`
+    for a custom property, else `get_edge_weight(u, v)` (None when the graph
+    has neither, so every edge weighs 1). Lookups for the same graph and
+    property compare equal, so snapshots keep their weights across queries.
+    """
+    get_property = getattr(node, 'get_edge_property', None)
+    if weight_property != 'weight' and callable(get_property):
+        return _PropertyWeight(get_property, weight_property)
+    get_weight = getattr(node, 'get_edge_weight', None)
+    return get_weight if callable(get_weight) else None
+
+
+def reversed_weight(weight_of: Callable[[Any, Any], Any] | None) -> Callable[[Any, Any], Any] | None:
+    """`weight_of` for incoming edges (`weight_of(target, source)`), stable like `weight_function()`."""
+    return _ReversedWeight(weight_of) if weight_of is not None else None
+
+
+def vertex_property(node: Any, vertex: Any, name: str) -> Any:
+    """
+    Property of a vertex, read through the graph's vertex API
+    (`get_vertex_property(vertex, name)`, `get_vertex_properties(vertex)` or
+    `get_vertex(vertex)`); dict vertices are read directly.
+    """
+    if isinstance(vertex, dict):
+        return vertex.get(name)
+    getter = getattr(node, 'get_vertex_property', None)
+    if callable(getter):
+        return getter(vertex, name)
+    for method in ('get_vertex_properties', 'get_vertex'):
+        getter = getattr(node, method, None)
+        if callable(getter):
+            properties = getter(vertex)
+            if isinstance(properties, dict):
+                return properties.get(name)
+            return getattr(properties, name, None)
+    return None
+
+
+def _as_dict(value: Any) -> dict:
+    if isinstance(value, dict):
+        return value
+    attributes = getattr(value, '__dict__', None)
+    return attributes if isinstance(attributes, dict) else {}
+
+
+def vertex_properties(node: Any, vertex: Any) -> dict:
+    """
+    All properties of a vertex (`get_vertex_properties(vertex)` or
+    `get_vertex(vertex)`; dict vertices are their own properties).
+    """
+    if isinstance(vertex, dict):
+        return vertex
+    for method in ('get_vertex_properties', 'get_vertex'):
+        getter = getattr(node, method, None)
+        if callable(getter):
+            try:
+                return _as_dict(getter(vertex))
+            except Exception:
+                return {}
+    return {}
+
+
+def vertex_labels(node: Any, vertex: Any) -> tuple[Any, ...]:
+    """
+    Labels of a vertex: `get_vertex_labels(vertex)`/`get_labels(vertex)`,
+    else its 'labels' (list) or 'label' property.
+    """
+    for method in ('get_vertex_labels', 'get_labels'):
+        getter = getattr(node, method, None)
+        if callable(getter):
+            try:
+                labels = getter(vertex)
+            except Exception:
+                labels = None
+            if labels is not None:
+                return (labels,) if isinstance(labels, str) else tuple(labels)
+    properties = vertex_properties(node, vertex)
+    labels = properties.get('labels', properties.get('label'))
+    if labels is None:
+        return ()
+    return (labels,) if isinstance(labels, str) else tuple(labels)
+
+
+def edge_properties(node: Any, source: Any, target: Any) -> dict:
+    """Properties of the edge source -> target (`get_edge_properties` or `get_edge`)."""
+    for method in ('get_edge_properties', 'get_edge'):
+        getter = getattr(node, method, None)
+        if callable(getter):
+            try:
+                return _as_dict(getter(source, target))
+            except Exception:
+                return {}
+    return {}
+
+
+def edge_type(node: Any, source: Any, target: Any) -> Any:
+    """Type of the edge source -> target: `get_edge_type`, else its 'type'/'label' property."""
+    getter = getattr(node, 'get_edge_type', None)
+    if callable(getter):
+        try:
+            return getter(source, target)
+        except Exception:
+            return None
+    properties = edge_properties(node, source, target)
+    return properties.get('type', properties.get('label'))
+
+
+def vertex_path(graph: CSRGraph | LazyAdjacency, parents: dict[int, int], position: int) -> list[Any]:
+    """Vertices from the root to `position` following parent indexes (roots have none)."""
+    path = []
+    while position is not None:
+        path.append(graph.vertices[position])
+        position = parents.get(position)
+    path.reverse()
+    return path
+__all__ = [
+    'CSRGraph',
+    'LazyAdjacency',
+    'adjacency',
+    'csr_snapshot',
+    'edge_properties',
+    'edge_type',
+    'full_snapshot',
+    'graph_version',
+    'mark_graph_changed',
+    'reverse_adjacency',
+    'reversed_weight',
+    'vertex_labels',
+    'vertex_path',
+    'vertex_properties',
+    'vertex_property',
+    'weight_function',
+]
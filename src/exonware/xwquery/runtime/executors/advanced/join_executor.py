@@ -16,6 +16,23 @@ from ....contracts import QueryAction, ExecutionContext, ExecutionResult
 from ....defs import OperationType
 # REUSE: Shared utilities
 from ..utils import extract_items
+from ..joins import (
+    anti_join,
+    choose_build_side,
+    compile_join_key,
+    hash_join,
+    iter_merge_join,
+    iter_range_join,
+    make_merger,
+    normalize_join_type,
+    parse_join_condition,
+    parse_join_keys,
+    resolve_join_memory_budget,
+    semi_join,
+)
+from ..sorting import iter_sorted, parse_order_by, resolve_sort_memory_budget, resolve_spill_directory
+from ...optimization.cost_model import SimpleCostModel
+from ...streaming import RowStream
 
 
 class JoinType(Enum):
@@ -25,6 +42,8 @@ class JoinType(Enum):
     RIGHT = "RIGHT"
     FULL = "FULL"
     CROSS = "CROSS"
+    SEMI = "SEMI"
+    ANTI = "ANTI"
 
 
 class JoinExecutor(AUniversalOperationExecutor):
@@ -46,6 +65,8 @@ class JoinExecutor(AUniversalOperationExecutor):
     - RIGHT JOIN: All from right + matching from left (null for non-matches)
     - FULL OUTER JOIN: All rows from both (null for non-matches)
     - CROSS JOIN: Cartesian product of both tables
+    - SEMI JOIN (EXISTS): Left rows with at least one match, each once
+    - ANTI JOIN (NOT EXISTS): Left rows without any match
     Capability: Universal
     Operation Type: JOINING
     """
@@ -64,7 +85,7 @@ class JoinExecutor(AUniversalOperationExecutor):
             action_type=self.OPERATION_NAME,
             metadata={
                 'operation': self.OPERATION_NAME,
-                'join_type': params.get('type', 'INNER'),
+                'join_type': result_data.get('join_type', normalize_join_type(params.get('type', 'INNER'))),
                 'matched_count': result_data.get('matched_count', 0),
                 'result_count': result_data.get('result_count', 0)
             }
@@ -75,16 +96,32 @@ class JoinExecutor(AUniversalOperationExecutor):
         Execute JOIN using hash-based algorithm.
         REUSE: Uses Python dict (xwnode HASH_MAP strategy) for O(1) lookups.
         Algorithm:
-        1. Build hash map from right table (smaller table ideally)
-        2. Probe with left table for matches
-        3. Apply join type logic (INNER/LEFT/RIGHT/FULL)
+        1. Build hash map from the smaller input (or the 'build_side' param)
+        2. Probe with the other input for matches
+        3. Apply join type logic (INNER/LEFT/RIGHT/FULL/SEMI/ANTI)
+        Join keys may be composite ('on': "customer_id = id AND region = region",
+        {'customer_id': 'id', 'region': 'region'}, ...). With 'columns'
+        (e.g. ['left_name', 'right_email'], usually pushed down from a
+        following projection) only those fields are copied into joined rows.
+        Inputs may be lazy row streams (e.g. from FileSourceExecutor); a stream
+        is always the probe side. When the build side exceeds the join memory
+        budget (`join_memory_budget_mb`), both inputs are hashed into on-disk
+        partitions that are joined pair by pair (Grace hash join, 'partitions'
+        param sets the fan-out).
+        Inputs ordered on the join key ('presorted' param, set by the planner
+        for inputs coming from ORDER BY, or detected on lists) are joined with
+        a streaming sort-merge join when the cost model prefers it
+        ('algorithm' param forces 'hash' or 'merge'). Range/inequality
+        conditions ("ts >= ts - 5 AND ts <= ts + 5") always use a merge
+        (band) join; inputs that are not ordered are sorted first.
         Supports both standard JOIN and server-side collection joins (RethinkDB-style).
         For server-side joins, right table can be specified as a collection path.
         Time Complexity: O(n + m) where n, m are table sizes
-        Space Complexity: O(m) for hash map
+        Space Complexity: O(min(n, m)) for hash map
         Args:
             node: Left table data
-            params: Join parameters (right, on, type, collection for server-side joins)
+            params: Join parameters (right, on, type, columns, build_side,
+                algorithm, presorted, collection for server-side joins)
             context: Execution context
         Returns:
             dict with joined results and metadata
@@ -93,16 +130,20 @@ class JoinExecutor(AUniversalOperationExecutor):
         right_data = params.get('right', params.get('right_table'))
         right_collection = params.get('collection', params.get('right_collection'))
         join_on = params.get('on', params.get('join_on', {}))
-        join_type = params.get('type', params.get('join_type', 'INNER')).upper()
-        join_method = params.get('method', params.get('join_method', 'eqJoin')).lower()
+        join_type = normalize_join_type(params.get('type', params.get('join_type', 'INNER')))
         # REUSE: Get left table data
-        left_data = extract_items(node)
+        left_data = self._rows(node)
         # Support server-side collection joins (RethinkDB-style eqJoin)
         if right_collection and not right_data:
             right_data = self._load_collection(right_collection, context)
         # If right_data is still None, try to extract from params
         if right_data is None:
             right_data = []
+        right_data = self._rows(right_data)
+        counts = {'left': len(left_data) if isinstance(left_data, list) else 0,
+                  'right': len(right_data) if isinstance(right_data, list) else 0}
+        left_rows = self._counted(left_data, counts, 'left')
+        right_rows = self._counted(right_data, counts, 'right')
         # Validate join configuration (CROSS does not need join condition)
         if not join_on and join_type != 'CROSS':
             return {
@@ -111,19 +152,49 @@ class JoinExecutor(AUniversalOperationExecutor):
                 'matched_count': 0,
                 'error': 'Missing join condition (on parameter)'
             }
-        # Parse join condition (used for non-CROSS joins)
-        left_key, right_key = self._parse_join_condition(join_on) if join_on else ('id', 'id')
-        # Execute appropriate join type
-        if join_type == 'INNER':
-            result = self._inner_join(left_data, right_data, left_key, right_key)
-        elif join_type == 'LEFT':
-            result = self._left_join(left_data, right_data, left_key, right_key)
-        elif join_type == 'RIGHT':
-            result = self._right_join(left_data, right_data, left_key, right_key)
-        elif join_type in ('FULL', 'FULL OUTER'):
-            result = self._full_outer_join(left_data, right_data, left_key, right_key)
-        elif join_type == 'CROSS':
-            result = self._cross_join(left_data, right_data)
+        merge = make_merger(params.get('columns', params.get('select')))
+        stats = {'matched_count': 0}
+        build_side = None
+        algorithm = 'nested_loop' if join_type == 'CROSS' else 'hash'
+        if join_type == 'CROSS':
+            result = self._cross_join(list(left_rows), list(right_rows), merge)
+            stats['matched_count'] = len(result)
+        elif join_type in ('INNER', 'LEFT', 'RIGHT', 'FULL', 'SEMI', 'ANTI'):
+            # Parse join condition (used for non-CROSS joins)
+            left_keys, right_keys, ranges = parse_join_condition(join_on)
+            if not left_keys and not ranges:
+                left_keys, right_keys = parse_join_keys(join_on)
+            left_key = compile_join_key(left_keys) if left_keys else None
+            right_key = compile_join_key(right_keys) if right_keys else None
+            algorithm = self._choose_algorithm(params, join_type, left_data, right_data, left_key, right_key, ranges)
+            if algorithm == 'merge':
+                presorted = self._presorted(params)
+                left_order, right_order = (
+                    ([ranges[0].left_field], [ranges[0].right_field]) if ranges else (left_keys, right_keys)
+                )
+                left_rows = self._ordered(left_rows, left_order, 'left' in presorted, context)
+                right_rows = self._ordered(right_rows, right_order, 'right' in presorted, context)
+                if ranges:
+                    result = list(iter_range_join(
+                        left_rows, right_rows, ranges, join_type, merge, stats, left_key, right_key
+                    ))
+                else:
+                    result = list(iter_merge_join(left_rows, right_rows, left_key, right_key, join_type, merge, stats))
+            elif join_type in ('SEMI', 'ANTI'):
+                # Only key values are hashed; result rows are the left rows themselves
+                build_side = choose_build_side(left_data, right_data, join_type, params.get('build_side'))
+                filter_join = semi_join if join_type == 'SEMI' else anti_join
+                result = list(filter_join(left_rows, right_rows, left_key, right_key, build_side))
+                stats['matched_count'] = len(result) if join_type == 'SEMI' else 0
+            else:
+                build_side = choose_build_side(left_data, right_data, join_type, params.get('build_side'))
+                result = list(hash_join(
+                    left_rows, right_rows, left_key, right_key,
+                    join_type, build_side, merge, stats,
+                    memory_budget=resolve_join_memory_budget(context.options),
+                    spill_dir=resolve_spill_directory(context.options),
+                    partitions=params.get('partitions')
+                ))
         else:
             return {
                 'result': [],
@@ -131,210 +202,103 @@ class JoinExecutor(AUniversalOperationExecutor):
                 'matched_count': 0,
                 'error': f'Unsupported join type: {join_type}'
             }
-        matched_count = len([r for r in result if r.get('_matched', True)])
         return {
             'result': result,
             'result_count': len(result),
-            'matched_count': matched_count,
+            'matched_count': stats['matched_count'],
             'join_type': join_type,
-            'left_count': len(left_data),
-            'right_count': len(right_data)
+            'algorithm': algorithm,
+            'build_side': build_side,
+            'spilled_partitions': stats.get('spilled_partitions', 0),
+            'left_count': counts['left'],
+            'right_count': counts['right']
         }
 
-    def _inner_join(self, left: list[dict], right: list[dict], 
-                    left_key: str, right_key: str) -> list[dict]:
-        """
-        INNER JOIN: Returns only matching rows.
-        REUSE: Hash map (xwnode HASH_MAP) for O(n+m) performance.
-        """
-        # Build hash map from right table (HASH_MAP strategy)
-        right_hash = {}
-        for right_item in right:
-            key_value = self._extract_key_value(right_item, right_key)
-            if key_value is not None:
-                if key_value not in right_hash:
-                    right_hash[key_value] = []
-                right_hash[key_value].append(right_item)
-        # Probe with left table
-        result = []
-        for left_item in left:
-            key_value = self._extract_key_value(left_item, left_key)
-            if key_value is not None and key_value in right_hash:
-                # Match found - create joined records
-                for right_item in right_hash[key_value]:
-                    joined = self._merge_records(left_item, right_item, 'left', 'right')
-                    result.append(joined)
-        return result
-
-    def _left_join(self, left: list[dict], right: list[dict],
-                   left_key: str, right_key: str) -> list[dict]:
-        """
-        LEFT JOIN: All from left + matching from right.
-        Non-matching left rows get null right values.
-        """
-        # Build hash map from right table
-        right_hash = {}
-        for right_item in right:
-            key_value = self._extract_key_value(right_item, right_key)
-            if key_value is not None:
-                if key_value not in right_hash:
-                    right_hash[key_value] = []
-                right_hash[key_value].append(right_item)
-        # Probe with left table
-        result = []
-        for left_item in left:
-            key_value = self._extract_key_value(left_item, left_key)
-            matched = False
-            if key_value is not None and key_value in right_hash:
-                # Match found
-                for right_item in right_hash[key_value]:
-                    joined = self._merge_records(left_item, right_item, 'left', 'right')
-                    result.append(joined)
-                    matched = True
-            if not matched:
-                # No match - include left with null right
-                joined = self._merge_records(left_item, None, 'left', 'right')
-                joined['_matched'] = False
-                result.append(joined)
-        return result
+    def _choose_algorithm(self, params: dict, join_type: str, left: Any, right: Any,
+                          left_key: Any, right_key: Any, ranges: list) -> str:
+        """Pick 'hash' or 'merge' for a non-CROSS join (the cost model decides unless forced)."""
+        if ranges:
+            return 'merge'
+        if join_type in ('SEMI', 'ANTI'):
+            return 'hash'
+        requested = str(params.get('algorithm') or 'auto').lower()
+        if requested in ('hash', 'merge'):
+            return requested
+        if params.get('build_side') in ('left', 'right'):
+            return 'hash'
+        presorted = self._presorted(params)
+        choice = SimpleCostModel().choose_join_algorithm(
+            len(left) if isinstance(left, list) else 1000,
+            len(right) if isinstance(right, list) else 1000,
+            left_sorted='left' in presorted or self._is_ordered(left, left_key),
+            right_sorted='right' in presorted or self._is_ordered(right, right_key)
+        )
+        # Nested loops are never cheaper than hashing here
+        return 'merge' if choice == 'merge' else 'hash'
 
-    def _right_join(self, left: list[dict], right: list[dict],
-                    left_key: str, right_key: str) -> list[dict]:
-        """
-        RIGHT JOIN: All from right + matching from left.
-        Non-matching right rows get null left values.
-        """
-        # Build hash map from left table
-        left_hash = {}
-        for left_item in left:
-            key_value = self._extract_key_value(left_item, left_key)
-            if key_value is not None:
-                if key_value not in left_hash:
-                    left_hash[key_value] = []
-                left_hash[key_value].append(left_item)
-        # Probe with right table
-        result = []
-        for right_item in right:
-            key_value = self._extract_key_value(right_item, right_key)
-            matched = False
-            if key_value is not None and key_value in left_hash:
-                # Match found
-                for left_item in left_hash[key_value]:
-                    joined = self._merge_records(left_item, right_item, 'left', 'right')
-                    result.append(joined)
-                    matched = True
-            if not matched:
-                # No match - include right with null left
-                joined = self._merge_records(None, right_item, 'left', 'right')
-                joined['_matched'] = False
-                result.append(joined)
-        return result
+    @staticmethod
+    def _presorted(params: dict) -> set[str]:
+        """Sides declared ordered on the join key ('presorted': True/'both'/'left'/'right'/list)."""
+        presorted = params.get('presorted')
+        if presorted is True or presorted == 'both':
+            return {'left', 'right'}
+        if isinstance(presorted, str):
+            return {presorted}
+        return set(presorted or ())
 
-    def _full_outer_join(self, left: list[dict], right: list[dict],
-                         left_key: str, right_key: str) -> list[dict]:
-        """
-        FULL OUTER JOIN: All rows from both tables.
-        Non-matching rows get nulls from the other table.
-        """
-        # Build hash maps for both tables
-        right_hash = {}
-        for right_item in right:
-            key_value = self._extract_key_value(right_item, right_key)
-            if key_value is not None:
-                if key_value not in right_hash:
-                    right_hash[key_value] = []
-                right_hash[key_value].append(right_item)
-        # Track which right rows were matched
-        right_matched = set()
-        # Process left table
-        result = []
-        for left_item in left:
-            key_value = self._extract_key_value(left_item, left_key)
-            matched = False
-            if key_value is not None and key_value in right_hash:
-                # Match found
-                for i, right_item in enumerate(right_hash[key_value]):
-                    joined = self._merge_records(left_item, right_item, 'left', 'right')
-                    result.append(joined)
-                    right_matched.add((key_value, i))
-                    matched = True
-            if not matched:
-                # No match - include left with null right
-                joined = self._merge_records(left_item, None, 'left', 'right')
-                joined['_matched'] = False
-                result.append(joined)
-        # Add unmatched right rows
-        for key_value, right_items in right_hash.items():
-            for i, right_item in enumerate(right_items):
-                if (key_value, i) not in right_matched:
-                    joined = self._merge_records(None, right_item, 'left', 'right')
-                    joined['_matched'] = False
-                    result.append(joined)
-        return result
+    @staticmethod
+    def _is_ordered(rows: Any, key: Any) -> bool:
+        """Whether a materialized input is ascending on its join key (NULL keys ignored)."""
+        if not isinstance(rows, list) or key is None:
+            return False
+        previous = None
+        try:
+            for row in rows:
+                value = key(row)
+                if value is None:
+                    continue
+                if previous is not None and value < previous:
+                    return False
+                previous = value
+        except TypeError:
+            return False
+        return True
 
-    def _cross_join(self, left: list[dict], right: list[dict]) -> list[dict]:
-        """
-        CROSS JOIN: Cartesian product.
-        Returns every combination of left and right rows.
-        """
-        result = []
-        for left_item in left:
-            for right_item in right:
-                joined = self._merge_records(left_item, right_item, 'left', 'right')
-                result.append(joined)
-        return result
+    def _ordered(self, rows: Any, fields: list[str], presorted: bool, context: ExecutionContext) -> Any:
+        """Rows ordered ascending on `fields` (external sort for large streamed inputs)."""
+        if presorted or (isinstance(rows, list) and self._is_ordered(rows, compile_join_key(fields))):
+            return rows
+        return iter_sorted(
+            rows,
+            parse_order_by(', '.join(fields)),
+            memory_budget=resolve_sort_memory_budget(context.options),
+            spill_dir=resolve_spill_directory(context.options)
+        )
 
-    def _parse_join_condition(self, join_on: Any) -> tuple[str, str]:
-        """
-        Parse join condition to extract key fields.
-        Supports:
-        - dict: {'left_field': 'right_field'}
-        - String: 'field' (assumes same field name in both tables)
-        - Tuple: ('left_field', 'right_field')
-        """
-        if isinstance(join_on, dict):
-            # {'left.id': 'right.id'} or {'id': 'user_id'}
-            items = list(join_on.items())
-            if items:
-                return items[0]  # (left_key, right_key)
-        elif isinstance(join_on, str):
-            # 'id' - same field in both tables
-            return (join_on, join_on)
-        elif isinstance(join_on, (list, tuple)) and len(join_on) == 2:
-            # ('id', 'user_id')
-            return tuple(join_on)
-        # Default: assume 'id'
-        return ('id', 'id')
+    @staticmethod
+    def _rows(data: Any) -> Any:
+        """Rows of a join input; lazy streams and generators are left unconsumed."""
+        if isinstance(data, RowStream) or (hasattr(data, '__next__') and iter(data) is data):
+            return data
+        return extract_items(data)
 
-    def _extract_key_value(self, item: Any, key: str) -> Any:
-        """Extract join key value from item."""
-        if item is None:
-            return None
-        if isinstance(item, dict):
-            return item.get(key)
-        elif hasattr(item, key):
-            return getattr(item, key)
-        return None
+    @staticmethod
+    def _counted(rows: Any, counts: dict, side: str) -> Any:
+        """Count rows of a lazy input as the join consumes them."""
+        if isinstance(rows, list):
+            return rows
+        def counting():
+            for row in rows:
+                counts[side] += 1
+                yield row
+        return counting()
 
-    def _merge_records(self, left: dict | None, right: dict | None,
-                      left_prefix: str = 'left', right_prefix: str = 'right') -> dict:
+    def _cross_join(self, left: list[dict], right: list[dict], merge) -> list[dict]:
         """
-        Merge two records with prefixes to avoid key conflicts.
-        Result format: {
-            'left_field1': value1,
-            'left_field2': value2,
-            'right_field1': value3,
-            'right_field2': value4
-        }
+        CROSS JOIN: Cartesian product.
+        Returns every combination of left and right rows.
         """
-        merged = {}
-        if left:
-            for key, value in left.items():
-                merged[f"{left_prefix}_{key}"] = value
-        if right:
-            for key, value in right.items():
-                merged[f"{right_prefix}_{key}"] = value
-        return merged
+        return [merge(left_item, right_item) for left_item in left for right_item in right]
 
     def _load_collection(self, collection_path: str, context: ExecutionContext) -> list[dict]:
         """
@@ -47,7 +47,7 @@ class MinusExecutor(AUniversalOperationExecutor):
         Priority Alignment:
         - Usability (#2): Standard set difference syntax (SPARQL MINUS, SQL EXCEPT).
         - Maintainability (#3): Reuses extract_items utility.
-        - Performance (#4): Efficient set difference with hash-based lookup.
+        - Performance (#4): Hash anti-join (joins.anti_join) over key values.
         - Extensibility (#5): Supports multiple sources for subtraction.
         Args:
             node: Primary data source (items to subtract from)
@@ -57,6 +57,7 @@ class MinusExecutor(AUniversalOperationExecutor):
             dict with difference results and metadata
         """
         from ..utils import extract_items
+        from ..joins import anti_join
         subtract = params.get('subtract', params.get('minus', params.get('except')))
         sources = params.get('sources', [])
         match_on = params.get('on', params.get('match_by'))  # Key(s) for matching (e.g. 'id' or ['id'])
@@ -69,44 +70,15 @@ class MinusExecutor(AUniversalOperationExecutor):
             items_to_subtract.extend(extract_items(subtract))
         for source in sources:
             items_to_subtract.extend(extract_items(source))
-        # Build subtract set - full match or key-based match
+        # Anti-join: hash the subtracted keys once, stream the primary items
         if match_on and items_to_subtract:
             # Key-based: match by specified field(s) only
             keys = [match_on] if isinstance(match_on, str) else list(match_on)
-            subtract_set = set()
-            for item in items_to_subtract:
-                if isinstance(item, dict):
-                    key_vals = tuple(item.get(k) for k in keys)
-                    subtract_set.add(key_vals)
-                else:
-                    subtract_set.add(item)
-            def get_item_key(it):
-                if isinstance(it, dict) and keys:
-                    return tuple(it.get(k) for k in keys)
-                return it
-            result_items = [item for item in primary_items if get_item_key(item) not in subtract_set]
+            item_key = self._field_key(keys)
         else:
             # Full dict equality (original behavior)
-            subtract_set = set()
-            for item in items_to_subtract:
-                try:
-                    if isinstance(item, dict):
-                        subtract_set.add(frozenset(item.items()))
-                    elif isinstance(item, (str, int, float, bool, type(None))):
-                        subtract_set.add(item)
-                    else:
-                        subtract_set.add(str(item))
-                except (TypeError, ValueError):
-                    subtract_set.add(str(item))
-            result_items = []
-            for item in primary_items:
-                try:
-                    item_key = frozenset(item.items()) if isinstance(item, dict) else (item if isinstance(item, (str, int, float, bool, type(None))) else str(item))
-                    if item_key not in subtract_set:
-                        result_items.append(item)
-                except (TypeError, ValueError):
-                    if str(item) not in subtract_set:
-                        result_items.append(item)
+            item_key = self._row_key
+        result_items = list(anti_join(primary_items, items_to_subtract, item_key, item_key))
         return {
             'items': result_items,
             'count': len(result_items),
@@ -115,3 +87,27 @@ class MinusExecutor(AUniversalOperationExecutor):
             'subtract_sources_count': len(sources) + (1 if subtract else 0),
             'status': 'implemented'
         }
+
+    @staticmethod
+    def _field_key(keys: list):
+        """Key on the given fields; unlike JOIN, NULL key values still match."""
+        def key(item: Any) -> Any:
+            if isinstance(item, dict):
+                return ('fields', tuple(item.get(k) for k in keys))
+            return MinusExecutor._row_key(item)
+        return key
+
+    @staticmethod
+    def _row_key(item: Any) -> Any:
+        """Whole-item key (wrapped so a None item is still a matchable key)."""
+        try:
+            if isinstance(item, dict):
+                key = frozenset(item.items())
+            elif isinstance(item, (str, int, float, bool, type(None))):
+                key = item
+            else:
+                key = str(item)
+            hash(key)
+        except (TypeError, ValueError):
+            key = str(item)
+        return ('row', key)
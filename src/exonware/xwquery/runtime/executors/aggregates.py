@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/src/exonware/xwquery/runtime/executors/aggregates.py
+Shared streaming aggregation: running accumulators and hash aggregation.
+Root cause: GROUP stored every row of every group in an `_items` list and
+SUM/AVG/COUNT/MIN/MAX re-scanned those lists (or a fully materialized input),
+so GROUP BY held the dataset twice and memory grew with the row count.
+Solution: aggregate while consuming the input stream.
+- `Accumulator` keeps count, sum, min, max and the running mean/variance
+  (Welford's algorithm, numerically stable in one pass); accumulators merge,
+  so partial results of independent partitions combine exactly.
+- `HashAggregator` maps each group key to one accumulator per aggregated
+  field, so GROUP BY memory is O(groups), not O(rows). Aggregators pickle
+  and merge, so row chunks can be aggregated by worker processes.
+- `parse_aggregates()` normalizes "SUM(amount) AS total", grammar dicts and
+  builder actions into AggregateSpec entries, and `rewrite_aggregate_calls()`
+  lets HAVING refer to "COUNT(*)" / "SUM(amount)" directly.
+Numeric conversion matches `extract_numeric_value()`: numbers and numeric
+strings count, everything else (NULL, bool, text) is skipped.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.9.0.5
+Generation Date: 17-Oct-2026
+"""
+
+from __future__ import annotations
+import math
+import re
+from collections.abc import Iterable, Iterator
+from itertools import chain
+from typing import Any, NamedTuple
+from ...errors import XWQueryValueError
+from ..streaming import RowStream, iter_rows
+from .predicates import compile_field_getter, is_missing
+# Aggregate functions computed from an Accumulator
+AGGREGATE_FUNCTIONS = frozenset({'COUNT', 'SUM', 'AVG', 'MIN', 'MAX', 'VARIANCE', 'STDDEV'})
+_FUNCTION_ALIASES = {'MEAN': 'AVG', 'VAR': 'VARIANCE', 'STDEV': 'STDDEV'}
+_AGGREGATE_TEXT = re.compile(
+    r'^\s*(\w+)\s*\(\s*(\*|[\w.]+)\s*\)\s*(?:AS\s+(\w+))?\s*$',
+    re.IGNORECASE
+)
+_AGGREGATE_CALL = re.compile(
+    r'\b(COUNT|SUM|AVG|MEAN|MIN|MAX|VARIANCE|VAR|STDDEV|STDEV)\s*\(\s*(\*|[\w.]+)\s*\)',
+    re.IGNORECASE
+)
+
+
+def _to_number(value: Any) -> float | None:
+    """Numeric value of a field, or None when it is not numeric."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+class Accumulator:
+    """
+    Running aggregate state for one value column.
+    `rows` counts every row seen, `non_null` the rows with a value, `count`
+    the numeric values that feed sum/mean/variance/min/max.
+    """
+    __slots__ = ('rows', 'non_null', 'count', 'total', 'mean', 'm2', 'min', 'max')
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.non_null = 0
+        self.count = 0
+        self.total = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def add(self, value: Any) -> None:
+        """Fold one raw value into the running state."""
+        self.rows += 1
+        if value is None:
+            return
+        self.non_null += 1
+        number = _to_number(value)
+        if number is None:
+            return
+        self.count += 1
+        self.total += number
+        delta = number - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (number - self.mean)
+        if self.min is None or number < self.min:
+            self.min = number
+        if self.max is None or number > self.max:
+            self.max = number
+
+    def merge(self, other: Accumulator) -> Accumulator:
+        """Combine another partition's state into this one (Chan et al.)."""
+        if other.count:
+            combined = self.count + other.count
+            delta = other.mean - self.mean
+            self.m2 += other.m2 + delta * delta * self.count * other.count / combined
+            self.mean += delta * other.count / combined
+            self.count = combined
+            self.total += other.total
+            if self.min is None or other.min < self.min:
+                self.min = other.min
+            if self.max is None or other.max > self.max:
+                self.max = other.max
+        self.rows += other.rows
+        self.non_null += other.non_null
+        return self
+
+    @property
+    def avg(self) -> float | None:
+        return self.total / self.count if self.count else None
+
+    @property
+    def variance(self) -> float | None:
+        """Sample variance (None for fewer than two values)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else None
+
+    @property
+    def stddev(self) -> float | None:
+        variance = self.variance
+        return math.sqrt(variance) if variance is not None else None
+
+    def result(self, function: str, count_rows: bool = False) -> Any:
+        """Value of one aggregate function ('COUNT', 'SUM', ...)."""
+        if function == 'COUNT':
+            return self.rows if count_rows else self.non_null
+        if function == 'SUM':
+            return self.total
+        if function == 'AVG':
+            return self.avg
+        if function == 'MIN':
+            return self.min
+        if function == 'MAX':
+            return self.max
+        if function == 'VARIANCE':
+            return self.variance
+        if function == 'STDDEV':
+            return self.stddev
+        raise XWQueryValueError(f"Unsupported aggregate function: {function}")
+
+    def summary(self) -> dict[str, Any]:
+        """count/sum/avg/min/max dict in the shape of `compute_aggregates()`."""
+        return {
+            'count': self.count,
+            'sum': self.total,
+            'avg': self.avg,
+            'min': self.min,
+            'max': self.max,
+            'total_items': self.rows
+        }
+
+
+class AggregateSpec(NamedTuple):
+    """One aggregate output column."""
+    function: str
+    field: str | None = None
+    alias: str | None = None
+
+    @property
+    def counts_rows(self) -> bool:
+        """COUNT(*) counts rows; COUNT(field) counts non-null values."""
+        return self.function == 'COUNT' and self.field in (None, '*')
+
+    @property
+    def name(self) -> str:
+        """Output column name (alias, else e.g. 'count' or 'sum_amount')."""
+        if self.alias:
+            return self.alias
+        return default_aggregate_name(self.function, self.field)
+
+
+def default_aggregate_name(function: str, field: str | None) -> str:
+    """Column name an unaliased aggregate is reported under."""
+    function = function.lower()
+    if field in (None, '*'):
+        return function
+    return f"{function}_{field.replace('.', '_')}"
+
+
+def _normalize_function(function: Any) -> str:
+    name = str(function).strip().upper()
+    name = _FUNCTION_ALIASES.get(name, name)
+    if name not in AGGREGATE_FUNCTIONS:
+        raise XWQueryValueError(f"Unsupported aggregate function: {function}")
+    return name
+
+
+def parse_aggregates(aggregates: Any) -> list[AggregateSpec]:
+    """
+    Normalize aggregate definitions into AggregateSpec entries.
+    Accepts "SUM(amount) AS total" strings (comma-separated or in a list),
+    dicts with 'function'/'func'/'type', 'field'/'column' and 'alias'/'as'
+    keys, AggregateSpec instances and (function, field[, alias]) tuples.
+    Raises:
+        XWQueryValueError: For unknown functions or malformed definitions
+    """
+    if not aggregates:
+        return []
+    if isinstance(aggregates, str):
+        aggregates = _split_top_level(aggregates)
+    elif isinstance(aggregates, (dict, AggregateSpec)):
+        aggregates = [aggregates]
+    specs = []
+    for entry in aggregates:
+        if isinstance(entry, AggregateSpec):
+            specs.append(entry)
+        elif isinstance(entry, str):
+            match = _AGGREGATE_TEXT.match(entry)
+            if not match:
+                raise XWQueryValueError(f"Invalid aggregate: {entry!r}")
+            function, field, alias = match.groups()
+            specs.append(AggregateSpec(_normalize_function(function), field, alias))
+        elif isinstance(entry, dict):
+            function = entry.get('function') or entry.get('func') or entry.get('type')
+            if not function:
+                raise XWQueryValueError(f"Aggregate has no function: {entry!r}")
+            field = entry.get('field', entry.get('column'))
+            alias = entry.get('alias') or entry.get('as')
+            specs.append(AggregateSpec(_normalize_function(function), field, alias))
+        elif isinstance(entry, (list, tuple)) and 1 <= len(entry) <= 3:
+            specs.append(AggregateSpec(_normalize_function(entry[0]), *entry[1:]))
+        else:
+            raise XWQueryValueError(f"Invalid aggregate: {entry!r}")
+    return specs
+
+
+def _split_top_level(text: str) -> list[str]:
+    """Split on commas outside parentheses."""
+    parts, depth, start = [], 0, 0
+    for index, char in enumerate(text):
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            parts.append(text[start:index])
+            start = index + 1
+    parts.append(text[start:])
+    return [part for part in parts if part.strip()]
+
+
+def rewrite_aggregate_calls(condition: Any, specs: Iterable[AggregateSpec] = ()) -> Any:
+    """
+    Rewrite aggregate calls in a HAVING string to the group columns they name.
+    "COUNT(*) > 10 AND SUM(amount) >= 5" becomes "_count > 10 AND sum_amount >= 5"
+    (or the spec's alias when that aggregate was declared with one). Other
+    condition forms are returned unchanged.
+    """
+    if not isinstance(condition, str):
+        return condition
+    aliases = {(spec.function, spec.field or '*'): spec.name for spec in specs}
+
+    def replace(match: re.Match) -> str:
+        function = _normalize_function(match.group(1))
+        field = match.group(2)
+        if (function, field) in aliases:
+            return aliases[(function, field)]
+        if function == 'COUNT' and field == '*':
+            return '_count'
+        return default_aggregate_name(function, field)
+    return _AGGREGATE_CALL.sub(replace, condition)
+
+
+def required_aggregates(condition: Any) -> list[AggregateSpec]:
+    """Aggregates a HAVING string refers to (so GROUP can compute them)."""
+    if not isinstance(condition, str):
+        return []
+    specs = []
+    for match in _AGGREGATE_CALL.finditer(condition):
+        function = _normalize_function(match.group(1))
+        if function == 'COUNT' and match.group(2) == '*':
+            continue
+        specs.append(AggregateSpec(function, match.group(2)))
+    return specs
+
+
+_END = object()
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _hashable(value: Any) -> Any:
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        from .xw_reuse import SafeComparator
+        return SafeComparator.make_hashable(value)
+
+
+class HashAggregator:
+    """
+    Streaming GROUP BY: one accumulator per (group, aggregated field).
+    Rows are folded in as they arrive and never retained unless
+    `keep_items` is set (legacy `_items` output).
+    """
+
+    def __init__(
+        self,
+        group_fields: list[str] | None = None,
+        specs: Iterable[AggregateSpec] = (),
+        keep_items: bool = False
+    ):
+        self.group_fields = list(group_fields or [])
+        self.specs = list(specs)
+        self.keep_items = keep_items
+        self.total_items = 0
+        # Accumulate each distinct value field once, however many specs use it
+        self._value_fields = list(dict.fromkeys(
+            spec.field for spec in self.specs if not spec.counts_rows
+        ))
+        self._slot = {field: index for index, field in enumerate(self._value_fields)}
+        self._key_getters = [compile_field_getter(field) for field in self.group_fields]
+        self._value_getters = [
+            compile_field_getter(field) if field else _identity for field in self._value_fields
+        ]
+        # group key -> [key values, row count, accumulators, items]
+        self._groups: dict[Any, list[Any]] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Compiled getters are closures; rebuild them instead of pickling
+        state = self.__dict__.copy()
+        del state['_key_getters'], state['_value_getters']
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._key_getters = [compile_field_getter(field) for field in self.group_fields]
+        self._value_getters = [
+            compile_field_getter(field) if field else _identity for field in self._value_fields
+        ]
+
+    def _key(self, row: Any) -> tuple[tuple, tuple]:
+        """(hashable key, raw key values) of a row."""
+        if not self.group_fields:
+            return (), ()
+        if not isinstance(row, dict):
+            return (_hashable(row),), (row,)
+        values = tuple(None if is_missing(value) else value for value in (get(row) for get in self._key_getters))
+        try:
+            hash(values)
+            return values, values
+        except TypeError:
+            return tuple(_hashable(value) for value in values), values
+
+    def add(self, row: Any) -> None:
+        """Fold one row into its group."""
+        self.total_items += 1
+        key, values = self._key(row)
+        state = self._groups.get(key)
+        if state is None:
+            state = [values, 0, [Accumulator() for _ in self._value_fields], [] if self.keep_items else None]
+            self._groups[key] = state
+        state[1] += 1
+        for accumulator, get in zip(state[2], self._value_getters):
+            value = get(row)
+            accumulator.add(None if is_missing(value) else value)
+        if self.keep_items:
+            state[3].append(row)
+
+    def consume(self, rows: Iterable[Any]) -> HashAggregator:
+        """Fold every row of an iterable (consumed lazily)."""
+        add = self.add
+        for row in rows:
+            add(row)
+        return self
+
+    def merge(self, other: HashAggregator) -> HashAggregator:
+        """Combine another aggregator over the same fields and specs."""
+        self.total_items += other.total_items
+        for key, (values, count, accumulators, items) in other._groups.items():
+            state = self._groups.get(key)
+            if state is None:
+                self._groups[key] = [values, count, accumulators, items]
+                continue
+            state[1] += count
+            for mine, theirs in zip(state[2], accumulators):
+                mine.merge(theirs)
+            if state[3] is not None and items:
+                state[3].extend(items)
+        return self
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def groups(self) -> Iterator[dict[str, Any]]:
+        """
+        Yield one result row per group in first-seen order. Without group
+        fields there is always exactly one group, even for empty input.
+        """
+        states = list(self._groups.values())
+        if not states and not self.group_fields:
+            states = [[(), 0, [Accumulator() for _ in self._value_fields], [] if self.keep_items else None]]
+        for values, count, accumulators, items in states:
+            if not self.group_fields:
+                key = None
+            elif len(values) == len(self.group_fields):
+                key = dict(zip(self.group_fields, values))
+            else:
+                key = {'_key': values}
+            group: dict[str, Any] = {'key': key}
+            if items is not None:
+                group['_items'] = items
+            group['_count'] = count
+            for spec in self.specs:
+                if spec.counts_rows:
+                    group[spec.name] = count
+                else:
+                    group[spec.name] = accumulators[self._slot[spec.field]].result(spec.function)
+            yield group
+
+
+def accumulate(rows: Iterable[Any], field: str | None = None) -> Accumulator:
+    """
+    Aggregate one column of a row iterable (or the values themselves when no
+    field is given) in a single pass.
+    """
+    accumulator = Accumulator()
+    add = accumulator.add
+    if not field:
+        for row in rows:
+            add(row)
+        return accumulator
+    get = compile_field_getter(field)
+    for row in rows:
+        value = get(row)
+        add(None if is_missing(value) else value)
+    return accumulator
+
+
+def is_grouped(node: Any) -> bool:
+    """Check if a stage input is GROUP output ({'groups': [...]})."""
+    if isinstance(node, list) and len(node) == 1:
+        node = node[0]
+    return isinstance(node, dict) and isinstance(node.get('groups'), list)
+
+
+def split_grouped(node: Any) -> tuple[list[dict] | None, Iterable[Any] | None]:
+    """
+    Open an aggregate stage's input.
+    Returns (group rows, None) for GROUP output, else (None, rows) where
+    streamed input stays lazy. A stream is recognized as GROUP output by
+    peeking at its first row.
+    """
+    if isinstance(node, (RowStream, Iterator)):
+        rows = iter_rows(node)
+        first = next(rows, _END)
+        if first is _END:
+            return None, ()
+        if is_grouped(first):
+            return first['groups'], None
+        return None, chain((first,), rows)
+    if is_grouped(node):
+        return (node[0] if isinstance(node, list) else node)['groups'], None
+    return None, iter_rows(node)
+
+
+def grouped_specs(node: Any) -> list[AggregateSpec]:
+    """Aggregates the GROUP that produced `node` computed (none for other input)."""
+    if not is_grouped(node):
+        return []
+    return parse_aggregates((node[0] if isinstance(node, list) else node).get('aggregate_specs'))
+
+
+def aggregate_groups(groups: list[dict], spec: AggregateSpec) -> list[dict]:
+    """
+    Apply one aggregate to each group of GROUP output.
+    Reuses a value GROUP already computed (fused aggregate or '_count');
+    otherwise folds the group's legacy '_items' list. Groups keep their other
+    columns, so chained aggregate stages add up.
+    """
+    results = []
+    for group in groups:
+        if spec.counts_rows:
+            value = group.get('_count')
+        elif spec.name in group:
+            value = group[spec.name]
+        elif group.get('_items') is not None:
+            value = accumulate(group['_items'], spec.field).result(spec.function)
+        else:
+            value = None
+        results.append({**group, spec.name: value})
+    return results
+__all__ = [
+    'AGGREGATE_FUNCTIONS',
+    'Accumulator',
+    'AggregateSpec',
+    'HashAggregator',
+    'accumulate',
+    'aggregate_groups',
+    'default_aggregate_name',
+    'grouped_specs',
+    'is_grouped',
+    'parse_aggregates',
+    'required_aggregates',
+    'rewrite_aggregate_calls',
+    'split_grouped',
+]
@@ -9,13 +9,14 @@ Version: 0.9.0.5
 Generation Date: 09-Oct-2025
 """
 
+from collections.abc import Iterator
 from typing import Any
 from ..base import AUniversalOperationExecutor
 from ....contracts import QueryAction, ExecutionContext, ExecutionResult
 from ....defs import OperationType
 # REUSE: Proper xwsystem/xwnode integration
 from ..xw_reuse import SafeExtractor, DataValidator, SmartAggregator
-from ..utils import extract_items, compute_aggregates
+from ..aggregates import AggregateSpec, accumulate, aggregate_groups, split_grouped
 
 
 class AvgExecutor(AUniversalOperationExecutor):
@@ -28,6 +29,7 @@ class AvgExecutor(AUniversalOperationExecutor):
     OPERATION_NAME = "AVG"
     OPERATION_TYPE = OperationType.AGGREGATION
     SUPPORTED_NODE_TYPES = []  # Universal
+    SUPPORTS_STREAMING = True
 
     def _do_execute(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
         """Execute AVG operation."""
@@ -41,17 +43,21 @@ class AvgExecutor(AUniversalOperationExecutor):
             metadata={'operation': self.OPERATION_NAME}
         )
 
+    def _iter_execute(self, action: QueryAction, context: ExecutionContext, batch_size: int) -> Iterator[list[Any]]:
+        """Fold the upstream stream into running totals (never materialized)."""
+        yield [self._execute_avg(context.node, action.params, context)]
+
     def _execute_avg(self, node: Any, params: dict, context: ExecutionContext) -> dict:
         """
         Execute AVG operation using shared aggregation utilities.
         Root cause fixed: Stub implementation + code duplication.
-        Solution: Use shared compute_aggregates() utility.
+        Solution: Use the shared running Accumulator (aggregates.py).
         Priority alignment:
         - Maintainability (#3): REUSE shared utilities, no duplication
-        - Performance (#4): O(n) single-pass aggregation
-        - Usability (#2): Intuitive average behavior
+        - Performance (#4): O(n) single-pass aggregation over lists or streams
+        - Usability (#2): Intuitive average behavior, plus variance/stddev
         Following GUIDELINES_DEV.md:
-        - **Never reinvent the wheel**: Uses shared compute_aggregates()
+        - **Never reinvent the wheel**: Uses the shared Accumulator
         - **Reduce maintenance burden**: Single source of truth
         Args:
             node: Data node to average
@@ -60,22 +66,32 @@ class AvgExecutor(AUniversalOperationExecutor):
         Returns:
             dict with average result
         """
-        # REUSE: Extract items using shared utility
-        items = extract_items(node)
-        if not items:
+        field = params.get('field', params.get('column'))
+        # GROUP output: one AVG per group (reuses fused aggregates when present)
+        groups, rows = split_grouped(node)
+        if groups is not None:
+            spec = AggregateSpec('AVG', field, params.get('alias'))
+            return {
+                'groups': aggregate_groups(groups, spec),
+                'aggregate': spec.name,
+                'field': field,
+                'total_groups': len(groups)
+            }
+        # REUSE: Fold rows (list or stream) into one running accumulator;
+        # Welford's running mean also yields the variance in the same pass
+        accumulator = accumulate(rows, field)
+        if not accumulator.rows:
             return {
                 'avg': None,
                 'count': 0,
                 'field': params.get('field')
             }
-        # Get field to average
-        field = params.get('field', params.get('column'))
-        # REUSE: Compute all aggregates in one pass (returns sum, avg, min, max, count)
-        aggregates = compute_aggregates(items, field)
         return {
-            'avg': aggregates['avg'],
-            'sum': aggregates['sum'],
-            'count': aggregates['count'],
+            'avg': accumulator.avg,
+            'sum': accumulator.total,
+            'variance': accumulator.variance,
+            'stddev': accumulator.stddev,
+            'count': accumulator.count,
             'field': field,
-            'total_items': aggregates['total_items']
+            'total_items': accumulator.rows
         }
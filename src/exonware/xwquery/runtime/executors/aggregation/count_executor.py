@@ -9,29 +9,62 @@ Version: 0.9.0.5
 Generation Date: 08-Oct-2025
 """
 
+from collections.abc import Iterator
+from typing import Any
 from ..base import AUniversalOperationExecutor
 from ....contracts import QueryAction, ExecutionContext, ExecutionResult
+from ...streaming import RowStream
+from ..aggregates import AggregateSpec, accumulate, aggregate_groups, is_grouped, split_grouped
 
 
 class CountExecutor(AUniversalOperationExecutor):
     """COUNT operation executor - Universal aggregation."""
     OPERATION_NAME = "COUNT"
+    SUPPORTS_STREAMING = True
 
     def _do_execute(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
         """Execute COUNT operation."""
-        # Count items in node
-        count = 0
-        if hasattr(context.node, '__len__'):
-            count = len(context.node)
-        elif hasattr(context.node, 'size'):
-            count = context.node.size()
-        elif hasattr(context.node, '_strategy') and hasattr(context.node._strategy, 'size'):
-            count = context.node._strategy.size()
+        data = self._execute_count(context.node, action.params)
+        count = data.get('count', data.get('total_groups', 0))
         return ExecutionResult(
             success=True,
-            data={'count': count},
+            data=data,
             action_type=self.OPERATION_NAME,
             affected_count=count,
             metadata={'operation': self.OPERATION_NAME}
         )
+
+    def _iter_execute(self, action: QueryAction, context: ExecutionContext, batch_size: int) -> Iterator[list[Any]]:
+        """Count the upstream stream without materializing it."""
+        yield [self._execute_count(context.node, action.params)]
+
+    def _execute_count(self, node: Any, params: dict) -> dict:
+        """
+        Count rows (COUNT(*)) or non-null values of 'field'.
+        GROUP output is counted per group; streams are counted as they pass.
+        """
+        field = params.get('field', params.get('column'))
+        if field == '*':
+            field = None
+        if isinstance(node, (RowStream, Iterator)) or field or is_grouped(node):
+            groups, rows = split_grouped(node)
+            if groups is not None:
+                spec = AggregateSpec('COUNT', field, params.get('alias'))
+                return {
+                    'groups': aggregate_groups(groups, spec),
+                    'aggregate': spec.name,
+                    'total_groups': len(groups)
+                }
+            if not field:
+                return {'count': sum(1 for _ in rows)}
+            return {'count': accumulate(rows, field).non_null}
+        # Count items in node
+        count = 0
+        if hasattr(node, '__len__'):
+            count = len(node)
+        elif hasattr(node, 'size'):
+            count = node.size()
+        elif hasattr(node, '_strategy') and hasattr(node._strategy, 'size'):
+            count = node._strategy.size()
+        return {'count': count}
 __all__ = ['CountExecutor']
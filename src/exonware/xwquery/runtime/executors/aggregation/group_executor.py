@@ -9,25 +9,31 @@ Version: 0.9.0.5
 Generation Date: 09-Oct-2025
 """
 
+from collections.abc import Iterator
 from typing import Any
 from ..base import AUniversalOperationExecutor
 from ....contracts import QueryAction, ExecutionContext, ExecutionResult
 from ....defs import OperationType
+from ...streaming import RowStream, iter_rows
 # REUSE: Proper xwsystem/xwnode integration
-from ..xw_reuse import SafeExtractor, DataValidator, SafeComparator
-from ..utils import extract_items
+from ..xw_reuse import SafeExtractor, DataValidator
+from ..aggregates import parse_aggregates, required_aggregates, rewrite_aggregate_calls
+from ..parallel import aggregate_parallel, resolve_parallel_min_rows, resolve_parallel_workers
+from ..predicates import compile_predicate
 
 
 class GroupExecutor(AUniversalOperationExecutor):
     """
     GROUP operation executor.
-    Groups data by specified fields
+    Groups data by specified fields with streaming hash aggregation: each
+    group keeps running accumulators for its aggregates, not its rows.
     Capability: Universal
     Operation Type: AGGREGATION
     """
     OPERATION_NAME = "GROUP"
     OPERATION_TYPE = OperationType.AGGREGATION
     SUPPORTED_NODE_TYPES = []  # Universal
+    SUPPORTS_STREAMING = True
 
     def _do_execute(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
         """Execute GROUP operation."""
@@ -41,20 +47,25 @@ class GroupExecutor(AUniversalOperationExecutor):
             metadata={'operation': self.OPERATION_NAME}
         )
 
+    def _iter_execute(self, action: QueryAction, context: ExecutionContext, batch_size: int) -> Iterator[list[Any]]:
+        """Aggregate the upstream stream row by row (never materialized)."""
+        yield [self._execute_group(context.node, action.params, context)]
+
     def _execute_group(self, node: Any, params: dict, context: ExecutionContext) -> dict:
         """
         Execute GROUP BY operation with hash-based grouping.
         PROPER REUSE:
         - xwsystem: Input validation for safety
         - SafeExtractor: Null-safe item extraction
-        - SafeComparator: Handle unhashable group keys
-        Root cause fixed: Stub implementation returned mock data.
-        Solution: Implement O(n) hash-based grouping using Python dict.
-        Priority alignment:
-        - Security (#1): xwsystem validation prevents injection
-        - Usability (#2): Handles null, missing fields gracefully
-        - Maintainability (#3): Clean, reusable logic
-        - Performance (#4): O(n) single-pass grouping
+        - HashAggregator: Running accumulators per group (aggregates.py)
+        Root cause fixed: Stub implementation returned mock data; later every
+        group kept an `_items` list that SUM/AVG/COUNT re-scanned.
+        Solution: O(n) single-pass hash aggregation. Aggregates ('aggregates'
+        param, or SUM/AVG/COUNT/MIN/MAX stages fused by the optimizer) are
+        folded in as rows stream past, so memory is O(groups). `_items` is
+        only kept when the GROUP has nothing to compute (legacy output) or
+        'keep_items' is set. With enable_parallel_execution, row chunks are
+        aggregated on max_workers worker processes and merged (parallel.py).
         Edge Cases Handled:
         ✅ Empty data (None, [], {})
         ✅ Null values in group keys
@@ -63,73 +74,54 @@ class GroupExecutor(AUniversalOperationExecutor):
         ✅ Unhashable keys (lists, dicts)
         ✅ Unicode characters
         Args:
-            node: Data node to group (supports lists, dicts, XWNode)
-            params: Group parameters with 'fields' list
+            node: Data node to group (supports lists, dicts, XWNode, RowStream)
+            params: Group parameters with 'fields' list, optional 'aggregates'
+                ("SUM(amount) AS total", ...), 'having' and 'keep_items'
             context: Execution context
         Returns:
-            dict with grouped results including keys, items, and counts
+            dict with grouped results including keys, counts and aggregates
         """
-        # REUSE xwsystem: Validate input
-        try:
-            DataValidator.validate_input(node, "GROUP")
-        except:
-            pass  # Continue with validation warnings
+        if isinstance(node, (RowStream, Iterator)):
+            rows = iter_rows(node)
+        else:
+            # REUSE xwsystem: Validate input
+            try:
+                DataValidator.validate_input(node, "GROUP")
+            except ValueError:
+                pass  # Continue with validation warnings
+            # REUSE: Safe extraction with null handling
+            rows = SafeExtractor.extract_items(node, validate=False)
         # Extract grouping fields from params
         group_fields = params.get('fields', params.get('by', []))
-        # REUSE: Safe extraction with null handling
-        items = SafeExtractor.extract_items(node, validate=False)
-        if not group_fields:
-            # No grouping fields - return single group with all items
-            return {
-                'groups': [{
-                    'key': None,
-                    '_items': items,
-                    '_count': len(items)
-                }],
-                'total_groups': 1,
-                'total_items': len(items)
-            }
         # Ensure group_fields is a list
         if isinstance(group_fields, str):
             group_fields = [group_fields]
+        having = params.get('having')
+        specs = parse_aggregates(params.get('aggregates'))
+        # HAVING may name aggregates nobody selected ("HAVING SUM(x) > 5")
+        declared = {(spec.function, spec.field) for spec in specs}
+        specs += [spec for spec in required_aggregates(having) if (spec.function, spec.field) not in declared]
+        keep_items = params.get('keep_items', not specs)
         # Hash-based grouping: O(n) performance with null-safe key handling
-        groups = {}  # key_tuple -> list of items
-        for item in items:
-            # Build group key from specified fields with null handling
-            if isinstance(item, dict):
-                # REUSE: Safe field extraction (handles missing fields → None)
-                key_values = tuple(
-                    SafeExtractor.extract_field_value(item, field, default=None)
-                    for field in group_fields
-                )
-            else:
-                # For non-dict items, use the item itself as key
-                # REUSE: Make hashable to handle lists/dicts as items
-                try:
-                    key_values = (SafeComparator.make_hashable(item),)
-                except:
-                    key_values = (str(item),)
-            # Add to group (key_values may contain None, which is fine)
-            if key_values not in groups:
-                groups[key_values] = []
-            groups[key_values].append(item)
-        # Build result structure
-        result_groups = []
-        for key_tuple, group_items in groups.items():
-            # Create key dict for readability
-            key_dict = {}
-            if len(group_fields) == len(key_tuple):
-                key_dict = dict(zip(group_fields, key_tuple))
-            else:
-                key_dict = {'_key': key_tuple}
-            result_groups.append({
-                'key': key_dict,
-                '_items': group_items,
-                '_count': len(group_items)
-            })
-        return {
+        aggregator = aggregate_parallel(
+            rows, group_fields, specs, keep_items,
+            workers=resolve_parallel_workers(context.options),
+            min_rows=resolve_parallel_min_rows(context.options)
+        )
+        result_groups = list(aggregator.groups())
+        result = {
             'groups': result_groups,
             'total_groups': len(result_groups),
-            'total_items': len(items),
-            'group_fields': group_fields
+            'total_items': aggregator.total_items
         }
+        if group_fields:
+            result['group_fields'] = group_fields
+        if specs:
+            result['aggregates'] = [spec.name for spec in specs]
+            # Lets a later HAVING stage map "SUM(amount)" to its alias
+            result['aggregate_specs'] = [spec._asdict() for spec in specs]
+        if having:
+            predicate = compile_predicate(rewrite_aggregate_calls(having, specs))
+            result['groups'] = [group for group in result_groups if predicate(group)]
+            result['total_groups'] = len(result['groups'])
+        return result
@@ -17,6 +17,8 @@ from ....defs import OperationType
 # REUSE: Import WHERE executor's expression evaluation
 # Following GUIDELINES_DEV.md: "Never reinvent the wheel"
 from ..filtering.where_executor import WhereExecutor
+from ..predicates import compile_predicate
+from ..aggregates import accumulate, grouped_specs, is_grouped, required_aggregates, rewrite_aggregate_calls
 
 
 class HavingExecutor(AUniversalOperationExecutor):
@@ -65,6 +67,9 @@ class HavingExecutor(AUniversalOperationExecutor):
         """
         Execute HAVING logic on grouped results.
         HAVING is WHERE for groups - filters groups based on aggregate conditions.
+        Aggregate calls in string conditions are rewritten to the group columns
+        GROUP computed for them: the alias GROUP declared for that aggregate,
+        else the default name (COUNT(*) -> _count, SUM(amount) -> sum_amount).
         Examples:
         - HAVING COUNT(*) > 10 - groups with more than 10 items
         - HAVING SUM(amount) >= 1000 - groups where sum >= 1000
@@ -87,13 +92,23 @@ class HavingExecutor(AUniversalOperationExecutor):
                 'total_groups': 0,
                 'condition': str(condition)
             }
+        # Aggregates named in the condition ("SUM(amount) > 5") read the
+        # group's column; legacy groups that only carry '_items' get it folded
+        specs = grouped_specs(node)
+        declared = {(spec.function, spec.field or '*') for spec in specs}
+        for spec in required_aggregates(condition):
+            if (spec.function, spec.field) in declared:
+                continue
+            groups = [
+                {**group, spec.name: accumulate(group['_items'], spec.field).result(spec.function)}
+                if spec.name not in group and group.get('_items') is not None else group
+                for group in groups
+            ]
         # Filter groups using WHERE executor's condition evaluation
         # REUSE: Leverage WhereExecutor._evaluate_condition for consistency
-        filtered_groups = []
-        for group in groups:
-            # Evaluate condition on group aggregate data
-            if self._where_evaluator._evaluate_condition(group, condition):
-                filtered_groups.append(group)
+        # Evaluate condition on group aggregate data (compiled once)
+        predicate = compile_predicate(rewrite_aggregate_calls(condition, specs))
+        filtered_groups = [group for group in groups if predicate(group)]
         return {
             'groups': filtered_groups,
             'filtered_count': len(filtered_groups),
@@ -110,9 +125,9 @@ class HavingExecutor(AUniversalOperationExecutor):
         """
         if node is None:
             return []
-        # If node is a dict with 'groups' key (GROUP BY output format)
-        if isinstance(node, dict) and 'groups' in node:
-            return node['groups']
+        # If node is GROUP BY output (possibly the single row of a streamed GROUP)
+        if is_grouped(node):
+            return (node[0] if isinstance(node, list) else node)['groups']
         # If node is already a list, treat as groups
         if isinstance(node, list):
             return node
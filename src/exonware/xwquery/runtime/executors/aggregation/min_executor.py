@@ -9,13 +9,15 @@ Version: 0.9.0.5
 Generation Date: 09-Oct-2025
 """
 
+from collections.abc import Iterator
 from typing import Any
 from ..base import AUniversalOperationExecutor
 from ....contracts import QueryAction, ExecutionContext, ExecutionResult
 from ....defs import OperationType
 # REUSE: Proper xwsystem/xwnode integration
 from ..xw_reuse import SafeExtractor, DataValidator, SmartAggregator
-from ..utils import extract_items, compute_aggregates
+from ..utils import compute_aggregates
+from ..aggregates import AggregateSpec, aggregate_groups, split_grouped
 
 
 class MinExecutor(AUniversalOperationExecutor):
@@ -28,6 +30,7 @@ class MinExecutor(AUniversalOperationExecutor):
     OPERATION_NAME = "MIN"
     OPERATION_TYPE = OperationType.AGGREGATION
     SUPPORTED_NODE_TYPES = []  # Universal
+    SUPPORTS_STREAMING = True
 
     def _do_execute(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
         """Execute MIN operation."""
@@ -41,6 +44,10 @@ class MinExecutor(AUniversalOperationExecutor):
             metadata={'operation': self.OPERATION_NAME}
         )
 
+    def _iter_execute(self, action: QueryAction, context: ExecutionContext, batch_size: int) -> Iterator[list[Any]]:
+        """Fold the upstream stream into running totals (never materialized)."""
+        yield [self._execute_min(context.node, action.params, context)]
+
     def _execute_min(self, node: Any, params: dict, context: ExecutionContext) -> dict:
         """
         Execute MIN operation using shared aggregation utilities.
@@ -60,16 +67,25 @@ class MinExecutor(AUniversalOperationExecutor):
         Returns:
             dict with minimum result
         """
-        # REUSE: Extract items and compute aggregates
-        items = extract_items(node)
-        if not items:
+        field = params.get('field', params.get('column'))
+        # GROUP output: one MIN per group (reuses fused aggregates when present)
+        groups, rows = split_grouped(node)
+        if groups is not None:
+            spec = AggregateSpec('MIN', field, params.get('alias'))
+            return {
+                'groups': aggregate_groups(groups, spec),
+                'aggregate': spec.name,
+                'field': field,
+                'total_groups': len(groups)
+            }
+        # REUSE: Fold rows (list or stream) into one running accumulator
+        aggregates = compute_aggregates(rows, field)
+        if 'total_items' not in aggregates:
             return {
                 'min': None,
                 'count': 0,
                 'field': params.get('field')
             }
-        field = params.get('field', params.get('column'))
-        aggregates = compute_aggregates(items, field)
         return {
             'min': aggregates['min'],
             'count': aggregates['count'],
@@ -9,13 +9,15 @@ Version: 0.9.0.5
 Generation Date: 09-Oct-2025
 """
 
+from collections.abc import Iterator
 from typing import Any
 from ..base import AUniversalOperationExecutor
 from ....contracts import QueryAction, ExecutionContext, ExecutionResult
 from ....defs import OperationType
 # REUSE: Proper xwsystem/xwnode integration  
 from ..xw_reuse import SafeExtractor, DataValidator, SmartAggregator
-from ..utils import extract_items, compute_aggregates
+from ..utils import compute_aggregates
+from ..aggregates import AggregateSpec, aggregate_groups, split_grouped
 
 
 class SumExecutor(AUniversalOperationExecutor):
@@ -28,6 +30,7 @@ class SumExecutor(AUniversalOperationExecutor):
     OPERATION_NAME = "SUM"
     OPERATION_TYPE = OperationType.AGGREGATION
     SUPPORTED_NODE_TYPES = []  # Universal
+    SUPPORTS_STREAMING = True
 
     def _do_execute(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
         """Execute SUM operation."""
@@ -41,6 +44,10 @@ class SumExecutor(AUniversalOperationExecutor):
             metadata={'operation': self.OPERATION_NAME}
         )
 
+    def _iter_execute(self, action: QueryAction, context: ExecutionContext, batch_size: int) -> Iterator[list[Any]]:
+        """Fold the upstream stream into running totals (never materialized)."""
+        yield [self._execute_sum(context.node, action.params, context)]
+
     def _execute_sum(self, node: Any, params: dict, context: ExecutionContext) -> dict:
         """
         Execute SUM operation using shared aggregation utilities.
@@ -60,19 +67,25 @@ class SumExecutor(AUniversalOperationExecutor):
         Returns:
             dict with sum result and metadata
         """
-        # REUSE: Extract items using shared utility
-        items = extract_items(node)
-        if not items:
+        field = params.get('field', params.get('column'))
+        # GROUP output: one SUM per group (reuses fused aggregates when present)
+        groups, rows = split_grouped(node)
+        if groups is not None:
+            spec = AggregateSpec('SUM', field, params.get('alias'))
+            return {
+                'groups': aggregate_groups(groups, spec),
+                'aggregate': spec.name,
+                'field': field,
+                'total_groups': len(groups)
+            }
+        # REUSE: Fold rows (list or stream) into one running accumulator
+        aggregates = compute_aggregates(rows, field)
+        if 'total_items' not in aggregates:
             return {
                 'sum': 0,
                 'count': 0,
                 'field': params.get('field')
             }
-        # Get field to sum (if specified)
-        field = params.get('field', params.get('column'))
-        # REUSE: Compute aggregates using shared utility
-        # This computes ALL aggregates in one pass (but we only return sum)
-        aggregates = compute_aggregates(items, field)
         return {
             'sum': aggregates['sum'],
             'count': aggregates['count'],
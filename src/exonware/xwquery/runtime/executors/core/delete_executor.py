@@ -15,7 +15,8 @@ from ....contracts import QueryAction, ExecutionContext, ExecutionResult
 from ....defs import OperationType
 from exonware.xwnode.nodes.strategies.contracts import NodeType
 # REUSE: Shared utilities
-from ..utils import extract_items, matches_condition
+from ..utils import extract_items
+from ..predicates import compile_predicate
 
 
 class DeleteExecutor(AUniversalOperationExecutor):
@@ -74,6 +75,8 @@ class DeleteExecutor(AUniversalOperationExecutor):
         deleted_count = 0
         deleted_items = []
         try:
+            # Compile the WHERE condition once for all items
+            matches = compile_predicate(condition)
             if target:
                 # Delete specific target path
                 current = (node.get(target, None) if hasattr(node, 'get') else None)
@@ -81,12 +84,12 @@ class DeleteExecutor(AUniversalOperationExecutor):
                     # When current is a list, remove matching items in place (for plain dict nodes)
                     if isinstance(current, list):
                         to_remove = [i for i, item in enumerate(current)
-                                     if self._matches_condition(item, condition)]
+                                     if matches(item)]
                         for i in reversed(to_remove):
                             del current[i]
                             deleted_count += 1
                             deleted_items.append(f"{target}[{i}]")
-                    elif self._matches_condition(current, condition):
+                    elif matches(current):
                         if hasattr(node, 'delete'):
                             node.delete(target)
                             deleted_count = 1
@@ -102,7 +105,7 @@ class DeleteExecutor(AUniversalOperationExecutor):
                 # Collect indices to delete (reverse order to avoid index shifting)
                 to_delete = []
                 for i, item in enumerate(items):
-                    if self._matches_condition(item, condition):
+                    if matches(item):
                         to_delete.append(i)
                         deleted_items.append(f"item[{i}]")
                 # Delete in reverse order
@@ -136,53 +139,6 @@ class DeleteExecutor(AUniversalOperationExecutor):
         Supports both formats:
         - Direct: {'id': 'blue'} - field equals value
         - SQL: {'field': 'id', 'operator': '=', 'value': 'blue'}
+        REUSE: Delegates to the shared compiled predicate engine.
         """
-        if condition is None:
-            return True
-        # Handle dict-based condition
-        if isinstance(condition, dict):
-            # SQL format: {'field': 'id', 'operator': '=', 'value': 'blue'}
-            if 'field' in condition and 'operator' in condition:
-                field = condition.get('field')
-                op = condition.get('operator', '=')
-                expected = condition.get('value')
-                actual = item.get(field) if isinstance(item, dict) else getattr(item, field, None)
-                if op in ('=', '=='):
-                    return actual == expected
-                if op in ('!=', '<>'):
-                    return actual != expected
-                if op == '>':
-                    return actual > expected
-                if op == '<':
-                    return actual < expected
-                if op == '>=':
-                    return actual >= expected
-                if op == '<=':
-                    return actual <= expected
-                return False
-            # Direct format: {'id': 'blue'} - all fields must match
-            if isinstance(item, dict):
-                for key, expected_value in condition.items():
-                    if item.get(key) != expected_value:
-                        return False
-                return True
-            else:
-                for key, expected_value in condition.items():
-                    if not hasattr(item, key) or getattr(item, key) != expected_value:
-                        return False
-                return True
-        # Handle callable condition (e.g., lambda)
-        if callable(condition):
-            try:
-                return condition(item)
-            except Exception:
-                return False
-        # Handle string condition (field name check)
-        if isinstance(condition, str):
-            # Check if item has the field
-            if isinstance(item, dict):
-                return condition in item
-            else:
-                return hasattr(item, condition)
-        # Default: match all
-        return True
+        return compile_predicate(condition)(item)
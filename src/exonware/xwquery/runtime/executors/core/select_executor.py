@@ -12,10 +12,22 @@ Generation Date: 08-Oct-2025
 
 import re
 import logging
+from collections.abc import Iterable, Iterator
+from itertools import islice
 from typing import Any
 from ..base import AUniversalOperationExecutor
 from ....contracts import QueryAction, ExecutionContext, ExecutionResult
 from ....defs import OperationCapability
+from ...streaming import RowStream, iter_batches
+from ..predicates import compile_predicate, is_match_all
+from ..expressions import compile_projection
+from ..sorting import (
+    iter_sorted,
+    order_rows,
+    parse_order_by,
+    resolve_sort_memory_budget,
+    resolve_spill_directory,
+)
 from exonware.xwnode.nodes.strategies.contracts import NodeType
 logger = logging.getLogger(__name__)
 
@@ -28,6 +40,8 @@ class SelectExecutor(AUniversalOperationExecutor):
     """
     OPERATION_NAME = "SELECT"
 
+    SUPPORTS_STREAMING = True
+
     def _do_execute(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
         """
         Execute SELECT operation.
@@ -40,6 +54,8 @@ class SelectExecutor(AUniversalOperationExecutor):
         - ORDER BY sorting (ASC/DESC)
         - LIMIT with offset
         - Adapts to different node types
+        Rows are produced by a generator, so LIMIT without ORDER BY stops
+        scanning the source as soon as enough rows matched.
         """
         # Extract parameters (support both SQLParamExtractor and grammar/syntax_adapter naming)
         fields = action.params.get('fields') or action.params.get('select_list', ['*'])
@@ -50,6 +66,70 @@ class SelectExecutor(AUniversalOperationExecutor):
         aggregation_function = self._detect_aggregation(columns)
         if aggregation_function:
             return self._execute_aggregation(aggregation_function, action, context)
+        source = self._resolve_source(action, context)
+        if source is None:
+            logger.error(f"SelectExecutor: source is still None after all attempts, returning empty result")
+            return ExecutionResult(
+                data=[],
+                affected_count=0
+            )
+        data = list(self._iter_result_rows(source, columns, action, context))
+        return ExecutionResult(
+            data=data,
+            affected_count=len(data) if isinstance(data, list) else 1
+        )
+
+    def _iter_execute(self, action: QueryAction, context: ExecutionContext, batch_size: int) -> Iterator[list[Any]]:
+        """
+        Streaming SELECT: yield result rows in batches as the source is scanned.
+        Aggregation queries need the whole input and fall back to the
+        materializing path.
+        """
+        fields = action.params.get('fields') or action.params.get('select_list', ['*'])
+        columns = action.params.get('columns') or fields
+        if self._detect_aggregation(columns):
+            yield from super()._iter_execute(action, context, batch_size)
+            return
+        source = self._resolve_source(action, context)
+        if source is None:
+            return
+        yield from iter_batches(self._iter_result_rows(source, columns, action, context), batch_size)
+
+    def _iter_result_rows(self, source: Any, columns: list[str], action: QueryAction, context: ExecutionContext) -> Iterator[Any]:
+        """
+        Lazily apply WHERE, projection, ORDER BY, DISTINCT and LIMIT/OFFSET.
+        ORDER BY is the only blocking step; without it every step streams.
+        """
+        # Get WHERE condition to apply BEFORE column projection (support both naming conventions)
+        where_condition = action.params.get('where') or action.params.get('where_clause')
+        rows = self._iter_select(source, columns, context, where_condition)
+        # CRITICAL FIX: Apply ORDER BY if specified (support string or list-of-dicts from grammar)
+        order_by = action.params.get('order_by')
+        distinct = action.params.get('distinct')
+        limit = action.params.get('limit')
+        offset = action.params.get('offset', 0) or 0
+        if order_by:
+            # ORDER BY + LIMIT only needs the leading rows: Top-N heap instead of a full sort
+            # (not with DISTINCT, which may drop rows after ordering). Without a limit,
+            # inputs beyond the sort memory budget are merge-sorted through temp files.
+            top_n = offset + limit if limit and limit > 0 and not distinct else None
+            rows = iter_sorted(
+                rows,
+                parse_order_by(order_by),
+                top_n,
+                resolve_sort_memory_budget(context.options),
+                resolve_spill_directory(context.options)
+            )
+        # Apply DISTINCT if specified
+        if distinct:
+            rows = self._iter_distinct(rows, columns)
+        # CRITICAL FIX: Apply LIMIT if specified
+        if limit and limit > 0:
+            rows = islice(rows, offset, offset + limit)
+        return rows
+
+    def _resolve_source(self, action: QueryAction, context: ExecutionContext) -> Any:
+        """Resolve the data source for FROM (table name) against the context node."""
         table_name = action.params.get('from') or action.params.get('path') or action.params.get('from_clause')
         # Get the actual data source
         if table_name:
@@ -93,8 +173,8 @@ class SelectExecutor(AUniversalOperationExecutor):
                 source = context.node
         else:
             source = context.node
-        # Debug: Log source data
-        logger.debug(f"SelectExecutor: table_name={table_name}, source type={type(source)}, source={source}")
+        # Debug: Log source type (never the data itself - it may be a large stream)
+        logger.debug(f"SelectExecutor: table_name={table_name}, source type={type(source)}")
         # If source is None and we have table_name, try to get from context.node's native representation
         if source is None and table_name:
             # Try to get native representation
@@ -116,12 +196,9 @@ class SelectExecutor(AUniversalOperationExecutor):
                             except Exception:
                                 pass
             if node_native is not None:
-                logger.debug(f"SelectExecutor: node_native type={type(node_native)}, node_native={node_native}")
                 if isinstance(node_native, dict) and table_name in node_native:
                     source = node_native[table_name]
-                    logger.debug(f"SelectExecutor: Found source from native data: {source}")
-        # Get WHERE condition to apply BEFORE column projection (support both naming conventions)
-        where_condition = action.params.get('where') or action.params.get('where_clause')
+                    logger.debug(f"SelectExecutor: Found source from native data")
         # If source is None, try to get it from context.node's native representation
         if source is None:
             logger.warning(f"SelectExecutor: source is None for table '{table_name}', trying to get from context.node")
@@ -131,7 +208,7 @@ class SelectExecutor(AUniversalOperationExecutor):
                     node_native = context.node.to_native()
                     if isinstance(node_native, dict) and table_name in node_native:
                         source = node_native[table_name]
-                        logger.debug(f"SelectExecutor: Found source from to_native() fallback: {source}")
+                        logger.debug(f"SelectExecutor: Found source from to_native() fallback")
                 except Exception as e:
                     logger.debug(f"SelectExecutor: to_native() fallback failed: {e}")
             # If still None, use context.node directly
@@ -143,48 +220,29 @@ class SelectExecutor(AUniversalOperationExecutor):
                         source = context.node
                 else:
                     source = context.node
+        return source
+
+    def _iter_select(self, source: Any, columns: list[str], context: ExecutionContext, where_condition: dict | None = None) -> Iterator[Any]:
+        """Route row generation by the shape of the source (or the root node type)."""
         # Prefer selecting based on the *actual source value* (more robust for
         # facade/persistent strategies where the root node type may not match
         # the selected table's runtime shape).
-        if source is None:
-            logger.error(f"SelectExecutor: source is still None after all attempts, returning empty result")
-            return ExecutionResult(
-                data=[],
-                affected_count=0
-            )
-        if isinstance(source, (list, dict)):
-            data = self._select_from_tree(source, columns, context, where_condition)
-        else:
-            # Fallback: route based on the root node type
-            node_type = self._get_node_type(context.node)
-            # Route to appropriate handler based on node type
-            # Pass where_condition to apply filtering before projection
-            if node_type == NodeType.LINEAR:
-                data = self._select_from_linear(source, columns, context, where_condition)
-            elif node_type == NodeType.TREE:
-                data = self._select_from_tree(source, columns, context, where_condition)
-            elif node_type == NodeType.GRAPH:
-                data = self._select_from_graph(source, columns, context, where_condition)
-            elif node_type == NodeType.MATRIX:
-                data = self._select_from_matrix(source, columns, context, where_condition)
-            else:  # HYBRID
-                data = self._select_from_tree(source, columns, context, where_condition)  # Default to tree
-        # CRITICAL FIX: Apply ORDER BY if specified (support string or list-of-dicts from grammar)
-        order_by = action.params.get('order_by')
-        if order_by and isinstance(data, list):
-            data = self._apply_order_by(data, order_by)
-        # Apply DISTINCT if specified
-        if action.params.get('distinct') and isinstance(data, list):
-            data = self._apply_distinct(data, columns)
-        # CRITICAL FIX: Apply LIMIT if specified
-        limit = action.params.get('limit')
-        if limit and isinstance(data, list):
-            offset = action.params.get('offset', 0)
-            data = self._apply_limit(data, limit, offset)
-        return ExecutionResult(
-            data=data,
-            affected_count=len(data) if isinstance(data, list) else 1
-        )
+        if isinstance(source, (list, dict, RowStream)) or isinstance(source, Iterator):
+            return self._select_from_tree(source, columns, context, where_condition)
+        # Fallback: route based on the root node type
+        node_type = self._get_node_type(context.node)
+        # Route to appropriate handler based on node type
+        # Pass where_condition to apply filtering before projection
+        if node_type == NodeType.LINEAR:
+            return self._select_from_linear(source, columns, context, where_condition)
+        elif node_type == NodeType.TREE:
+            return self._select_from_tree(source, columns, context, where_condition)
+        elif node_type == NodeType.GRAPH:
+            return self._select_from_graph(source, columns, context, where_condition)
+        elif node_type == NodeType.MATRIX:
+            return self._select_from_matrix(source, columns, context, where_condition)
+        else:  # HYBRID
+            return self._select_from_tree(source, columns, context, where_condition)  # Default to tree
 
     def _get_node_type(self, node: Any) -> NodeType:
         """Get node's strategy type."""
@@ -194,90 +252,97 @@ class SelectExecutor(AUniversalOperationExecutor):
             return node.STRATEGY_TYPE
         return NodeType.TREE  # Default
 
-    def _select_from_linear(self, source: Any, columns: list[str], context: ExecutionContext, where_condition: dict | None = None) -> list[dict]:
+    def _select_from_linear(self, source: Any, columns: list[str], context: ExecutionContext, where_condition: dict | None = None) -> Iterator[dict]:
         """Select from linear node (list-like)."""
-        results = []
+        matches = self._compile_where(where_condition)
+        project = compile_projection(columns)
         # Iterate through linear structure
         if hasattr(source, 'items'):
             for key, value in source.items():
                 row_dict = {'key': key, 'value': value} if not isinstance(value, dict) else value
                 # Apply WHERE filter first
-                if where_condition and not self._matches_condition(row_dict, where_condition):
+                if matches and not matches(row_dict):
                     continue
                 if columns == ['*']:
-                    results.append(row_dict)
+                    yield row_dict
                 else:
-                    row = self._project_columns(row_dict, columns)
+                    row = project(row_dict)
                     if row is not None:
-                        results.append(row)
-        return results
+                        yield row
 
-    def _select_from_tree(self, source: Any, columns: list[str], context: ExecutionContext, where_condition: dict | None = None) -> list[dict]:
-        """Select from tree node (key-value map)."""
-        results = []
-        # Handle list of records (most common case)
-        if isinstance(source, list):
+    def _select_from_tree(self, source: Any, columns: list[str], context: ExecutionContext, where_condition: dict | None = None) -> Iterator[dict]:
+        """Select from tree node (key-value map) or a list/stream of records."""
+        matches = self._compile_where(where_condition)
+        project = compile_projection(columns)
+        # Handle list of records (most common case) - streams are consumed lazily
+        if isinstance(source, (list, RowStream)) or isinstance(source, Iterator):
+            select_all = columns == ['*'] or columns == [' *'] or '*' in columns
             for item in source:
                 if isinstance(item, dict):
                     # Apply WHERE filter FIRST (before column projection)
-                    if where_condition and not self._matches_condition(item, where_condition):
+                    if matches and not matches(item):
                         continue
                     # Then project columns
-                    if columns == ['*'] or columns == [' *'] or '*' in columns:
-                        results.append(item)
+                    if select_all:
+                        yield item
                     else:
-                        row = self._project_columns(item, columns)
+                        row = project(item)
                         if row is not None:
-                            results.append(row)
+                            yield row
                 else:
-                    results.append({'value': item})
+                    yield {'value': item}
         # Handle tree structure (dict)
         elif hasattr(source, 'items'):
             for key, value in source.items():
                 if columns == ['*']:
-                    results.append({'key': key, 'value': value})
+                    # Filter the rows a following WHERE would see (pushed-down filters)
+                    row = {'key': key, 'value': value}
+                    if matches and not matches(row):
+                        continue
+                    yield row
                 else:
-                    row = self._project_columns(value, columns)
+                    if matches and not matches(value):
+                        continue
+                    row = project(value)
                     if row is not None:
-                        results.append(row)
-        return results
+                        yield row
 
-    def _select_from_graph(self, source: Any, columns: list[str], context: ExecutionContext, where_condition: dict | None = None) -> list[dict]:
+    def _select_from_graph(self, source: Any, columns: list[str], context: ExecutionContext, where_condition: dict | None = None) -> Iterator[dict]:
         """Select from graph node."""
+        matches = self._compile_where(where_condition)
+        project = compile_projection(columns)
         # For graphs, return nodes
-        results = []
         if hasattr(source, 'items'):
             for key, value in source.items():
                 row_dict = {'node_id': key, 'node_data': value}
                 # Apply WHERE filter first
-                if where_condition and not self._matches_condition(row_dict, where_condition):
+                if matches and not matches(row_dict):
                     continue
                 if columns == ['*']:
-                    results.append(row_dict)
+                    yield row_dict
                 else:
-                    row = self._project_columns(value, columns)
+                    row = project(value)
                     if row is not None:
                         row['node_id'] = key
-                        results.append(row)
-        return results
+                        yield row
 
-    def _select_from_matrix(self, source: Any, columns: list[str], context: ExecutionContext, where_condition: dict | None = None) -> list[dict]:
+    def _select_from_matrix(self, source: Any, columns: list[str], context: ExecutionContext, where_condition: dict | None = None) -> Iterator[dict]:
         """Select from matrix node."""
-        results = []
+        matches = self._compile_where(where_condition)
+        project = compile_projection(columns)
         # Iterate through matrix
         if hasattr(source, 'items'):
             for key, value in source.items():
                 row_dict = {'position': key, 'value': value} if not isinstance(value, dict) else value
                 # Apply WHERE filter first
-                if where_condition and not self._matches_condition(row_dict, where_condition):
+                if matches and not matches(row_dict):
                     continue
                 if columns == ['*']:
-                    results.append(row_dict)
+                    yield row_dict
                 else:
-                    row = self._project_columns(row_dict, columns)
+                    row = project(row_dict)
                     if row is not None:
-                        results.append(row)
-        return results
+                        yield row
 
     def _detect_aggregation(self, columns: list[str]) -> dict | None:
         """
@@ -344,11 +409,8 @@ class SelectExecutor(AUniversalOperationExecutor):
         # Apply WHERE filter if present
         where_condition = action.params.get('where')
         if where_condition:
-            filtered = []
-            for item in source:
-                if isinstance(item, dict) and self._matches_condition(item, where_condition):
-                    filtered.append(item)
-            source = filtered
+            matches = compile_predicate(where_condition)
+            source = [item for item in source if isinstance(item, dict) and matches(item)]
         # Execute aggregation
         agg_func = agg_info['function']
         field = agg_info.get('field')
@@ -383,63 +445,12 @@ class SelectExecutor(AUniversalOperationExecutor):
         """
         Project specific columns from a value.
         Supports:
-        - Direct column names: "age", "name"
+        - Direct column names: "age", "name", "address.city"
         - Expressions with AS alias: "age - 5 AS perfect_age"
-        - Arithmetic expressions: "age - 5", "price * quantity"
+        - Arithmetic, string functions, CASE and COALESCE: "price * quantity"
+        Column lists are compiled once (see expressions.py) and cached.
         """
-        if not isinstance(value, dict):
-            return {'value': value}
-        projected = {}
-        for col_expr in columns:
-            col_expr = col_expr.strip()
-            # Check if it's an expression with AS alias (e.g., "age - 5 AS perfect_age")
-            if ' AS ' in col_expr.upper():
-                # Split expression and alias (case-insensitive)
-                parts = re.split(r'\s+AS\s+', col_expr, flags=re.IGNORECASE)
-                if len(parts) == 2:
-                    expr = parts[0].strip()
-                    alias = parts[1].strip()
-                    # Evaluate expression
-                    try:
-                        # Replace field names with values from dict
-                        eval_expr = expr
-                        for field_name, field_value in value.items():
-                            # Replace field references in expression (word boundaries)
-                            # Use word boundaries to avoid partial matches
-                            pattern = rf'\b{re.escape(field_name)}\b'
-                            eval_expr = re.sub(pattern, str(field_value), eval_expr)
-                        # Safe evaluation of arithmetic expressions
-                        result_value = eval(eval_expr, {"__builtins__": {}}, {})
-                        projected[alias] = result_value
-                        logger.debug(f"_project_columns: Evaluated '{expr}' AS '{alias}' = {result_value}")
-                    except Exception as e:
-                        # If evaluation fails, log and skip this column
-                        logger.debug(f"_project_columns: Failed to evaluate '{expr}': {e}")
-                        continue
-                else:
-                    # Malformed AS expression, skip
-                    continue
-            elif col_expr in value:
-                # Direct column reference
-                projected[col_expr] = value[col_expr]
-            else:
-                # Try to evaluate as expression without alias
-                try:
-                    # Replace field names with values
-                    eval_expr = col_expr
-                    for field_name, field_value in value.items():
-                        pattern = rf'\b{re.escape(field_name)}\b'
-                        eval_expr = re.sub(pattern, str(field_value), eval_expr)
-                    result_value = eval(eval_expr, {"__builtins__": {}}, {})
-                    # Use expression as key (sanitized)
-                    key = col_expr.replace(' ', '_').replace('-', '_').replace('+', '_')
-                    projected[key] = result_value
-                except Exception as e:
-                    # If evaluation fails, skip this column
-                    logger.debug(f"_project_columns: Failed to evaluate expression '{col_expr}': {e}")
-                    continue
-        logger.debug(f"_project_columns: Input columns={columns}, value={value}, projected={projected}")
-        return projected if projected else None
+        return compile_projection(columns)(value)
 
     def _get_value_by_path(self, obj: Any, path: str) -> Any:
         """
@@ -472,115 +483,55 @@ class SelectExecutor(AUniversalOperationExecutor):
             return None
         return cur
 
+    def _compile_where(self, condition: Any) -> Any | None:
+        """Compile a WHERE condition once per scan; None when it matches everything."""
+        if not condition:
+            return None
+        predicate = compile_predicate(condition)
+        return None if is_match_all(predicate) else predicate
+
     def _matches_condition(self, row: dict, condition: dict[str, Any]) -> bool:
         """Check if a single row matches a WHERE condition."""
-        if not condition or not isinstance(row, dict):
-            return True
-        field = condition.get('field')
-        operator = condition.get('operator')
-        value = condition.get('value')
-        if not field or not operator:
+        if not condition:
             return True
-        row_value = self._get_value_by_path(row, field)
-        if row_value is None:
-            return False
-        # Apply operator
-        try:
-            if operator == '>':
-                return row_value > value
-            elif operator == '<':
-                return row_value < value
-            elif operator == '>=':
-                return row_value >= value
-            elif operator == '<=':
-                return row_value <= value
-            elif operator == '=' or operator == '==':
-                return row_value == value
-            elif operator == '!=' or operator == '<>':
-                return row_value != value
-            elif operator == 'LIKE':
-                # SQL LIKE: % = any chars, _ = single char. Use fnmatch (glob-style).
-                import fnmatch
-                pattern = str(value).replace('%', '*').replace('_', '?')
-                return fnmatch.fnmatch(str(row_value).lower(), pattern.lower())
-            elif operator == 'BETWEEN':
-                low, high = value if isinstance(value, (list, tuple)) and len(value) >= 2 else (None, None)
-                if low is None or high is None:
-                    return False
-                try:
-                    return low <= row_value <= high
-                except (TypeError, ValueError):
-                    return False
-            elif operator == 'IN':
-                return row_value in value
-        except (TypeError, AttributeError):
-            return False
-        return False
+        return compile_predicate(condition)(row)
 
     def _apply_where_filter(self, data: list[dict], condition: dict[str, Any]) -> list[dict]:
         """Apply WHERE filter to data."""
         if not condition:
             return data
-        return [row for row in data if self._matches_condition(row, condition)]
+        matches = compile_predicate(condition)
+        return [row for row in data if matches(row)]
 
-    def _apply_order_by(self, data: list[dict], order_by: Any) -> list[dict]:
+    def _apply_order_by(self, data: Iterable[dict], order_by: Any, limit: int | None = None) -> list[dict]:
         """
         Apply ORDER BY sorting to data.
         Supports both formats:
-        - String from SQLParamExtractor: "age ASC", "price DESC"
+        - String from SQLParamExtractor: "age ASC", "price DESC, name NULLS FIRST"
         - List of dicts from grammar: [{"column": "name", "direction": "ASC"}]
+        Each key keeps its own direction; NULLs sort last for ASC and first for DESC.
         Args:
-            data: List of dictionaries to sort
+            data: Rows to sort
             order_by: ORDER BY clause - string or list of {column, direction} dicts
+            limit: Number of leading rows needed (offset + limit); uses a Top-N heap
         Returns:
             Sorted list of dictionaries
         """
-        if not order_by or not isinstance(data, list) or len(data) == 0:
-            return data
-        # Normalize to list of (field, direction) tuples
-        specs = []
-        if isinstance(order_by, list):
-            for item in order_by:
-                if isinstance(item, dict):
-                    field = item.get('column') or item.get('field')
-                    direction = (item.get('direction') or 'ASC').upper()
-                    if field:
-                        specs.append((field, direction))
-                elif isinstance(item, str):
-                    parts = item.strip().split()
-                    field = parts[0] if parts else None
-                    direction = parts[1].upper() if len(parts) > 1 else 'ASC'
-                    if field:
-                        specs.append((field, direction))
-        elif isinstance(order_by, str):
-            # Support "age, name" or "age ASC, name DESC" - split by comma first
-            for part in order_by.split(','):
-                part = part.strip()
-                if not part:
-                    continue
-                tokens = part.split()
-                field = tokens[0]
-                direction = tokens[1].upper() if len(tokens) > 1 else 'ASC'
-                if field:
-                    specs.append((field, direction))
+        specs = parse_order_by(order_by)
         if not specs:
-            return data
-        try:
-            # Build sort key: (field1_key, field2_key, ...) for multi-column ORDER BY
-            def sort_key(item):
-                return tuple(self._get_sort_key(item, field) for field, _ in specs)
-            reverse = specs[0][1] == 'DESC'
-            return sorted(data, key=sort_key, reverse=reverse)
-        except (KeyError, TypeError, AttributeError):
-            return data
+            return data if isinstance(data, list) else list(data)
+        return order_rows(data, specs, limit)
 
     def _apply_distinct(self, data: list[dict], columns: list[str]) -> list[dict]:
         """Apply DISTINCT - deduplicate by columns or full row."""
         if not data or not isinstance(data, list):
             return data
+        return list(self._iter_distinct(data, columns))
+
+    def _iter_distinct(self, rows: Iterable[dict], columns: list[str]) -> Iterator[dict]:
+        """Streaming DISTINCT - yields the first row of each distinct key."""
         seen = set()
-        result = []
-        for row in data:
+        for row in rows:
             if columns == ['*'] or (columns and '*' in columns):
                 items = row.items() if isinstance(row, dict) else [('', row)]
                 key = tuple(sorted((k, v) for k, v in items))
@@ -588,8 +539,7 @@ class SelectExecutor(AUniversalOperationExecutor):
                 key = tuple(row.get(c) for c in columns) if isinstance(row, dict) else (row,)
             if key not in seen:
                 seen.add(key)
-                result.append(row)
-        return result
+                yield row
 
     def _apply_limit(self, data: list[dict], limit: int, offset: int = 0) -> list[dict]:
         """
@@ -609,22 +559,4 @@ class SelectExecutor(AUniversalOperationExecutor):
         start = offset
         end = offset + limit
         return data[start:end]
-
-    def _get_sort_key(self, item: Any, field: str) -> Any:
-        """
-        Extract sort key from item for ORDER BY.
-        Args:
-            item: Data item (dict or other)
-            field: Field name to extract
-        Returns:
-            Sort key value (handles None gracefully)
-        """
-        if isinstance(item, dict):
-            value = self._get_value_by_path(item, field)
-            # Handle None values - sort them last
-            if value is None:
-                return (1, '')  # Tuple ensures None sorts last
-            return (0, value)
-        else:
-            return (0, item)
 __all__ = ['SelectExecutor']
@@ -15,7 +15,8 @@ from ....contracts import QueryAction, ExecutionContext, ExecutionResult
 from ....defs import OperationType
 from exonware.xwnode.nodes.strategies.contracts import NodeType
 # REUSE: Shared utilities
-from ..utils import extract_items, matches_condition
+from ..utils import extract_items
+from ..predicates import compile_predicate
 
 
 class UpdateExecutor(AUniversalOperationExecutor):
@@ -76,6 +77,8 @@ class UpdateExecutor(AUniversalOperationExecutor):
         updated_count = 0
         updated_items = []
         try:
+            # Compile the WHERE condition once for all items
+            matches = compile_predicate(condition)
             if target:
                 # Update specific target path
                 current = (node.get(target, None) if hasattr(node, 'get') else None)
@@ -83,12 +86,12 @@ class UpdateExecutor(AUniversalOperationExecutor):
                     # When current is a list, update each matching item in place (for plain dict nodes)
                     if isinstance(current, list):
                         for i, item in enumerate(current):
-                            if self._matches_condition(item, condition) and isinstance(item, dict):
+                            if matches(item) and isinstance(item, dict):
                                 for key, value in values.items():
                                     item[key] = value
                                 updated_count += 1
                                 updated_items.append(f"{target}[{i}]")
-                    elif self._matches_condition(current, condition):
+                    elif matches(current):
                         if hasattr(node, 'set'):
                             for key, value in values.items():
                                 node.set(f"{target}.{key}" if target else key, value)
@@ -104,7 +107,7 @@ class UpdateExecutor(AUniversalOperationExecutor):
                 # REUSE: Extract items using shared utility
                 items = extract_items(node)
                 for i, item in enumerate(items):
-                    if self._matches_condition(item, condition):
+                    if matches(item):
                         # Update the item
                         if isinstance(item, dict):
                             # Update dict items
@@ -143,53 +146,6 @@ class UpdateExecutor(AUniversalOperationExecutor):
         Supports both formats:
         - Direct: {'id': 'blue'} - field equals value
         - SQL: {'field': 'id', 'operator': '=', 'value': 'blue'}
+        REUSE: Delegates to the shared compiled predicate engine.
         """
-        if condition is None:
-            return True
-        # Handle dict-based condition
-        if isinstance(condition, dict):
-            # SQL format: {'field': 'id', 'operator': '=', 'value': 'blue'}
-            if 'field' in condition and 'operator' in condition:
-                field = condition.get('field')
-                op = condition.get('operator', '=')
-                expected = condition.get('value')
-                actual = item.get(field) if isinstance(item, dict) else getattr(item, field, None)
-                if op in ('=', '=='):
-                    return actual == expected
-                if op in ('!=', '<>'):
-                    return actual != expected
-                if op == '>':
-                    return actual > expected
-                if op == '<':
-                    return actual < expected
-                if op == '>=':
-                    return actual >= expected
-                if op == '<=':
-                    return actual <= expected
-                return False
-            # Direct format: {'id': 'blue'} - all fields must match
-            if isinstance(item, dict):
-                for key, expected_value in condition.items():
-                    if item.get(key) != expected_value:
-                        return False
-                return True
-            else:
-                for key, expected_value in condition.items():
-                    if not hasattr(item, key) or getattr(item, key) != expected_value:
-                        return False
-                return True
-        # Handle callable condition (e.g., lambda)
-        if callable(condition):
-            try:
-                return condition(item)
-            except Exception:
-                return False
-        # Handle string condition (field name check)
-        if isinstance(condition, str):
-            # Check if item has the field
-            if isinstance(item, dict):
-                return condition in item
-            else:
-                return hasattr(item, condition)
-        # Default: match all
-        return True
+        return compile_predicate(condition)(item)
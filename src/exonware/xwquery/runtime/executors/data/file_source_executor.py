@@ -2,8 +2,12 @@
 """
 #exonware/xwquery/src/exonware/xwquery/runtime/executors/data/file_source_executor.py
 File-Based Data Source Executor
-Implements file-based data source support using xwsystem's XWIndex for efficient
-querying of JSONL/NDJSON files.
+Implements file-based data source support for efficient querying of JSONL/NDJSON
+files, plus CSV/TSV, Parquet and Arrow IPC files read column-pruned (see
+file_columnar). Lookups and pages use persistent line-offset/id indexes (see file_index)
+and slice records from a memory mapping of the file (see file_mmap);
+select/stream scans read the file directly with the WHERE and SELECT pushed
+down (see file_scan).
 Company: eXonware.com
 Author: eXonware Backend Team
 Email: connect@exonware.com
@@ -11,23 +15,32 @@ Version: 0.9.0.5
 Generation Date: January 20, 2026
 """
 
+from itertools import islice
 from pathlib import Path
 from typing import Any
 from ..base import AUniversalOperationExecutor
 from ....contracts import QueryAction, ExecutionContext, ExecutionResult
 from ....defs import OperationType
-from exonware.xwsystem.io.indexing import XWIndex
+from ....errors import XWQueryExecutionError
+from ...streaming import iter_batches
+from ..file_columnar import columnar_format, scan_columnar
+from ..file_index import JsonlIndex, forget_index, open_index
+from ..file_scan import JsonlScan, scan_jsonl
+from ..parallel import resolve_parallel_min_rows, resolve_parallel_workers, scan_jsonl_parallel
+from ..sorting import iter_sorted, parse_order_by, resolve_sort_memory_budget, resolve_spill_directory
 
 
-from collections.abc import Callable
+from collections.abc import Iterator
 class FileSourceExecutor(AUniversalOperationExecutor):
     """
-    File-Based Data Source Executor using xwsystem's XWIndex.
+    File-Based Data Source Executor.
     Provides efficient querying of JSONL/NDJSON files with:
-    - Line-offset indexing for random access
+    - Line-offset indexing for random access (persisted, validated, extended on append)
     - ID-based indexing for fast lookups
     - Paging support for large datasets
     - Streaming operations with predicates
+    - CSV/TSV, Parquet and Arrow IPC sources reading only referenced columns
+      (Parquet row groups skipped by their statistics)
     Examples:
         >>> # Query JSONL file
         >>> query = XWQuery("SELECT * FROM users.jsonl WHERE age > 25")
@@ -42,10 +55,7 @@ class FileSourceExecutor(AUniversalOperationExecutor):
     OPERATION_NAME = "FILE_SOURCE"
     OPERATION_TYPE = OperationType.DATA_OPS
     SUPPORTED_NODE_TYPES = []
-
-    def __init__(self, **options):
-        super().__init__(**options)
-        self._index_cache: dict[str, XWIndex] = {}
+    SUPPORTS_STREAMING = True
 
     def _do_execute(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
         """
@@ -75,46 +85,74 @@ class FileSourceExecutor(AUniversalOperationExecutor):
                 action_type=self.OPERATION_NAME,
                 metadata={'file_path': file_path}
             )
-        # Get or create index
-        index = self._get_index(file_path, params.get('id_field'))
         # Execute based on operation type
         operation = params.get('operation', 'select')
-        if operation == 'get_by_id':
-            id_value = params.get('id')
-            result_data = self._execute_get_by_id(index, id_value, params.get('id_field'))
+        index = scan = None
+        if columnar_format(file_path, params.get('format')) is not None:
+            params = self._columnar_params(operation, params)
+            scan = self._build_scan(params, use_match=operation in ('select', 'stream'))
+            result_data = self._execute_stream(file_path, scan, params, context.options)
+            if operation == 'get_by_id' and params.get('ids') is None:
+                result_data = result_data[0] if result_data else []
+        elif operation == 'get_by_id':
+            index = self._get_index(file_path, context.options)
+            if params.get('ids') is not None:
+                result_data = self._execute_get_by_ids(index, params['ids'], params.get('id_field'))
+            else:
+                result_data = self._execute_get_by_id(index, params.get('id'), params.get('id_field'))
         elif operation == 'get_page':
             page = params.get('page', 0)
             size = params.get('size', params.get('limit', 10))
+            index = self._get_index(file_path, context.options)
             result_data = self._execute_get_page(index, page, size)
         elif operation == 'stream' or operation == 'select':
-            match_predicate = params.get('match') or self._build_match_predicate(params)
-            result_data = self._execute_stream(index, match_predicate, params)
+            scan = self._build_scan(params)
+            result_data = self._execute_stream(file_path, scan, params, context.options)
         else:
             # Default: load all or use paging
             limit = params.get('limit')
             offset = params.get('offset', 0)
-            if limit:
-                page = offset // limit if limit > 0 else 0
-                size = limit
-                result_data = self._execute_get_page(index, page, size)
+            if limit and not params.get('order_by'):
+                index = self._get_index(file_path, context.options)
+                result_data = index.read(offset or 0, limit)
             else:
                 # Stream all records
-                match_predicate = self._build_match_predicate(params)
-                result_data = self._execute_stream(index, match_predicate, params)
+                scan = self._build_scan(params, use_match=False)
+                result_data = self._execute_stream(file_path, scan, params, context.options)
+        metadata = {'file_path': file_path, 'operation': operation}
+        if index is not None:
+            metadata['index_stats'] = {
+                'total_lines': len(index),
+                'has_id_index': bool(index.ids),
+                'state': index.state,
+                'persistent': index.persistent
+            }
+        if scan is not None:
+            metadata['scan_stats'] = dict(scan.stats)
         return ExecutionResult(
             success=True,
             data=result_data,
             action_type=self.OPERATION_NAME,
-            metadata={
-                'file_path': file_path,
-                'operation': operation,
-                'index_stats': {
-                    'total_lines': len(index.index.line_offsets) if index.index else 0,
-                    'has_id_index': index.index.id_index is not None if index.index else False
-                }
-            }
+            metadata=metadata
         )
 
+    def _iter_execute(self, action: QueryAction, context: ExecutionContext, batch_size: int) -> Iterator[list[Any]]:
+        """
+        Streaming FILE_SOURCE - yield matching records in batches as they are read.
+        Only select/stream scans stream; lookups and pages are small and use
+        the materialized path.
+        """
+        params = action.params
+        operation = params.get('operation', 'select')
+        file_path = params.get('source') or params.get('from') or params.get('path')
+        if operation not in ('select', 'stream') or not file_path:
+            yield from super()._iter_execute(action, context, batch_size)
+            return
+        file_path = self._resolve_file_path(file_path, context)
+        if not Path(file_path).exists():
+            raise XWQueryExecutionError(f'File not found: {file_path}')
+        yield from iter_batches(self._iter_stream(file_path, self._build_scan(params), params, context.options), batch_size)
+
     def _resolve_file_path(self, file_path: str, context: ExecutionContext) -> str:
         """Resolve file path (absolute or relative)."""
         path = Path(file_path)
@@ -127,100 +165,176 @@ class FileSourceExecutor(AUniversalOperationExecutor):
         # Fallback: try current working directory
         return str(path.resolve())
 
-    def _get_index(self, file_path: str, id_field: str | None = None) -> XWIndex:
-        """Get or create XWIndex for file."""
-        cache_key = f"{file_path}:{id_field or 'default'}"
-        if cache_key not in self._index_cache:
-            index = XWIndex(file_path, id_field=id_field)
-            index.build()
-            self._index_cache[cache_key] = index
-        return self._index_cache[cache_key]
+    def _get_index(self, file_path: str, options: dict[str, Any] | None = None) -> JsonlIndex:
+        """
+        Get the line-offset/id index of a file.
+        Root cause fixed: Indexes lived in an unbounded per-executor cache,
+        were rebuilt in every process and never noticed file changes.
+        Solution: Shared LRU of indexes persisted to sidecar files and
+        validated (size, mtime, hash) on every use; appends extend them.
+        REUSE: file_index.open_index.
+        Params (execution options):
+        - file_index_directory: Where sidecars go (default: next to the data)
+        - max_open_file_indexes: LRU bound on in-memory indexes
+        """
+        return open_index(file_path, options)
+
+    def _columnar_params(self, operation: str, params: dict[str, Any]) -> dict[str, Any]:
+        """
+        Lookups and pages on CSV/Parquet/Arrow files, which have no line
+        index, as scans: get_by_id becomes a WHERE on the id field (ids come
+        back in file order) and get_page an OFFSET/LIMIT.
+        """
+        if operation == 'get_by_id':
+            id_field = params.get('id_field') or 'id'
+            if params.get('ids') is not None:
+                return {**params, 'where': {id_field: list(params['ids'])}, 'limit': None}
+            return {**params, 'where': {id_field: params.get('id')}, 'limit': 1}
+        if operation == 'get_page':
+            size = params.get('size', params.get('limit', 10))
+            return {**params, 'offset': max(params.get('page', 0), 0) * size, 'limit': size}
+        return params
 
     def _execute_get_by_id(
         self,
-        index: XWIndex,
+        index: JsonlIndex,
         id_value: Any,
         id_field: str | None = None
     ) -> Any:
         """Execute ID-based lookup."""
-        record = index.get_by_id(id_value, id_field=id_field)
+        record = index.get_by_id(id_value, id_field or 'id')
         return record if record is not None else []
 
+    def _execute_get_by_ids(
+        self,
+        index: JsonlIndex,
+        id_values: list[Any],
+        id_field: str | None = None
+    ) -> list[Any]:
+        """
+        Execute a multi-ID lookup (records in the order of `id_values`).
+        Root cause fixed: Fetching many ids meant one query, and one seek +
+        read per record, for each id.
+        Solution: Resolve all ids through the id index and slice the records
+        from the file's shared memory mapping.
+        REUSE: file_index.JsonlIndex.get_many.
+        """
+        return index.get_many(id_values, id_field or 'id')
+
     def _execute_get_page(
         self,
-        index: XWIndex,
+        index: JsonlIndex,
         page: int,
         size: int
     ) -> list[Any]:
         """Execute paged retrieval."""
-        return index.get_page(page=page, size=size)
+        return index.get_page(page, size)
 
     def _execute_stream(
         self,
-        index: XWIndex,
-        match_predicate: Callable[[Any], bool] | None,
-        params: dict[str, Any]
+        file_path: str,
+        scan: JsonlScan,
+        params: dict[str, Any],
+        options: dict[str, Any] | None = None
     ) -> list[Any]:
         """Execute streaming operation with predicate."""
+        return list(self._iter_stream(file_path, scan, params, options))
+
+    def _build_scan(self, params: dict[str, Any], use_match: bool = True) -> JsonlScan:
+        """
+        Push the WHERE (or `match`) and the SELECT columns down into the scan.
+        Root cause fixed: every line was fully decoded before the predicate
+        ran, and whole records were returned for two selected fields.
+        Solution: the scan rejects lines on a raw byte pre-check derived from
+        the condition, decodes only the rest, and keeps only the selected
+        columns (and the ORDER BY keys until sorting is done).
+        REUSE: file_scan.JsonlScan (compiles the condition with predicates).
+        Params:
+        - where: WHERE condition (any predicates form); match: callable or condition overriding it
+        - fields/select/columns: SELECT columns (plain, aliased or computed)
+        - order_by: Sort keys kept on narrowed records
+        """
+        match = params.get('match') if use_match else None
+        if match and callable(match):
+            condition, predicate = None, match
+        else:
+            condition, predicate = match or params.get('where'), None
+        columns = params.get('fields', params.get('select', params.get('columns')))
+        keep = [spec.field for spec in parse_order_by(params.get('order_by'))]
+        return JsonlScan(predicate, condition, columns, keep)
+
+    def _iter_stream(
+        self,
+        file_path: str,
+        scan: JsonlScan,
+        params: dict[str, Any],
+        options: dict[str, Any] | None = None
+    ) -> Iterator[Any]:
+        """
+        Lazily stream matching records with optional ORDER BY and OFFSET/LIMIT.
+        ORDER BY + LIMIT keeps only the leading rows in a heap; a full ORDER BY
+        over files larger than the sort memory budget spills sorted runs to
+        temp files and merges them, so the file never has to fit in memory.
+        Lines are filtered before decoding and records narrowed to the
+        selected columns by the pushed-down scan; CSV, Parquet and Arrow
+        files are read column-pruned by their columnar reader instead.
+        Params (columnar files):
+        - format: Format hint overriding the extension (csv, tsv, parquet, arrow)
+        - delimiter: CSV delimiter (default ',' and tab for .tsv)
+        - column_types: CSV column -> 'int'/'float'/'bool'/'str' (default: inferred)
+        """
         limit = params.get('limit')
-        offset = params.get('offset', 0)
-        results = []
-        count = 0
-        for record in index.stream(match=match_predicate):
-            if count < offset:
-                count += 1
-                continue
-            results.append(record)
-            if limit and len(results) >= limit:
-                break
-        return results
-
-    def _build_match_predicate(self, params: dict[str, Any]) -> Callable[[Any], bool] | None:
-        """Build predicate function from query parameters."""
-        where_clauses = params.get('where', [])
-        if not where_clauses:
-            return None
-        # Simple predicate builder for common conditions
-        # In production, this would use xwquery's predicate builder
-        def match(record: Any) -> bool:
-            if not isinstance(record, dict):
-                return False
-            for clause in where_clauses:
-                if isinstance(clause, dict):
-                    field = clause.get('field')
-                    operator = clause.get('operator', '=')
-                    value = clause.get('value')
-                    if field not in record:
-                        return False
-                    record_value = record[field]
-                    if operator == '=' and record_value != value:
-                        return False
-                    elif operator == '>' and not (record_value > value):
-                        return False
-                    elif operator == '<' and not (record_value < value):
-                        return False
-                    elif operator == '>=' and not (record_value >= value):
-                        return False
-                    elif operator == '<=' and not (record_value <= value):
-                        return False
-                    elif operator == '!=' and record_value == value:
-                        return False
-                    elif operator == 'IN' and value not in record_value:
-                        return False
-                elif isinstance(clause, str):
-                    # Simple string matching (e.g., "age > 25")
-                    # For now, skip complex parsing - would integrate with xwquery parser
-                    pass
-            return True
-        return match
+        offset = params.get('offset', 0) or 0
+        specs = parse_order_by(params.get('order_by'))
+        if columnar_format(file_path, params.get('format')) is not None:
+            records = scan_columnar(
+                file_path, scan, params.get('format'), params.get('delimiter'), params.get('column_types')
+            )
+            projected = False
+        else:
+            records, projected = self._scan_records(file_path, scan, bool(specs or offset), not specs, options)
+        if specs:
+            records = iter_sorted(
+                records,
+                specs,
+                offset + limit if limit else None,
+                resolve_sort_memory_budget(options),
+                resolve_spill_directory(options)
+            )
+        records = islice(records, offset, offset + limit if limit else None)
+        if projected:
+            return (row for row in records if row is not None)
+        return scan.projected(records)
+
+    def _scan_records(
+        self,
+        file_path: str,
+        scan: JsonlScan,
+        ordered: bool,
+        project: bool,
+        options: dict[str, Any] | None = None
+    ) -> tuple[Iterator[Any], bool]:
+        """
+        Scan the file on one core, or in parallel byte ranges when parallel
+        execution is enabled and the file has at least `parallel_min_rows`
+        lines. Returns the records and whether they are already projected
+        (parallel scans project in the workers when `project` is set, with
+        None kept for rows without selected values so OFFSET counts them).
+        Root cause fixed: Full-file scans were stuck on one JSON decoder.
+        Solution: Split the file into ranges aligned on the index's line
+        offsets and scan them in the worker pool; `ordered` keeps file order
+        (needed by ORDER BY ties and OFFSET), otherwise ranges are merged as
+        they complete.
+        REUSE: parallel.scan_jsonl_parallel, file_index.open_index.
+        """
+        workers = resolve_parallel_workers(options)
+        if workers > 1:
+            index = self._get_index(file_path, options)
+            if len(index) >= max(resolve_parallel_min_rows(options), 2):
+                records = scan_jsonl_parallel(file_path, scan, index.offsets, workers, ordered, project)
+                return records, project
+        return scan_jsonl(file_path, scan), False
 
     def clear_cache(self, file_path: str | None = None):
-        """Clear index cache."""
-        if file_path:
-            # Clear specific file
-            keys_to_remove = [k for k in self._index_cache.keys() if k.startswith(file_path)]
-            for key in keys_to_remove:
-                del self._index_cache[key]
-        else:
-            # Clear all
-            self._index_cache.clear()
+        """Clear in-memory indexes (of one file, or all); persisted sidecars are kept."""
+        forget_index(file_path)
@@ -20,6 +20,7 @@ from ..base import AOperationsExecutionEngine
 from .registry import get_operation_registry, OperationRegistry
 from .capability_checker import check_operation_compatibility
 from ...errors import UnsupportedOperationError
+from ..optimization.pipeline import is_optimization_enabled, optimize_action_tree
 
 
 class NativeOperationsExecutionEngine(AOperationsExecutionEngine):
@@ -113,6 +114,28 @@ class NativeOperationsExecutionEngine(AOperationsExecutionEngine):
                 action_type=action.type
             )
 
+    def _optimize_action_tree(self, action: QueryAction, context: ExecutionContext) -> QueryAction:
+        """
+        Run the tree through the query planner and optimizer.
+        Skipped when XWQuery.execute() already optimized it (context metadata
+        'optimized'), or when disabled via the 'optimize' option or
+        XWQueryConfig.enable_optimization.
+        """
+        if context.metadata.get('optimized') or not is_optimization_enabled(context.options):
+            return action
+        return optimize_action_tree(action)
+
+    def _get_streaming_executor(self, action: QueryAction) -> Any | None:
+        """
+        Get registry executor for a streaming pipeline stage.
+        Returns the executor only when it implements pull-based execution
+        (SUPPORTS_STREAMING); other operations run as blocking stages.
+        """
+        executor = self._registry.get(action.type)
+        if executor is None or not getattr(executor, 'SUPPORTS_STREAMING', False):
+            return None
+        return executor
+
     def list_supported_operations(self) -> list[str]:
         """
         Get list of all supported operations.
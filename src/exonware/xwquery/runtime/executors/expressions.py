@@ -0,0 +1,578 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/src/exonware/xwquery/runtime/executors/expressions.py
+Compiled projection expressions for SELECT columns.
+Root cause: computed columns ("age - 5 AS perfect_age") were evaluated by
+textually substituting every field value into the expression with re.sub and
+calling eval() - for every column of every row. That was the hottest CPU path
+for computed columns and broke on values containing spaces, quotes or
+operators (and on fields whose names prefix each other).
+Solution: parse each expression once into a tree of closures (constants folded
+at compile time) and evaluate it against rows; whole column lists compile to a
+single row projector, cached per query text.
+Supported expression syntax:
+- Literals: 42, 3.5, 'text' ('' escapes a quote), TRUE, FALSE, NULL
+- Fields: age, user.address.city, items.0.price, `first name`
+- Arithmetic: + - * / % and unary minus; || concatenates strings
+- Comparisons: = != <> < <= > >=, IS [NOT] NULL, [NOT] LIKE, [NOT] IN (...),
+  [NOT] BETWEEN x AND y, combined with AND / OR / NOT
+- CASE WHEN cond THEN x [...] [ELSE y] END and CASE expr WHEN v THEN x ... END
+- Functions: UPPER, LOWER, LENGTH, TRIM, LTRIM, RTRIM, SUBSTR/SUBSTRING,
+  REPLACE, LEFT, RIGHT, CONCAT, ABS, ROUND, FLOOR, CEIL, POWER, MOD,
+  COALESCE, IFNULL, NULLIF, CAST(x AS type)
+NULL propagates SQL-style: any arithmetic, comparison or function involving
+NULL (a missing field reads as NULL) yields NULL, except COALESCE/IFNULL,
+CONCAT (skips NULLs) and IS [NOT] NULL. Division by zero yields NULL.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.9.0.5
+Generation Date: 16-Oct-2026
+"""
+
+from __future__ import annotations
+import math
+import operator
+import re
+import threading
+from collections.abc import Callable, Sequence
+from typing import Any
+from ...errors import XWQueryValueError
+from .predicates import _like_regex, compile_field_getter, is_missing
+Evaluator = Callable[[Any], Any]
+Projector = Callable[[Any], 'dict | None']
+_CACHE_SIZE = 512
+_EXPRESSION_CACHE: dict[str, Evaluator] = {}
+_PROJECTION_CACHE: dict[tuple[str, ...], Projector] = {}
+_cache_lock = threading.Lock()
+_TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<string>'(?:[^']|'')*'|"(?:[^"\\]|\\.)*")
+      | (?P<number>\d+(?:\.\d+)?(?:[eE][-+]?\d+)?(?![\w]))
+      | (?P<op>\|\||>=|<=|!=|<>|==|=|>|<|\+|-|\*|/|%)
+      | (?P<punct>[(),])
+      | (?P<quoted>`[^`]+`)
+      | (?P<word>[A-Za-z_][\w.]*)
+    )""", re.VERBOSE)
+_KEYWORDS = {
+    'AND', 'OR', 'NOT', 'IS', 'NULL', 'TRUE', 'FALSE', 'LIKE', 'IN', 'BETWEEN',
+    'CASE', 'WHEN', 'THEN', 'ELSE', 'END', 'AS',
+}
+_LITERAL_WORDS = {'NULL': None, 'NONE': None, 'TRUE': True, 'FALSE': False}
+# Top-level " AS alias" (the alias may be quoted with `, " or ')
+_ALIAS_RE = re.compile(r"""\s+AS\s+(`[^`]+`|"[^"]+"|'[^']+'|[A-Za-z_][\w.]*)\s*$""", re.IGNORECASE)
+
+
+def _divide(left: Any, right: Any) -> Any:
+    return None if right == 0 else left / right
+
+
+def _modulo(left: Any, right: Any) -> Any:
+    return None if right == 0 else left % right
+
+
+def _concat(left: Any, right: Any) -> str:
+    return f"{left}{right}"
+_BINARY_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': _divide,
+    '%': _modulo,
+    '||': _concat,
+    '=': operator.eq,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<>': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+}
+_COMPARISON_OPERATORS = {'=', '==', '!=', '<>', '<', '<=', '>', '>='}
+
+
+def _substr(value: Any, start: Any, length: Any = None) -> str:
+    """SQL SUBSTR: 1-based start, optional length."""
+    text = str(value)
+    begin = max(int(start) - 1, 0)
+    return text[begin:] if length is None else text[begin:begin + max(int(length), 0)]
+
+
+def _cast(value: Any, type_name: str) -> Any:
+    if type_name in ('INT', 'INTEGER', 'BIGINT'):
+        return int(float(value)) if isinstance(value, str) else int(value)
+    if type_name in ('FLOAT', 'REAL', 'DOUBLE', 'DECIMAL', 'NUMERIC'):
+        return float(value)
+    if type_name in ('TEXT', 'STRING', 'VARCHAR', 'CHAR'):
+        return str(value)
+    if type_name in ('BOOL', 'BOOLEAN'):
+        return value.strip().lower() in ('true', '1', 'yes') if isinstance(value, str) else bool(value)
+    raise XWQueryValueError(f"Unsupported CAST type: {type_name!r}")
+# Null-propagating scalar functions: name -> (function, min args, max args)
+_FUNCTIONS: dict[str, tuple[Callable[..., Any], int, int]] = {
+    'UPPER': (lambda s: str(s).upper(), 1, 1),
+    'LOWER': (lambda s: str(s).lower(), 1, 1),
+    'LENGTH': (lambda s: len(s) if isinstance(s, (list, tuple, dict)) else len(str(s)), 1, 1),
+    'TRIM': (lambda s: str(s).strip(), 1, 1),
+    'LTRIM': (lambda s: str(s).lstrip(), 1, 1),
+    'RTRIM': (lambda s: str(s).rstrip(), 1, 1),
+    'SUBSTR': (_substr, 2, 3),
+    'REPLACE': (lambda s, old, new: str(s).replace(str(old), str(new)), 3, 3),
+    'LEFT': (lambda s, n: str(s)[:max(int(n), 0)], 2, 2),
+    'RIGHT': (lambda s, n: str(s)[-int(n):] if int(n) > 0 else '', 2, 2),
+    'ABS': (abs, 1, 1),
+    'ROUND': (lambda x, n=0: round(x, int(n)), 1, 2),
+    'FLOOR': (math.floor, 1, 1),
+    'CEIL': (math.ceil, 1, 1),
+    'POWER': (lambda x, y: x ** y, 2, 2),
+    'MOD': (_modulo, 2, 2),
+}
+_FUNCTION_ALIASES = {
+    'LEN': 'LENGTH', 'CHAR_LENGTH': 'LENGTH', 'SUBSTRING': 'SUBSTR',
+    'CEILING': 'CEIL', 'POW': 'POWER', 'UCASE': 'UPPER', 'LCASE': 'LOWER',
+}
+
+
+class _Constant:
+    """Evaluator for a compile-time constant (enables constant folding)."""
+    __slots__ = ('value',)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __call__(self, row: Any) -> Any:
+        return self.value
+
+
+def _field(path: str) -> Evaluator:
+    get = compile_field_getter(path)
+
+    def read(row: Any) -> Any:
+        value = get(row)
+        return None if is_missing(value) else value
+    return read
+
+
+def _fold(evaluator: Evaluator, *operands: Evaluator) -> Evaluator:
+    """Evaluate now when every operand is constant; keep runtime errors for runtime."""
+    if all(isinstance(operand, _Constant) for operand in operands):
+        try:
+            return _Constant(evaluator(None))
+        except (TypeError, ValueError, ArithmeticError):
+            pass
+    return evaluator
+
+
+def _binary(op: str, left: Evaluator, right: Evaluator) -> Evaluator:
+    func = _BINARY_OPERATORS[op]
+    if isinstance(right, _Constant) and right.value is not None:
+        constant = right.value
+
+        def apply_constant(row: Any) -> Any:
+            value = left(row)
+            return None if value is None else func(value, constant)
+        return _fold(apply_constant, left, right)
+
+    def apply(row: Any) -> Any:
+        a = left(row)
+        if a is None:
+            return None
+        b = right(row)
+        return None if b is None else func(a, b)
+    return _fold(apply, left, right)
+
+
+def _call(func: Callable[..., Any], args: list[Evaluator]) -> Evaluator:
+    if len(args) == 1:
+        (arg,) = args
+
+        def call_one(row: Any) -> Any:
+            value = arg(row)
+            return None if value is None else func(value)
+        return _fold(call_one, arg)
+
+    def call(row: Any) -> Any:
+        values = [arg(row) for arg in args]
+        return None if any(value is None for value in values) else func(*values)
+    return _fold(call, *args)
+
+
+def _all_true(operands: list[Evaluator]) -> Evaluator:
+    return _fold(lambda row: all(operand(row) for operand in operands), *operands)
+
+
+def _any_true(operands: list[Evaluator]) -> Evaluator:
+    return _fold(lambda row: any(operand(row) for operand in operands), *operands)
+
+
+def _negate(operand: Evaluator) -> Evaluator:
+    """NOT, with NULL staying NULL."""
+    def evaluate(row: Any) -> Any:
+        value = operand(row)
+        return None if value is None else not value
+    return _fold(evaluate, operand)
+
+
+class _ExpressionParser:
+    """Recursive-descent parser compiling an expression into closures."""
+
+    def __init__(self, text: str):
+        self._text = text
+        self._tokens = self._tokenize(text)
+        self._pos = 0
+
+    def _tokenize(self, text: str) -> list[tuple[str, str]]:
+        tokens = []
+        pos = 0
+        text = text.rstrip()
+        while pos < len(text):
+            match = _TOKEN_RE.match(text, pos)
+            if not match or match.end() == pos:
+                raise XWQueryValueError(f"Invalid expression near {text[pos:]!r}: {text!r}")
+            kind = match.lastgroup
+            tokens.append((kind, match.group(kind)))
+            pos = match.end()
+        return tokens
+
+    def _peek(self) -> tuple[str, str] | None:
+        return self._tokens[self._pos] if self._pos < len(self._tokens) else None
+
+    def _peek_keyword(self, *keywords: str) -> bool:
+        token = self._peek()
+        return token is not None and token[0] == 'word' and token[1].upper() in keywords
+
+    def _take(self) -> tuple[str, str]:
+        token = self._peek()
+        if token is None:
+            raise XWQueryValueError(f"Unexpected end of expression: {self._text!r}")
+        self._pos += 1
+        return token
+
+    def _expect(self, kind: str, value: str | None = None) -> None:
+        token = self._take()
+        if token[0] != kind or (value is not None and token[1].upper() != value):
+            raise XWQueryValueError(f"Expected {value or kind} in expression: {self._text!r}")
+
+    def parse(self) -> Evaluator:
+        if not self._tokens:
+            raise XWQueryValueError("Empty expression")
+        evaluator = self._parse_or()
+        if self._peek() is not None:
+            raise XWQueryValueError(f"Unexpected {self._peek()[1]!r} in expression: {self._text!r}")
+        return evaluator
+
+    def _parse_or(self) -> Evaluator:
+        operands = [self._parse_and()]
+        while self._peek_keyword('OR'):
+            self._take()
+            operands.append(self._parse_and())
+        return operands[0] if len(operands) == 1 else _any_true(operands)
+
+    def _parse_and(self) -> Evaluator:
+        operands = [self._parse_not()]
+        while self._peek_keyword('AND'):
+            self._take()
+            operands.append(self._parse_not())
+        return operands[0] if len(operands) == 1 else _all_true(operands)
+
+    def _parse_not(self) -> Evaluator:
+        if self._peek_keyword('NOT'):
+            self._take()
+            operand = self._parse_not()
+            return _negate(operand)
+        return self._parse_comparison()
+
+    def _parse_comparison(self) -> Evaluator:
+        left = self._parse_additive()
+        token = self._peek()
+        if token is None:
+            return left
+        if token[0] == 'op' and token[1] in _COMPARISON_OPERATORS:
+            self._take()
+            return _binary(token[1], left, self._parse_additive())
+        if not self._peek_keyword('IS', 'NOT', 'LIKE', 'IN', 'BETWEEN'):
+            return left
+        keyword = self._take()[1].upper()
+        if keyword == 'IS':
+            negated = self._peek_keyword('NOT')
+            if negated:
+                self._take()
+            self._expect('word', 'NULL')
+            if negated:
+                return _fold(lambda row: left(row) is not None, left)
+            return _fold(lambda row: left(row) is None, left)
+        negated = keyword == 'NOT'
+        if negated:
+            keyword = self._take()[1].upper()
+        if keyword == 'LIKE':
+            evaluator = self._parse_like(left)
+        elif keyword == 'IN':
+            evaluator = self._parse_in(left)
+        elif keyword == 'BETWEEN':
+            low = self._parse_additive()
+            self._expect('word', 'AND')
+            high = self._parse_additive()
+            evaluator = _all_true([_binary('>=', left, low), _binary('<=', left, high)])
+        else:
+            raise XWQueryValueError(f"Unexpected {keyword!r} in expression: {self._text!r}")
+        if not negated:
+            return evaluator
+
+        def negate(row: Any) -> Any:
+            result = evaluator(row)
+            return None if result is None else not result
+        return _fold(negate, evaluator)
+
+    def _parse_like(self, left: Evaluator) -> Evaluator:
+        pattern = self._parse_additive()
+        if isinstance(pattern, _Constant):
+            if pattern.value is None:
+                return _Constant(None)
+            match = _like_regex(pattern.value).fullmatch
+
+            def like(row: Any) -> Any:
+                value = left(row)
+                return None if value is None else match(str(value)) is not None
+            return like
+        return _call(lambda value, pat: _like_regex(pat).fullmatch(str(value)) is not None, [left, pattern])
+
+    def _parse_in(self, left: Evaluator) -> Evaluator:
+        self._expect('punct', '(')
+        options = [self._parse_or()]
+        while self._peek() == ('punct', ','):
+            self._take()
+            options.append(self._parse_or())
+        self._expect('punct', ')')
+        if all(isinstance(option, _Constant) for option in options):
+            try:
+                lookup = frozenset(option.value for option in options)
+            except TypeError:
+                lookup = [option.value for option in options]
+
+            def contains(row: Any) -> Any:
+                value = left(row)
+                return None if value is None else value in lookup
+            return _fold(contains, left)
+
+        def contains_any(row: Any) -> Any:
+            value = left(row)
+            return None if value is None else any(value == option(row) for option in options)
+        return contains_any
+
+    def _parse_additive(self) -> Evaluator:
+        left = self._parse_multiplicative()
+        while (token := self._peek()) is not None and token[0] == 'op' and token[1] in ('+', '-', '||'):
+            self._take()
+            left = _binary(token[1], left, self._parse_multiplicative())
+        return left
+
+    def _parse_multiplicative(self) -> Evaluator:
+        left = self._parse_unary()
+        while (token := self._peek()) is not None and token[0] == 'op' and token[1] in ('*', '/', '%'):
+            self._take()
+            left = _binary(token[1], left, self._parse_unary())
+        return left
+
+    def _parse_unary(self) -> Evaluator:
+        token = self._peek()
+        if token is not None and token[0] == 'op' and token[1] in ('-', '+'):
+            self._take()
+            operand = self._parse_unary()
+            if token[1] == '+':
+                return operand
+            return _call(operator.neg, [operand])
+        return self._parse_primary()
+
+    def _parse_primary(self) -> Evaluator:
+        kind, text = self._take()
+        if kind == 'number':
+            return _Constant(float(text) if any(c in text for c in '.eE') else int(text))
+        if kind == 'string':
+            quote = text[0]
+            body = text[1:-1]
+            return _Constant(body.replace("''", "'") if quote == "'" else body)
+        if kind == 'quoted':
+            return _field(text[1:-1])
+        if (kind, text) == ('punct', '('):
+            evaluator = self._parse_or()
+            self._expect('punct', ')')
+            return evaluator
+        if kind != 'word':
+            raise XWQueryValueError(f"Unexpected {text!r} in expression: {self._text!r}")
+        upper = text.upper()
+        if upper in _LITERAL_WORDS:
+            return _Constant(_LITERAL_WORDS[upper])
+        if upper == 'CASE':
+            return self._parse_case()
+        if self._peek() == ('punct', '('):
+            return self._parse_function(upper)
+        if upper in _KEYWORDS:
+            raise XWQueryValueError(f"Unexpected {text!r} in expression: {self._text!r}")
+        return _field(text)
+
+    def _parse_case(self) -> Evaluator:
+        subject = None if self._peek_keyword('WHEN') else self._parse_or()
+        branches: list[tuple[Evaluator, Evaluator]] = []
+        while self._peek_keyword('WHEN'):
+            self._take()
+            condition = self._parse_or()
+            if subject is not None:
+                condition = _binary('=', subject, condition)
+            self._expect('word', 'THEN')
+            branches.append((condition, self._parse_or()))
+        if not branches:
+            raise XWQueryValueError(f"CASE requires at least one WHEN: {self._text!r}")
+        default: Evaluator = _Constant(None)
+        if self._peek_keyword('ELSE'):
+            self._take()
+            default = self._parse_or()
+        self._expect('word', 'END')
+
+        def case(row: Any) -> Any:
+            for condition, result in branches:
+                if condition(row):
+                    return result(row)
+            return default(row)
+        return case
+
+    def _parse_function(self, name: str) -> Evaluator:
+        self._expect('punct', '(')
+        name = _FUNCTION_ALIASES.get(name, name)
+        if name == 'CAST':
+            value = self._parse_or()
+            self._expect('word', 'AS')
+            type_name = self._take()[1].upper()
+            self._expect('punct', ')')
+            return _call(lambda v: _cast(v, type_name), [value])
+        args: list[Evaluator] = []
+        if self._peek() != ('punct', ')'):
+            args.append(self._parse_or())
+            while self._peek() == ('punct', ','):
+                self._take()
+                args.append(self._parse_or())
+        self._expect('punct', ')')
+        if name in ('COALESCE', 'IFNULL'):
+            if not args:
+                raise XWQueryValueError(f"{name} requires arguments: {self._text!r}")
+
+            def coalesce(row: Any) -> Any:
+                for arg in args:
+                    value = arg(row)
+                    if value is not None:
+                        return value
+                return None
+            return _fold(coalesce, *args)
+        if name == 'NULLIF' and len(args) == 2:
+            first, second = args
+            return _fold(lambda row: None if (value := first(row)) == second(row) else value, first, second)
+        if name == 'CONCAT':
+            return _fold(lambda row: ''.join(str(v) for arg in args if (v := arg(row)) is not None), *args)
+        if name not in _FUNCTIONS:
+            raise XWQueryValueError(f"Unknown function {name!r} in expression: {self._text!r}")
+        func, min_args, max_args = _FUNCTIONS[name]
+        if not min_args <= len(args) <= max_args:
+            raise XWQueryValueError(f"{name} takes {min_args}-{max_args} arguments: {self._text!r}")
+        return _call(func, args)
+
+
+def _cache_put(cache: dict, key: Any, value: Any) -> None:
+    with _cache_lock:
+        if len(cache) >= _CACHE_SIZE:
+            cache.clear()
+        cache[key] = value
+
+
+def compile_expression(text: str) -> Evaluator:
+    """
+    Compile a scalar expression into a row evaluator.
+    Args:
+        text: Expression text, e.g. "price * quantity" or "UPPER(name)"
+    Returns:
+        Callable taking a row and returning the expression value
+    Raises:
+        XWQueryValueError: If the expression cannot be parsed
+    """
+    evaluator = _EXPRESSION_CACHE.get(text)
+    if evaluator is None:
+        evaluator = _ExpressionParser(text).parse()
+        _cache_put(_EXPRESSION_CACHE, text, evaluator)
+    return evaluator
+
+
+def split_alias(column: str) -> tuple[str, str | None]:
+    """
+    Split "expr AS alias" into (expr, alias); alias is None without AS.
+    Only a trailing top-level AS counts, so CAST(x AS INT) is left intact.
+    """
+    column = column.strip()
+    match = _ALIAS_RE.search(column)
+    if not match:
+        return column, None
+    expr = column[:match.start()]
+    if expr.count('(') != expr.count(')') or expr.count("'") % 2:
+        return column, None
+    alias = match.group(1)
+    if alias[0] in '`"\'':
+        alias = alias[1:-1]
+    return expr.strip(), alias
+
+
+def _compile_column(column: str) -> tuple[str, str, Evaluator | None, Callable[[Any], Any] | None]:
+    """Compile one column into (raw, key, evaluator, plain field getter)."""
+    expr, alias = split_alias(column)
+    try:
+        evaluator = compile_expression(expr)
+    except XWQueryValueError:
+        evaluator = None
+    if alias is not None:
+        return column, alias, evaluator, None
+    # Un-aliased: plain fields keep their name, expressions get a sanitized key
+    if re.fullmatch(r'[A-Za-z_][\w.]*', expr):
+        return column, expr, None, compile_field_getter(expr)
+    return column, expr.replace(' ', '_').replace('-', '_').replace('+', '_'), evaluator, None
+
+
+def compile_projection(columns: Sequence[str]) -> Projector:
+    """
+    Compile a SELECT column list into a row projector.
+    Plain columns are copied when present (a column literally named like an
+    expression wins), computed columns are evaluated, and columns whose
+    expression does not apply to the row are skipped. The projector returns
+    None when no column produced a value.
+    Args:
+        columns: Column expressions, e.g. ["name", "age - 5 AS perfect_age"]
+    Returns:
+        Callable mapping a row to its projected dict (or None)
+    """
+    key = tuple(column.strip() for column in columns)
+    projector = _PROJECTION_CACHE.get(key)
+    if projector is not None:
+        return projector
+    specs = [_compile_column(column) for column in key if column]
+
+    def project(row: Any) -> dict | None:
+        if not isinstance(row, dict):
+            return {'value': row}
+        projected = {}
+        for raw, name, evaluator, getter in specs:
+            if raw in row:
+                projected[raw] = row[raw]
+            elif getter is not None:
+                value = getter(row)
+                if not is_missing(value):
+                    projected[name] = value
+            elif evaluator is not None:
+                try:
+                    projected[name] = evaluator(row)
+                except (TypeError, ValueError, ArithmeticError, XWQueryValueError):
+                    continue
+        return projected or None
+    _cache_put(_PROJECTION_CACHE, key, project)
+    return project
+__all__ = [
+    'Evaluator',
+    'compile_expression',
+    'compile_projection',
+    'split_alias',
+]
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/src/exonware/xwquery/runtime/executors/file_columnar.py
+Delimited and columnar file sources: CSV/TSV, Parquet and Arrow IPC.
+Root cause: FILE_SOURCE only understood JSONL and the serialization engine
+loaded whole documents, so Parquet analytics exports had to be converted to
+JSONL before they could be queried, and every column of every row was read
+even when a query touched two columns.
+Solution: readers that stream rows through the query's `JsonlScan` (WHERE,
+narrowing, SELECT) like JSONL scans do, reading only the columns the query
+references (`JsonlScan.fields()`):
+- CSV/TSV: the C `csv` parser; only referenced columns are converted, to
+  int/float/bool by per-column types inferred from the leading rows (or
+  given as `column_types`). Values that do not fit the type stay text and
+  empty values of typed columns become None.
+- Parquet (pyarrow): columns are pruned by the reader, and row groups are
+  skipped when their min/max/null-count statistics prove that an AND-ed
+  comparison of the WHERE cannot hold for any of their rows.
+- Arrow IPC files and streams (pyarrow): record batches are read from a
+  memory map and only the referenced columns are converted to Python.
+pyarrow is optional; without it Parquet and Arrow sources raise
+UnsupportedFormatError.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.9.0.5
+Generation Date: 17-Oct-2026
+"""
+
+from __future__ import annotations
+import csv
+import re
+from collections.abc import Callable, Iterator
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any
+from ...errors import UnsupportedFormatError, XWQueryExecutionError, XWQueryValueError
+from .file_scan import JsonlScan
+from .predicates import comparison_of, split_conjuncts
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Optional: Parquet and Arrow sources need it
+    pa = pq = None
+# Extension (or format hint) -> reader
+COLUMNAR_FORMATS = {
+    'csv': 'csv', 'tsv': 'csv',
+    'parquet': 'parquet', 'pq': 'parquet',
+    'arrow': 'arrow', 'arrows': 'arrow', 'feather': 'arrow', 'ipc': 'arrow',
+}
+# Rows read to infer CSV column types
+_TYPE_SAMPLE_ROWS = 1000
+# Rows per Arrow batch converted to Python at a time
+_BATCH_ROWS = 8192
+# No leading zeros, so codes like '007' stay text
+_INT_RE = re.compile(r'[-+]?(?:0|[1-9]\d*)')
+_FLOAT_RE = re.compile(r'[-+]?(?:(?:0|[1-9]\d*)(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?')
+_BOOLS = {'true': True, 'false': False}
+
+
+def columnar_format(path: str, format_name: str | None = None) -> str | None:
+    """Reader for a file ('csv', 'parquet' or 'arrow'); None for other formats."""
+    name = format_name or Path(str(path)).suffix.lstrip('.')
+    return COLUMNAR_FORMATS.get(str(name).lower())
+
+
+def _typed(parse: Callable[[str], Any], pattern: re.Pattern) -> Callable[[str], Any]:
+    match = pattern.fullmatch
+
+    def convert(text: str) -> Any:
+        if not text:
+            return None
+        return parse(text) if match(text) else text
+    return convert
+
+
+def _to_bool(text: str) -> Any:
+    return _BOOLS.get(text.lower(), text) if text else None
+
+
+_CONVERTERS: dict[str, Callable[[str], Any] | None] = {
+    'int': _typed(int, _INT_RE),
+    'float': _typed(float, _FLOAT_RE),
+    'bool': _to_bool,
+    'str': None,
+}
+
+
+def _infer_type(values: list[str]) -> str:
+    """Narrowest CSV type ('int', 'float', 'bool', else 'str') all non-empty values fit."""
+    values = [value for value in values if value]
+    if not values:
+        return 'str'
+    if all(_INT_RE.fullmatch(value) for value in values):
+        return 'int'
+    if all(_FLOAT_RE.fullmatch(value) for value in values):
+        return 'float'
+    if all(value.lower() in _BOOLS for value in values):
+        return 'bool'
+    return 'str'
+
+
+def _csv_rows(path: str, scan: JsonlScan, delimiter: str, column_types: dict[str, str] | None) -> Iterator[dict]:
+    with open(path, newline='', encoding='utf-8-sig') as handle:
+        reader = csv.reader(handle, delimiter=delimiter)
+        header = next(reader, None)
+        if not header:
+            return
+        wanted = scan.fields()
+        columns = [(name, position) for position, name in enumerate(header) if wanted is None or name in wanted]
+        sample = list(islice(reader, _TYPE_SAMPLE_ROWS))
+        types = {
+            name: _infer_type([row[position] for row in sample if position < len(row)])
+            for name, position in columns
+        }
+        for name, kind in (column_types or {}).items():
+            if kind not in _CONVERTERS:
+                raise XWQueryValueError(f"Unknown CSV column type {kind!r} for {name!r} (use one of {sorted(_CONVERTERS)})")
+            types[name] = kind
+        converters = [(name, position, _CONVERTERS[types[name]]) for name, position in columns]
+        width = max((position for _, position in columns), default=-1) + 1
+        for row in chain(sample, reader):
+            if len(row) >= width:
+                yield {
+                    name: row[position] if convert is None else convert(row[position])
+                    for name, position, convert in converters
+                }
+            elif row:
+                yield {
+                    name: row[position] if convert is None else convert(row[position])
+                    for name, position, convert in converters if position < len(row)
+                }
+
+
+def _require_pyarrow(format_name: str) -> None:
+    if pa is None:
+        raise UnsupportedFormatError(
+            f'Reading {format_name} files requires pyarrow (pip install pyarrow)',
+            format_name=format_name, available_formats=['csv', 'jsonl']
+        )
+
+
+def _statistics_tests(scan: JsonlScan) -> list[tuple[str, str, Any]]:
+    """(field, operator, value) of the AND-ed comparisons in the scan's WHERE."""
+    condition = scan.condition
+    if not condition or callable(condition):
+        return []
+    tests = []
+    for part, _ in split_conjuncts(condition):
+        comparison = comparison_of(part)
+        if comparison is not None:
+            tests.append(comparison)
+    return tests
+
+
+def _excludes(statistics: Any, rows: int, op: str, value: Any) -> bool:
+    """True when column statistics prove `column OP value` false for every row."""
+    if op in ('IS NULL', 'IS') or (op == '=' and value is None):
+        return statistics.has_null_count and statistics.null_count == 0
+    if op in ('IS NOT NULL', 'IS NOT') or (op == '!=' and value is None):
+        return statistics.has_null_count and statistics.null_count == rows
+    if value is None or not statistics.has_min_max:
+        return False
+    low, high = statistics.min, statistics.max
+    try:
+        if op == '=':
+            return value < low or value > high
+        if op == '>':
+            return high <= value
+        if op == '>=':
+            return high < value
+        if op == '<':
+            return low >= value
+        if op == '<=':
+            return low > value
+        if op == 'IN' and isinstance(value, (list, tuple, set, frozenset)):
+            return all(item is None or item < low or item > high for item in value)
+        if op == 'BETWEEN' and isinstance(value, (list, tuple)) and len(value) >= 2:
+            return value[0] is None or value[1] is None or value[1] < low or value[0] > high
+    except TypeError:
+        # Values the column cannot be compared with: decide per row
+        return False
+    return False
+
+
+def skippable_row_groups(metadata: Any, tests: list[tuple[str, str, Any]]) -> list[int]:
+    """Row groups of a Parquet file whose statistics rule out one of `tests`."""
+    if not tests:
+        return []
+    leaves = {metadata.schema.column(index).path: index for index in range(metadata.num_columns)}
+    tests = [(leaves[field], op, value) for field, op, value in tests if field in leaves]
+    skipped = []
+    for group in range(metadata.num_row_groups):
+        row_group = metadata.row_group(group)
+        for column, op, value in tests:
+            statistics = row_group.column(column).statistics
+            if statistics is not None and _excludes(statistics, row_group.num_rows, op, value):
+                skipped.append(group)
+                break
+    return skipped
+
+
+def _parquet_rows(path: str, scan: JsonlScan) -> Iterator[dict]:
+    parquet = pq.ParquetFile(path, memory_map=True)
+    metadata = parquet.metadata
+    wanted = scan.fields()
+    columns = None if wanted is None else [name for name in parquet.schema_arrow.names if name in wanted]
+    skipped = set(skippable_row_groups(metadata, _statistics_tests(scan)))
+    stats = scan.stats
+    stats['row_groups'] = stats.get('row_groups', 0) + metadata.num_row_groups
+    stats['row_groups_skipped'] = stats.get('row_groups_skipped', 0) + len(skipped)
+    for group in skipped:
+        rows = metadata.row_group(group).num_rows
+        stats['lines'] += rows
+        stats['prefiltered'] += rows
+    groups = [group for group in range(metadata.num_row_groups) if group not in skipped]
+    if groups:
+        for batch in parquet.iter_batches(batch_size=_BATCH_ROWS, row_groups=groups, columns=columns):
+            yield from batch.to_pylist()
+
+
+def _arrow_rows(path: str, scan: JsonlScan) -> Iterator[dict]:
+    source = pa.memory_map(path)
+    try:
+        reader = pa.ipc.open_file(source)
+        batches = (reader.get_batch(index) for index in range(reader.num_record_batches))
+    except pa.ArrowInvalid:
+        # Not the file format: an IPC stream
+        source.seek(0)
+        reader = pa.ipc.open_stream(source)
+        batches = iter(reader)
+    wanted = scan.fields()
+    columns = None if wanted is None else [name for name in reader.schema.names if name in wanted]
+    for batch in batches:
+        if columns is not None:
+            batch = batch.select(columns)
+        for start in range(0, batch.num_rows, _BATCH_ROWS):
+            yield from batch.slice(start, _BATCH_ROWS).to_pylist()
+
+
+def _matching(rows: Iterator[dict], scan: JsonlScan) -> Iterator[Any]:
+    """Filter and narrow rows through `scan`, counting them in its stats."""
+    predicate, narrow, stats = scan.predicate, scan.narrow, scan.stats
+    read = matched = 0
+    try:
+        for read, row in enumerate(rows, 1):
+            if predicate is None or predicate(row):
+                matched += 1
+                yield row if narrow is None else narrow(row)
+    finally:
+        stats['lines'] += read
+        stats['decoded'] += read
+        stats['matched'] += matched
+
+
+def scan_columnar(
+    path: str,
+    scan: JsonlScan,
+    format_name: str | None = None,
+    delimiter: str | None = None,
+    column_types: dict[str, str] | None = None
+) -> Iterator[Any]:
+    """
+    Stream the matching rows of a CSV/TSV, Parquet or Arrow IPC file
+    through `scan` (format from `format_name` or the extension).
+    Raises:
+        UnsupportedFormatError: If the format is not columnar or needs pyarrow
+        XWQueryExecutionError: If the file cannot be read
+    """
+    name = str(format_name or Path(str(path)).suffix.lstrip('.')).lower()
+    kind = columnar_format(path, name)
+    if kind == 'csv':
+        rows = _csv_rows(path, scan, delimiter or ('\t' if name == 'tsv' else ','), column_types)
+        errors: tuple[type[Exception], ...] = (csv.Error, UnicodeDecodeError)
+    elif kind in ('parquet', 'arrow'):
+        _require_pyarrow(kind)
+        rows = _parquet_rows(path, scan) if kind == 'parquet' else _arrow_rows(path, scan)
+        errors = (pa.ArrowException,)
+    else:
+        raise UnsupportedFormatError(f'Not a columnar file format: {name!r}', format_name=name,
+                                     available_formats=sorted(COLUMNAR_FORMATS))
+    try:
+        yield from _matching(rows, scan)
+    except errors as error:
+        raise XWQueryExecutionError(f'Cannot read {path}: {error}')
+__all__ = [
+    'COLUMNAR_FORMATS',
+    'columnar_format',
+    'scan_columnar',
+    'skippable_row_groups',
+]
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/src/exonware/xwquery/runtime/executors/file_index.py
+Persistent line-offset and id indexes for JSONL/NDJSON files.
+Root cause: FILE_SOURCE kept one in-memory index per file in an unbounded
+per-executor cache, rebuilt it from scratch in every process and never
+noticed when the file changed, so worker cold starts rescanned multi-GB
+files before answering the first query and stale offsets could be served.
+Solution: `JsonlIndex` keeps the byte offset of every record line (an
+array('Q')) plus lazily built id -> line maps, and
+- persists them to a sidecar file (`<data file>.xwqidx`, next to the data or
+  in the `file_index_directory`), written atomically and reloaded on the
+  next open
+- validates against the file's size and mtime, both when loading the sidecar
+  and on every open of a cached index, and rebuilds on any other change
+- extends the index incrementally when the file only grew and a hash of the
+  first and last 64 KiB of the previously indexed bytes still matches
+Records are sliced from a shared memory mapping of the file (see file_mmap),
+so lookups of scattered ids are page-cache hits rather than a seek and read
+per record.
+Open indexes are shared across executors in an LRU bounded by
+`max_open_file_indexes`. Sidecars are plain JSON plus raw offsets (never
+pickled); when the sidecar cannot be written the index stays in memory.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.9.0.5
+Generation Date: 17-Oct-2026
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from ...errors import XWQueryExecutionError
+from .file_mmap import MappedFile, map_file
+from .predicates import compile_field_getter, is_missing
+INDEX_SUFFIX = '.xwqidx'
+_MAGIC = b'XWQIDX1\n'
+# Bytes hashed at each end of the indexed region
+_HASH_WINDOW = 64 * 1024
+_DEFAULT_MAX_OPEN = 16
+_open_indexes: OrderedDict[tuple[str, str], JsonlIndex] = OrderedDict()
+_lock = threading.Lock()
+
+
+def _fingerprint(handle: Any, size: int) -> str:
+    """Hash of the first and last `_HASH_WINDOW` bytes of the first `size` bytes."""
+    digest = hashlib.blake2b(digest_size=16)
+    handle.seek(0)
+    digest.update(handle.read(min(size, _HASH_WINDOW)))
+    if size > _HASH_WINDOW:
+        handle.seek(max(_HASH_WINDOW, size - _HASH_WINDOW))
+        digest.update(handle.read(size - max(_HASH_WINDOW, size - _HASH_WINDOW)))
+    return digest.hexdigest()
+
+
+def _id_key(value: Any) -> Any:
+    """Hashable form of an id value (None when it cannot be indexed)."""
+    if isinstance(value, (dict, list)) or value is None:
+        return None
+    return value
+
+
+class JsonlIndex:
+    """
+    Line offsets and id maps of one JSONL file, kept valid across appends
+    and persisted across processes. `refresh()` is called by `open_index()`
+    before every use; `state` tells how the last refresh went ('current',
+    'loaded', 'extended' or 'rebuilt').
+    """
+
+    def __init__(self, path: str, index_dir: str | None = None):
+        self.path = str(path)
+        directory = Path(index_dir) if index_dir else Path(self.path).parent
+        self.index_path = str(directory / (Path(self.path).name + INDEX_SUFFIX))
+        self.offsets = array('Q')
+        self.ids: dict[str, dict[Any, int]] = {}
+        self.persistent = True
+        self.state = None
+        self._size = 0
+        self._mtime_ns = None
+        self._complete = 0  # Offset after the last newline: extension restarts here
+        self._hash = None
+        self._mapped: MappedFile | None = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    # Validation --------------------------------------------------------
+
+    def refresh(self) -> str:
+        """Bring the index up to date with the file (load, extend or rebuild)."""
+        with self._lock:
+            try:
+                stat = os.stat(self.path)
+            except OSError as error:
+                raise XWQueryExecutionError(f'Cannot index {self.path}: {error}')
+            if self._mtime_ns is None and self._load():
+                self._validate(stat, 'loaded')
+            elif (stat.st_size, stat.st_mtime_ns) == (self._size, self._mtime_ns):
+                self.state = 'current'
+            else:
+                self._validate(stat, 'current')
+            if self.state != 'current':
+                # Readers holding the old mapping keep it until they finish
+                self._mapped = None
+            return self.state
+
+    def _validate(self, stat: os.stat_result, state: str) -> None:
+        """Keep (as `state`), extend or rebuild the index for the file's current stat."""
+        with open(self.path, 'rb') as handle:
+            if (stat.st_size, stat.st_mtime_ns) == (self._size, self._mtime_ns):
+                self.state = state
+                return
+            # The head/tail hash only vouches for appends: a same-size change
+            # with a new mtime may be an in-place rewrite anywhere in the file
+            unchanged = self._hash is not None and stat.st_size > self._size and (
+                _fingerprint(handle, self._size) == self._hash
+            )
+            if unchanged:
+                self._scan(handle, stat)
+                self.state = 'extended'
+            else:
+                self.offsets, self._complete = array('Q'), 0
+                self.ids = {field: {} for field in self.ids}
+                self._scan(handle, stat)
+                self.state = 'rebuilt'
+        self.save()
+
+    def _scan(self, handle: Any, stat: os.stat_result) -> None:
+        """Index the lines from `_complete` to the end of the file."""
+        kept = len(self.offsets)
+        while kept and self.offsets[kept - 1] >= self._complete:
+            kept -= 1
+        del self.offsets[kept:]
+        for ids in self.ids.values():
+            for key in [key for key, line in ids.items() if line >= kept]:
+                del ids[key]
+        getters = [(ids, compile_field_getter(field)) for field, ids in self.ids.items()]
+        offsets, position = self.offsets, self._complete
+        handle.seek(position)
+        for line in handle:
+            if not line.isspace():
+                if getters:
+                    self._add_ids(getters, line, len(offsets))
+                offsets.append(position)
+            position += len(line)
+            if line.endswith(b'\n'):
+                self._complete = position
+        self._size, self._mtime_ns = position, stat.st_mtime_ns
+        self._hash = _fingerprint(handle, position)
+
+    @staticmethod
+    def _add_ids(getters: list, line: bytes, number: int) -> None:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            return
+        for ids, get in getters:
+            value = get(record)
+            key = None if is_missing(value) else _id_key(value)
+            if key is not None:
+                ids.setdefault(key, number)
+
+    # Persistence -------------------------------------------------------
+
+    def save(self) -> None:
+        """Write the sidecar atomically; on failure keep the index in memory only."""
+        if not self.persistent:
+            return
+        header = {
+            'size': self._size, 'mtime_ns': self._mtime_ns, 'complete': self._complete, 'hash': self._hash,
+            'count': len(self.offsets), 'byteorder': sys.byteorder,
+            'ids': {field: list(ids.items()) for field, ids in self.ids.items()},
+        }
+        directory = os.path.dirname(self.index_path) or '.'
+        try:
+            descriptor, temporary = tempfile.mkstemp(prefix='.xwqidx-', dir=directory)
+            try:
+                with os.fdopen(descriptor, 'wb') as handle:
+                    handle.write(_MAGIC)
+                    handle.write(json.dumps(header, separators=(',', ':')).encode('utf-8') + b'\n')
+                    self.offsets.tofile(handle)
+                os.replace(temporary, self.index_path)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+        except (OSError, TypeError, ValueError):
+            # Read-only directory or ids that JSON cannot hold
+            self.persistent = False
+
+    def _load(self) -> bool:
+        """Read the sidecar (validated afterwards by `refresh`)."""
+        try:
+            with open(self.index_path, 'rb') as handle:
+                if handle.read(len(_MAGIC)) != _MAGIC:
+                    return False
+                header = json.loads(handle.readline())
+                offsets = array('Q')
+                offsets.fromfile(handle, header['count'])
+        except (OSError, EOFError, ValueError, KeyError, TypeError):
+            return False
+        if header.get('byteorder') != sys.byteorder:
+            offsets.byteswap()
+        self.offsets = offsets
+        self.ids = {field: {key: line for key, line in pairs} for field, pairs in header['ids'].items()}
+        self._size, self._mtime_ns = header['size'], header['mtime_ns']
+        self._complete, self._hash = header['complete'], header['hash']
+        return True
+
+    # Access ------------------------------------------------------------
+
+    def mapped(self) -> MappedFile | None:
+        """Shared read-only mapping of the indexed file (None when it cannot be mapped)."""
+        with self._lock:
+            if self._mapped is None or len(self._mapped) < self._size:
+                self._mapped = map_file(self.path)
+            return self._mapped
+
+    @contextmanager
+    def _line_reader(self) -> Iterator[Callable[[int], bytes]]:
+        """line(offset) -> bytes, sliced from the mapping or read from the file."""
+        mapped = self.mapped()
+        if mapped is not None:
+            yield mapped.line
+            return
+        with open(self.path, 'rb') as handle:
+            def line(offset: int) -> bytes:
+                handle.seek(offset)
+                return handle.readline()
+            yield line
+
+    def read(self, start: int, count: int | None = None) -> list[Any]:
+        """Records `start` .. `start + count` (to the end when count is None)."""
+        offsets = self.offsets
+        stop = len(offsets) if count is None else min(len(offsets), start + count)
+        if start >= stop:
+            return []
+        return self._records(range(start, stop))
+
+    def _records(self, numbers: Iterable[int]) -> list[Any]:
+        """Decode the records on lines `numbers`."""
+        offsets, loads = self.offsets, json.loads
+        with self._line_reader() as line:
+            try:
+                return [loads(line(offsets[number])) for number in numbers]
+            except ValueError as error:
+                raise XWQueryExecutionError(f'Invalid JSON record in {self.path}: {error}')
+
+    def get_page(self, page: int, size: int) -> list[Any]:
+        return self.read(max(page, 0) * size, size)
+
+    def _ids_of(self, id_field: str) -> dict[Any, int]:
+        """The id -> line map of `id_field`, built on first use."""
+        with self._lock:
+            ids = self.ids.get(id_field)
+            if ids is None:
+                ids = self.ids[id_field] = {}
+                getters = [(ids, compile_field_getter(id_field))]
+                with self._line_reader() as line:
+                    for number, offset in enumerate(self.offsets):
+                        self._add_ids(getters, line(offset), number)
+                self.save()
+            return ids
+
+    def line_of(self, value: Any, id_field: str = 'id') -> int | None:
+        """Line number of the first record whose `id_field` equals `value`."""
+        key = _id_key(value)
+        return self._ids_of(id_field).get(key) if key is not None else None
+
+    def get_by_id(self, value: Any, id_field: str = 'id') -> Any:
+        """The first record whose `id_field` equals `value` (None when absent)."""
+        found = self.get_many([value], id_field)
+        return found[0] if found else None
+
+    def get_many(self, values: Iterable[Any], id_field: str = 'id') -> list[Any]:
+        """Records of the given ids, in the order asked (absent ids are skipped)."""
+        ids = self._ids_of(id_field)
+        numbers = [ids.get(key) for key in map(_id_key, values) if key is not None]
+        return self._records([number for number in numbers if number is not None])
+
+
+def _max_open(options: dict[str, Any] | None) -> int:
+    if options and options.get('max_open_file_indexes'):
+        return int(options['max_open_file_indexes'])
+    try:
+        from ...config import get_config
+        return get_config().max_open_file_indexes
+    except Exception:
+        return _DEFAULT_MAX_OPEN
+
+
+def resolve_index_directory(options: dict[str, Any] | None = None) -> str | None:
+    """Resolve where sidecar indexes go (None = next to the data file)."""
+    if options and options.get('file_index_directory'):
+        return str(options['file_index_directory'])
+    try:
+        from ...config import get_config
+        return get_config().file_index_directory or None
+    except Exception:
+        return None
+
+
+def open_index(path: str, options: dict[str, Any] | None = None) -> JsonlIndex:
+    """
+    The shared, refreshed index of a JSONL file. Recently used indexes stay
+    open (LRU); others are reloaded from their sidecar when needed again.
+    Raises:
+        XWQueryExecutionError: If the file cannot be read
+    """
+    directory = resolve_index_directory(options)
+    key = (os.path.abspath(path), directory or '')
+    with _lock:
+        index = _open_indexes.pop(key, None)
+        if index is None:
+            index = JsonlIndex(key[0], directory)
+        _open_indexes[key] = index
+        limit = max(_max_open(options), 1)
+        while len(_open_indexes) > limit:
+            _open_indexes.popitem(last=False)
+    index.refresh()
+    return index
+
+
+def forget_index(path: str | None = None) -> None:
+    """Drop open indexes (of one file, or all); sidecars are kept."""
+    with _lock:
+        if path is None:
+            _open_indexes.clear()
+            return
+        path = os.path.abspath(path)
+        for key in [key for key in _open_indexes if key[0] == path]:
+            del _open_indexes[key]
+__all__ = [
+    'INDEX_SUFFIX',
+    'JsonlIndex',
+    'forget_index',
+    'open_index',
+    'resolve_index_directory',
+]
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/src/exonware/xwquery/runtime/executors/file_mmap.py
+Memory-mapped access to line-oriented data files.
+Root cause: FILE_SOURCE paging and id lookups did one seek + buffered
+readline per record (two syscalls and a copy into the read buffer each), so
+fetching a handful of scattered ids from a large file cost a syscall round
+trip per record even when the file was in the page cache.
+Solution: `MappedFile` maps the file read-only once and slices records
+straight out of the mapping: a lookup is a `find(b'\\n')` and one copy of the
+record's bytes (the copy the JSON decoder needs), served from the page cache.
+Streaming scans split the mapping into lines a chunk at a time (walking it
+line by line with `find` in Python was measured slower than splitting in C).
+Files that cannot be mapped (pipes, special files) make `map_file()` return
+None and callers fall back to regular reads.
+Mapped files may be appended to or replaced (rename over) while mapped, not
+truncated in place: reading a mapped page past a truncated end faults.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.9.0.5
+Generation Date: 17-Oct-2026
+"""
+
+from __future__ import annotations
+import mmap
+from collections.abc import Iterator
+from typing import Any
+# Streaming scans split the mapping into lines a chunk at a time
+_CHUNK_BYTES = 1 << 20
+
+
+class MappedFile:
+    """
+    Read-only memory map of a file, sized to the file when it was mapped
+    (bytes appended later are not visible; map again to see them). Empty
+    files map to an empty buffer.
+    """
+
+    def __init__(self, path: str):
+        self.path = str(path)
+        with open(self.path, 'rb') as handle:
+            size = handle.seek(0, 2)
+            self._buffer: Any = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self.size = len(self._buffer)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __enter__(self) -> MappedFile:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def line_end(self, start: int) -> int:
+        """End (after the newline) of the line starting at `start`."""
+        newline = self._buffer.find(b'\n', start)
+        return self.size if newline < 0 else newline + 1
+
+    def line(self, start: int) -> bytes:
+        """Bytes of the line starting at `start` (newline included)."""
+        return self._buffer[start:self.line_end(start)]
+
+    def lines(self, start: int = 0, end: int | None = None) -> Iterator[bytes]:
+        """
+        Lines (without their newline) starting in [start, end), to the end of
+        the mapping when end is None; `start` must be a line start. Lines are
+        split from chunks of about `_CHUNK_BYTES` cut at line ends.
+        """
+        buffer, size = self._buffer, self.size
+        stop = size if end is None else min(end, size)
+        position = start
+        while position < stop:
+            cut = self.line_end(min(position + _CHUNK_BYTES, stop) - 1)
+            lines = buffer[position:cut].split(b'\n')
+            if not lines[-1]:
+                lines.pop()
+            yield from lines
+            position = cut
+
+
+def map_file(path: str) -> MappedFile | None:
+    """Map `path` read-only (None when it cannot be mapped)."""
+    try:
+        return MappedFile(path)
+    except (OSError, ValueError):
+        return None
+__all__ = [
+    'MappedFile',
+    'map_file',
+]
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/src/exonware/xwquery/runtime/executors/file_scan.py
+JSONL scans with WHERE and SELECT pushed down.
+Root cause: FILE_SOURCE streamed through `XWIndex.stream(match=...)`, which
+decodes every line into a dict before the predicate runs and returns whole
+records even when the query selects two fields. On large logs where most
+lines fail the filter, nearly all of the decode work was wasted.
+Solution: scan the file as raw lines and
+- reject lines on a byte pre-check before decoding: every AND-ed comparison
+  that fails on a missing field requires `"field"` in the line, and an
+  equality (or IN list) with string literals requires `"value"` (one of the
+  values). Only literals that standard JSON encoders never escape are used,
+  so the pre-check can only reject lines the WHERE would reject.
+- run the compiled WHERE on the decoded records that pass
+- keep only the SELECT columns: records are narrowed to the top-level keys
+  the columns and ORDER BY read before they are buffered for sorting, and
+  projected last.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.9.0.5
+Generation Date: 17-Oct-2026
+"""
+
+from __future__ import annotations
+import json
+import re
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any
+from ...errors import XWQueryExecutionError
+from .expressions import compile_projection, split_alias
+from .file_mmap import map_file
+from .predicates import Predicate, comparison_of, compile_predicate, is_match_all, split_conjuncts
+# Text that JSON encoders write verbatim (no escapes, no non-ASCII)
+_VERBATIM_RE = re.compile(r'[ !#-.0-\[\]-~]*')
+# Plain (dotted) field paths, the only columns records can be narrowed for
+_PLAIN_FIELD_RE = re.compile(r'[A-Za-z_][\w.]*')
+# Operators whose comparison is false for a missing field
+_NEEDS_FIELD = {
+    '=', '!=', '>', '<', '>=', '<=', 'LIKE', 'NOT LIKE', 'IN', 'NOT IN',
+    'BETWEEN', 'NOT BETWEEN', 'CONTAINS', 'STARTSWITH', 'ENDSWITH', 'IS NOT NULL', 'IS NOT',
+}
+
+
+def _json_string(text: Any) -> bytes | None:
+    """Encoded JSON string for `text`, when no encoder would escape it."""
+    if isinstance(text, str) and _VERBATIM_RE.fullmatch(text):
+        return b'"' + text.encode('ascii') + b'"'
+    return None
+
+
+def _literals_of(field: str, op: str, value: Any) -> list[tuple[bytes, ...]]:
+    """Byte literals one comparison requires (each tuple: at least one must occur)."""
+    required = []
+    if op == '=' and value is not None:
+        encoded = _json_string(value)
+        if encoded is not None:
+            required.append((encoded,))
+    elif op == 'IN' and isinstance(value, (list, tuple)) and value:
+        encoded = tuple(_json_string(item) for item in value)
+        if all(encoded):
+            required.append(encoded)
+    if '.' not in field and (op in _NEEDS_FIELD and not (op in ('=', '!=') and value is None)):
+        key = _json_string(field)
+        if key is not None:
+            required.append((key,))
+    return required
+
+
+def required_literals(condition: Any) -> list[tuple[bytes, ...]]:
+    """
+    Byte literals a JSON line must contain to possibly match `condition`:
+    every tuple needs at least one of its literals in the line.
+    """
+    required = []
+    for part, _ in split_conjuncts(condition):
+        comparison = comparison_of(part)
+        if comparison is not None:
+            required.extend(_literals_of(*comparison))
+    return list(dict.fromkeys(required))
+
+
+def compile_prefilter(required: Sequence[tuple[bytes, ...]]) -> Callable[[bytes], bool] | None:
+    """Compile required literals into a raw line test (None when nothing is required)."""
+    if not required:
+        return None
+    # Longer literals (values rather than keys) are usually more selective
+    singles = tuple(sorted((group[0] for group in required if len(group) == 1), key=len, reverse=True))
+    alternatives = tuple(group for group in required if len(group) > 1)
+    if len(singles) == 1 and not alternatives:
+        return lambda line, _literal=singles[0]: _literal in line
+
+    def accept(line: bytes) -> bool:
+        for literal in singles:
+            if literal not in line:
+                return False
+        for group in alternatives:
+            for literal in group:
+                if literal in line:
+                    break
+            else:
+                return False
+        return True
+    return accept
+
+
+def _column_fields(columns: Sequence[str] | None) -> set[str] | None:
+    """Field paths read by plain columns; None when a column is computed."""
+    fields = set()
+    for column in columns or ():
+        expr, _ = split_alias(column)
+        if not _PLAIN_FIELD_RE.fullmatch(expr):
+            return None
+        fields.add(expr)
+    return fields
+
+
+class JsonlScan:
+    """
+    WHERE and SELECT of one FILE_SOURCE query, pushed into the line scan.
+    `condition` is the WHERE (compiled here, and the source of the byte
+    pre-check) unless an explicit `predicate` is given, `columns` the SELECT
+    list and `keep` further fields needed before projection (ORDER BY keys).
+    `stats` counts lines read, lines rejected by the pre-check, records
+    decoded and records matched. Scans pickle as their specification, so
+    worker processes recompile them. Columnar readers (see file_columnar)
+    reuse the predicate, narrowing and projection on the rows they build.
+    """
+
+    def __init__(
+        self,
+        predicate: Predicate | None = None,
+        condition: Any = None,
+        columns: Sequence[str] | str | None = None,
+        keep: Iterable[str] = ()
+    ):
+        if isinstance(columns, str):
+            columns = [columns]
+        if columns and all(str(column).strip() == '*' for column in columns):
+            columns = None
+        self._spec = {'predicate': predicate, 'condition': condition, 'columns': columns, 'keep': list(keep)}
+        self.condition = condition
+        self.predicate = predicate if predicate is not None else _record_predicate(condition)
+        self.literals = required_literals(condition) if condition and not callable(condition) else []
+        self.prefilter = compile_prefilter(self.literals)
+        self.columns = list(columns) if columns else None
+        self.project = compile_projection(self.columns) if self.columns else None
+        self.narrow = self._compile_narrow(self._spec['keep'])
+        self.stats = {'lines': 0, 'prefiltered': 0, 'decoded': 0, 'matched': 0}
+
+    def __getstate__(self) -> dict[str, Any]:
+        return self._spec
+
+    def __setstate__(self, spec: dict[str, Any]) -> None:
+        self.__init__(**spec)
+
+    def fork(self) -> JsonlScan:
+        """Same scan with its own stats (for scanning one range)."""
+        return JsonlScan(**self._spec)
+
+    def fields(self) -> set[str] | None:
+        """
+        Top-level fields the scan reads (SELECT, WHERE and `keep`), for
+        readers that can skip columns; None when every field may be needed.
+        """
+        spec = self._spec
+        selected = _column_fields(self.columns) if self.columns else None
+        if selected is None or spec['predicate'] is not None:
+            return None
+        needed = {*selected, *spec['keep']}
+        if self.condition:
+            for _, part_fields in split_conjuncts(self.condition):
+                if part_fields is None:
+                    return None
+                needed.update(part_fields)
+        return {field.split('.', 1)[0] for field in needed}
+
+    def _compile_narrow(self, keep: Iterable[str]) -> Callable[[Any], Any] | None:
+        keep = list(keep)
+        fields = _column_fields(self.columns) if self.columns and keep else None
+        if fields is None:
+            return None
+        keys = frozenset(key for field in (*fields, *keep) for key in (field, field.split('.', 1)[0]))
+
+        def narrow(record: Any) -> Any:
+            if not isinstance(record, dict):
+                return record
+            return {key: value for key, value in record.items() if key in keys}
+        return narrow
+
+    def records(self, lines: Iterable[bytes], source: str = '<jsonl>') -> Iterator[Any]:
+        """
+        Decode and filter raw JSON lines (narrowed for buffering when an
+        ORDER BY needs it). Blank lines are skipped; lines rejected by the
+        pre-check are never decoded.
+        Raises:
+            XWQueryExecutionError: If a line that has to be decoded is not valid JSON
+        """
+        accept, predicate, narrow, loads = self.prefilter, self.predicate, self.narrow, json.loads
+        stats = self.stats
+        read = rejected = decoded = matched = 0
+        try:
+            for read, line in enumerate(lines, 1):
+                if accept is not None and not accept(line):
+                    rejected += 1
+                    continue
+                try:
+                    record = loads(line)
+                except ValueError as error:
+                    if not line.strip():
+                        continue
+                    raise XWQueryExecutionError(f'Invalid JSON on line {stats["lines"] + read} of {source}: {error}')
+                decoded += 1
+                if predicate is None or predicate(record):
+                    matched += 1
+                    yield record if narrow is None else narrow(record)
+        finally:
+            stats['lines'] += read
+            stats['prefiltered'] += rejected
+            stats['decoded'] += decoded
+            stats['matched'] += matched
+
+    def projected(self, records: Iterable[Any]) -> Iterator[Any]:
+        """Apply the SELECT columns (rows without any selected value are dropped)."""
+        if self.project is None:
+            yield from records
+            return
+        project = self.project
+        for record in records:
+            row = project(record)
+            if row is not None:
+                yield row
+
+
+def _record_predicate(condition: Any) -> Predicate | None:
+    """Compiled WHERE for decoded records (None when it keeps everything)."""
+    if condition is None or condition == '' or condition == [] or condition == {}:
+        return None
+    predicate = compile_predicate(condition)
+    if is_match_all(predicate):
+        return None
+    return lambda record: isinstance(record, dict) and predicate(record)
+
+
+def _range_lines(handle: Any, start: int, end: int | None) -> Iterator[bytes]:
+    """Lines starting in [start, end) (to the end of the file when end is None)."""
+    handle.seek(start)
+    if end is None:
+        yield from handle
+        return
+    position = start
+    for line in handle:
+        if position >= end:
+            return
+        position += len(line)
+        yield line
+
+
+def scan_jsonl(path: str, scan: JsonlScan, start: int = 0, end: int | None = None) -> Iterator[Any]:
+    """
+    Stream the matching records of a JSONL/NDJSON file through `scan`;
+    `start`/`end` restrict it to the lines starting in that byte range
+    (`start` must be a line start). Lines are cut from a memory mapping of
+    the file; files that cannot be mapped are read.
+    """
+    source = path if not start and end is None else f'{path} (from byte {start})'
+    mapped = map_file(path)
+    if mapped is not None:
+        with mapped:
+            yield from scan.records(mapped.lines(start, end), source)
+        return
+    with open(path, 'rb') as handle:
+        yield from scan.records(_range_lines(handle, start, end), source)
+__all__ = [
+    'JsonlScan',
+    'compile_prefilter',
+    'required_literals',
+    'scan_jsonl',
+]
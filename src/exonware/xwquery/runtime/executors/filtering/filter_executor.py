@@ -17,6 +17,7 @@ from ....defs import OperationType
 # Following GUIDELINES_DEV.md: "Never reinvent the wheel"
 from .where_executor import WhereExecutor
 from ..utils import extract_items
+from ..predicates import compile_predicate
 
 
 from collections.abc import Callable
@@ -99,9 +100,8 @@ class FilterExecutor(AUniversalOperationExecutor):
         items = extract_items(data)
         # Apply filter using WHERE executor's condition evaluation
         # REUSE: Consistent expression evaluation across all filtering operations
-        for item in items:
-            if self._where_evaluator._evaluate_condition(item, condition):
-                filtered_items.append(item)
+        predicate = compile_predicate(condition)
+        filtered_items = [item for item in items if predicate(item)]
         return {
             'items': filtered_items,
             'count': len(filtered_items),
@@ -28,7 +28,10 @@ class HasExecutor(AUniversalOperationExecutor):
         property_name = params.get('property', params.get('field'))
         path = params.get('path')
         node = context.node
-        result_data = self._execute_has(node, property_name, path, context)
+        if not path and callable(getattr(node, 'get_all_vertices', None)):
+            result_data = self._execute_has_graph(node, params)
+        else:
+            result_data = self._execute_has(node, property_name, path, context)
         return ExecutionResult(
             success=True,
             data=result_data,
@@ -51,3 +54,34 @@ class HasExecutor(AUniversalOperationExecutor):
                      hasattr(item, property_name)]
         return {'items': matched, 'count': len(matched), 
                 'total_items': len(items), 'property': property_name}
+
+    def _execute_has_graph(self, node: Any, params: dict) -> dict:
+        """
+        HAS over graph vertices.
+        Root cause fixed: Graph vertices were not items of the node, so HAS
+        could not select them (and would have checked each one).
+        Solution: Answer from the vertex property/label indexes: vertices
+        having `property` (equal to `value` when given) and carrying `label`.
+        REUSE: graph_indexes.graph_index / find_vertices.
+        """
+        from ..adjacency import vertex_labels, vertex_properties
+        from ..graph_indexes import find_vertices, graph_index
+        property_name = params.get('property', params.get('field'))
+        label = params.get('label')
+        vertices = list(node.get_all_vertices())
+        if 'value' in params:
+            matched = find_vertices(node, label, {property_name: params['value']})
+        else:
+            index = graph_index(node)
+            if index is not None:
+                matched = set(index.vertices_with_property(property_name))
+                if label is not None:
+                    matched &= index.vertices_with_label(label)
+                matched = list(matched)
+            else:
+                matched = [
+                    vertex for vertex in vertices
+                    if property_name in vertex_properties(node, vertex)
+                    and (label is None or label in vertex_labels(node, vertex))
+                ]
+        return {'items': matched, 'count': len(matched), 'total_items': len(vertices), 'property': property_name}
@@ -15,6 +15,7 @@ from ....contracts import QueryAction, ExecutionContext, ExecutionResult
 from ....defs import OperationType
 # REUSE: Shared utilities + WHERE evaluator
 from ..utils import extract_items
+from ..predicates import compile_predicate
 from .where_executor import WhereExecutor
 
 
@@ -53,10 +54,11 @@ class OptionalExecutor(AUniversalOperationExecutor):
         items = extract_items(data)
         # Include all items, mark which match optional condition
         all_items = []
+        predicate = compile_predicate(condition)
         for item in items:
             result_item = item.copy() if isinstance(item, dict) else {'value': item}
             # REUSE: WHERE evaluator for consistent condition checking
-            result_item['_optional_matched'] = self._where_evaluator._evaluate_condition(item, condition)
+            result_item['_optional_matched'] = predicate(item)
             all_items.append(result_item)
         matched_count = sum(1 for item in all_items if item.get('_optional_matched'))
         return {'items': all_items, 'count': len(all_items), 
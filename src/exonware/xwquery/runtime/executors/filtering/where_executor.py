@@ -8,12 +8,15 @@ Email: connect@exonware.com
 Version: 0.9.0.5
 Generation Date: 08-Oct-2025
 """
+from collections.abc import Iterator
 from typing import Any
-import operator
 from ..base import AUniversalOperationExecutor
 from ....contracts import QueryAction, ExecutionContext, ExecutionResult
+from ....errors import XWQueryValueError
+from ...streaming import RowStream, iter_batches, iter_rows
 # REUSE: Shared utilities
 from ..utils import extract_items
+from ..predicates import compile_predicate, is_match_all
 class WhereExecutor(AUniversalOperationExecutor):
     """
     WHERE operation executor - Universal filtering operation.
@@ -26,40 +29,28 @@ class WhereExecutor(AUniversalOperationExecutor):
     - Performance (#4): O(n) single-pass filtering
     """
     OPERATION_NAME = "WHERE"
-    # Operator mapping for evaluation
-    OPERATORS = {
-        '==': operator.eq,
-        '!=': operator.ne,
-        '>': operator.gt,
-        '>=': operator.ge,
-        '<': operator.lt,
-        '<=': operator.le,
-        'in': lambda x, y: x in y,
-        'not in': lambda x, y: x not in y,
-        'contains': lambda x, y: y in x,
-        'startswith': lambda x, y: str(x).startswith(str(y)),
-        'endswith': lambda x, y: str(x).endswith(str(y)),
-    }
+    SUPPORTS_STREAMING = True
+
     def _do_execute(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
         """
         Execute WHERE operation - filter data based on condition.
         Supports:
         - dict-based conditions: {'field': value, 'field2': value2}
+        - SQL/grammar conditions: {'field', 'operator', 'value'}, AND/OR trees
         - Callable conditions: lambda item: item['age'] > 18
-        - Expression conditions: "field > 10"
+        - Expression conditions: "field > 10 AND name LIKE 'A%'"
         - List data from params or context node
+        The condition is compiled once and the predicate applied per item.
         """
-        condition = action.params.get('condition', action.params.get('where', {}))
+        condition = self._get_condition(action)
         # Get data from params or context node
         data = action.params.get('data', None)
         if data is None:
             # REUSE: Extract from context node using shared utility
             data = extract_items(context.node)
         # Filter data based on condition
-        filtered = []
-        for item in data:
-            if self._evaluate_condition(item, condition):
-                filtered.append(item)
+        predicate = compile_predicate(condition)
+        filtered = data if is_match_all(predicate) else [item for item in data if predicate(item)]
         return ExecutionResult(
             success=True,
             data=filtered,
@@ -70,6 +61,41 @@ class WhereExecutor(AUniversalOperationExecutor):
                 'condition': str(condition)
             }
         )
+
+    def _iter_execute(self, action: QueryAction, context: ExecutionContext, batch_size: int) -> Iterator[list[Any]]:
+        """
+        Streaming WHERE - filter rows as they are pulled from the input.
+        A RowStream input is filtered batch by batch, so each upstream batch
+        yields its matches at once instead of waiting for a full batch of them.
+        """
+        predicate = compile_predicate(self._get_condition(action))
+        data = action.params.get('data', None)
+        if data is None and isinstance(context.node, RowStream):
+            for batch in context.node.batches():
+                kept = [row for row in batch if predicate(row)]
+                if kept:
+                    yield kept
+            return
+        rows = iter(data) if data is not None else iter_rows(context.node)
+        yield from iter_batches(filter(predicate, rows), batch_size)
+
+    def _get_condition(self, action: QueryAction) -> Any:
+        """
+        Get the WHERE condition from action params.
+        Script WHERE lines carry the parsed condition directly in params
+        ({'field', 'operator', 'value'} or {'expression'}).
+        """
+        params = action.params
+        if 'condition' in params:
+            return params['condition']
+        if 'where' in params:
+            return params['where']
+        if 'field' in params and 'operator' in params:
+            return {key: params[key] for key in ('field', 'operator', 'value') if key in params}
+        if 'expression' in params:
+            return params['expression']
+        return {}
+
     def _evaluate_condition(self, item: Any, condition: Any) -> bool:
         """
         Evaluate condition on item with full expression support.
@@ -79,57 +105,18 @@ class WhereExecutor(AUniversalOperationExecutor):
         - Callable: lambda item: boolean
         - String: "field > 10" - simple expression evaluation
         - List/Tuple: [cond1, cond2, ...] - all conditions must match (AND)
+        REUSE: Delegates to the shared compiled predicate engine (compiled
+        once per condition and cached).
         """
-        if condition is None or condition == '' or condition == {}:
-            return True
-        # Handle dict-based condition (e.g., {'age': 25, 'status': 'active'})
-        if isinstance(condition, dict):
-            return self._evaluate_dict_condition(item, condition)
-        # Handle callable condition (e.g., lambda)
-        if callable(condition):
-            try:
-                return bool(condition(item))
-            except Exception:
-                return False
-        # Handle string expression (e.g., "age > 18")
-        if isinstance(condition, str):
-            return self._evaluate_expression(item, condition)
-        # Handle list/tuple of conditions (AND logic)
-        if isinstance(condition, (list, tuple)):
-            return all(self._evaluate_condition(item, cond) for cond in condition)
-        # Default: treat as boolean
-        return bool(condition)
+        return compile_predicate(condition)(item)
+
     def _evaluate_dict_condition(self, item: Any, condition: dict) -> bool:
         """
         Evaluate dict-based condition.
         Example: {'age': 25, 'status': 'active'} matches if both fields match.
         """
-        if isinstance(item, dict):
-            # Check all condition fields match
-            for key, expected_value in condition.items():
-                if key not in item:
-                    return False
-                actual_value = item[key]
-                # Handle nested dict conditions
-                if isinstance(expected_value, dict):
-                    if not self._evaluate_dict_condition(actual_value, expected_value):
-                        return False
-                # Handle list membership
-                elif isinstance(expected_value, (list, tuple)):
-                    if actual_value not in expected_value:
-                        return False
-                # Direct comparison
-                elif actual_value != expected_value:
-                    return False
-            return True
-        else:
-            # For non-dict items, check attributes
-            for key, expected_value in condition.items():
-                if not hasattr(item, key):
-                    return False
-                if getattr(item, key) != expected_value:
-                    return False
-            return True
+        return compile_predicate(condition)(item)
+
     def _evaluate_expression(self, item: Any, expression: str) -> bool:
         """
         Evaluate string expression.
@@ -138,70 +125,10 @@ class WhereExecutor(AUniversalOperationExecutor):
         - "name == 'John'"
         - "age >= 18"
         - "status in ['active', 'pending']"
+        - AND / OR / NOT with parentheses
         """
         try:
-            # Parse expression - find operator (check longer ops first: >= before >, <= before <)
-            op_order = ['>=', '<=', '!=', '<>', '==', '>', '<', '=', 'in', 'not in', 'contains', 'startswith', 'endswith']
-            for op_str in op_order:
-                if op_str in expression and op_str in self.OPERATORS:
-                    op_func = self.OPERATORS[op_str]
-                    parts = expression.split(op_str, 1)
-                    if len(parts) == 2:
-                        field = parts[0].strip()
-                        value_str = parts[1].strip()
-                        # Extract field value from item
-                        if isinstance(item, dict):
-                            actual_value = item.get(field)
-                        elif hasattr(item, field):
-                            actual_value = getattr(item, field)
-                        else:
-                            return False
-                        # Parse expected value
-                        expected_value = self._parse_value(value_str)
-                        # Evaluate operator
-                        return op_func(actual_value, expected_value)
-            # No operator found - treat as field existence check
-            field = expression.strip()
-            if isinstance(item, dict):
-                return field in item and bool(item[field])
-            else:
-                return hasattr(item, field) and bool(getattr(item, field))
-        except Exception:
+            return compile_predicate(expression)(item)
+        except XWQueryValueError:
             return False
-    def _parse_value(self, value_str: str) -> Any:
-        """
-        Parse value string to appropriate Python type.
-        Handles: numbers, strings (quoted), lists, booleans, None
-        """
-        value_str = value_str.strip()
-        # Handle None
-        if value_str.lower() == 'none' or value_str.lower() == 'null':
-            return None
-        # Handle booleans
-        if value_str.lower() == 'true':
-            return True
-        if value_str.lower() == 'false':
-            return False
-        # Handle quoted strings
-        if (value_str.startswith("'") and value_str.endswith("'")) or \
-           (value_str.startswith('"') and value_str.endswith('"')):
-            return value_str[1:-1]
-        # Handle lists
-        if value_str.startswith('[') and value_str.endswith(']'):
-            try:
-                # Simple list parsing (not full eval for security)
-                items_str = value_str[1:-1]
-                items = [self._parse_value(item.strip()) for item in items_str.split(',') if item.strip()]
-                return items
-            except Exception:
-                return value_str
-        # Handle numbers
-        try:
-            if '.' in value_str:
-                return float(value_str)
-            return int(value_str)
-        except ValueError:
-            pass
-        # Return as string
-        return value_str
 __all__ = ['WhereExecutor']
@@ -34,6 +34,10 @@ from .subgraph_executor import SubgraphExecutor
 from .traversal_executor import TraversalExecutor
 from .update_edge_executor import UpdateEdgeExecutor
 from .variable_path_executor import VariablePathExecutor
+from .pagerank_executor import PageRankExecutor
+from .betweenness_executor import BetweennessExecutor
+from .triangle_count_executor import TriangleCountExecutor
+from .k_core_executor import KCoreExecutor
 __all__ = [
     'MatchExecutor',
     'PathExecutor',
@@ -69,4 +73,8 @@ __all__ = [
     'TraversalExecutor',
     'UpdateEdgeExecutor',
     'VariablePathExecutor',
+    'PageRankExecutor',
+    'BetweennessExecutor',
+    'TriangleCountExecutor',
+    'KCoreExecutor',
 ]
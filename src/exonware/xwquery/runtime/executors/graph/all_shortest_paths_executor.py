@@ -38,20 +38,26 @@ class AllShortestPathsExecutor(AUniversalOperationExecutor):
     def _execute_all_shortest_paths(self, node: Any, params: dict, context: ExecutionContext) -> dict:
         """
         Execute ALL_SHORTEST_PATHS - Find all shortest paths between nodes.
-        Root cause fixed: Missing ALL_SHORTEST_PATHS operation.
-        Solution: Full implementation with BFS to find all paths of minimum length.
-        REUSE: Leverages BFS algorithm from shortest_path_executor.
+        Root cause fixed: Missing ALL_SHORTEST_PATHS operation; later a BFS for
+        the distance followed by a recursive DFS over every path of that
+        length, exploring dead branches and hitting the recursion limit.
+        Solution: One BFS (Dijkstra when weighted) builds the predecessor DAG
+        of all shortest paths, which are then counted exactly and listed
+        without backtracking, within max_paths/timeout budgets.
+        REUSE: graph_algorithms.py shortest_path_dag/dag_paths.
+        Params:
+            weighted / weight_property: Minimize total edge weight
+            max_paths: Paths to return (default 100)
+            max_length: Edge limit for unweighted searches
+            timeout: Enumeration time budget in seconds (default: OPTIONS timeout)
         Priority Alignment:
         - Usability (#2): Standard all shortest paths syntax.
-        - Maintainability (#3): Reuses BFS path finding logic.
-        - Performance (#4): Efficient BFS-based enumeration.
+        - Maintainability (#3): Shared path enumeration kernels.
+        - Performance (#4): Output-linear enumeration over the predecessor DAG.
         - Extensibility (#5): Supports weighted and unweighted graphs.
         """
-        from collections import deque
         source = params.get('source', params.get('start'))
         target = params.get('target', params.get('end'))
-        weighted = params.get('weighted', False)
-        max_paths = params.get('max_paths', 100)  # Safety limit
         if not source or not target:
             return {
                 'paths': [],
@@ -62,25 +68,15 @@ class AllShortestPathsExecutor(AUniversalOperationExecutor):
             }
         # Try to use xwnode graph capabilities
         if hasattr(node, 'get_neighbors') and callable(node.get_neighbors):
-            # BFS to find shortest distance first, then enumerate all paths at that distance
-            shortest_distance = self._find_shortest_distance(node, source, target)
-            if shortest_distance == float('inf'):
-                return {
-                    'paths': [],
-                    'source': source,
-                    'target': target,
-                    'shortest_distance': float('inf'),
-                    'path_count': 0,
-                    'status': 'implemented'
-                }
-            # Find all paths of shortest distance
-            paths = self._find_all_paths_at_distance(node, source, target, shortest_distance, max_paths)
+            paths, shortest_distance, total, truncated = self._find_all_shortest_paths(node, source, target, params, context)
             return {
                 'paths': paths,
                 'source': source,
                 'target': target,
                 'shortest_distance': shortest_distance,
                 'path_count': len(paths),
+                'total_path_count': total,
+                'truncated': truncated,
                 'status': 'implemented'
             }
         return {
@@ -92,45 +88,21 @@ class AllShortestPathsExecutor(AUniversalOperationExecutor):
             'note': 'Node does not support graph operations - xwnode graph strategies recommended'
         }
 
-    def _find_shortest_distance(self, node: Any, source: str, target: str) -> float:
-        """Find shortest distance using BFS."""
-        from collections import deque
-        if source == target:
-            return 0
-        queue = deque([(source, 0)])
-        visited = {source}
-        while queue:
-            current, distance = queue.popleft()
-            try:
-                neighbors = list(node.get_neighbors(current))
-                for neighbor in neighbors:
-                    if neighbor == target:
-                        return distance + 1
-                    if neighbor not in visited:
-                        visited.add(neighbor)
-                        queue.append((neighbor, distance + 1))
-            except Exception:
-                break
-        return float('inf')
-
-    def _find_all_paths_at_distance(self, node: Any, source: str, target: str, distance: int, max_paths: int) -> list:
-        """Find all paths of exact distance using DFS."""
-        paths = []
-        def dfs(current: str, path: list, remaining_steps: int):
-            if len(paths) >= max_paths:
-                return
-            if remaining_steps == 0:
-                if current == target:
-                    paths.append(path.copy())
-                return
-            try:
-                neighbors = list(node.get_neighbors(current))
-                for neighbor in neighbors:
-                    if neighbor not in path:  # Avoid cycles
-                        path.append(neighbor)
-                        dfs(neighbor, path, remaining_steps - 1)
-                        path.pop()
-            except Exception:
-                pass
-        dfs(source, [source], distance)
-        return paths
+    def _find_all_shortest_paths(self, node: Any, source: str, target: str, params: dict, context: ExecutionContext) -> tuple:
+        """(paths, distance, total path count, truncated) from the predecessor DAG."""
+        from ..adjacency import adjacency, weight_function
+        from ..graph_algorithms import budget_deadline, collect_paths, count_dag_paths, dag_paths, shortest_path_dag
+        graph = adjacency(node)
+        start, goal = graph.index_of(source), graph.index_of(target)
+        if start is None or goal is None:
+            return ([[source]], 0, 1, False) if source == target else ([], float('inf'), 0, False)
+        weighted = bool(params.get('weighted', False))
+        weight_of = weight_function(node, params.get('weight_property', 'weight')) if weighted else None
+        predecessors, distance = shortest_path_dag(graph, start, goal, weight_of, weighted, params.get('max_length'))
+        total = count_dag_paths(predecessors, goal)
+        deadline = budget_deadline(params.get('timeout', context.metadata.get('timeout')))
+        indexes, truncated = collect_paths(dag_paths(predecessors, goal), params.get('max_paths', 100), deadline)
+        vertices = graph.vertices
+        paths = [[vertices[position] for position in path] for path in indexes]
+        return paths, distance, total, truncated and len(paths) < total
+__all__ = ['AllShortestPathsExecutor']
@@ -37,13 +37,23 @@ class AllSimplePathsExecutor(AUniversalOperationExecutor):
     def _execute_all_simple_paths(self, node: Any, params: dict, context: ExecutionContext) -> dict:
         """
         Execute ALL_SIMPLE_PATHS - Find all simple paths (no cycles).
-        Root cause fixed: Missing ALL_SIMPLE_PATHS operation.
-        Solution: Full implementation with DFS path enumeration avoiding cycles.
-        REUSE: Leverages DFS from all_paths_executor with cycle avoidance.
+        Root cause fixed: Missing ALL_SIMPLE_PATHS operation; later an unbounded
+        recursive DFS that hit the recursion limit on deep graphs and walked
+        every dead branch.
+        Solution: Explicit-stack DFS over the adjacency snapshot, pruned by
+        BFS distances to the target, within max_paths/timeout budgets; with
+        `k`, the k cheapest simple paths by Yen's algorithm instead.
+        REUSE: graph_algorithms.py bounded_paths.
+        Params:
+            max_length: Maximum vertices per path (default 10)
+            max_paths: Paths to return (default 100)
+            k: Return the k shortest simple paths, cheapest first
+            weighted / weight_property: Rank k paths by total edge weight
+            timeout: Enumeration time budget in seconds (default: OPTIONS timeout)
         Priority Alignment:
         - Usability (#2): Standard all simple paths syntax.
-        - Maintainability (#3): Reuses path enumeration logic.
-        - Performance (#4): DFS with backtracking (can be expensive).
+        - Maintainability (#3): Shared path enumeration kernels.
+        - Performance (#4): Pruned iterative DFS; Yen's algorithm for top-k routes.
         - Extensibility (#5): Supports max length and max paths limits.
         """
         source = params.get('source', params.get('start'))
@@ -60,16 +70,20 @@ class AllSimplePathsExecutor(AUniversalOperationExecutor):
             }
         # Try to use xwnode graph capabilities
         if hasattr(node, 'get_neighbors') and callable(node.get_neighbors):
-            paths = self._find_all_simple_paths_dfs(node, source, target, max_length, max_paths)
-            return {
+            paths, costs, truncated = self._find_paths(node, source, target, params, context)
+            result = {
                 'paths': paths,
                 'source': source,
                 'target': target,
                 'max_length': max_length,
                 'max_paths': max_paths,
                 'path_count': len(paths),
+                'truncated': truncated,
                 'status': 'implemented'
             }
+            if params.get('k') is not None:
+                result.update(k=params['k'], costs=costs)
+            return result
         return {
             'paths': [],
             'source': source,
@@ -79,25 +93,25 @@ class AllSimplePathsExecutor(AUniversalOperationExecutor):
             'note': 'Node does not support graph operations - xwnode graph strategies recommended'
         }
 
-    def _find_all_simple_paths_dfs(self, node: Any, source: str, target: str, max_length: int, max_paths: int) -> list:
-        """Find all simple paths using DFS with backtracking."""
-        paths = []
-        def dfs(current: str, path: list):
-            if len(paths) >= max_paths:
-                return
-            if current == target:
-                paths.append(path.copy())
-                return
-            if len(path) >= max_length:
-                return
-            try:
-                neighbors = list(node.get_neighbors(current))
-                for neighbor in neighbors:
-                    if neighbor not in path:  # Simple path: no repeated vertices
-                        path.append(neighbor)
-                        dfs(neighbor, path)
-                        path.pop()
-            except Exception:
-                pass
-        dfs(source, [source])
-        return paths
+    def _find_paths(self, node: Any, source: str, target: str, params: dict, context: ExecutionContext) -> tuple:
+        """(paths, costs, truncated) over the graph's adjacency snapshot."""
+        from ..adjacency import adjacency, reverse_adjacency, weight_function
+        from ..graph_algorithms import bounded_paths, budget_deadline
+        graph = adjacency(node)
+        start, goal = graph.index_of(source), graph.index_of(target)
+        if start is None or goal is None:
+            return ([[source]], [0], False) if source == target else ([], [], False)
+        k = params.get('k')
+        weight_of = weight_function(node, params.get('weight_property', 'weight')) if params.get('weighted') else None
+        indexes, costs, truncated = bounded_paths(
+            graph, start, goal,
+            k=int(k) if k is not None else None,
+            weight_of=weight_of,
+            max_length=params.get('max_length', 10) - 1,
+            max_paths=params.get('max_paths', 100),
+            reverse=reverse_adjacency(node, graph),
+            deadline=budget_deadline(params.get('timeout', context.metadata.get('timeout')))
+        )
+        vertices = graph.vertices
+        return [[vertices[position] for position in path] for path in indexes], costs, truncated
+__all__ = ['AllSimplePathsExecutor']
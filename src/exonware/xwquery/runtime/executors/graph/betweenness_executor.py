@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/src/exonware/xwquery/executors/graph/betweenness_executor.py
+BETWEENNESS Operation Executor - Betweenness centrality of vertices
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.9.0.5
+Generation Date: 17-Oct-2026
+"""
+
+from typing import Any
+from ..base import AUniversalOperationExecutor
+from ....contracts import QueryAction, ExecutionContext, ExecutionResult
+
+
+class BetweennessExecutor(AUniversalOperationExecutor):
+    """
+    BETWEENNESS operation executor - Betweenness centrality of vertices.
+    Cypher (GDS): CALL gds.betweenness.stream(graph)
+    Brandes' algorithm over the graph's CSR snapshot; with 'samples' it
+    expands only k random sources (approximate, O(k * E)).
+    """
+    OPERATION_NAME = "BETWEENNESS"
+
+    def _do_execute(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
+        """Execute BETWEENNESS operation."""
+        params = action.params
+        node = context.node
+        result_data = self._execute_betweenness(node, params, context)
+        return ExecutionResult(
+            success=True,
+            data=result_data,
+            action_type=self.OPERATION_NAME,
+            metadata={'operation': self.OPERATION_NAME}
+        )
+
+    def _execute_betweenness(self, node: Any, params: dict, context: ExecutionContext) -> dict:
+        """
+        Execute BETWEENNESS - Betweenness centrality of vertices.
+        Root cause fixed: Missing BETWEENNESS operation (graphs were exported to
+        NetworkX for analysis, doubling memory).
+        Solution: Brandes' dependency accumulation from every source, or from
+        a seeded random sample of sources scaled by V / k.
+        REUSE: graph_metrics.py betweenness_centrality over adjacency.py snapshots.
+        Params:
+            samples: Number of sampled sources (also 'k'); default all (exact)
+            seed: Random seed for reproducible samples
+            directed: Follow edge direction (default True)
+            normalized: Divide by (V - 1)(V - 2) (default True)
+            weighted / weight_property: Shortest paths by edge weight
+            limit: Most central vertices listed in 'top' (default 10)
+            edges: Edge rows to use instead of a graph node
+        """
+        from ..adjacency import weight_function
+        from ..graph_metrics import analysis_graph, betweenness_centrality, top_scores
+        graph = analysis_graph(node, params.get('edges'))
+        weight_of = weight_function(node, params.get('weight_property', 'weight')) if params.get('weighted') else None
+        samples = params.get('samples', params.get('k'))
+        scores, sources = betweenness_centrality(
+            graph,
+            samples=int(samples) if samples is not None else None,
+            seed=params.get('seed'),
+            weight_of=weight_of,
+            directed=params.get('directed', True),
+            normalized=params.get('normalized', True)
+        )
+        return {
+            'scores': dict(zip(graph.vertices, scores)),
+            'top': top_scores(graph.vertices, scores, int(params.get('limit', 10))),
+            'sources': sources,
+            'approximate': sources < len(graph),
+            'vertex_count': len(graph),
+            'status': 'implemented'
+        }
+__all__ = ['BetweennessExecutor']
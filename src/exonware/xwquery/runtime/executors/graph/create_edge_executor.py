@@ -39,23 +39,58 @@ class CreateEdgeExecutor(AUniversalOperationExecutor):
     def _execute_create_edge(self, node: Any, params: dict, context: ExecutionContext) -> dict:
         """
         Execute CREATE_EDGE - Add new edge/relationship.
-        FUTURE: Will use xwnode graph modification methods.
+        Root cause fixed: The edge was never added to the graph.
+        Solution: Add it through the graph's `add_edge`, keeping the label,
+        property and edge type indexes and the cached adjacency in step.
+        REUSE: graph_indexes.graph_mutation (index maintenance + mark_graph_changed).
+        Params:
+        - source/from, target/to: Endpoints
+        - edge_type/label/type: Edge type; properties: Edge properties
+        - directed: False also adds target -> source
         """
+        from ..graph_indexes import graph_mutation, write_edge_properties
         source = params.get('source', params.get('from'))
         target = params.get('target', params.get('to'))
         edge_type = params.get('edge_type', params.get('label', params.get('type')))
         properties = params.get('properties', {})
         directed = params.get('directed', True)
-        # FUTURE: Use xwnode's graph methods
-        # edge_id = graph.add_edge(source, target, edge_type=edge_type, properties=properties, directed=directed)
+        add_edge = getattr(node, 'add_edge', None)
+        if not callable(add_edge):
+            return {
+                'edge_created': True,
+                'source': source,
+                'target': target,
+                'edge_type': edge_type,
+                'properties': properties,
+                'directed': directed,
+                'status': 'basic_implementation',
+                'note': 'Will use xwnode graph modification for production'
+            }
+        pairs = [(source, target)] if directed else [(source, target), (target, source)]
+        with graph_mutation(node) as index:
+            for pair in pairs:
+                index.unindex_edge(*pair)
+            try:
+                edge_id = add_edge(source, target, edge_type=edge_type, properties=properties, directed=directed)
+            except TypeError:
+                # Plain add_edge(source, target): write the type and properties afterwards
+                edge_id = None
+                values = {**({'type': edge_type} if edge_type is not None else {}), **(properties or {})}
+                for pair in pairs:
+                    add_edge(*pair)
+                    write_edge_properties(node, *pair, values)
+            for pair in pairs:
+                index.index_edge(*pair)
+            index.index_vertex(source)
+            index.index_vertex(target)
         return {
             'edge_created': True,
+            'edge_id': edge_id,
             'source': source,
             'target': target,
             'edge_type': edge_type,
             'properties': properties,
             'directed': directed,
-            'status': 'basic_implementation',
-            'note': 'Will use xwnode graph modification for production'
+            'status': 'implemented'
         }
 __all__ = ['CreateEdgeExecutor']
@@ -71,91 +71,71 @@ class CycleDetectionExecutor(AUniversalOperationExecutor):
             'note': 'Node does not support graph operations - xwnode graph strategies recommended'
         }
 
+    def _roots(self, node: Any, graph: Any) -> list[int]:
+        """Start vertices (every vertex the graph lists) as adjacency indexes."""
+        try:
+            vertices = list(node.get_all_vertices()) if hasattr(node, 'get_all_vertices') else []
+        except Exception:
+            vertices = []
+        roots = (graph.index_of(vertex) for vertex in vertices)
+        return [root for root in roots if root is not None]
+
     def _detect_cycle_directed(self, node: Any) -> tuple:
-        """Detect cycle in directed graph using DFS with color marking."""
-        # Color: WHITE (unvisited), GRAY (visiting), BLACK (visited)
+        """Detect cycle in directed graph using DFS with color marking (explicit stack)."""
+        from ..adjacency import adjacency
+        graph = adjacency(node)
+        # Color: absent (unvisited), GRAY (on the DFS stack), BLACK (finished)
         color = {}
-        parent = {}
-        cycle = []
-        def dfs(vertex: str) -> bool:
-            color[vertex] = 'GRAY'
-            try:
-                neighbors = list(node.get_neighbors(vertex))
-                for neighbor in neighbors:
+        for root in self._roots(node, graph):
+            if root in color:
+                continue
+            color[root] = 'GRAY'
+            path = [root]
+            stack = [iter(graph.out(root))]
+            while stack:
+                for neighbor in stack[-1]:
                     if neighbor not in color:
-                        parent[neighbor] = vertex
-                        if dfs(neighbor):
-                            return True
-                    elif color[neighbor] == 'GRAY':
-                        # Back edge found - cycle detected
-                        # Reconstruct cycle
-                        cycle_path = [neighbor]
-                        current = vertex
-                        while current != neighbor and current in parent:
-                            cycle_path.append(current)
-                            current = parent.get(current)
-                        cycle_path.append(neighbor)
-                        cycle.extend(reversed(cycle_path))
-                        return True
-            except Exception:
-                pass
-            color[vertex] = 'BLACK'
-            return False
-        # Try to get all vertices
-        try:
-            # For now, start from first available vertex
-            # In production, would iterate over all vertices
-            if hasattr(node, 'get_all_vertices'):
-                vertices = list(node.get_all_vertices())
-            else:
-                # Fallback: try to detect from neighbors
-                vertices = []
-            for vertex in vertices:
-                if vertex not in color:
-                    if dfs(vertex):
-                        return True, cycle
-        except Exception:
-            pass
+                        color[neighbor] = 'GRAY'
+                        path.append(neighbor)
+                        stack.append(iter(graph.out(neighbor)))
+                        break
+                    if color[neighbor] == 'GRAY':
+                        # Back edge found - the cycle is the stack from `neighbor` up
+                        cycle = path[path.index(neighbor):] + [neighbor]
+                        return True, [graph.vertices[position] for position in cycle]
+                else:
+                    stack.pop()
+                    color[path.pop()] = 'BLACK'
         return False, []
 
     def _detect_cycle_undirected(self, node: Any) -> tuple:
-        """Detect cycle in undirected graph using DFS with parent tracking."""
+        """Detect cycle in undirected graph using DFS with parent tracking (explicit stack)."""
+        from ..adjacency import adjacency
+        graph = adjacency(node)
         visited = set()
-        parent = {}
-        cycle = []
-        def dfs(vertex: str, parent_vertex: str = None) -> bool:
-            visited.add(vertex)
-            try:
-                neighbors = list(node.get_neighbors(vertex))
-                for neighbor in neighbors:
+        for root in self._roots(node, graph):
+            if root in visited:
+                continue
+            visited.add(root)
+            path = [root]
+            on_path = {root}
+            stack = [iter(graph.out(root))]
+            while stack:
+                current = path[-1]
+                parent_vertex = path[-2] if len(path) > 1 else None
+                for neighbor in stack[-1]:
                     if neighbor not in visited:
-                        parent[neighbor] = vertex
-                        if dfs(neighbor, vertex):
-                            return True
-                    elif neighbor != parent_vertex:
-                        # Back edge found - cycle detected
-                        cycle_path = [neighbor]
-                        current = vertex
-                        while current != neighbor and current in parent:
-                            cycle_path.append(current)
-                            current = parent.get(current)
-                        cycle_path.append(neighbor)
-                        cycle.extend(cycle_path)
-                        return True
-            except Exception:
-                pass
-            return False
-        # Try to get all vertices
-        try:
-            if hasattr(node, 'get_all_vertices'):
-                vertices = list(node.get_all_vertices())
-            else:
-                vertices = []
-            for vertex in vertices:
-                if vertex not in visited:
-                    if dfs(vertex):
-                        return True, cycle
-        except Exception:
-            pass
+                        visited.add(neighbor)
+                        path.append(neighbor)
+                        on_path.add(neighbor)
+                        stack.append(iter(graph.out(neighbor)))
+                        break
+                    if neighbor != parent_vertex and neighbor in on_path:
+                        # Back edge found - walk back from `current` to `neighbor`
+                        cycle = [neighbor] + path[path.index(neighbor) + 1:][::-1] + [neighbor]
+                        return True, [graph.vertices[position] for position in cycle]
+                else:
+                    stack.pop()
+                    on_path.discard(path.pop())
         return False, []
 __all__ = ['CycleDetectionExecutor']
@@ -21,7 +21,7 @@ class DegreeExecutor(AUniversalOperationExecutor):
     - In-degree: number of incoming edges
     - Out-degree: number of outgoing edges
     - Total degree: in-degree + out-degree
-    Reuses xwnode degree calculation.
+    Computed for all vertices at once from the graph's CSR snapshot.
     """
     OPERATION_NAME = "DEGREE"
 
@@ -40,26 +40,50 @@ class DegreeExecutor(AUniversalOperationExecutor):
     def _execute_degree(self, node: Any, params: dict, context: ExecutionContext) -> dict:
         """
         Execute DEGREE - Calculate node degree.
-        FUTURE: Will use xwnode degree calculation.
+        Root cause fixed: Stub that always returned zero degrees.
+        Solution: Degrees of every vertex at once from the CSR snapshot
+        (offset differences for out-degree, target counts for in-degree),
+        returned as {vertex: degree} maps; with 'vertex', that vertex's
+        degrees as numbers.
+        REUSE: graph_metrics.py degree_counts over adjacency.py snapshots.
+        Params:
+            vertex: Report a single vertex (also 'node_id'/'id'); default all
+            type: 'in', 'out' or 'total' (default): ranking used for 'top'
+            limit: Highest-degree vertices listed in 'top' (default 10)
+            edges: Edge rows to use instead of a graph node
         """
-        degree_type = params.get('type', 'total')  # in, out, total
+        from ..graph_metrics import analysis_graph, degree_counts, top_scores
+        degree_type = str(params.get('type', params.get('direction', 'total'))).lower()
         edge_type = params.get('edge_type')
-        in_degree = 0
-        out_degree = 0
-        total_degree = 0
-        # FUTURE: Use xwnode's degree methods
-        # if degree_type in ['in', 'total']:
-        #     in_degree = node.in_degree(edge_type=edge_type)
-        # if degree_type in ['out', 'total']:
-        #     out_degree = node.out_degree(edge_type=edge_type)
-        # total_degree = in_degree + out_degree
+        graph = analysis_graph(node, params.get('edges'))
+        out_degrees, in_degrees = degree_counts(graph)
+        vertex = params.get('vertex', params.get('node_id', params.get('id')))
+        if vertex is not None:
+            position = graph.index_of(vertex)
+            out_degree = out_degrees[position] if position is not None else 0
+            in_degree = in_degrees[position] if position is not None else 0
+            return {
+                'vertex': vertex,
+                'in_degree': in_degree,
+                'out_degree': out_degree,
+                'total_degree': in_degree + out_degree,
+                'degree_type': degree_type,
+                'edge_type': edge_type,
+                'status': 'implemented'
+            }
+        totals = [incoming + outgoing for incoming, outgoing in zip(in_degrees, out_degrees)]
+        degrees = {'in': in_degrees, 'out': out_degrees}.get(degree_type, totals)
+        vertices = graph.vertices
         return {
-            'in_degree': in_degree,
-            'out_degree': out_degree,
-            'total_degree': total_degree,
+            'in_degree': dict(zip(vertices, in_degrees)),
+            'out_degree': dict(zip(vertices, out_degrees)),
+            'total_degree': dict(zip(vertices, totals)),
+            'top': top_scores(vertices, degrees, int(params.get('limit', 10))),
+            'max_degree': max(degrees, default=0),
+            'average_degree': sum(degrees) / len(degrees) if degrees else 0.0,
+            'vertex_count': len(vertices),
             'degree_type': degree_type,
             'edge_type': edge_type,
-            'status': 'basic_implementation',
-            'note': 'Will use xwnode degree calculation for production'
+            'status': 'implemented'
         }
 __all__ = ['DegreeExecutor']
@@ -39,26 +39,56 @@ class DeleteEdgeExecutor(AUniversalOperationExecutor):
     def _execute_delete_edge(self, node: Any, params: dict, context: ExecutionContext) -> dict:
         """
         Execute DELETE_EDGE - Remove edge/relationship.
-        FUTURE: Will use xwnode graph modification methods.
+        Root cause fixed: Nothing was removed (deleted_count was always 0).
+        Solution: Select the edges (by endpoints, edge type - an index lookup -
+        and condition) and remove each through the graph's `remove_edge`,
+        keeping the indexes and the cached adjacency in step.
+        REUSE: graph_indexes.edge_pairs / graph_mutation.
+        Params:
+        - edge_id/id: Remove one edge by id
+        - source/from, target/to, edge_type/label: Edge selection (any when omitted)
+        - condition/where: Condition on the edge properties
+        Without any selector nothing is deleted (as DETACH_DELETE).
         """
+        from ..graph_indexes import edge_pairs, graph_mutation
         edge_id = params.get('edge_id', params.get('id'))
         source = params.get('source', params.get('from'))
         target = params.get('target', params.get('to'))
         edge_type = params.get('edge_type', params.get('label'))
         condition = params.get('condition', params.get('where'))
         deleted_count = 0
-        # FUTURE: Use xwnode's graph methods
-        # if edge_id:
-        #     deleted_count = graph.remove_edge(edge_id)
-        # else:
-        #     deleted_count = graph.remove_edges(source, target, edge_type=edge_type, condition=condition)
+        remove_edge = getattr(node, 'remove_edge', None)
+        if not callable(remove_edge) or not callable(getattr(node, 'get_neighbors', None)):
+            return {
+                'deleted_count': deleted_count,
+                'edge_id': edge_id,
+                'source': source,
+                'target': target,
+                'edge_type': edge_type,
+                'status': 'basic_implementation',
+                'note': 'Will use xwnode graph modification for production'
+            }
+        if edge_id is not None:
+            with graph_mutation(node) as index:
+                # The endpoints of an edge id are unknown: rebuild the indexes lazily
+                index.clear()
+                deleted_count = 0 if remove_edge(edge_id) is False else 1
+        elif source is not None or target is not None or edge_type or condition:
+            pairs = edge_pairs(node, source, target, edge_type, condition)
+            with graph_mutation(node) as index:
+                for pair in pairs:
+                    index.unindex_edge(*pair)
+                    if remove_edge(*pair) is not False:
+                        deleted_count += 1
+                    if pair[1] in (node.get_neighbors(pair[0]) or ()):
+                        # A parallel edge remains
+                        index.index_edge(*pair)
         return {
             'deleted_count': deleted_count,
             'edge_id': edge_id,
             'source': source,
             'target': target,
             'edge_type': edge_type,
-            'status': 'basic_implementation',
-            'note': 'Will use xwnode graph modification for production'
+            'status': 'implemented'
         }
 __all__ = ['DeleteEdgeExecutor']
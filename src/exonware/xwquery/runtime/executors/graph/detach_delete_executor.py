@@ -40,25 +40,67 @@ class DetachDeleteExecutor(AUniversalOperationExecutor):
     def _execute_detach_delete(self, node: Any, params: dict, context: ExecutionContext) -> dict:
         """
         Execute DETACH_DELETE - Delete node with all edges.
-        FUTURE: Will use xwnode graph modification.
+        Root cause fixed: Nothing was deleted (both counts were always 0).
+        Solution: Remove every incoming and outgoing edge, then the vertex,
+        through the graph API; vertices can be selected by id or by
+        label/property lookups in the vertex indexes. Indexes and the cached
+        adjacency are kept in step.
+        REUSE: graph_indexes.find_vertices / graph_mutation.
+        Params:
+        - node_ids/nodes: Vertex ids
+        - label, match (property equalities), condition/where: Vertex selection
         """
+        from ..graph_indexes import find_vertices, graph_mutation
         node_ids = params.get('node_ids', params.get('nodes', []))
         condition = params.get('condition', params.get('where'))
         deleted_nodes = 0
         deleted_edges = 0
-        # FUTURE: Use xwnode's graph methods
-        # for node_id in node_ids:
-        #     # Delete all connected edges first
-        #     deleted_edges += graph.remove_node_edges(node_id)
-        #     # Then delete the node
-        #     graph.remove_node(node_id)
-        #     deleted_nodes += 1
+        remove_vertex = getattr(node, 'remove_vertex', None) or getattr(node, 'remove_node', None)
+        if not callable(remove_vertex) or not callable(getattr(node, 'get_neighbors', None)):
+            return {
+                'deleted_nodes': deleted_nodes,
+                'deleted_edges': deleted_edges,
+                'node_ids': node_ids,
+                'condition': condition,
+                'status': 'basic_implementation',
+                'note': 'Will use xwnode graph modification for production'
+            }
+        if not node_ids and (condition or params.get('label') or params.get('match')):
+            node_ids = find_vertices(node, params.get('label'), params.get('match'), condition) or []
+        remove_edge = getattr(node, 'remove_edge', None)
+        with graph_mutation(node) as index:
+            for vertex in node_ids:
+                edges = self._incident_edges(node, vertex)
+                for pair in edges:
+                    index.unindex_edge(*pair)
+                    if callable(remove_edge):
+                        remove_edge(*pair)
+                deleted_edges += len(edges)
+                index.unindex_vertex(vertex)
+                if remove_vertex(vertex) is not False:
+                    deleted_nodes += 1
         return {
             'deleted_nodes': deleted_nodes,
             'deleted_edges': deleted_edges,
             'node_ids': node_ids,
             'condition': condition,
-            'status': 'basic_implementation',
-            'note': 'Will use xwnode graph modification for production'
+            'status': 'implemented'
         }
+
+    def _incident_edges(self, node: Any, vertex: Any) -> list:
+        """Outgoing and incoming (source, target) pairs of a vertex."""
+        try:
+            edges = [(vertex, neighbor) for neighbor in node.get_neighbors(vertex) or ()]
+        except Exception:
+            # Unknown vertex
+            return []
+        get_incoming = getattr(node, 'get_incoming_neighbors', None)
+        if callable(get_incoming):
+            edges += [(neighbor, vertex) for neighbor in get_incoming(vertex) or ()]
+        elif callable(getattr(node, 'get_all_vertices', None)):
+            edges += [
+                (other, vertex) for other in list(node.get_all_vertices())
+                if vertex in (node.get_neighbors(other) or ())
+            ]
+        return list(dict.fromkeys(edges))
 __all__ = ['DetachDeleteExecutor']
@@ -65,10 +65,8 @@ class InTraverseExecutor(AOperationExecutor):
                     vertex = vertex[0] if isinstance(vertex[0], str) else str(vertex[0])
             if vertex:
                 neighbors = list(node.get_incoming_neighbors(vertex))
-                if edge_type:
-                    neighbors = [n for n in neighbors if self._matches_edge_type(node, n, vertex, edge_type)]
-                if label:
-                    neighbors = [n for n in neighbors if self._matches_label(node, n, vertex, label)]
+                if edge_type or label:
+                    neighbors = self._filter_neighbors(node, vertex, neighbors, edge_type, label)
                 if limit:
                     neighbors = neighbors[:limit]
                 return {
@@ -116,10 +114,33 @@ class InTraverseExecutor(AOperationExecutor):
             'note': 'Node does not support graph operations - xwnode graph strategies recommended'
         }
 
+    def _filter_neighbors(self, node: Any, vertex: Any, neighbors: list, edge_type: Any, label: Any) -> list:
+        """
+        Keep neighbors reaching `vertex` over an `edge_type` edge that carry
+        vertex `label`, using the graph's edge type/label indexes when built.
+        """
+        from ..graph_indexes import graph_index
+        index = graph_index(node)
+        if edge_type:
+            if index is not None and index.is_built('edge_types'):
+                typed = index.edges_with_type(edge_type)
+                neighbors = [neighbor for neighbor in neighbors if (neighbor, vertex) in typed]
+            else:
+                neighbors = [n for n in neighbors if self._matches_edge_type(node, n, vertex, edge_type)]
+        if label:
+            if index is not None and index.is_built('labels'):
+                labeled = index.vertices_with_label(label)
+                neighbors = [neighbor for neighbor in neighbors if neighbor in labeled]
+            else:
+                neighbors = [n for n in neighbors if self._matches_label(node, n, vertex, label)]
+        return neighbors
+
     def _matches_edge_type(self, node: Any, source: str, target: str, edge_type: str) -> bool:
-        """Check if edge matches edge type."""
-        return True
+        """Check if the edge source -> target has type `edge_type`."""
+        from ..adjacency import edge_type as type_of
+        return type_of(node, source, target) == edge_type
 
     def _matches_label(self, node: Any, source: str, target: str, label: str) -> bool:
-        """Check if edge matches label."""
-        return True
+        """Check if the neighbor (`source`) carries `label`."""
+        from ..adjacency import vertex_labels
+        return label in vertex_labels(node, source)
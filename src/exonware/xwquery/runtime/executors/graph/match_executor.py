@@ -46,83 +46,99 @@ class MatchExecutor(AOperationExecutor):
     def _execute_match(self, node: Any, params: dict, context: ExecutionContext) -> dict:
         """
         Execute MATCH - Graph pattern matching.
-        Root cause fixed: Basic stub with no pattern matching.
-        Solution: Full implementation with graph pattern matching, delegating to xwnode when available.
-        REUSE: Delegates to xwnode edge strategies for graph traversal.
+        Root cause fixed: Only a single {source, target} edge from a bound
+        source was matched ('Full graph traversal needed' otherwise) and WHERE
+        ran on the finished matches through an XWData round-trip.
+        Solution: Multi-hop Cypher/GQL patterns are compiled into a cost-based
+        expansion plan (most selective start vertex from label/property
+        statistics or the graph's label/property indexes, cheapest edge next)
+        and bindings are streamed; WHERE conjuncts are pushed into the expansion.
+        REUSE: graph_patterns (parser, statistics, planner, matcher) over the
+        cached CSR snapshot from adjacency.
+        Params:
+        - pattern: Cypher text "(a:Person)-[:KNOWS*1..2]->(b)", {'nodes', 'edges'},
+          a node spec {'label': 'User'} or the legacy {'source', 'target', 'edge'}
+        - where / where_action: Condition on the variables ("a.age > 30 AND b = 'x'")
+        - parameters: Values for $name placeholders in the pattern
+        - bind: {variable: vertex id or list of ids} start bindings
+        - limit: Maximum matches; timeout: Seconds before returning partial results
         Priority Alignment:
         - Usability (#2): Standard graph pattern matching syntax (Cypher/SPARQL-like).
-        - Maintainability (#3): Delegates to xwnode graph strategies.
-        - Performance (#4): Efficient pattern matching via xwnode.
-        - Extensibility (#5): Supports complex graph patterns.
+        - Performance (#4): Selective start, pushed-down predicates, lazy bindings.
+        - Extensibility (#5): Variable-length, multi-type and comma-joined patterns.
         """
-        from ..filtering import WhereExecutor
-        from ..engine import NativeOperationsExecutionEngine
-        from ....contracts import QueryAction
-        from ..utils import extract_items
+        from ..adjacency import adjacency, full_snapshot, reverse_adjacency
+        from ..graph_algorithms import budget_deadline, collect_paths
+        from ..graph_indexes import graph_index
+        from ..graph_patterns import PatternMatch, parse_pattern
+        from ....errors import XWQueryValueError
         pattern = params.get('pattern', {})
         where = params.get('where')
         where_action = params.get('where_action')
-        # Try to use xwnode graph capabilities if available
-        if hasattr(node, 'get_neighbors') and callable(node.get_neighbors):
-            # Node has graph capabilities
-            matches = []
-            # Extract pattern components
-            if isinstance(pattern, dict):
-                # Pattern: {source: 'A', target: 'B', edge: {...}}
-                source = pattern.get('source', pattern.get('from'))
-                target = pattern.get('target', pattern.get('to'))
-                edge_pattern = pattern.get('edge', {})
-                if source:
-                    # Get neighbors of source
-                    neighbors = list(node.get_neighbors(source))
-                    if target:
-                        # Match specific target
-                        if target in neighbors:
-                            matches.append({
-                                'source': source,
-                                'target': target,
-                                'edge': edge_pattern
-                            })
-                    else:
-                        # Match all neighbors
-                        for neighbor in neighbors:
-                            matches.append({
-                                'source': source,
-                                'target': neighbor,
-                                'edge': edge_pattern
-                            })
-                else:
-                    # No source specified, match all edges
-                    # This would require full graph traversal
-                    matches = [{'pattern': pattern, 'note': 'Full graph traversal needed'}]
-            # Apply WHERE clause if provided
-            if where or where_action:
-                from exonware.xwdata import XWData
-                temp_node = XWData.from_native(matches)
-                where_context = context.model_copy(update={'node': temp_node})
-                if where_action:
-                    engine = getattr(context, 'engine', None) or NativeOperationsExecutionEngine()
-                    if isinstance(where_action, dict):
-                        where_action = QueryAction(**where_action)
-                    where_result = engine.execute_tree(where_action, where_context)
-                else:
-                    where_executor = WhereExecutor()
-                    where_query_action = QueryAction(type='WHERE', params={'where': where})
-                    where_result = where_executor.execute(where_query_action, where_context)
-                if where_result.success:
-                    matches = extract_items(where_result.data)
+        if where_action is not None and where is None:
+            where, where_action = self._where_condition(where_action)
+        if not (hasattr(node, 'get_neighbors') and callable(node.get_neighbors)):
+            # Fallback: Basic pattern matching without graph capabilities
             return {
                 'pattern': pattern,
-                'matches': matches,
-                'match_count': len(matches),
-                'status': 'implemented'
+                'where': where,
+                'matches': [],
+                'match_count': 0,
+                'status': 'basic_implementation',
+                'note': 'Node does not support graph operations - xwnode graph strategies recommended'
             }
-        # Fallback: Basic pattern matching without graph capabilities
+        parsed = parse_pattern(pattern, params.get('parameters'))
+        for var, ids in (params.get('bind') or {}).items():
+            if var not in parsed.nodes:
+                raise XWQueryValueError(f"MATCH bind refers to unknown variable: {var}")
+            parsed.add_node(var, ids=list(ids) if isinstance(ids, (list, tuple, set)) else [ids])
+        graph = full_snapshot(node)
+        reverse = None
+        index = graph_index(node) if graph is not None else None
+        if graph is None:
+            graph = adjacency(node)
+            reverse = reverse_adjacency(node, graph)
+        match = PatternMatch(node, graph, parsed, where, reverse=reverse, index=index)
+        deadline = budget_deadline(params.get('timeout', context.metadata.get('timeout')))
+        matches, truncated = collect_paths(match.bindings(deadline), params.get('limit'), deadline)
+        legacy_edge = self._legacy_edge(pattern)
+        if legacy_edge is not None:
+            for binding in matches:
+                binding['edge'] = legacy_edge
+        if where_action is not None:
+            matches = self._apply_where_action(matches, where_action, context)
         return {
             'pattern': pattern,
-            'where': where,
-            'matches': [],
-            'match_count': 0,
-            'status': 'basic_implementation',
-            'note': 'Node does not support graph operations - xwnode graph strategies recommended'
+            'matches': matches,
+            'match_count': len(matches),
+            'plan': match.explain(),
+            'truncated': truncated,
+            'status': 'implemented'
         }
+
+    def _legacy_edge(self, pattern: Any) -> Any:
+        """Edge spec echoed into each match of a legacy {source, target, edge} pattern."""
+        if isinstance(pattern, dict) and not ('nodes' in pattern or 'edges' in pattern) and any(
+            key in pattern for key in ('source', 'target', 'from', 'to')
+        ):
+            return pattern.get('edge', {})
+        return None
+
+    def _where_condition(self, where_action: Any) -> tuple[Any, Any]:
+        """(condition, None) for a plain WHERE action, else (None, the action) to run as a tree."""
+        from ..filtering import WhereExecutor
+        if isinstance(where_action, dict):
+            where_action = QueryAction(**where_action)
+        if str(where_action.type).upper() == 'WHERE' and not where_action.get_children():
+            return WhereExecutor()._get_condition(where_action), None
+        return None, where_action
+
+    def _apply_where_action(self, matches: list, where_action: QueryAction, context: ExecutionContext) -> list:
+        """Run a compound WHERE action tree over the finished matches."""
+        from exonware.xwdata import XWData
+        from ..engine import NativeOperationsExecutionEngine
+        from ..utils import extract_items
+        engine = getattr(context, 'engine', None) or NativeOperationsExecutionEngine()
+        where_context = context.model_copy(update={'node': XWData.from_native(matches)})
+        where_result = engine.execute_tree(where_action, where_context)
+        return extract_items(where_result.data) if where_result.success else matches
@@ -67,12 +67,8 @@ class OutExecutor(AOperationExecutor):
                 # Get outgoing neighbors
                 neighbors = list(node.get_neighbors(vertex))
                 # Apply filters
-                if edge_type:
-                    # Filter by edge type (if node supports it)
-                    neighbors = [n for n in neighbors if self._matches_edge_type(node, vertex, n, edge_type)]
-                if label:
-                    # Filter by label (if node supports it)
-                    neighbors = [n for n in neighbors if self._matches_label(node, vertex, n, label)]
+                if edge_type or label:
+                    neighbors = self._filter_neighbors(node, vertex, neighbors, edge_type, label)
                 if limit:
                     neighbors = neighbors[:limit]
                 return {
@@ -94,12 +90,33 @@ class OutExecutor(AOperationExecutor):
             'note': 'Node does not support graph operations - xwnode graph strategies recommended'
         }
 
+    def _filter_neighbors(self, node: Any, vertex: Any, neighbors: list, edge_type: Any, label: Any) -> list:
+        """
+        Keep neighbors reached over an `edge_type` edge that carry vertex
+        `label`, using the graph's edge type/label indexes when they are built.
+        """
+        from ..graph_indexes import graph_index
+        index = graph_index(node)
+        if edge_type:
+            if index is not None and index.is_built('edge_types'):
+                typed = index.edges_with_type(edge_type)
+                neighbors = [neighbor for neighbor in neighbors if (vertex, neighbor) in typed]
+            else:
+                neighbors = [n for n in neighbors if self._matches_edge_type(node, vertex, n, edge_type)]
+        if label:
+            if index is not None and index.is_built('labels'):
+                labeled = index.vertices_with_label(label)
+                neighbors = [neighbor for neighbor in neighbors if neighbor in labeled]
+            else:
+                neighbors = [n for n in neighbors if self._matches_label(node, vertex, n, label)]
+        return neighbors
+
     def _matches_edge_type(self, node: Any, source: str, target: str, edge_type: str) -> bool:
-        """Check if edge matches edge type."""
-        # Basic implementation - can be enhanced with actual edge type checking
-        return True
+        """Check if the edge source -> target has type `edge_type`."""
+        from ..adjacency import edge_type as type_of
+        return type_of(node, source, target) == edge_type
 
     def _matches_label(self, node: Any, source: str, target: str, label: str) -> bool:
-        """Check if edge matches label."""
-        # Basic implementation - can be enhanced with actual label checking
-        return True
+        """Check if the reached vertex (`target`) carries `label`."""
+        from ..adjacency import vertex_labels
+        return label in vertex_labels(node, target)
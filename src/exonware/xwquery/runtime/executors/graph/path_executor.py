@@ -91,31 +91,32 @@ class PathExecutor(AOperationExecutor):
         }
 
     def _find_paths_bfs(self, node: Any, start: str, end: str, max_depth: int, find_all: bool) -> list:
-        """Find paths using BFS."""
+        """Find paths using BFS over the graph's adjacency snapshot."""
         from collections import deque
+        from ..adjacency import adjacency
         if start == end:
             return [[start]]
+        graph = adjacency(node)
+        origin, goal = graph.index_of(start), graph.index_of(end)
+        if origin is None or goal is None:
+            return []
+        vertices = graph.vertices
         paths = []
-        queue = deque([(start, [start])])
+        queue = deque([(origin, (origin,))])
         visited = set()
         while queue:
             current, path = queue.popleft()
             if len(path) > max_depth:
                 continue
-            if current == end:
-                paths.append(path)
+            if current == goal:
+                paths.append([vertices[position] for position in path])
                 if not find_all:
                     break
                 continue
             if current in visited and not find_all:
                 continue
             visited.add(current)
-            # Get neighbors
-            try:
-                neighbors = list(node.get_neighbors(current))
-                for neighbor in neighbors:
-                    if neighbor not in path:  # Avoid cycles
-                        queue.append((neighbor, path + [neighbor]))
-            except Exception:
-                break
+            for neighbor in graph.out(current):
+                if neighbor not in path:  # Avoid cycles
+                    queue.append((neighbor, path + (neighbor,)))
         return paths
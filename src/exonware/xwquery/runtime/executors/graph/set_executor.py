@@ -39,30 +39,67 @@ class SetExecutor(AUniversalOperationExecutor):
     def _execute_set(self, node: Any, params: dict, context: ExecutionContext) -> dict:
         """
         Execute SET - Set properties on nodes/edges.
-        FUTURE: Will use xwnode property management.
+        Root cause fixed: No property was written (updated_count was always 0).
+        Solution: Select the vertices (ids, or label/property lookups in the
+        vertex indexes plus a condition) and write through the graph's
+        property API, moving each vertex between label/property index entries.
+        REUSE: graph_indexes.find_vertices / edge_pairs / graph_mutation.
+        Params:
+        - properties/set: Properties to write; overwrite: False keeps existing values
+        - target_type: 'node' or 'edge'
+        - target_id/target_ids: Vertex id(s), or (source, target) for an edge
+        - label, match (property equalities), condition/where: Vertex/edge selection
+        Without any selector nothing is updated (as DELETE_EDGE).
         """
+        from ..graph_indexes import (
+            edge_pairs, find_vertices, graph_mutation, write_edge_properties, write_vertex_properties
+        )
         properties = params.get('properties', params.get('set', {}))
         target_type = params.get('target_type', 'node')  # node or edge
         target_id = params.get('target_id')
         overwrite = params.get('overwrite', True)
+        condition = params.get('condition', params.get('where'))
         updated_count = 0
-        # FUTURE: Use xwnode's property methods
-        # if target_id:
-        #     if target_type == 'node':
-        #         node = graph.get_node(target_id)
-        #     else:
-        #         node = graph.get_edge(target_id)
-        #     
-        #     for key, value in properties.items():
-        #         node.set_property(key, value, overwrite=overwrite)
-        #     updated_count = 1
-        return {
+        result = {
             'updated_count': updated_count,
             'properties': properties,
             'target_type': target_type,
             'target_id': target_id,
             'overwrite': overwrite,
-            'status': 'basic_implementation',
-            'note': 'Will use xwnode property management for production'
+            'status': 'implemented'
         }
+        if not callable(getattr(node, 'get_neighbors', None)):
+            result.update(status='basic_implementation', note='Will use xwnode property management for production')
+            return result
+        if target_type == 'edge':
+            if isinstance(target_id, (list, tuple)) and len(target_id) == 2:
+                pairs = [tuple(target_id)]
+            elif params.get('label') or condition:
+                pairs = edge_pairs(node, kind=params.get('label'), condition=condition)
+            else:
+                pairs = []
+            retypes = any(name in properties for name in ('type', 'label'))
+            with graph_mutation(node) as index:
+                for pair in pairs:
+                    if retypes:
+                        index.unindex_edge(*pair)
+                    if write_edge_properties(node, *pair, properties):
+                        updated_count += 1
+                    if retypes:
+                        index.index_edge(*pair)
+        else:
+            vertices = params.get('target_ids')
+            if target_id is not None:
+                vertices = [target_id]
+            if vertices is None and (params.get('label') or params.get('match') or condition):
+                vertices = find_vertices(node, params.get('label'), params.get('match'), condition)
+            vertices = vertices or []
+            with graph_mutation(node) as index:
+                for vertex in vertices:
+                    index.unindex_vertex(vertex)
+                    if write_vertex_properties(node, vertex, properties, overwrite):
+                        updated_count += 1
+                    index.index_vertex(vertex)
+        result['updated_count'] = updated_count
+        return result
 __all__ = ['SetExecutor']
@@ -91,51 +91,62 @@ class TraversalExecutor(AUniversalOperationExecutor):
         }
 
     def _bfs_traversal(self, node: Any, start: str, direction: str, max_depth: int) -> tuple:
-        """BFS traversal."""
+        """BFS traversal over the graph's adjacency snapshot ('out', 'in' or 'both' edges)."""
         from collections import deque
+        from ..adjacency import adjacency
+        graph = adjacency(node, direction)
+        origin = graph.index_of(start)
+        if origin is None:
+            return [start], [(start, 0)]
+        vertices = graph.vertices
         visited_nodes = []
         visit_order = []
-        queue = deque([(start, 0)])
-        visited = {start}
+        queue = deque([(origin, 0)])
+        visited = {origin}
         while queue:
             current, depth = queue.popleft()
             if depth > max_depth:
                 continue
-            visited_nodes.append(current)
-            visit_order.append((current, depth))
-            try:
-                neighbors = list(node.get_neighbors(current))
-                for neighbor in neighbors:
-                    if neighbor not in visited:
-                        visited.add(neighbor)
-                        queue.append((neighbor, depth + 1))
-            except Exception:
-                break
+            visited_nodes.append(vertices[current])
+            visit_order.append((vertices[current], depth))
+            for neighbor in graph.out(current):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append((neighbor, depth + 1))
         return visited_nodes, visit_order
 
     def _dfs_traversal(self, node: Any, start: str, direction: str, max_depth: int, order: str) -> tuple:
-        """DFS traversal."""
+        """DFS traversal with an explicit stack (no recursion limit on deep graphs)."""
+        from ..adjacency import adjacency
+        graph = adjacency(node, direction)
+        origin = graph.index_of(start)
+        if origin is None:
+            return [start], [(start, 0)]
+        vertices = graph.vertices
         visited_nodes = []
         visit_order = []
         visited = set()
-        def dfs(current: str, depth: int):
-            if depth > max_depth:
-                return
-            if current in visited:
-                return
+        stack = []
+
+        def enter(current: int, depth: int) -> bool:
+            if depth > max_depth or current in visited:
+                return False
             visited.add(current)
             if order == 'preorder':
-                visited_nodes.append(current)
-                visit_order.append((current, depth))
-            try:
-                neighbors = list(node.get_neighbors(current))
-                for neighbor in neighbors:
-                    dfs(neighbor, depth + 1)
-            except Exception:
-                pass
-            if order == 'postorder':
-                visited_nodes.append(current)
-                visit_order.append((current, depth))
-        dfs(start, 0)
+                visited_nodes.append(vertices[current])
+                visit_order.append((vertices[current], depth))
+            stack.append((current, depth, iter(graph.out(current))))
+            return True
+        enter(origin, 0)
+        while stack:
+            current, depth, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if enter(neighbor, depth + 1):
+                    break
+            else:
+                stack.pop()
+                if order == 'postorder':
+                    visited_nodes.append(vertices[current])
+                    visit_order.append((vertices[current], depth))
         return visited_nodes, visit_order
 __all__ = ['TraversalExecutor']
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/src/exonware/xwquery/executors/graph/triangle_count_executor.py
+TRIANGLE_COUNT Operation Executor - Count triangles per vertex
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.9.0.5
+Generation Date: 17-Oct-2026
+"""
+
+from typing import Any
+from ..base import AUniversalOperationExecutor
+from ....contracts import QueryAction, ExecutionContext, ExecutionResult
+
+
+class TriangleCountExecutor(AUniversalOperationExecutor):
+    """
+    TRIANGLE_COUNT operation executor - Count triangles per vertex.
+    Cypher (GDS): CALL gds.triangleCount.stream(graph)
+    Counts triangles of the underlying undirected graph by degree-ordered
+    neighbor set intersection; optionally local clustering coefficients.
+    """
+    OPERATION_NAME = "TRIANGLE_COUNT"
+
+    def _do_execute(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
+        """Execute TRIANGLE_COUNT operation."""
+        params = action.params
+        node = context.node
+        result_data = self._execute_triangle_count(node, params, context)
+        return ExecutionResult(
+            success=True,
+            data=result_data,
+            action_type=self.OPERATION_NAME,
+            metadata={'operation': self.OPERATION_NAME}
+        )
+
+    def _execute_triangle_count(self, node: Any, params: dict, context: ExecutionContext) -> dict:
+        """
+        Execute TRIANGLE_COUNT - Count triangles per vertex.
+        Root cause fixed: Missing TRIANGLE_COUNT operation (graphs were exported to
+        NetworkX for analysis, doubling memory).
+        Solution: Orient each undirected edge from lower to higher degree and
+        intersect forward neighbor sets, so every triangle is found once.
+        REUSE: graph_metrics.py triangle_counts over adjacency.py snapshots.
+        Params:
+            clustering: Also return local clustering coefficients (default False)
+            limit: Vertices with most triangles listed in 'top' (default 10)
+            edges: Edge rows to use instead of a graph node
+        """
+        from ..graph_metrics import analysis_graph, clustering_coefficients, top_scores, triangle_counts
+        graph = analysis_graph(node, params.get('edges'))
+        counts = triangle_counts(graph)
+        result = {
+            'triangles': dict(zip(graph.vertices, counts)),
+            'triangle_count': sum(counts) // 3,
+            'top': top_scores(graph.vertices, counts, int(params.get('limit', 10))),
+            'vertex_count': len(graph),
+            'status': 'implemented'
+        }
+        if params.get('clustering'):
+            coefficients = clustering_coefficients(graph, counts)
+            result['clustering'] = dict(zip(graph.vertices, coefficients))
+            result['average_clustering'] = sum(coefficients) / len(coefficients) if coefficients else 0.0
+        return result
+__all__ = ['TriangleCountExecutor']
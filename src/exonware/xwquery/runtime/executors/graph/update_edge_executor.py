@@ -39,26 +39,59 @@ class UpdateEdgeExecutor(AUniversalOperationExecutor):
     def _execute_update_edge(self, node: Any, params: dict, context: ExecutionContext) -> dict:
         """
         Execute UPDATE_EDGE - Modify edge properties.
-        FUTURE: Will use xwnode property management.
+        Root cause fixed: No edge was updated (updated_count was always 0).
+        Solution: Select the edges (endpoints, edge type, condition) and write
+        the updates through the graph's property API; changing 'type' or
+        'label' moves the edge between edge type index entries.
+        REUSE: graph_indexes.edge_pairs / write_edge_properties / graph_mutation.
+        Params:
+        - edge_id/id: Edge id (through `get_edge(edge_id)`)
+        - source/from, target/to, edge_type/label: Edge selection
+        - updates/set: Properties to write; condition/where: Condition on the edge properties
         """
+        from ..graph_indexes import edge_pairs, graph_mutation, write_edge_properties
         edge_id = params.get('edge_id', params.get('id'))
         updates = params.get('updates', params.get('set', {}))
         condition = params.get('condition', params.get('where'))
+        source = params.get('source', params.get('from'))
+        target = params.get('target', params.get('to'))
+        edge_type = params.get('edge_type', params.get('label'))
         updated_count = 0
-        # FUTURE: Use xwnode's property methods
-        # if edge_id:
-        #     edge = graph.get_edge(edge_id)
-        #     for key, value in updates.items():
-        #         edge.set_property(key, value)
-        #     updated_count = 1
-        # else:
-        #     updated_count = graph.update_edges(updates, condition=condition)
-        return {
+        result = {
             'updated_count': updated_count,
             'edge_id': edge_id,
             'updates': updates,
             'condition': condition,
-            'status': 'basic_implementation',
-            'note': 'Will use xwnode property management for production'
+            'status': 'implemented'
         }
+        retypes = any(name in updates for name in ('type', 'label'))
+        if edge_id is not None and callable(getattr(node, 'get_edge', None)):
+            edge = node.get_edge(edge_id)
+            if edge is not None:
+                with graph_mutation(node) as index:
+                    if retypes:
+                        index.clear()
+                    for name, value in updates.items():
+                        if callable(getattr(edge, 'set_property', None)):
+                            edge.set_property(name, value)
+                        elif isinstance(edge, dict):
+                            edge[name] = value
+                result['updated_count'] = 1
+            return result
+        if edge_id is None and callable(getattr(node, 'get_neighbors', None)) and (
+            source is not None or target is not None or edge_type is not None or condition
+        ):
+            pairs = edge_pairs(node, source, target, edge_type, condition)
+            with graph_mutation(node) as index:
+                for pair in pairs:
+                    if retypes:
+                        index.unindex_edge(*pair)
+                    if write_edge_properties(node, *pair, updates):
+                        updated_count += 1
+                    if retypes:
+                        index.index_edge(*pair)
+            result['updated_count'] = updated_count
+            return result
+        result.update(status='basic_implementation', note='Will use xwnode property management for production')
+        return result
 __all__ = ['UpdateEdgeExecutor']
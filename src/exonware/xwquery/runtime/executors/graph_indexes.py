@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/src/exonware/xwquery/runtime/executors/graph_indexes.py
+Secondary indexes for graph vertices and edges.
+Root cause: label, edge type and property filters (MATCH, HAS, OUT, IN)
+called the graph's vertex/edge API for every candidate, so
+`MATCH (u:User {country: 'DE'})` scanned every vertex on every query.
+Solution: per-graph secondary indexes
+- label -> set of vertices
+- property name -> value -> set of vertices (plus the vertices having it)
+- edge type -> set of (source, target) pairs
+Each table is built by one scan on its first lookup and then kept in step
+with the graph: the mutating executors (CREATE_EDGE, DELETE_EDGE,
+UPDATE_EDGE, SET, DETACH_DELETE) run inside `graph_mutation()`, unindexing
+what they are about to change and reindexing it afterwards. Indexes are
+tied to the graph's version (see `adjacency.graph_version`), so changes made
+behind the executors' backs drop them; graphs without a version are not
+indexed and callers fall back to scanning.
+Helpers for the executors: `find_vertices()` and `edge_pairs()` select
+vertices/edges through the indexes, `write_vertex_properties()` and
+`write_edge_properties()` write through whichever property API the graph has.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.9.0.5
+Generation Date: 17-Oct-2026
+"""
+
+from __future__ import annotations
+import threading
+import weakref
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any
+from .adjacency import (
+    edge_properties,
+    edge_type,
+    graph_version,
+    mark_graph_changed,
+    vertex_labels,
+    vertex_properties,
+)
+# Indexes of graph objects; older ones are dropped first
+_MAX_INDEXES = 8
+_indexes: dict[int, GraphIndex] = {}
+_lock = threading.Lock()
+# Marker for "any value" in property lookups (existence checks)
+_ANY = object()
+
+
+def _hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+class GraphIndex:
+    """
+    Label, property and edge type indexes of one graph. Lookups build the
+    table they need on first use; maintenance only touches built tables.
+    """
+
+    def __init__(self, reference: Callable[[], Any], version: Any):
+        self._node = reference
+        self.version = version
+        self._labels: dict[Any, set[Any]] | None = None
+        self._properties: dict[str, tuple[dict[Any, set[Any]], set[Any]]] = {}
+        self._edge_types: dict[Any, set[tuple[Any, Any]]] | None = None
+
+    def _vertices(self) -> Iterable[Any]:
+        return self._node().get_all_vertices()
+
+    # Lookups -----------------------------------------------------------
+
+    def is_built(self, table: str, name: str | None = None) -> bool:
+        """
+        Whether a table ('labels', 'edge_types', or 'properties' with a
+        property name) exists, so a lookup costs no scan. Per-vertex
+        traversals only use built tables.
+        """
+        if table == 'properties':
+            return name in self._properties
+        return (self._labels if table == 'labels' else self._edge_types) is not None
+
+    def vertices_with_label(self, label: Any) -> set[Any]:
+        """Vertices carrying `label`."""
+        if self._labels is None:
+            node, labels = self._node(), {}
+            for vertex in self._vertices():
+                for name in vertex_labels(node, vertex):
+                    labels.setdefault(name, set()).add(vertex)
+            self._labels = labels
+        return self._labels.get(label, set())
+
+    def label_count(self, label: Any) -> int:
+        return len(self.vertices_with_label(label))
+
+    def vertices_with_property(self, name: str, value: Any = _ANY) -> set[Any] | None:
+        """
+        Vertices whose property `name` equals `value` (any value when
+        omitted). None when `value` is unhashable and cannot be looked up.
+        """
+        if value is not _ANY and not _hashable(value):
+            return None
+        table = self._properties.get(name)
+        if table is None:
+            node, values, present = self._node(), {}, set()
+            for vertex in self._vertices():
+                self._add_property(values, present, vertex, vertex_properties(node, vertex), name)
+            table = self._properties[name] = (values, present)
+        return table[1] if value is _ANY else table[0].get(value, set())
+
+    def edges_with_type(self, kind: Any) -> set[tuple[Any, Any]]:
+        """(source, target) pairs of the edges of type `kind`."""
+        if self._edge_types is None:
+            node, types = self._node(), {}
+            for source in list(self._vertices()):
+                for target in node.get_neighbors(source) or ():
+                    self._add_edge(types, source, target, edge_type(node, source, target))
+            self._edge_types = types
+        return self._edge_types.get(kind, set())
+
+    # Maintenance -------------------------------------------------------
+
+    @staticmethod
+    def _add_property(values: dict, present: set, vertex: Any, properties: dict, name: str) -> None:
+        if name in properties:
+            present.add(vertex)
+            if _hashable(properties[name]):
+                values.setdefault(properties[name], set()).add(vertex)
+
+    @staticmethod
+    def _add_edge(types: dict, source: Any, target: Any, kind: Any) -> None:
+        if kind is not None and _hashable(kind):
+            types.setdefault(kind, set()).add((source, target))
+
+    def index_vertex(self, vertex: Any) -> None:
+        """Add a (new or changed) vertex to the built tables."""
+        node = self._node()
+        if self._labels is not None:
+            for name in vertex_labels(node, vertex):
+                self._labels.setdefault(name, set()).add(vertex)
+        if self._properties:
+            properties = vertex_properties(node, vertex)
+            for name, (values, present) in self._properties.items():
+                self._add_property(values, present, vertex, properties, name)
+
+    def unindex_vertex(self, vertex: Any) -> None:
+        """Remove a vertex from the built tables (call before changing it)."""
+        node = self._node()
+        if self._labels is not None:
+            for name in vertex_labels(node, vertex):
+                self._labels.get(name, set()).discard(vertex)
+        if self._properties:
+            properties = vertex_properties(node, vertex)
+            for name, (values, present) in self._properties.items():
+                present.discard(vertex)
+                if name in properties and _hashable(properties[name]):
+                    values.get(properties[name], set()).discard(vertex)
+
+    def index_edge(self, source: Any, target: Any) -> None:
+        """Add a (new or changed) edge to the edge type table."""
+        if self._edge_types is not None:
+            self._add_edge(self._edge_types, source, target, edge_type(self._node(), source, target))
+
+    def unindex_edge(self, source: Any, target: Any) -> None:
+        """Remove an edge from the edge type table (call before changing it)."""
+        if self._edge_types is not None:
+            for pairs in self._edge_types.values():
+                pairs.discard((source, target))
+
+    def clear(self) -> None:
+        """Drop every table (for changes that cannot be tracked, e.g. by edge id)."""
+        self._labels, self._properties, self._edge_types = None, {}, None
+
+
+def _forget(key: int) -> None:
+    with _lock:
+        _indexes.pop(key, None)
+
+
+def graph_index(node: Any) -> GraphIndex | None:
+    """
+    The index of a versioned graph that can list its vertices (None
+    otherwise). A version change not made through `graph_mutation()`
+    starts a fresh, empty index.
+    """
+    if not callable(getattr(node, 'get_all_vertices', None)) or not callable(getattr(node, 'get_neighbors', None)):
+        return None
+    version = graph_version(node)
+    if version is None:
+        return None
+    key = id(node)
+    with _lock:
+        index = _indexes.get(key)
+        if index is not None and index._node() is node and index.version == version:
+            return index
+    try:
+        index = GraphIndex(weakref.ref(node, lambda _, key=key: _forget(key)), version)
+    except TypeError:
+        return None
+    with _lock:
+        _indexes.pop(key, None)
+        while len(_indexes) >= _MAX_INDEXES:
+            _indexes.pop(next(iter(_indexes)))
+        _indexes[key] = index
+    return index
+
+
+def find_vertices(
+    node: Any,
+    label: Any = None,
+    properties: dict | None = None,
+    condition: Any = None
+) -> list[Any] | None:
+    """
+    Vertices carrying `label`, with `properties` equal to the given values
+    and matching `condition` (a WHERE condition on the vertex properties).
+    Indexed graphs start from the smallest label/property lookup; others
+    scan. None when the graph cannot list its vertices.
+    """
+    from .predicates import compile_predicate
+    if not callable(getattr(node, 'get_all_vertices', None)):
+        return None
+    properties = properties or {}
+    index = graph_index(node)
+    candidates = None
+    if index is not None:
+        lookups = [index.vertices_with_label(label)] if label is not None else []
+        lookups += [index.vertices_with_property(name, value) for name, value in properties.items()]
+        exact = all(found is not None for found in lookups) and not condition
+        lookups = sorted((found for found in lookups if found is not None), key=len)
+        if lookups and exact:
+            return list(lookups[0].intersection(*lookups[1:]))
+        if lookups:
+            candidates = lookups[0]
+    if candidates is None:
+        candidates = node.get_all_vertices()
+    predicate = compile_predicate(condition) if condition else None
+    found = []
+    for vertex in list(candidates):
+        if label is not None and label not in vertex_labels(node, vertex):
+            continue
+        if properties or predicate is not None:
+            values = vertex_properties(node, vertex)
+            if any(values.get(name) != value for name, value in properties.items()):
+                continue
+            if predicate is not None and not predicate(values):
+                continue
+        found.append(vertex)
+    return found
+
+
+def edge_pairs(
+    node: Any,
+    source: Any = None,
+    target: Any = None,
+    kind: Any = None,
+    condition: Any = None
+) -> list[tuple[Any, Any]]:
+    """
+    (source, target) pairs of the edges between the given endpoints (any
+    when None) of type `kind` matching `condition` (a WHERE condition on the
+    edge properties, with 'type'). Type-only selections are index lookups.
+    """
+    from .predicates import compile_predicate
+    index = graph_index(node) if kind is not None else None
+    typed = index.edges_with_type(kind) if index is not None else None
+    if typed is not None and source is None and target is None:
+        pairs = list(typed)
+    elif source is not None:
+        pairs = [(source, neighbor) for neighbor in node.get_neighbors(source) or () if target is None or neighbor == target]
+    elif target is not None and callable(getattr(node, 'get_incoming_neighbors', None)):
+        pairs = [(neighbor, target) for neighbor in node.get_incoming_neighbors(target) or ()]
+    else:
+        pairs = [
+            (vertex, neighbor) for vertex in list(node.get_all_vertices())
+            for neighbor in node.get_neighbors(vertex) or () if target is None or neighbor == target
+        ]
+    pairs = list(dict.fromkeys(pairs))
+    if kind is not None:
+        pairs = [pair for pair in pairs if (pair in typed if typed is not None else edge_type(node, *pair) == kind)]
+    if condition:
+        predicate = compile_predicate(condition)
+        pairs = [pair for pair in pairs if predicate({**edge_properties(node, *pair), 'type': edge_type(node, *pair)})]
+    return pairs
+
+
+def _property_writer(node: Any, method: str, getters: tuple[str, ...], key: tuple) -> Callable[[str, Any], None] | None:
+    setter = getattr(node, method, None)
+    if callable(setter):
+        return lambda name, value: setter(*key, name, value)
+    for getter in getters:
+        getter = getattr(node, getter, None)
+        if not callable(getter):
+            continue
+        try:
+            target = getter(*key)
+        except Exception:
+            continue
+        if callable(getattr(target, 'set_property', None)):
+            return target.set_property
+        if isinstance(target, dict):
+            return target.__setitem__
+    return None
+
+
+def write_vertex_properties(node: Any, vertex: Any, values: dict, overwrite: bool = True) -> bool:
+    """
+    Set properties of a vertex (`set_vertex_property`, the vertex object's
+    `set_property`, or its properties dict). False when the graph offers no
+    way to write them.
+    """
+    if isinstance(vertex, dict):
+        write = vertex.__setitem__
+    else:
+        write = _property_writer(node, 'set_vertex_property', ('get_vertex', 'get_vertex_properties'), (vertex,))
+    if write is None:
+        return False
+    current = vertex_properties(node, vertex) if not overwrite else {}
+    for name, value in values.items():
+        if overwrite or name not in current:
+            write(name, value)
+    return True
+
+
+def write_edge_properties(node: Any, source: Any, target: Any, values: dict) -> bool:
+    """Set properties of the edge source -> target (see `write_vertex_properties`)."""
+    write = _property_writer(node, 'set_edge_property', ('get_edge', 'get_edge_properties'), (source, target))
+    if write is None:
+        return False
+    for name, value in values.items():
+        write(name, value)
+    return True
+
+
+@contextmanager
+def graph_mutation(node: Any) -> Iterator[GraphIndex]:
+    """
+    Wrap a change to a graph: yields its index (a detached one when the
+    graph is not indexed) for `unindex_*`/`index_*` calls, then reports the
+    change through `mark_graph_changed()` and revalidates the index. If the
+    change fails midway the index is dropped.
+    """
+    index = graph_index(node)
+    try:
+        yield index if index is not None else GraphIndex(lambda: node, None)
+    except BaseException:
+        _forget(id(node))
+        raise
+    finally:
+        mark_graph_changed(node)
+    if index is not None:
+        index.version = graph_version(node)
+__all__ = [
+    'GraphIndex',
+    'edge_pairs',
+    'find_vertices',
+    'graph_index',
+    'graph_mutation',
+    'write_edge_properties',
+    'write_vertex_properties',
+]
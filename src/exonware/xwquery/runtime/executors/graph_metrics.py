@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/src/exonware/xwquery/runtime/executors/graph_metrics.py
+Whole-graph metrics over CSR adjacency snapshots.
+Root cause: graph operations stopped at traversal primitives and DEGREE was a
+stub returning zeros, so ranking or structural analysis meant copying the
+graph out of XWNode into NetworkX (a second in-memory graph).
+Solution: metric kernels on the snapshot's integer arrays.
+- `degree_counts()`: out/in degrees of every vertex from `offsets` and
+  `targets` in one pass (np.diff / np.bincount when NumPy is available).
+- `pagerank()`: power iteration; each step scatters rank along the CSR edge
+  arrays (np.bincount with NumPy, one loop over edges without), with dangling
+  mass redistributed through the teleport vector.
+- `betweenness_centrality()`: Brandes' dependency accumulation (BFS, or
+  Dijkstra when weighted), optionally from a random sample of k sources and
+  rescaled by n/k - O(k * E) instead of O(V * E).
+- `triangle_counts()`: each undirected edge is oriented from lower to higher
+  (degree, index) rank and triangles are closed by intersecting forward
+  neighbor sets - O(E^1.5) worst case, every triangle found exactly once.
+- `core_numbers()`: Batagelj-Zaversnik bucket peeling, O(V + E).
+Undirected metrics run on `CSRGraph.symmetric()`, so directed graphs are
+treated as their underlying undirected graph.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.9.0.5
+Generation Date: 17-Oct-2026
+"""
+
+from __future__ import annotations
+import heapq
+import math
+import random
+from array import array
+from collections.abc import Callable, Sequence
+from typing import Any
+from ...errors import XWQueryValueError
+from .adjacency import CSRGraph, full_snapshot
+from .graph_algorithms import edge_list_graph
+try:
+    import numpy as np
+except ImportError:  # Optional: pure Python loops over the same arrays
+    np = None
+WeightFunction = Callable[[Any, Any], Any] | None
+
+
+def _np_view(values: array | memoryview) -> Any:
+    """Zero-copy NumPy view of an array/memoryview of numbers."""
+    typecode = values.typecode if isinstance(values, array) else values.format
+    if not len(values):
+        return np.zeros(0, dtype=typecode)
+    return np.frombuffer(values, dtype=typecode)
+
+
+def analysis_graph(node: Any, edges: Any = None) -> CSRGraph:
+    """
+    Whole-graph snapshot for metrics: the graph node's CSR snapshot, else
+    one built from edge rows (`edges`, a node 'edges' key, or the rows).
+    """
+    from ..streaming import iter_rows
+    graph = full_snapshot(node) if edges is None else None
+    if graph is not None:
+        return graph
+    if edges is None:
+        edges = node['edges'] if isinstance(node, dict) and 'edges' in node else iter_rows(node)
+    return edge_list_graph(edges)
+
+
+def top_scores(vertices: Sequence[Any], scores: Sequence[float], limit: int) -> list[dict[str, Any]]:
+    """The `limit` highest scoring vertices, best first."""
+    best = heapq.nlargest(limit, range(len(vertices)), key=scores.__getitem__)
+    return [{'vertex': vertices[position], 'score': scores[position]} for position in best]
+
+
+def degree_counts(graph: CSRGraph) -> tuple[list[int], list[int]]:
+    """(out-degrees, in-degrees) of every vertex, indexed like `graph.vertices`."""
+    size = len(graph)
+    if np is not None:
+        return np.diff(_np_view(graph.offsets)).tolist(), np.bincount(_np_view(graph.targets), minlength=size).tolist()
+    offsets = graph.offsets
+    incoming = [0] * size
+    for target in graph.targets:
+        incoming[target] += 1
+    return [offsets[position + 1] - offsets[position] for position in range(size)], incoming
+
+
+def pagerank(
+    graph: CSRGraph,
+    damping: float = 0.85,
+    tolerance: float = 1e-6,
+    max_iterations: int = 100,
+    weight_of: WeightFunction = None,
+    personalization: Sequence[float] | None = None
+) -> tuple[list[float], int, bool]:
+    """
+    PageRank scores by power iteration.
+    Rank flows along out-edges in proportion to edge weight; vertices without
+    out-edges (dangling) and the teleport step (1 - damping) spread their
+    rank by `personalization` (uniform by default). Stops when the L1 change
+    drops below `tolerance * V`. Returns (scores, iterations, converged).
+    """
+    size = len(graph)
+    if not 0 <= damping <= 1:
+        raise XWQueryValueError(f"PageRank damping must be within [0, 1], got {damping}")
+    if size == 0:
+        return [], 0, True
+    teleport = [1.0 / size] * size
+    if personalization is not None:
+        total = float(sum(personalization))
+        if total <= 0:
+            raise XWQueryValueError("PageRank personalization needs a positive total weight")
+        teleport = [value / total for value in personalization]
+    weights = graph.edge_weights(weight_of) if weight_of is not None else None
+    offsets, targets = graph.offsets, graph.targets
+    if np is not None:
+        return _pagerank_numpy(graph, damping, tolerance, max_iterations, weights, teleport)
+    if weights is None:
+        strength = [float(offsets[position + 1] - offsets[position]) for position in range(size)]
+    else:
+        strength = [sum(weights[offsets[position]:offsets[position + 1]]) for position in range(size)]
+    scores = list(teleport)
+    for iteration in range(1, max_iterations + 1):
+        following = [0.0] * size
+        dangling = 0.0
+        for source in range(size):
+            if not strength[source]:
+                dangling += scores[source]
+                continue
+            share = damping * scores[source] / strength[source]
+            for edge in range(offsets[source], offsets[source + 1]):
+                following[targets[edge]] += share * weights[edge] if weights is not None else share
+        base = damping * dangling + 1.0 - damping
+        following = [value + base * teleport[position] for position, value in enumerate(following)]
+        change = sum(abs(new - old) for new, old in zip(following, scores))
+        scores = following
+        if change < tolerance * size:
+            return scores, iteration, True
+    return scores, max_iterations, False
+
+
+def _pagerank_numpy(
+    graph: CSRGraph,
+    damping: float,
+    tolerance: float,
+    max_iterations: int,
+    weights: memoryview | None,
+    teleport: list[float]
+) -> tuple[list[float], int, bool]:
+    size = len(graph)
+    counts = np.diff(_np_view(graph.offsets))
+    sources = np.repeat(np.arange(size), counts)
+    targets = _np_view(graph.targets)
+    edge_weights = _np_view(weights) if weights is not None else np.ones(len(targets))
+    strength = np.bincount(sources, weights=edge_weights, minlength=size)
+    dangling = strength == 0
+    inverse = np.divide(1.0, strength, out=np.zeros(size), where=~dangling)
+    teleport_vector = np.asarray(teleport, dtype=float)
+    scores = teleport_vector.copy()
+    for iteration in range(1, max_iterations + 1):
+        flow = np.bincount(targets, weights=(scores * inverse)[sources] * edge_weights, minlength=size)
+        following = damping * flow + (damping * scores[dangling].sum() + 1.0 - damping) * teleport_vector
+        change = np.abs(following - scores).sum()
+        scores = following
+        if change < tolerance * size:
+            return scores.tolist(), iteration, True
+    return scores.tolist(), max_iterations, False
+
+
+def betweenness_centrality(
+    graph: CSRGraph,
+    samples: int | None = None,
+    seed: Any = None,
+    weight_of: WeightFunction = None,
+    directed: bool = True,
+    normalized: bool = True
+) -> tuple[list[float], int]:
+    """
+    Betweenness centrality by Brandes' algorithm.
+    With `samples` < V, only that many random sources (reproducible with
+    `seed`) are expanded and the sums are scaled by V / samples. Normalized
+    scores divide by (V - 1)(V - 2); undirected scores count each pair once.
+    Returns (scores, sources used).
+    """
+    adjacency = graph if directed else graph.symmetric()
+    size = len(graph)
+    sources: Sequence[int] = range(size)
+    if samples is not None and 0 < samples < size:
+        sources = random.Random(seed).sample(range(size), samples)
+    centrality = [0.0] * size
+    for source in sources:
+        order, predecessors, paths = _shortest_path_counts(adjacency, source, weight_of)
+        dependency = dict.fromkeys(order, 0.0)
+        for target in reversed(order):
+            coefficient = (1.0 + dependency[target]) / paths[target]
+            for parent in predecessors[target]:
+                dependency[parent] += paths[parent] * coefficient
+            if target != source:
+                centrality[target] += dependency[target]
+    scale = 1.0
+    if normalized:
+        scale = 1.0 / ((size - 1) * (size - 2)) if size > 2 else 1.0
+    elif not directed:
+        scale = 0.5
+    if len(sources) < size:
+        scale *= size / max(len(sources), 1)
+    return [value * scale for value in centrality], len(sources)
+
+
+def _shortest_path_counts(
+    graph: CSRGraph,
+    source: int,
+    weight_of: WeightFunction
+) -> tuple[list[int], dict[int, list[int]], dict[int, float]]:
+    """Single-source stage of Brandes: (vertices by distance, predecessors, shortest path counts)."""
+    predecessors: dict[int, list[int]] = {source: []}
+    paths = {source: 1.0}
+    order = []
+    if weight_of is None:
+        depth = {source: 0}
+        frontier = [source]
+        while frontier:
+            order.extend(frontier)
+            following = []
+            for current in frontier:
+                for neighbor in graph.out(current):
+                    if neighbor not in depth:
+                        depth[neighbor] = depth[current] + 1
+                        predecessors[neighbor] = []
+                        paths[neighbor] = 0.0
+                        following.append(neighbor)
+                    if depth[neighbor] == depth[current] + 1:
+                        paths[neighbor] += paths[current]
+                        predecessors[neighbor].append(current)
+            frontier = following
+        return order, predecessors, paths
+    distances = {source: 0.0}
+    queue = [(0.0, source)]
+    settled = set()
+    while queue:
+        distance, current = heapq.heappop(queue)
+        if current in settled:
+            continue
+        settled.add(current)
+        order.append(current)
+        for neighbor, weight in zip(graph.out(current), graph.out_weights(current, weight_of)):
+            if weight < 0:
+                raise XWQueryValueError("Betweenness needs edge weights >= 0")
+            candidate = distance + weight
+            known = distances.get(neighbor)
+            if known is None or (candidate < known and not math.isclose(candidate, known)):
+                distances[neighbor] = candidate
+                paths[neighbor] = paths[current]
+                predecessors[neighbor] = [current]
+                heapq.heappush(queue, (candidate, neighbor))
+            elif math.isclose(candidate, known) and neighbor not in settled:
+                paths[neighbor] += paths[current]
+                predecessors[neighbor].append(current)
+    return order, predecessors, paths
+
+
+def _simple_neighbors(graph: CSRGraph) -> list[set[int]]:
+    """Undirected neighbor sets without self loops."""
+    undirected = graph.symmetric()
+    return [{neighbor for neighbor in undirected.out(position) if neighbor != position} for position in range(len(undirected))]
+
+
+def triangle_counts(graph: CSRGraph) -> list[int]:
+    """Triangles through each vertex of the underlying undirected graph."""
+    neighbors = _simple_neighbors(graph)
+    rank = [(len(adjacent), position) for position, adjacent in enumerate(neighbors)]
+    forward = [
+        {neighbor for neighbor in adjacent if rank[neighbor] > rank[position]}
+        for position, adjacent in enumerate(neighbors)
+    ]
+    counts = [0] * len(neighbors)
+    for first, higher in enumerate(forward):
+        for second in higher:
+            for third in higher & forward[second]:
+                counts[first] += 1
+                counts[second] += 1
+                counts[third] += 1
+    return counts
+
+
+def clustering_coefficients(graph: CSRGraph, triangles: Sequence[int] | None = None) -> list[float]:
+    """Local clustering coefficient: closed triangles / possible neighbor pairs."""
+    neighbors = _simple_neighbors(graph)
+    triangles = triangles if triangles is not None else triangle_counts(graph)
+    return [
+        2.0 * triangles[position] / (len(adjacent) * (len(adjacent) - 1)) if len(adjacent) > 1 else 0.0
+        for position, adjacent in enumerate(neighbors)
+    ]
+
+
+def core_numbers(graph: CSRGraph) -> list[int]:
+    """
+    Core number of every vertex (largest k with the vertex in the k-core).
+    Vertices are kept in degree-sorted buckets; removing the lowest-degree
+    vertex decrements each higher-degree neighbor by moving it one bucket
+    down in O(1).
+    """
+    neighbors = _simple_neighbors(graph)
+    size = len(neighbors)
+    degree = [len(adjacent) for adjacent in neighbors]
+    starts = [0] * (max(degree, default=0) + 1)
+    for value in degree:
+        starts[value] += 1
+    offset = 0
+    for value, count in enumerate(starts):
+        starts[value], offset = offset, offset + count
+    order = [0] * size
+    position = [0] * size
+    cursor = list(starts)
+    for vertex, value in enumerate(degree):
+        position[vertex] = cursor[value]
+        order[position[vertex]] = vertex
+        cursor[value] += 1
+    for index in range(size):
+        vertex = order[index]
+        for neighbor in neighbors[vertex]:
+            if degree[neighbor] > degree[vertex]:
+                value = degree[neighbor]
+                # Swap the neighbor with the first vertex of its bucket, then shrink the bucket
+                first = order[starts[value]]
+                if first != neighbor:
+                    order[position[neighbor]], order[starts[value]] = first, neighbor
+                    position[first], position[neighbor] = position[neighbor], starts[value]
+                starts[value] += 1
+                degree[neighbor] -= 1
+    return degree
+__all__ = [
+    'analysis_graph',
+    'betweenness_centrality',
+    'clustering_coefficients',
+    'core_numbers',
+    'degree_counts',
+    'pagerank',
+    'top_scores',
+    'triangle_counts',
+]
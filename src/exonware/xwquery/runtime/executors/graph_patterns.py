@@ -0,0 +1,974 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/src/exonware/xwquery/runtime/executors/graph_patterns.py
+Cost-based graph pattern matching for MATCH.
+Root cause: MATCH only matched one {source, target} edge from a bound source
+(anything else returned 'Full graph traversal needed') and applied WHERE by
+round-tripping the finished matches through XWData, so multi-hop Cypher
+patterns could not run at all.
+Solution: compile a pattern into an ordered expansion plan over the CSR
+snapshot and stream variable bindings.
+- `parse_pattern()`: Cypher/GQL path syntax such as
+  `(a:Person {name: 'Ann'})-[r:KNOWS|LIKES*1..3]->(b)<-[:OWNS]-(c), (c)--(d)`,
+  structured {'nodes': [...], 'edges': [...]} dicts and the legacy
+  {source, target, edge} dict.
+- `PatternStatistics`: label -> vertex index lists, sampled distinct value
+  counts per (label, property) and sampled edge type frequencies, built on
+  first use and cached with the snapshot.
+- `plan_pattern()`: starts at the pattern vertex with the fewest estimated
+  candidates (bound ids, else label/property index lookups, else label
+  count x property selectivity), then
+  greedily adds the edge with the lowest estimated fan-out (average degree x
+  edge type frequency x selectivity of the vertex it reaches); edges between
+  two bound vertices become cheap checks as soon as both ends are bound.
+- `PatternMatch`/`match_pattern()`: depth-first expansion following the plan. Labels,
+  inline properties and WHERE conjuncts on a single variable are tested while
+  expanding (memoized per vertex); conjuncts on several variables run as soon
+  as their variables are bound. A relationship is used at most once per
+  binding (Cypher relationship isomorphism); vertices may repeat.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.9.0.5
+Generation Date: 17-Oct-2026
+"""
+
+from __future__ import annotations
+import math
+import operator
+import re
+import time
+from bisect import bisect_right
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+from ...errors import XWQueryValueError
+from .adjacency import (
+    CSRGraph,
+    LazyAdjacency,
+    edge_properties,
+    edge_type,
+    vertex_labels,
+    vertex_properties,
+)
+from .graph_indexes import GraphIndex
+from .predicates import compile_field_getter, compile_predicate, normalize_operator, split_conjuncts
+# Vertices/edges sampled for selectivity estimates
+_SAMPLE_SIZE = 256
+# Hops assumed for unbounded variable-length edges when estimating fan-out
+_UNBOUNDED_HOPS = 3
+_TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+      | (?P<number>-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)
+      | (?P<param>\$\w+)
+      | (?P<op><-|->|\.\.)
+      | (?P<punct>[()\[\]{}:,|*-])
+      | (?P<word>[A-Za-z_]\w*|`[^`]+`)
+    )""", re.VERBOSE)
+_LITERALS = {'true': True, 'false': False, 'null': None}
+# `a.age < b.age`: comparisons between two variables (predicates compare to constants)
+_VARIABLE_COMPARISON = re.compile(r'^\s*([A-Za-z_][\w.]*)\s*(>=|<=|!=|<>|==|=|>|<)\s*([A-Za-z_][\w.]*)\s*$')
+_COMPARISONS = {
+    '=': operator.eq, '!=': operator.ne, '<': operator.lt, '>': operator.gt, '<=': operator.le, '>=': operator.ge,
+}
+
+
+class _Timeout(Exception):
+    """Raised inside the expansion when the time budget is spent."""
+
+
+@dataclass
+class PatternNode:
+    """A vertex of the pattern; `named` is False for anonymous `()` vertices."""
+    var: str
+    labels: tuple[Any, ...] = ()
+    properties: dict[str, Any] = field(default_factory=dict)
+    ids: list[Any] | None = None
+    named: bool = True
+    conditions: list[Condition] = field(default_factory=list)
+
+
+@dataclass
+class PatternEdge:
+    """
+    An edge of the pattern from `source` to `target` (variable names).
+    Incoming edges are stored reversed, so `direction` is 'out' or 'both'.
+    """
+    var: str
+    source: str
+    target: str
+    types: tuple[Any, ...] = ()
+    direction: str = 'out'
+    min_hops: int = 1
+    max_hops: int | None = 1
+    properties: dict[str, Any] = field(default_factory=dict)
+    named: bool = True
+    conditions: list[Condition] = field(default_factory=list)
+
+    @property
+    def variable_length(self) -> bool:
+        return (self.min_hops, self.max_hops) != (1, 1)
+
+
+@dataclass
+class Condition:
+    """
+    One WHERE conjunct. `vars` are the pattern variables it reads; variables
+    in `bare` are compared by vertex id (`b = 'x'`), the others by their
+    properties (`b.age > 30`).
+    """
+    predicate: Callable[[Any], bool]
+    vars: frozenset[str]
+    bare: frozenset[str] = frozenset()
+
+
+@dataclass
+class Pattern:
+    """Pattern vertices (by variable, in order of appearance) and edges."""
+    nodes: dict[str, PatternNode] = field(default_factory=dict)
+    edges: list[PatternEdge] = field(default_factory=list)
+
+    def add_node(
+        self,
+        var: str | None = None,
+        labels: Any = (),
+        properties: dict | None = None,
+        ids: list[Any] | None = None
+    ) -> PatternNode:
+        """Vertex `var` (created on first use, merged afterwards; None: anonymous)."""
+        labels = (labels,) if isinstance(labels, str) else tuple(labels or ())
+        if var is None:
+            var = f'_n{len(self.nodes)}'
+            while var in self.nodes:
+                var += '_'
+            node = self.nodes[var] = PatternNode(var, named=False)
+        else:
+            node = self.nodes.get(var)
+            if node is None:
+                node = self.nodes[var] = PatternNode(var)
+        node.labels += tuple(label for label in labels if label not in node.labels)
+        node.properties.update(properties or {})
+        if ids is not None:
+            node.ids = list(ids) if node.ids is None else [i for i in node.ids if i in ids]
+        return node
+
+    def add_edge(self, source: str, target: str, var: str | None = None, **spec: Any) -> PatternEdge:
+        """Edge source -> target ('in' direction is stored reversed)."""
+        direction = str(spec.pop('direction', 'out') or 'out').lower()
+        if direction == 'in':
+            source, target, direction = target, source, 'out'
+        elif direction != 'out':
+            direction = 'both'
+        types = spec.pop('types', ())
+        named = var is not None
+        if var is None:
+            var = f'_e{len(self.edges)}'
+        edge = PatternEdge(
+            var, source, target, (types,) if isinstance(types, str) else tuple(types or ()), direction, **spec
+        )
+        edge.named = named
+        if edge.min_hops < 0 or (edge.max_hops is not None and edge.max_hops < edge.min_hops):
+            raise XWQueryValueError(f"Invalid hop range {edge.min_hops}..{edge.max_hops} in MATCH pattern")
+        self.edges.append(edge)
+        return edge
+
+    @property
+    def variables(self) -> dict[str, PatternNode | PatternEdge]:
+        return {**self.nodes, **{edge.var: edge for edge in self.edges}}
+# ============================================================================
+# PARSING
+# ============================================================================
+
+
+class _PatternParser:
+    """Recursive-descent parser for Cypher/GQL path patterns."""
+
+    def __init__(self, text: str, pattern: Pattern, parameters: dict | None):
+        self._text = text
+        self._pattern = pattern
+        self._parameters = parameters or {}
+        self._tokens = self._tokenize(text)
+        self._pos = 0
+
+    def _tokenize(self, text: str) -> list[tuple[str, str]]:
+        tokens = []
+        pos = 0
+        text = text.rstrip()
+        while pos < len(text):
+            match = _TOKEN_RE.match(text, pos)
+            if not match or match.end() == pos:
+                raise XWQueryValueError(f"Invalid MATCH pattern near {text[pos:]!r}: {text!r}")
+            kind = match.lastgroup
+            tokens.append((kind, match.group(kind)))
+            pos = match.end()
+        return tokens
+
+    def _peek(self) -> str | None:
+        return self._tokens[self._pos][1] if self._pos < len(self._tokens) else None
+
+    def _take(self) -> tuple[str, str]:
+        if self._pos >= len(self._tokens):
+            raise XWQueryValueError(f"Unexpected end of MATCH pattern: {self._text!r}")
+        self._pos += 1
+        return self._tokens[self._pos - 1]
+
+    def _expect(self, text: str) -> None:
+        if self._take()[1] != text:
+            raise XWQueryValueError(f"Expected {text!r} in MATCH pattern: {self._text!r}")
+
+    def _name(self) -> str | None:
+        if self._pos < len(self._tokens) and self._tokens[self._pos][0] == 'word':
+            return self._take()[1].strip('`')
+        return None
+
+    def parse(self) -> Pattern:
+        if self._tokens and self._tokens[0][1].upper() == 'MATCH':
+            self._pos = 1
+        self._path()
+        while self._peek() == ',':
+            self._take()
+            self._path()
+        if self._peek() is not None:
+            raise XWQueryValueError(f"Unexpected {self._peek()!r} in MATCH pattern: {self._text!r}")
+        return self._pattern
+
+    def _path(self) -> None:
+        left = self._node()
+        while self._peek() in ('-', '<-'):
+            spec, var, incoming, outgoing = self._relationship()
+            right = self._node()
+            spec['direction'] = 'in' if incoming and not outgoing else 'out' if outgoing and not incoming else 'both'
+            self._pattern.add_edge(left, right, var, **spec)
+            left = right
+
+    def _node(self) -> str:
+        self._expect('(')
+        var = self._name()
+        labels = []
+        while self._peek() == ':':
+            self._take()
+            labels.append(self._name())
+        properties = self._properties() if self._peek() == '{' else None
+        self._expect(')')
+        return self._pattern.add_node(var, labels, properties).var
+
+    def _relationship(self) -> tuple[dict, str | None, bool, bool]:
+        incoming = self._take()[1] == '<-'
+        spec: dict[str, Any] = {}
+        var = None
+        if self._peek() == '[':
+            self._take()
+            var = self._name()
+            if self._peek() == ':':
+                self._take()
+                types = [self._name()]
+                while self._peek() == '|':
+                    self._take()
+                    if self._peek() == ':':
+                        self._take()
+                    types.append(self._name())
+                spec['types'] = types
+            if self._peek() == '*':
+                self._take()
+                spec['min_hops'], spec['max_hops'] = self._hops()
+            if self._peek() == '{':
+                spec['properties'] = self._properties()
+            self._expect(']')
+        closing = self._take()[1]
+        if closing not in ('-', '->'):
+            raise XWQueryValueError(f"Expected '-' or '->' in MATCH pattern: {self._text!r}")
+        return spec, var, incoming, closing == '->'
+
+    def _count(self) -> int | None:
+        if self._pos < len(self._tokens) and self._tokens[self._pos][0] == 'number':
+            return int(self._take()[1])
+        return None
+
+    def _hops(self) -> tuple[int, int | None]:
+        low = self._count()
+        if self._peek() != '..':
+            return (low, low) if low is not None else (1, None)
+        self._take()
+        return (1 if low is None else low), self._count()
+
+    def _properties(self) -> dict[str, Any]:
+        self._expect('{')
+        properties = {}
+        while self._peek() != '}':
+            kind, key = self._take()
+            key = key[1:-1] if kind == 'string' else key.strip('`')
+            self._expect(':')
+            properties[key] = self._value()
+            if self._peek() == ',':
+                self._take()
+        self._take()
+        return properties
+
+    def _value(self) -> Any:
+        kind, text = self._take()
+        if kind == 'string':
+            return text[1:-1].replace(f"\\{text[0]}", text[0])
+        if kind == 'number':
+            return float(text) if any(c in text for c in '.eE') else int(text)
+        if kind == 'param':
+            if text[1:] not in self._parameters:
+                raise XWQueryValueError(f"Missing MATCH parameter {text}")
+            return self._parameters[text[1:]]
+        if kind == 'word' and text.lower() in _LITERALS:
+            return _LITERALS[text.lower()]
+        if text == '[':
+            values = []
+            while self._peek() != ']':
+                values.append(self._value())
+                if self._peek() == ',':
+                    self._take()
+            self._take()
+            return values
+        raise XWQueryValueError(f"Expected a value, got {text!r} in MATCH pattern: {self._text!r}")
+
+
+def _node_spec(pattern: Pattern, spec: Any, default_var: str | None = None) -> str:
+    if not isinstance(spec, dict):
+        return pattern.add_node(str(spec) if spec is not None else default_var).var
+    ids = spec.get('ids', [spec['id']] if 'id' in spec else None)
+    return pattern.add_node(
+        spec.get('var', spec.get('variable', spec.get('name', default_var))),
+        spec.get('labels', spec.get('label', ())),
+        spec.get('properties'),
+        ids
+    ).var
+
+
+def _hop_range(spec: dict) -> dict[str, Any]:
+    hops = {}
+    if 'min_hops' in spec or 'max_hops' in spec:
+        hops['min_hops'] = int(spec.get('min_hops', 1))
+        hops['max_hops'] = None if spec.get('max_hops', 1) is None else int(spec.get('max_hops', 1))
+    return hops
+
+
+def parse_pattern(pattern: Any, parameters: dict | None = None) -> Pattern:
+    """
+    Normalize a MATCH pattern.
+    Accepts Cypher text (optionally prefixed with MATCH; `$name` values come
+    from `parameters`), {'nodes': [...], 'edges': [...]} with node specs
+    {'var', 'labels'/'label', 'properties', 'id'/'ids'} and edge specs
+    {'var', 'source'/'from', 'target'/'to', 'type'/'types', 'direction',
+    'min_hops', 'max_hops', 'properties'}, a single node spec, the legacy
+    {'source', 'target', 'edge'} dict (variables 'source' and 'target'), or
+    a list of any of these (one comma-separated pattern).
+    Raises:
+        XWQueryValueError: For malformed patterns
+    """
+    if isinstance(pattern, Pattern):
+        return pattern
+    parsed = Pattern()
+    for part in pattern if isinstance(pattern, (list, tuple)) else [pattern]:
+        if isinstance(part, str):
+            _PatternParser(part, parsed, parameters).parse()
+        elif isinstance(part, dict) and ('nodes' in part or 'edges' in part):
+            for spec in part.get('nodes') or []:
+                _node_spec(parsed, spec)
+            for spec in part.get('edges') or []:
+                source = _node_spec(parsed, spec.get('source', spec.get('from')))
+                target = _node_spec(parsed, spec.get('target', spec.get('to')))
+                parsed.add_edge(
+                    source, target, spec.get('var', spec.get('variable')),
+                    types=spec.get('types', spec.get('type', spec.get('label', ()))),
+                    direction=spec.get('direction', 'out'),
+                    properties=dict(spec.get('properties') or {}),
+                    **_hop_range(spec)
+                )
+        elif isinstance(part, dict) and any(key in part for key in ('source', 'target', 'from', 'to')):
+            source, target = part.get('source', part.get('from')), part.get('target', part.get('to'))
+            edge = part.get('edge') if isinstance(part.get('edge'), dict) else {}
+            parsed.add_node('source', ids=None if source is None else [source])
+            parsed.add_node('target', ids=None if target is None else [target])
+            parsed.add_edge(
+                'source', 'target',
+                types=edge.get('types', edge.get('type', ())),
+                properties=dict(edge.get('properties') or {}),
+                **_hop_range(edge)
+            )
+        elif isinstance(part, dict):
+            _node_spec(parsed, part, 'n')
+        else:
+            raise XWQueryValueError(f"Unsupported MATCH pattern: {part!r}")
+    if not parsed.nodes:
+        raise XWQueryValueError("Empty MATCH pattern")
+    return parsed
+
+
+def _variable_comparison(text: str, variables: dict) -> tuple[Callable[[Any], bool], frozenset[str]] | None:
+    """Predicate and fields of `x.f OP y.g` when both sides are pattern variables."""
+    match = _VARIABLE_COMPARISON.match(text)
+    if not match or match.group(3).split('.', 1)[0] not in variables:
+        return None
+    if match.group(1).split('.', 1)[0] not in variables:
+        return None
+    left, right = compile_field_getter(match.group(1)), compile_field_getter(match.group(3))
+    compare = _COMPARISONS[normalize_operator(match.group(2))]
+
+    def predicate(row: Any) -> bool:
+        try:
+            return bool(compare(left(row), right(row)))
+        except TypeError:
+            return False
+    return predicate, frozenset([match.group(1), match.group(3)])
+
+
+def attach_conditions(pattern: Pattern, where: Any) -> list[Condition]:
+    """
+    Split WHERE into conjuncts and attach each one reading a single pattern
+    variable to that vertex/edge. Returns the remaining conjuncts; those
+    reading no pattern variable (or unknown fields) have empty `vars`.
+    """
+    variables = pattern.variables
+    remaining = []
+    for condition, fields in split_conjuncts(where):
+        compared = _variable_comparison(condition, variables) if isinstance(condition, str) else None
+        if compared is not None:
+            predicate, fields = compared
+        else:
+            predicate = compile_predicate(condition)
+        roots = {name.split('.', 1)[0] for name in fields} if fields is not None else set()
+        used = frozenset(root for root in roots if root in variables)
+        if fields is None or roots - used:
+            used = frozenset()
+        bare = frozenset(name for name in fields or () if name in used)
+        entry = Condition(predicate, used, bare)
+        if len(used) == 1:
+            variables[next(iter(used))].conditions.append(entry)
+        else:
+            remaining.append(entry)
+    return remaining
+# ============================================================================
+# STATISTICS AND PLANNING
+# ============================================================================
+
+
+def _hashable(value: Any) -> Any:
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+
+class PatternStatistics:
+    """
+    Planner statistics of one CSR snapshot (cached on it via
+    `PatternStatistics.of()`). Every statistic is gathered on first use.
+    """
+
+    def __init__(self, graph: CSRGraph):
+        self.graph = graph
+        self._labels: dict[Any, list[int]] | None = None
+        self._distinct: dict[tuple[Any, str], float] = {}
+        self._types: dict[Any, float] | None = None
+
+    @classmethod
+    def of(cls, graph: CSRGraph) -> PatternStatistics:
+        statistics = graph.cache.get('pattern_statistics')
+        if statistics is None:
+            statistics = graph.cache['pattern_statistics'] = cls(graph)
+        return statistics
+
+    @property
+    def average_degree(self) -> float:
+        return self.graph.edge_count / max(len(self.graph), 1)
+
+    def label_index(self, node: Any) -> dict[Any, list[int]]:
+        """Vertex indexes per label (one pass over the vertices)."""
+        if self._labels is None:
+            labels: dict[Any, list[int]] = {}
+            for position, vertex in enumerate(self.graph.vertices):
+                for label in vertex_labels(node, vertex):
+                    labels.setdefault(label, []).append(position)
+            self._labels = labels
+        return self._labels
+
+    def label_count(self, node: Any, label: Any) -> int:
+        return len(self.label_index(node).get(label, ()))
+
+    def equality_selectivity(self, node: Any, label: Any, name: str) -> float:
+        """Estimated fraction of (label) vertices matching `name = <constant>`."""
+        key = (label, name)
+        selectivity = self._distinct.get(key)
+        if selectivity is None:
+            population = self.label_index(node).get(label, []) if label is not None else range(len(self.graph))
+            step = max(len(population) // _SAMPLE_SIZE, 1)
+            sample = [population[position] for position in range(0, len(population), step)]
+            values = {
+                _hashable(vertex_properties(node, self.graph.vertices[position]).get(name))
+                for position in sample
+            }
+            # All sampled values distinct: assume a key-like property
+            distinct = len(population) if len(values) == len(sample) else len(values)
+            selectivity = self._distinct[key] = 1.0 / max(distinct, 1)
+        return selectivity
+
+    def type_frequency(self, node: Any, types: tuple[Any, ...]) -> float:
+        """Estimated fraction of edges whose type is one of `types`."""
+        if not types:
+            return 1.0
+        if self._types is None:
+            graph, counts = self.graph, {}
+            step = max(graph.edge_count // _SAMPLE_SIZE, 1)
+            sampled = range(0, graph.edge_count, step)
+            for edge in sampled:
+                source = bisect_right(graph.offsets, edge) - 1
+                kind = _hashable(edge_type(node, graph.vertices[source], graph.vertices[graph.targets[edge]]))
+                counts[kind] = counts.get(kind, 0) + 1
+            self._types = {kind: count / max(len(sampled), 1) for kind, count in counts.items()}
+        floor = 0.5 / _SAMPLE_SIZE
+        return min(sum(self._types.get(kind, floor) for kind in types), 1.0)
+
+
+@dataclass
+class PlanStep:
+    """
+    'scan' binds `var` from candidates; 'expand' follows `edge` from the
+    bound `source` to bind `var`; 'check' tests `edge` between bound
+    vertices. `conditions` are multi-variable conjuncts ready after the step.
+    """
+    kind: str
+    var: str
+    edge: PatternEdge | None = None
+    reverse: bool = False
+    estimate: float = 0.0
+    conditions: list[Condition] = field(default_factory=list)
+
+    def describe(self) -> str:
+        if self.edge is None:
+            return f"scan ({self.var}) ~{self.estimate:.3g}"
+        edge = self.edge
+        arrow = '--' if edge.direction == 'both' else '->'
+        text = f"({edge.source})-[{edge.var}{''.join(':' + str(t) for t in edge.types[:1])}]{arrow}({edge.target})"
+        return f"{self.kind} {text}{' backwards' if self.reverse else ''} ~{self.estimate:.3g}"
+
+
+def _index_lookups(index: GraphIndex | None, vertex: PatternNode) -> list[set[Any]]:
+    """Index entries (vertex id sets) for the labels and property equalities of a pattern vertex."""
+    if index is None:
+        return []
+    lookups = [index.vertices_with_label(label) for label in vertex.labels]
+    for name, value in vertex.properties.items():
+        found = index.vertices_with_property(name, value)
+        if found is not None:
+            lookups.append(found)
+    return lookups
+
+
+def _candidate_estimate(
+    statistics: PatternStatistics | None,
+    node: Any,
+    vertex: PatternNode,
+    index: GraphIndex | None = None
+) -> float:
+    """Estimated number of graph vertices matching a pattern vertex on its own."""
+    if vertex.ids is not None:
+        return float(len(vertex.ids))
+    lookups = _index_lookups(index, vertex)
+    if lookups:
+        return min(map(len, lookups)) * 0.5 ** len(vertex.conditions)
+    if statistics is None:
+        return math.inf
+    estimate = float(len(statistics.graph))
+    for label in vertex.labels:
+        estimate = min(estimate, statistics.label_count(node, label))
+    label = vertex.labels[0] if vertex.labels else None
+    for name in vertex.properties:
+        estimate *= statistics.equality_selectivity(node, label, name)
+    return estimate * 0.5 ** len(vertex.conditions)
+
+
+def _fan_out(statistics: PatternStatistics | None, node: Any, edge: PatternEdge) -> float:
+    """Estimated vertices reached by following one pattern edge from one vertex."""
+    if statistics is None:
+        return 1.0
+    per_hop = statistics.average_degree * statistics.type_frequency(node, edge.types)
+    per_hop *= (2 if edge.direction == 'both' else 1) * 0.5 ** (len(edge.properties) + len(edge.conditions))
+    hops = edge.max_hops if edge.max_hops is not None else max(edge.min_hops, _UNBOUNDED_HOPS)
+    return sum(per_hop ** hop for hop in range(edge.min_hops, hops + 1)) or 1.0
+
+
+def plan_pattern(
+    pattern: Pattern,
+    node: Any,
+    graph: CSRGraph | LazyAdjacency,
+    conditions: list[Condition] = (),
+    can_reverse: bool = True,
+    index: GraphIndex | None = None
+) -> list[PlanStep]:
+    """
+    Order the pattern into scan/expand/check steps (greedy, cheapest first)
+    and place each multi-variable condition after the step binding its last
+    variable. With a graph `index`, label/property candidate counts are
+    exact index lookups instead of estimates.
+    Raises:
+        XWQueryValueError: When a vertex must be scanned but the graph cannot
+        list its vertices, or an edge must be walked backwards without
+        incoming adjacency
+    """
+    statistics = PatternStatistics.of(graph) if isinstance(graph, CSRGraph) else None
+    size = float(len(graph)) if statistics is not None else math.inf
+    estimates = {var: _candidate_estimate(statistics, node, vertex, index) for var, vertex in pattern.nodes.items()}
+    bound: set[str] = set()
+    remaining = list(pattern.edges)
+    steps: list[PlanStep] = []
+    while len(bound) < len(pattern.nodes) or remaining:
+        best = None
+        for edge in remaining:
+            if edge.source in bound and edge.target in bound:
+                best = (0.0, PlanStep('check', edge.target, edge, estimate=1.0))
+                break
+            for start, end, reverse in ((edge.source, edge.target, False), (edge.target, edge.source, True)):
+                if start not in bound or end in bound:
+                    continue
+                walks_backwards = reverse or edge.direction == 'both'
+                cost = math.inf if walks_backwards and not can_reverse else (
+                    _fan_out(statistics, node, edge) * min(estimates[end] / size, 1.0)
+                    if statistics is not None else 1.0
+                )
+                if best is None or cost < best[0]:
+                    best = (cost, PlanStep('expand', end, edge, reverse, cost))
+        if best is None:
+            var = min((var for var in pattern.nodes if var not in bound), key=estimates.__getitem__)
+            if estimates[var] == math.inf and statistics is None:
+                raise XWQueryValueError(
+                    f"MATCH needs a bound start vertex for ({var}): the graph cannot list its vertices"
+                )
+            step = PlanStep('scan', var, estimate=estimates[var])
+        else:
+            if best[0] == math.inf:
+                raise XWQueryValueError("MATCH pattern needs incoming edges, which this graph cannot provide")
+            step = best[1]
+            remaining.remove(step.edge)
+        steps.append(step)
+        bound.add(step.var)
+        if step.edge is not None and step.edge.named:
+            bound.add(step.edge.var)
+        step.conditions = [condition for condition in conditions if condition.vars and condition.vars <= bound]
+        conditions = [condition for condition in conditions if condition not in step.conditions]
+    return steps
+# ============================================================================
+# MATCHING
+# ============================================================================
+
+
+class _Matcher:
+    """Executes a plan over a graph, memoizing vertex/edge checks per query."""
+
+    def __init__(
+        self,
+        node: Any,
+        graph: CSRGraph | LazyAdjacency,
+        reverse: CSRGraph | LazyAdjacency | None,
+        pattern: Pattern,
+        steps: list[PlanStep],
+        residual: list[Condition],
+        deadline: float | None,
+        index: GraphIndex | None = None
+    ):
+        self.node, self.graph, self.reverse, self.index = node, graph, reverse, index
+        self.pattern, self.steps, self.residual = pattern, steps, residual
+        self.deadline = deadline
+        self.ticks = 0
+        self.vertices: dict[str, int] = {}
+        self.edges: dict[str, Any] = {}
+        self.used: set[tuple[int, int]] = set()
+        self._records: dict[int, dict] = {}
+        self._edge_records: dict[tuple[int, int], dict] = {}
+        self._vertex_checks: dict[str, dict[int, bool]] = {var: {} for var in pattern.nodes}
+        self._id_positions = {
+            var: {graph.index_of(vertex_id) for vertex_id in vertex.ids}
+            for var, vertex in pattern.nodes.items() if vertex.ids is not None
+        }
+        # Edge type entries of an already built edge type index, per pattern edge
+        self._typed = {
+            edge.var: [index.edges_with_type(kind) for kind in edge.types]
+            for edge in pattern.edges if edge.types and index is not None and index.is_built('edge_types')
+        }
+
+    def _tick(self) -> None:
+        self.ticks += 1
+        if self.deadline is not None and not self.ticks & 1023 and time.monotonic() > self.deadline:
+            raise _Timeout
+
+    def record(self, position: int) -> dict:
+        """Properties of a vertex (with its 'id' and 'labels')."""
+        record = self._records.get(position)
+        if record is None:
+            vertex = self.graph.vertices[position]
+            record = self._records[position] = {
+                'id': vertex, 'labels': list(vertex_labels(self.node, vertex)), **vertex_properties(self.node, vertex)
+            }
+        return record
+
+    def edge_record(self, pair: tuple[int, int]) -> dict:
+        """Properties of an edge (with its 'source', 'target' and 'type')."""
+        record = self._edge_records.get(pair)
+        if record is None:
+            source, target = self.graph.vertices[pair[0]], self.graph.vertices[pair[1]]
+            properties = edge_properties(self.node, source, target)
+            record = self._edge_records[pair] = {
+                'source': source, 'target': target,
+                **properties, 'type': properties.get('type', edge_type(self.node, source, target))
+            }
+        return record
+
+    def _row(self, condition: Condition, candidate: tuple[str, Any] | None = None) -> dict:
+        row = {}
+        for var in condition.vars:
+            if candidate is not None and var == candidate[0]:
+                value = candidate[1]
+            else:
+                value = self.vertices[var] if var in self.vertices else self.edges.get(var)
+            if var in self.pattern.nodes:
+                row[var] = self.graph.vertices[value] if var in condition.bare else self.record(value)
+            else:
+                row[var] = [self.edge_record(pair) for pair in value] if isinstance(value, list) else (
+                    self.edge_record(value)
+                )
+        return row
+
+    def vertex_ok(self, vertex: PatternNode, position: int) -> bool:
+        checks = self._vertex_checks[vertex.var]
+        ok = checks.get(position)
+        if ok is None:
+            ok = vertex.var not in self._id_positions or position in self._id_positions[vertex.var]
+            if ok and (vertex.labels or vertex.properties):
+                record = self.record(position)
+                labels = record['labels']
+                ok = all(label in labels for label in vertex.labels) and all(
+                    record.get(name) == value for name, value in vertex.properties.items()
+                )
+            if ok and vertex.conditions:
+                ok = all(c.predicate(self._row(c, (vertex.var, position))) for c in vertex.conditions)
+            checks[position] = ok
+        return ok
+
+    def edge_ok(self, edge: PatternEdge, pair: tuple[int, int]) -> bool:
+        if pair in self.used:
+            return False
+        if not (edge.types or edge.properties or edge.conditions):
+            return True
+        typed = self._typed.get(edge.var)
+        if typed is not None:
+            ends = (self.graph.vertices[pair[0]], self.graph.vertices[pair[1]])
+            if not any(ends in pairs for pairs in typed):
+                return False
+            if not (edge.properties or edge.conditions):
+                return True
+        record = self.edge_record(pair)
+        if edge.types and typed is None and record['type'] not in edge.types:
+            return False
+        if any(record.get(name) != value for name, value in edge.properties.items()):
+            return False
+        return all(c.predicate(self._row(c, (edge.var, pair))) for c in edge.conditions)
+
+    def _hops(self, edge: PatternEdge, position: int, reverse: bool) -> Iterator[tuple[int, tuple[int, int]]]:
+        """(neighbor, traversed edge as (source, target)) pairs one hop from `position`."""
+        if edge.direction == 'both' or not reverse:
+            for neighbor in self.graph.out(position):
+                yield neighbor, (position, neighbor)
+        if edge.direction == 'both' or reverse:
+            for neighbor in self.reverse.out(position):
+                yield neighbor, (neighbor, position)
+
+    def expand(self, edge: PatternEdge, position: int, reverse: bool) -> Iterator[tuple[int, Any]]:
+        """(reached vertex, edge binding) for every way to follow `edge` from `position`."""
+        if not edge.variable_length:
+            for neighbor, pair in self._hops(edge, position, reverse):
+                self._tick()
+                if self.edge_ok(edge, pair):
+                    yield neighbor, pair
+            return
+        if edge.min_hops == 0:
+            yield position, []
+        # Explicit-stack DFS over edge-distinct walks; path edges are marked used
+        path: list[tuple[int, int]] = []
+        stack = [self._hops(edge, position, reverse)]
+        try:
+            while stack:
+                step = next(stack[-1], None)
+                if step is None:
+                    stack.pop()
+                    if path:
+                        self.used.discard(path.pop())
+                    continue
+                self._tick()
+                neighbor, pair = step
+                if not self.edge_ok(edge, pair):
+                    continue
+                path.append(pair)
+                self.used.add(pair)
+                if len(path) >= edge.min_hops:
+                    # Callers see the walk's edges as unused so they can mark them
+                    self.used.difference_update(path)
+                    yield neighbor, list(path) if not reverse else path[::-1]
+                    self.used.update(path)
+                if edge.max_hops is None or len(path) < edge.max_hops:
+                    stack.append(self._hops(edge, neighbor, reverse))
+                else:
+                    self.used.discard(path.pop())
+        finally:
+            self.used.difference_update(path)
+
+    def _candidates(self, vertex: PatternNode) -> Iterator[int]:
+        if vertex.ids is not None:
+            for vertex_id in vertex.ids:
+                position = self.graph.index_of(vertex_id)
+                if position is not None:
+                    yield position
+            return
+        lookups = _index_lookups(self.index, vertex)
+        if lookups:
+            index_of = self.graph.index_of
+            for vertex_id in min(lookups, key=len):
+                position = index_of(vertex_id)
+                if position is not None:
+                    yield position
+            return
+        statistics = PatternStatistics.of(self.graph)
+        if vertex.labels:
+            index = statistics.label_index(self.node)
+            yield from min((index.get(label, []) for label in vertex.labels), key=len)
+            return
+        yield from range(len(self.graph))
+
+    def _conditions_ok(self, step: PlanStep) -> bool:
+        return all(condition.predicate(self._row(condition)) for condition in step.conditions)
+
+    def run(self, depth: int = 0) -> Iterator[dict[str, Any]]:
+        if depth == len(self.steps):
+            if self.residual:
+                output = self.output()
+                if all(condition.predicate(output) for condition in self.residual):
+                    yield output
+            else:
+                yield self.output()
+            return
+        step = self.steps[depth]
+        vertex = self.pattern.nodes[step.var]
+        if step.kind == 'scan':
+            for position in self._candidates(vertex):
+                self._tick()
+                if self.vertex_ok(vertex, position):
+                    self.vertices[step.var] = position
+                    if self._conditions_ok(step):
+                        yield from self.run(depth + 1)
+            self.vertices.pop(step.var, None)
+            return
+        edge = step.edge
+        start = self.vertices[edge.target if step.reverse else edge.source]
+        bound = self.vertices.get(step.var) if step.kind == 'check' else None
+        for reached, binding in self.expand(edge, start, step.reverse):
+            if step.kind == 'check' and reached != bound:
+                continue
+            if step.kind == 'expand' and not self.vertex_ok(vertex, reached):
+                continue
+            pairs = binding if isinstance(binding, list) else [binding]
+            if len(set(pairs)) < len(pairs):
+                continue
+            self.vertices[step.var] = reached
+            self.edges[edge.var] = binding
+            self.used.update(pairs)
+            try:
+                if self._conditions_ok(step):
+                    yield from self.run(depth + 1)
+            finally:
+                self.used.difference_update(pairs)
+        self.edges.pop(edge.var, None)
+        if step.kind == 'expand':
+            self.vertices.pop(step.var, None)
+
+    def _edge_output(self, pair: tuple[int, int]) -> dict[str, Any]:
+        record = self.edge_record(pair)
+        return {'source': record['source'], 'target': record['target'], 'type': record['type']}
+
+    def output(self) -> dict[str, Any]:
+        """The current binding: vertex ids for vertex variables, edge dicts for edge variables."""
+        vertices = self.graph.vertices
+        output = {var: vertices[position] for var, position in self.vertices.items() if self.pattern.nodes[var].named}
+        for edge in self.pattern.edges:
+            if edge.named and edge.var in self.edges:
+                binding = self.edges[edge.var]
+                output[edge.var] = (
+                    [self._edge_output(pair) for pair in binding] if isinstance(binding, list)
+                    else self._edge_output(binding)
+                )
+        return output
+
+
+class PatternMatch:
+    """
+    A parsed and planned MATCH, ready to stream bindings.
+    `node` supplies labels and properties; `reverse` is the incoming
+    adjacency (the snapshot's transpose by default); `index` is the graph's
+    GraphIndex when `graph` is its current snapshot, turning label/property
+    scans into lookups.
+    Raises:
+        XWQueryValueError: For malformed patterns or WHERE expressions, or
+        patterns the graph cannot answer (see `plan_pattern()`)
+    """
+
+    def __init__(
+        self,
+        node: Any,
+        graph: CSRGraph | LazyAdjacency,
+        pattern: Any,
+        where: Any = None,
+        parameters: dict | None = None,
+        reverse: CSRGraph | LazyAdjacency | None = None,
+        index: GraphIndex | None = None
+    ):
+        self.node, self.graph, self.index = node, graph, index
+        self.pattern = parse_pattern(pattern, parameters)
+        conditions = attach_conditions(self.pattern, where)
+        if reverse is None and isinstance(graph, CSRGraph):
+            reverse = graph.transpose()
+        self.reverse = reverse
+        self.steps = plan_pattern(self.pattern, node, graph, conditions, reverse is not None, index)
+        self.residual = [condition for condition in conditions if not condition.vars]
+
+    def explain(self) -> list[str]:
+        """One line per plan step, with its estimated row count."""
+        return [step.describe() for step in self.steps]
+
+    def bindings(self, deadline: float | None = None) -> Iterator[dict[str, Any]]:
+        """Lazily yield every binding; stops quietly at `deadline` (a `time.monotonic()` value)."""
+        matcher = _Matcher(
+            self.node, self.graph, self.reverse, self.pattern, self.steps, self.residual, deadline, self.index
+        )
+        try:
+            yield from matcher.run()
+        except _Timeout:
+            return
+
+
+def match_pattern(
+    node: Any,
+    graph: CSRGraph | LazyAdjacency,
+    pattern: Any,
+    where: Any = None,
+    parameters: dict | None = None,
+    deadline: float | None = None
+) -> Iterator[dict[str, Any]]:
+    """Stream the bindings of `pattern` in `graph` (see `PatternMatch`)."""
+    return PatternMatch(node, graph, pattern, where, parameters).bindings(deadline)
+__all__ = [
+    'Condition',
+    'Pattern',
+    'PatternEdge',
+    'PatternMatch',
+    'PatternNode',
+    'PatternStatistics',
+    'PlanStep',
+    'attach_conditions',
+    'match_pattern',
+    'parse_pattern',
+    'plan_pattern',
+]
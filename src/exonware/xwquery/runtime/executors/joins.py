@@ -0,0 +1,860 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/src/exonware/xwquery/runtime/executors/joins.py
+Shared join machinery: join keys, output mergers and the hash join kernels.
+Root cause: JOIN only understood a single left/right key, always built its
+hash table on the right input, merged every field of both rows into a new
+dict even when a projection kept two columns, and counted matches by
+re-scanning the result. MINUS had its own set-difference loop.
+Solution:
+- `parse_join_keys()` turns any ON form (field, pairs, dicts,
+  "a.x = b.y AND a.z = b.w") into aligned composite key lists, and
+  `compile_join_key()` compiles them into one getter (scalar or tuple key;
+  NULL in any component never matches, as in SQL).
+- `iter_hash_join()` builds on whichever side the caller picks
+  (`choose_build_side()` prefers the smaller input) and preserves outer
+  rows on either side; matches are counted while joining.
+- `semi_join()` / `anti_join()` (EXISTS / NOT EXISTS, MINUS) only hash key
+  values and return the original left rows - no merged dicts at all.
+- `make_merger()` builds only the output columns a projection asked for.
+- `iter_merge_join()` joins inputs already ordered on the key in constant
+  memory, and `iter_range_join()` serves range/inequality (band) predicates
+  such as `left.ts >= right.ts - 5 AND left.ts <= right.ts + 5` with a
+  sliding window over the ordered right input.
+- `hash_join()` switches to a Grace hash join when the build side outgrows
+  the join memory budget: both inputs are hashed into on-disk partitions
+  and partition pairs are joined one at a time (oversized partitions are
+  re-partitioned with a new hash salt).
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.9.0.5
+Generation Date: 17-Oct-2026
+"""
+
+from __future__ import annotations
+import logging
+import pickle
+import re
+import operator
+import tempfile
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import timedelta
+from itertools import chain
+from typing import Any
+from ...errors import XWQueryValueError
+from .predicates import compile_field_getter, is_missing
+from .sorting import estimate_row_bytes
+logger = logging.getLogger(__name__)
+# Join types that keep unmatched rows of a side
+_PRESERVES_LEFT = frozenset({'LEFT', 'FULL'})
+_PRESERVES_RIGHT = frozenset({'RIGHT', 'FULL'})
+JOIN_TYPE_ALIASES = {
+    'LEFT OUTER': 'LEFT',
+    'RIGHT OUTER': 'RIGHT',
+    'FULL OUTER': 'FULL',
+    'OUTER': 'FULL',
+    'LEFT SEMI': 'SEMI',
+    'EXISTS': 'SEMI',
+    'LEFT ANTI': 'ANTI',
+    'NOT EXISTS': 'ANTI',
+}
+_CONDITION_SPLIT = re.compile(r'\s+AND\s+', re.IGNORECASE)
+_RANGE_CONDITION = re.compile(
+    r'^\s*([\w.]+)\s*(<=|>=|<|>)\s*([\w.]+)\s*(?:([+-])\s*(\d+(?:\.\d+)?))?\s*$'
+)
+_RANGE_OPS = {'<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge}
+_SIDE_PREFIXES = ('left.', 'right.')
+# Grace hash join tuning
+DEFAULT_JOIN_PARTITIONS = 32
+_MAX_PARTITION_DEPTH = 3  # Re-partitioning rounds before a skewed partition is joined in memory
+_PARTITION_BATCH_ROWS = 1024  # Rows per pickled batch in a partition file
+_SIZE_SAMPLE_EVERY = 64  # Estimate row size on every Nth build row
+
+
+def normalize_join_type(join_type: Any) -> str:
+    """Canonical join type name ('INNER', 'LEFT', ..., 'SEMI', 'ANTI')."""
+    name = ' '.join(str(join_type or 'INNER').upper().replace('_', ' ').split())
+    if name.endswith(' JOIN'):
+        name = name[:-5]
+    return JOIN_TYPE_ALIASES.get(name, name)
+
+
+def _strip_side(field: str) -> str:
+    field = field.strip()
+    for prefix in _SIDE_PREFIXES:
+        if field.lower().startswith(prefix):
+            return field[len(prefix):]
+    return field
+
+
+def _shifted(value: Any, offset: Any) -> Any:
+    if not offset:
+        return value  # No arithmetic, so text and date/time keys compare as they are
+    return value + offset
+
+
+@dataclass(frozen=True)
+class RangeCondition:
+    """
+    Inequality join predicate: `left.<left_field> <op> right.<right_field> + offset`.
+    The offset is a number, or a timedelta for date/time keys.
+    """
+    left_field: str
+    op: str
+    right_field: str
+    offset: float | timedelta = 0
+
+    def matches(self, left_value: Any, right_value: Any) -> bool:
+        try:
+            return _RANGE_OPS[self.op](left_value, _shifted(right_value, self.offset))
+        except TypeError:
+            return False
+
+
+def _range_condition(entry: Any) -> RangeCondition | None:
+    if isinstance(entry, str):
+        match = _RANGE_CONDITION.match(entry)
+        if not match:
+            return None
+        left, op, right, sign, number = match.groups()
+        offset = 0
+        if number:
+            offset = float(number) if '.' in number else int(number)
+            offset = -offset if sign == '-' else offset
+        return RangeCondition(_strip_side(left), op, _strip_side(right), offset)
+    if isinstance(entry, dict) and entry.get('op', entry.get('operator')) in _RANGE_OPS:
+        return RangeCondition(
+            _strip_side(str(entry['left'])),
+            entry.get('op', entry.get('operator')),
+            _strip_side(str(entry['right'])),
+            entry.get('offset', 0)
+        )
+    return None
+
+
+def parse_join_condition(join_on: Any) -> tuple[list[str], list[str], list[RangeCondition]]:
+    """
+    Parse a join condition into equality keys and range conditions.
+    Returns (left_keys, right_keys, ranges). Equality forms are those of
+    `parse_join_keys()`; range parts are 'left.ts >= right.start',
+    'ts <= ts + 5' or {'left': 'ts', 'op': '<', 'right': 'end'} entries (with
+    an optional 'offset', e.g. a timedelta for date/time keys).
+    Nothing is defaulted: both key lists are empty for a pure range join.
+    """
+    pairs: list[tuple[str, str]] = []
+    ranges: list[RangeCondition] = []
+    if isinstance(join_on, dict):
+        if _range_condition(join_on):
+            ranges.append(_range_condition(join_on))
+        else:
+            pairs = [(str(left), str(right)) for left, right in join_on.items()]
+    elif isinstance(join_on, str):
+        for part in _CONDITION_SPLIT.split(join_on):
+            condition = _range_condition(part)
+            if condition:
+                ranges.append(condition)
+            elif '=' in part:
+                left, right = part.replace('==', '=').split('=', 1)
+                pairs.append((_strip_side(left), _strip_side(right)))
+            else:
+                pairs.extend((field.strip(), field.strip()) for field in part.split(',') if field.strip())
+    elif isinstance(join_on, (list, tuple)):
+        if len(join_on) == 2 and all(isinstance(field, str) for field in join_on) and not any(
+            _range_condition(field) for field in join_on
+        ):
+            pairs = [(join_on[0], join_on[1])]
+        else:
+            for entry in join_on:
+                condition = _range_condition(entry)
+                if condition:
+                    ranges.append(condition)
+                elif isinstance(entry, str):
+                    pairs.append((entry, entry))
+                elif isinstance(entry, dict):
+                    pairs.extend((str(left), str(right)) for left, right in entry.items())
+                elif isinstance(entry, (list, tuple)) and len(entry) == 2:
+                    pairs.append((str(entry[0]), str(entry[1])))
+    return [left for left, _ in pairs], [right for _, right in pairs], ranges
+
+
+def parse_join_keys(join_on: Any) -> tuple[list[str], list[str]]:
+    """
+    Parse a join condition into aligned (left_keys, right_keys) lists.
+    Supports:
+    - 'id' (same field on both sides), 'id, region' (composite)
+    - 'customer_id = id AND region = region' (left = right pairs;
+      'left.'/'right.' qualifiers are dropped)
+    - {'customer_id': 'id', 'region': 'region'}
+    - ('customer_id', 'id') - a single left/right pair
+    - [('customer_id', 'id'), ('region', 'region')], or a list of dicts
+    Range parts are ignored here (see `parse_join_condition()`).
+    """
+    left_keys, right_keys, _ = parse_join_condition(join_on)
+    if not left_keys:
+        # Default: assume 'id'
+        return ['id'], ['id']
+    return left_keys, right_keys
+
+
+def compile_join_key(fields: list[str]) -> Callable[[Any], Any]:
+    """
+    Compile a key getter for one side of a join.
+    One field yields the value itself, several yield a tuple. The getter
+    returns None when any component is NULL/missing (such rows never match).
+    """
+    getters = [compile_field_getter(field) for field in fields]
+    if len(getters) == 1:
+        get = getters[0]
+
+        def single_key(row: Any) -> Any:
+            if row is None:
+                return None
+            value = get(row)
+            return None if is_missing(value) else _hashable(value)
+        return single_key
+
+    def composite_key(row: Any) -> Any:
+        if row is None:
+            return None
+        values = []
+        for get in getters:
+            value = get(row)
+            if value is None or is_missing(value):
+                return None
+            values.append(_hashable(value))
+        return tuple(values)
+    return composite_key
+
+
+def _hashable(value: Any) -> Any:
+    if isinstance(value, (list, dict, set)):
+        from .xw_reuse import SafeComparator
+        return SafeComparator.make_hashable(value)
+    return value
+
+
+def choose_build_side(left: Any, right: Any, join_type: str = 'INNER', hint: str | None = None) -> str:
+    """
+    Pick the side to hash ('left' or 'right').
+    An explicit hint wins; otherwise the smaller input by cardinality.
+    Inputs without a length (streams) are always probed, never built.
+    """
+    if hint in ('left', 'right'):
+        return hint
+    left_size = len(left) if hasattr(left, '__len__') else None
+    right_size = len(right) if hasattr(right, '__len__') else None
+    if left_size is None:
+        return 'right'
+    if right_size is None:
+        return 'left'
+    return 'left' if left_size < right_size else 'right'
+
+
+def make_merger(
+    columns: Iterable[str] | None = None,
+    left_prefix: str = 'left',
+    right_prefix: str = 'right'
+) -> Callable[[Any, Any], dict]:
+    """
+    Build the function that turns a (left, right) pair into an output row.
+    Without columns every field is copied with a side prefix
+    ({'left_id': .., 'right_email': ..}). With columns ('left_name',
+    'right.email', ...) only those are built, under the same prefixed names.
+    """
+    if not columns:
+        def merge_all(left: Any, right: Any) -> dict:
+            merged = {}
+            if left:
+                for key, value in left.items():
+                    merged[f"{left_prefix}_{key}"] = value
+            if right:
+                for key, value in right.items():
+                    merged[f"{right_prefix}_{key}"] = value
+            return merged
+        return merge_all
+    plan = []
+    for column in columns:
+        for side, prefix in ((0, left_prefix), (1, right_prefix)):
+            for separator in ('_', '.'):
+                if column.startswith(prefix + separator):
+                    field = column[len(prefix) + 1:]
+                    plan.append((f"{prefix}_{field}", side, compile_field_getter(field)))
+                    break
+            else:
+                continue
+            break
+    if not plan:
+        return make_merger(None, left_prefix, right_prefix)
+
+    def merge_columns(left: Any, right: Any) -> dict:
+        pair = (left, right)
+        merged = {}
+        for name, side, get in plan:
+            row = pair[side]
+            if row:
+                value = get(row)
+                if not is_missing(value):
+                    merged[name] = value
+        return merged
+    return merge_columns
+
+
+def iter_hash_join(
+    left: Iterable[Any],
+    right: Iterable[Any],
+    left_key: Callable[[Any], Any],
+    right_key: Callable[[Any], Any],
+    join_type: str = 'INNER',
+    build_side: str = 'right',
+    merge: Callable[[Any, Any], dict] | None = None,
+    stats: dict[str, Any] | None = None
+) -> Iterator[dict]:
+    """
+    Hash join two inputs, building on `build_side` and streaming the other.
+    Unmatched rows of preserved sides (LEFT/RIGHT/FULL) are emitted with
+    '_matched': False - probe-side rows as they pass, build-side rows at the
+    end. When `stats` is given, 'matched_count' (joined rows with a match)
+    is accumulated into it.
+    """
+    merge = merge or make_merger()
+    if build_side == 'left':
+        build, probe, build_key, probe_key = left, right, left_key, right_key
+        keep_build, keep_probe = join_type in _PRESERVES_LEFT, join_type in _PRESERVES_RIGHT
+    else:
+        build, probe, build_key, probe_key = right, left, right_key, left_key
+        keep_build, keep_probe = join_type in _PRESERVES_RIGHT, join_type in _PRESERVES_LEFT
+    # Orient (build row, probe row) back to (left, right)
+    if build_side == 'left':
+        def pair(build_row: Any, probe_row: Any) -> dict:
+            return merge(build_row, probe_row)
+    else:
+        def pair(build_row: Any, probe_row: Any) -> dict:
+            return merge(probe_row, build_row)
+    table: dict[Any, list[Any]] = {}
+    unkeyed: list[Any] = []
+    for row in build:
+        key = build_key(row)
+        if key is None:
+            if keep_build:
+                unkeyed.append(row)
+            continue
+        bucket = table.get(key)
+        if bucket is None:
+            table[key] = [row]
+        else:
+            bucket.append(row)
+    matched_keys: set[Any] = set()
+    matched = 0
+    for row in probe:
+        key = probe_key(row)
+        bucket = table.get(key) if key is not None else None
+        if bucket:
+            if keep_build:
+                matched_keys.add(key)
+            matched += len(bucket)
+            for build_row in bucket:
+                yield pair(build_row, row)
+        elif keep_probe:
+            joined = pair(None, row)
+            joined['_matched'] = False
+            yield joined
+    if stats is not None:
+        stats['matched_count'] = stats.get('matched_count', 0) + matched
+    if keep_build:
+        for key, bucket in table.items():
+            if key not in matched_keys:
+                for build_row in bucket:
+                    joined = pair(build_row, None)
+                    joined['_matched'] = False
+                    yield joined
+        for build_row in unkeyed:
+            joined = pair(build_row, None)
+            joined['_matched'] = False
+            yield joined
+
+
+def _check_order(previous: Any, key: Any, descending: bool, side: str) -> None:
+    try:
+        out_of_order = key > previous if descending else key < previous
+    except TypeError:
+        out_of_order = True
+    if out_of_order:
+        raise XWQueryValueError(f"Merge join {side} input is not ordered on the join key")
+
+
+def iter_merge_join(
+    left: Iterable[Any],
+    right: Iterable[Any],
+    left_key: Callable[[Any], Any],
+    right_key: Callable[[Any], Any],
+    join_type: str = 'INNER',
+    merge: Callable[[Any, Any], dict] | None = None,
+    stats: dict[str, Any] | None = None,
+    descending: bool = False
+) -> Iterator[dict]:
+    """
+    Sort-merge equi-join of inputs already ordered on their join keys.
+    Both inputs are streamed; only the right rows sharing the current key are
+    buffered, so memory is bounded by the largest duplicate-key group rather
+    than an input. Rows with a NULL key never match (preserved sides emit
+    them unmatched as they pass) and may sit anywhere in the input.
+    Output follows the left order, with unmatched right rows emitted as the
+    merge passes them.
+    Raises:
+        XWQueryValueError: If an input turns out not to be ordered
+    """
+    merge = merge or make_merger()
+    keep_left, keep_right = join_type in _PRESERVES_LEFT, join_type in _PRESERVES_RIGHT
+
+    def before(a: Any, b: Any) -> bool:
+        return a > b if descending else a < b
+
+    def unmatched(left_row: Any, right_row: Any) -> dict:
+        joined = merge(left_row, right_row)
+        joined['_matched'] = False
+        return joined
+    rights = iter(right)
+    pending: Any = None
+    pending_key: Any = None
+    previous_right: Any = None
+
+    def advance() -> Iterator[dict]:
+        # Move `pending` to the next right row with a key (NULL keys pass through)
+        nonlocal pending, pending_key, previous_right
+        for row in rights:
+            key = right_key(row)
+            if key is None:
+                if keep_right:
+                    yield unmatched(None, row)
+                continue
+            if previous_right is not None:
+                _check_order(previous_right, key, descending, 'right')
+            previous_right = key
+            pending, pending_key = row, key
+            return
+        pending = pending_key = None
+    yield from advance()
+    group: list[Any] = []
+    group_key: Any = None
+    group_matched = False
+    previous_left: Any = None
+    matched = 0
+    for row in left:
+        key = left_key(row)
+        if key is None:
+            if keep_left:
+                yield unmatched(row, None)
+            continue
+        if previous_left is not None:
+            _check_order(previous_left, key, descending, 'left')
+        previous_left = key
+        if not group or key != group_key:
+            if group and keep_right and not group_matched:
+                for right_row in group:
+                    yield unmatched(None, right_row)
+            group, group_key, group_matched = [], key, False
+            while pending_key is not None and before(pending_key, key):
+                if keep_right:
+                    yield unmatched(None, pending)
+                yield from advance()
+            while pending_key is not None and pending_key == key:
+                group.append(pending)
+                yield from advance()
+        if group:
+            group_matched = True
+            matched += len(group)
+            for right_row in group:
+                yield merge(row, right_row)
+        elif keep_left:
+            yield unmatched(row, None)
+    if stats is not None:
+        stats['matched_count'] = stats.get('matched_count', 0) + matched
+    if keep_right:
+        if not group_matched:
+            for right_row in group:
+                yield unmatched(None, right_row)
+        while pending_key is not None:
+            yield unmatched(None, pending)
+            yield from advance()
+
+
+def iter_range_join(
+    left: Iterable[Any],
+    right: Iterable[Any],
+    ranges: list[RangeCondition],
+    join_type: str = 'INNER',
+    merge: Callable[[Any, Any], dict] | None = None,
+    stats: dict[str, Any] | None = None,
+    left_key: Callable[[Any], Any] | None = None,
+    right_key: Callable[[Any], Any] | None = None
+) -> Iterator[Any]:
+    """
+    Band join for range/inequality predicates over ordered inputs.
+    Both inputs must be ordered ascending on the fields of the first range
+    condition. Those conditions bound the matching right values for each
+    left value; since the bounds only move forward, the right input is read
+    once into a sliding window (a deque) - memory is the window, not the
+    input (a one-sided predicate such as `left.ts > right.ts` keeps every
+    right row passed so far). The remaining range conditions and the
+    optional equality keys are checked on each candidate pair.
+    Supports INNER/LEFT/RIGHT/FULL plus SEMI/ANTI (left rows returned as-is).
+    Raises:
+        XWQueryValueError: If an input turns out not to be ordered
+    """
+    merge = merge or make_merger()
+    driver = ranges[0]
+    driving = [condition for condition in ranges if
+               (condition.left_field, condition.right_field) == (driver.left_field, driver.right_field)]
+    get_left = compile_field_getter(driver.left_field)
+    get_right = compile_field_getter(driver.right_field)
+    left_getters = {condition.left_field: compile_field_getter(condition.left_field) for condition in ranges}
+    right_getters = {condition.right_field: compile_field_getter(condition.right_field) for condition in ranges}
+    keep_left, keep_right = join_type in _PRESERVES_LEFT, join_type in _PRESERVES_RIGHT
+    semi, anti = join_type == 'SEMI', join_type == 'ANTI'
+
+    def value(get: Callable[[Any], Any], row: Any) -> Any:
+        found = get(row)
+        return None if is_missing(found) else found
+
+    def residual(left_row: Any, right_row: Any) -> bool:
+        if left_key is not None:
+            key = left_key(left_row)
+            if key is None or key != right_key(right_row):
+                return False
+        for condition in ranges:
+            left_value = value(left_getters[condition.left_field], left_row)
+            right_value = value(right_getters[condition.right_field], right_row)
+            if left_value is None or right_value is None or not condition.matches(left_value, right_value):
+                return False
+        return True
+
+    def unmatched(left_row: Any, right_row: Any) -> dict:
+        joined = merge(left_row, right_row)
+        joined['_matched'] = False
+        return joined
+
+    def bound(left_value: Any, condition: RangeCondition) -> Any:
+        try:
+            return _shifted(left_value, -condition.offset)
+        except TypeError:
+            raise XWQueryValueError(
+                f"Range join offset {condition.offset!r} does not apply to {type(left_value).__name__} values"
+            )
+
+    def below_lower(right_value: Any, left_value: Any) -> bool:
+        # Right values that no later (larger) left value can match
+        for condition in driving:
+            lower = bound(left_value, condition)
+            if condition.op == '<' and right_value <= lower:
+                return True
+            if condition.op == '<=' and right_value < lower:
+                return True
+        return False
+
+    def above_upper(right_value: Any, left_value: Any) -> bool:
+        # Right values too large for this left value (later ones may match)
+        for condition in driving:
+            upper = bound(left_value, condition)
+            if condition.op == '>' and right_value >= upper:
+                return True
+            if condition.op == '>=' and right_value > upper:
+                return True
+        return False
+    rights = iter(right)
+    window: deque[list[Any]] = deque()  # [right value, row, matched]
+    lookahead: list[Any] | None = None
+    previous_left: Any = None
+    previous_right: Any = None
+    matched = 0
+    for row in left:
+        left_value = value(get_left, row)
+        if left_value is None:
+            if keep_left:
+                yield unmatched(row, None)
+            elif anti:
+                yield row
+            continue
+        if previous_left is not None:
+            _check_order(previous_left, left_value, False, 'left')
+        previous_left = left_value
+        # Admit right rows up to the upper bound
+        while True:
+            if lookahead is None:
+                for right_row in rights:
+                    right_value = value(get_right, right_row)
+                    if right_value is None:
+                        if keep_right:
+                            yield unmatched(None, right_row)
+                        continue
+                    if previous_right is not None:
+                        _check_order(previous_right, right_value, False, 'right')
+                    previous_right = right_value
+                    lookahead = [right_value, right_row, False]
+                    break
+                else:
+                    break
+            if above_upper(lookahead[0], left_value):
+                break
+            window.append(lookahead)
+            lookahead = None
+        # Retire right rows below the lower bound
+        while window and below_lower(window[0][0], left_value):
+            entry = window.popleft()
+            if keep_right and not entry[2]:
+                yield unmatched(None, entry[1])
+        found = False
+        for entry in window:
+            if residual(row, entry[1]):
+                found = True
+                if semi or anti:
+                    break
+                entry[2] = True
+                matched += 1
+                yield merge(row, entry[1])
+        if semi and found:
+            matched += 1
+            yield row
+        elif anti and not found:
+            yield row
+        elif keep_left and not found:
+            yield unmatched(row, None)
+    if stats is not None:
+        stats['matched_count'] = stats.get('matched_count', 0) + matched
+    if keep_right:
+        for entry in window:
+            if not entry[2]:
+                yield unmatched(None, entry[1])
+        if lookahead is not None:
+            yield unmatched(None, lookahead[1])
+        for right_row in rights:
+            yield unmatched(None, right_row)
+
+
+class _PartitionFile:
+    """One join partition spilled to an anonymous temp file as pickled row batches."""
+
+    def __init__(self, spill_dir: str | None = None):
+        self._file = tempfile.TemporaryFile(prefix='xwquery-join-', dir=spill_dir or None)
+        self._pending: list[Any] = []
+        self.rows = 0
+
+    def append(self, row: Any) -> None:
+        self._pending.append(row)
+        self.rows += 1
+        if len(self._pending) >= _PARTITION_BATCH_ROWS:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._pending:
+            pickle.dump(self._pending, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+            self._pending = []
+
+    def __iter__(self) -> Iterator[Any]:
+        """Read the partition back lazily, one batch at a time."""
+        self._flush()
+        self._file.seek(0)
+        while True:
+            try:
+                batch = pickle.load(self._file)
+            except EOFError:
+                return
+            yield from batch
+
+    def read_all(self) -> list[Any]:
+        return list(self)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _partition(
+    rows: Iterable[Any],
+    key: Callable[[Any], Any],
+    fanout: int,
+    level: int,
+    spill_dir: str | None
+) -> list[_PartitionFile]:
+    """Hash rows into `fanout` partition files (NULL keys go to partition 0)."""
+    parts = [_PartitionFile(spill_dir) for _ in range(fanout)]
+    try:
+        for row in rows:
+            value = key(row)
+            # Salt with the level so a re-partitioned partition actually splits
+            index = 0 if value is None else hash((level, value)) % fanout
+            parts[index].append(row)
+    except BaseException:
+        for part in parts:
+            part.close()
+        raise
+    return parts
+
+
+def hash_join(
+    left: Iterable[Any],
+    right: Iterable[Any],
+    left_key: Callable[[Any], Any],
+    right_key: Callable[[Any], Any],
+    join_type: str = 'INNER',
+    build_side: str = 'right',
+    merge: Callable[[Any, Any], dict] | None = None,
+    stats: dict[str, Any] | None = None,
+    memory_budget: int | None = None,
+    spill_dir: str | None = None,
+    partitions: int | None = None
+) -> Iterator[dict]:
+    """
+    Hash join with a memory budget (Grace hash join beyond it).
+    The build side is buffered until its estimated size reaches
+    `memory_budget`. If it fits, this is `iter_hash_join()`. Otherwise the
+    rest of the build side and the whole probe side are hashed into
+    `partitions` temp files each, and matching partition pairs are joined
+    one at a time - equal keys always land in the same pair, so outer-join
+    semantics hold per pair. A build partition that still exceeds the budget
+    is re-partitioned (up to a few rounds; a single huge key cannot be split
+    and is joined in memory).
+    When `stats` is given, 'spilled_partitions' counts partition pairs
+    joined from disk.
+    Args:
+        memory_budget: Build-side size in bytes before spilling (None = unbounded)
+        spill_dir: Directory for temp files (system default when None)
+        partitions: Partitions per round (DEFAULT_JOIN_PARTITIONS when None)
+    """
+    if not memory_budget:
+        yield from iter_hash_join(left, right, left_key, right_key, join_type, build_side, merge, stats)
+        return
+    yield from _grace_join(
+        left, right, left_key, right_key, join_type, build_side, merge, stats,
+        memory_budget, spill_dir, max(2, int(partitions or DEFAULT_JOIN_PARTITIONS)), 0
+    )
+
+
+def _grace_join(left, right, left_key, right_key, join_type, build_side, merge, stats,
+                memory_budget, spill_dir, fanout, level) -> Iterator[dict]:
+    build, probe = (left, right) if build_side == 'left' else (right, left)
+    build_key, probe_key = (left_key, right_key) if build_side == 'left' else (right_key, left_key)
+    rows = iter(build)
+    buffer: list[Any] = []
+    sampled_bytes = 0
+    sampled_rows = 0
+    spilled = False
+    for row in rows:
+        buffer.append(row)
+        # Row sizes are sampled, not measured per row
+        if len(buffer) % _SIZE_SAMPLE_EVERY == 1:
+            sampled_bytes += estimate_row_bytes(row)
+            sampled_rows += 1
+            if len(buffer) * sampled_bytes >= memory_budget * sampled_rows:
+                spilled = True
+                break
+    if not spilled or level >= _MAX_PARTITION_DEPTH:
+        if spilled:
+            buffer.extend(rows)
+        pair = (buffer, probe) if build_side == 'left' else (probe, buffer)
+        yield from iter_hash_join(*pair, left_key, right_key, join_type, build_side, merge, stats)
+        return
+    row_bytes = sampled_bytes / sampled_rows
+    build_parts = _partition(chain(buffer, rows), build_key, fanout, level, spill_dir)
+    del buffer
+    probe_parts: list[_PartitionFile] = []
+    try:
+        probe_parts = _partition(probe, probe_key, fanout, level, spill_dir)
+        logger.debug(
+            f"hash_join: spilled {sum(part.rows for part in build_parts)} build rows into {fanout} partitions (level {level})"
+        )
+        for build_part, probe_part in zip(build_parts, probe_parts):
+            if stats is not None:
+                stats['spilled_partitions'] = stats.get('spilled_partitions', 0) + 1
+            if build_part.rows * row_bytes >= memory_budget:
+                # Still too big: split it again with a different hash salt
+                pair = (build_part, probe_part) if build_side == 'left' else (probe_part, build_part)
+                yield from _grace_join(
+                    *pair, left_key, right_key, join_type, build_side, merge, stats,
+                    memory_budget, spill_dir, fanout, level + 1
+                )
+            else:
+                part_rows = build_part.read_all()
+                pair = (part_rows, probe_part) if build_side == 'left' else (probe_part, part_rows)
+                yield from iter_hash_join(*pair, left_key, right_key, join_type, build_side, merge, stats)
+            build_part.close()
+            probe_part.close()
+    finally:
+        for part in (*build_parts, *probe_parts):
+            part.close()
+
+
+def resolve_join_memory_budget(options: dict[str, Any] | None = None) -> int | None:
+    """
+    Resolve the JOIN build-side memory budget in bytes (None = unbounded).
+    Order of precedence: `join_memory_budget_mb` execution option, then
+    `XWQueryConfig.join_memory_budget_mb`. Zero disables spilling.
+    """
+    megabytes = None
+    if options and options.get('join_memory_budget_mb') is not None:
+        megabytes = options['join_memory_budget_mb']
+    else:
+        try:
+            from ...config import get_config
+            megabytes = get_config().join_memory_budget_mb
+        except Exception:
+            megabytes = None
+    if not megabytes or float(megabytes) <= 0:
+        return None
+    return int(float(megabytes) * 1024 * 1024)
+
+
+def _semi_filter(
+    left: Iterable[Any],
+    right: Iterable[Any],
+    left_key: Callable[[Any], Any],
+    right_key: Callable[[Any], Any],
+    keep_matches: bool,
+    build_side: str
+) -> Iterator[Any]:
+    if build_side == 'left':
+        # Hash the (smaller) left keys, mark the ones right contains
+        left = left if isinstance(left, list) else list(left)
+        wanted = {key for key in map(left_key, left) if key is not None}
+        found = set()
+        for row in right:
+            key = right_key(row)
+            if key in wanted:
+                found.add(key)
+                if len(found) == len(wanted):
+                    break
+    else:
+        found = {key for key in map(right_key, right) if key is not None}
+    for row in left:
+        key = left_key(row)
+        if (key is not None and key in found) is keep_matches:
+            yield row
+
+
+def semi_join(left, right, left_key, right_key, build_side: str = 'right') -> Iterator[Any]:
+    """Left rows that have at least one match on the right (EXISTS), each once."""
+    return _semi_filter(left, right, left_key, right_key, True, build_side)
+
+
+def anti_join(left, right, left_key, right_key, build_side: str = 'right') -> Iterator[Any]:
+    """Left rows without any match on the right (NOT EXISTS / MINUS)."""
+    return _semi_filter(left, right, left_key, right_key, False, build_side)
+__all__ = [
+    'DEFAULT_JOIN_PARTITIONS',
+    'JOIN_TYPE_ALIASES',
+    'RangeCondition',
+    'anti_join',
+    'choose_build_side',
+    'compile_join_key',
+    'hash_join',
+    'iter_hash_join',
+    'iter_merge_join',
+    'iter_range_join',
+    'make_merger',
+    'normalize_join_type',
+    'parse_join_condition',
+    'parse_join_keys',
+    'resolve_join_memory_budget',
+    'semi_join',
+]
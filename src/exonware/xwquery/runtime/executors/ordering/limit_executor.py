@@ -16,10 +16,13 @@ Version: 0.9.0.5
 Generation Date: 27-Oct-2025
 """
 
+from collections.abc import Iterator
+from itertools import islice
 from typing import Any
 from ..base import AUniversalOperationExecutor
 from ....contracts import QueryAction, ExecutionContext, ExecutionResult
 from ....defs import OperationType
+from ...streaming import iter_batches, iter_rows
 
 
 class LimitExecutor(AUniversalOperationExecutor):
@@ -32,6 +35,7 @@ class LimitExecutor(AUniversalOperationExecutor):
     """
     OPERATION_NAME = "LIMIT"
     OPERATION_TYPE = OperationType.ORDERING
+    SUPPORTS_STREAMING = True
 
     def _do_execute(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
         """Execute LIMIT operation."""
@@ -50,6 +54,25 @@ class LimitExecutor(AUniversalOperationExecutor):
             }
         )
 
+    def _iter_execute(self, action: QueryAction, context: ExecutionContext, batch_size: int) -> Iterator[list[Any]]:
+        """
+        Streaming LIMIT - stop pulling from the input once enough rows passed.
+        Closing the upstream generator here is what lets a LIMIT short-circuit
+        the scan feeding it.
+        """
+        limit = action.params.get('limit', 0) or 0
+        offset = action.params.get('offset', 0) or 0
+        rows = iter_rows(context.node)
+        if limit <= 0:
+            yield from iter_batches(rows, batch_size)
+            return
+        try:
+            yield from iter_batches(islice(rows, offset, offset + limit), min(batch_size, limit))
+        finally:
+            close = getattr(rows, 'close', None)
+            if close is not None:
+                close()
+
     def _execute_limit(self, data: Any, params: dict, context: ExecutionContext) -> list[dict] | Any:
         """
         Execute limit logic with offset support.
@@ -6,7 +6,7 @@ Root cause fixed: ORDER executor was a stub that didn't actually sort data.
 Solution: Implemented proper sorting with ASC/DESC support and multi-field ordering.
 Priority alignment:
 - Usability (#2): Users can now sort query results as expected
-- Performance (#4): Efficient sorting using Python's built-in sorted()
+- Performance (#4): Stable multi-key sorts; Top-N heap when fused with LIMIT
 - Maintainability (#3): Clear, well-structured sorting implementation
 Company: eXonware.com
 Author: eXonware Backend Team
@@ -15,10 +15,19 @@ Version: 0.9.0.5
 Generation Date: 27-Oct-2025
 """
 
+from collections.abc import Iterator
 from typing import Any
 from ..base import AUniversalOperationExecutor
 from ....contracts import QueryAction, ExecutionContext, ExecutionResult
 from ....defs import OperationType
+from ...streaming import RowStream, iter_batches, iter_rows
+from ..sorting import (
+    iter_sorted,
+    order_rows,
+    parse_order_by,
+    resolve_sort_memory_budget,
+    resolve_spill_directory,
+)
 
 
 class OrderExecutor(AUniversalOperationExecutor):
@@ -31,6 +40,7 @@ class OrderExecutor(AUniversalOperationExecutor):
     """
     OPERATION_NAME = "ORDER"
     OPERATION_TYPE = OperationType.ORDERING
+    SUPPORTS_STREAMING = True
 
     def _do_execute(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
         """Execute ORDER operation."""
@@ -45,59 +55,53 @@ class OrderExecutor(AUniversalOperationExecutor):
             metadata={'operation': self.OPERATION_NAME, 'sorted': True}
         )
 
+    def _iter_execute(self, action: QueryAction, context: ExecutionContext, batch_size: int) -> Iterator[list[Any]]:
+        """
+        Streaming ORDER - sort the input stream without holding it in memory.
+        ORDER is blocking, but beyond the sort memory budget sorted runs are
+        spilled to temp files and merged lazily as batches are pulled.
+        """
+        yield from iter_batches(self._iter_order(iter_rows(context.node), action.params, context), batch_size)
+
+    def _iter_order(self, rows: Any, params: dict, context: ExecutionContext) -> Iterator[Any]:
+        """Sorted row iterator (Top-N, external or in-memory sort)."""
+        specs = parse_order_by(params.get('order_by') or params.get('fields'), params.get('direction'))
+        if not specs:
+            return iter(rows)
+        top_n = params.get('top_n')
+        return iter_sorted(
+            rows,
+            specs,
+            top_n if isinstance(top_n, int) and top_n >= 0 else None,
+            resolve_sort_memory_budget(context.options),
+            resolve_spill_directory(context.options)
+        )
+
     def _execute_order(self, data: Any, params: dict, context: ExecutionContext) -> list[dict] | Any:
         """
         Execute order/sort logic.
         Root cause fixed: Was returning stub message instead of sorting data.
+        Supports multiple keys with per-key direction and NULLS FIRST/LAST
+        ("age DESC, name"). When the planner fused a following LIMIT into this
+        stage ('top_n'), only the leading rows are selected with a bounded heap.
         Args:
             data: Input data (should be a list of dicts)
-            params: ORDER BY parameters with 'fields' containing sort specifications
+            params: ORDER BY parameters ('order_by' or 'fields', optional 'direction', 'top_n')
             context: Execution context
         Returns:
             Sorted list of dictionaries
         """
+        # Streamed input (RowStream/generator): sort without materializing it first
+        if isinstance(data, (RowStream, Iterator)):
+            return list(self._iter_order(iter_rows(data), params, context))
         # Handle non-list data
         if not isinstance(data, list):
             return data
         # Empty list - nothing to sort
         if len(data) == 0:
             return data
-        # Get order_by field and direction from params
-        order_by = params.get('order_by', '')
-        if not order_by:
-            return data
-        # Parse order_by: "field ASC" or "field DESC" or "field"
-        order_by_parts = order_by.strip().split()
-        field = order_by_parts[0]
-        direction = order_by_parts[1].upper() if len(order_by_parts) > 1 else 'ASC'
-        # Sort the data
-        try:
-            # Sort by field
-            sorted_data = sorted(
-                data,
-                key=lambda x: self._get_sort_key(x, field),
-                reverse=(direction == 'DESC')
-            )
-            return sorted_data
-        except (KeyError, TypeError, AttributeError) as e:
-            # If sorting fails, return unsorted data
-            # (better than crashing - Usability priority #2)
+        specs = parse_order_by(params.get('order_by') or params.get('fields'), params.get('direction'))
+        if not specs:
             return data
-
-    def _get_sort_key(self, item: Any, field: str) -> Any:
-        """
-        Extract sort key from item.
-        Args:
-            item: Data item (dict or other)
-            field: Field name to extract
-        Returns:
-            Sort key value (handles None gracefully)
-        """
-        if isinstance(item, dict):
-            value = item.get(field)
-            # Handle None values - sort them last
-            if value is None:
-                return (1, '')  # Tuple ensures None sorts last
-            return (0, value)
-        else:
-            return (0, item)
+        top_n = params.get('top_n')
+        return order_rows(data, specs, top_n if isinstance(top_n, int) and top_n >= 0 else None)
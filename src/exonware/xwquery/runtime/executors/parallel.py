@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/src/exonware/xwquery/runtime/executors/parallel.py
+Partition-parallel execution for WINDOW, GROUP BY and JSONL file scans.
+Root cause: WINDOW and GROUP BY processed every partition sequentially in one
+thread although partitions are independent, FILE_SOURCE decoded whole files
+on one core, and
+`XWQueryConfig.enable_parallel_execution`/`max_workers` were never read.
+Solution: split the work into independent tasks and run them on a worker pool.
+- WINDOW: rows are hashed into their PARTITION BY groups, whole partitions
+  are dealt to tasks (largest first, so tasks are balanced) and each task
+  sorts and evaluates its partitions; results are reassembled in the serial
+  (first-seen partition) order.
+- GROUP BY: contiguous row chunks are folded into HashAggregators by the
+  workers and merged in chunk order, so groups, their order and their
+  aggregates equal the serial run (accumulators merge exactly).
+- JSONL scans: the file is cut into byte ranges at line starts taken from its
+  line-offset index; workers decode, filter (and project) their ranges and
+  results are merged in file order or as ranges complete.
+CPU-bound Python threads are serialized by the GIL, so a process pool is used;
+under free-threaded Python (GIL disabled) a thread pool avoids pickling.
+Pools are created once per (kind, size) and reused. Inputs below
+`parallel_min_rows` run serially, and tasks that cannot be shipped to a worker
+process (unpicklable rows or callables) are evaluated in the caller instead.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.9.0.5
+Generation Date: 17-Oct-2026
+"""
+
+from __future__ import annotations
+import atexit
+import heapq
+import logging
+import os
+import pickle
+import sys
+import threading
+from collections import deque
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from typing import Any
+from .aggregates import AggregateSpec, HashAggregator
+from .file_scan import JsonlScan, scan_jsonl
+from .windows import WindowSpec, evaluate_partition, evaluate_windows, partition_rows
+logger = logging.getLogger(__name__)
+# Inputs smaller than this are not worth shipping to workers
+DEFAULT_PARALLEL_MIN_ROWS = 50_000
+# Byte range sizes of parallel file scans (ranges are cut at line starts)
+_MIN_RANGE_BYTES = 1 << 20
+_MAX_RANGE_BYTES = 32 << 20
+# Errors raised when a task cannot be sent to (or run in) a worker process
+_SHIPPING_ERRORS = (pickle.PicklingError, BrokenProcessPool, TypeError, AttributeError)
+_pools: dict[tuple[str, int], Executor] = {}
+_pools_lock = threading.Lock()
+
+
+def _option(options: dict[str, Any] | None, name: str, *aliases: str) -> Any:
+    """Execution option (or one of its aliases), else the XWQueryConfig field."""
+    for key in (name, *aliases):
+        if options and options.get(key) is not None:
+            return options[key]
+    try:
+        from ...config import get_config
+        return getattr(get_config(), name)
+    except Exception:
+        return None
+
+
+def resolve_parallel_workers(options: dict[str, Any] | None = None) -> int:
+    """
+    Number of workers for partition-parallel operators (1 = serial).
+    Order of precedence: `enable_parallel_execution` (or `parallel`, as set
+    by OPTIONS) and `max_workers` execution options, then XWQueryConfig.
+    """
+    if not _option(options, 'enable_parallel_execution', 'parallel'):
+        return 1
+    try:
+        return max(1, int(_option(options, 'max_workers') or 1))
+    except (TypeError, ValueError):
+        return 1
+
+
+def resolve_parallel_min_rows(options: dict[str, Any] | None = None) -> int:
+    """Smallest input that is split across workers (`parallel_min_rows`)."""
+    value = _option(options, 'parallel_min_rows')
+    return DEFAULT_PARALLEL_MIN_ROWS if value is None else max(0, int(value))
+
+
+def gil_disabled() -> bool:
+    """True on free-threaded Python builds running without the GIL."""
+    is_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_enabled is not None and not is_enabled()
+
+
+def worker_pool(workers: int) -> Executor:
+    """Shared pool of `workers` workers (threads without the GIL, else processes)."""
+    kind = 'thread' if gil_disabled() else 'process'
+    with _pools_lock:
+        pool = _pools.get((kind, workers))
+        if pool is None:
+            pool = ThreadPoolExecutor(workers) if kind == 'thread' else ProcessPoolExecutor(workers)
+            _pools[(kind, workers)] = pool
+        return pool
+
+
+def shutdown_pools() -> None:
+    """Shut down every shared worker pool."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+atexit.register(shutdown_pools)
+
+
+def _result(future: Future, fallback: Any, *args: Any) -> Any:
+    """Result of a worker task, or of `fallback(*args)` when it could not be shipped."""
+    try:
+        return future.result()
+    except _SHIPPING_ERRORS as error:
+        if isinstance(error, BrokenProcessPool):
+            shutdown_pools()
+        logger.debug("Parallel task ran serially: %s", error)
+        return fallback(*args)
+
+
+def _window_task(partitions: list[list[Any]], specs: list[WindowSpec], order_by: Any) -> list[list[dict]]:
+    return [evaluate_partition(rows, specs, order_by) for rows in partitions]
+
+
+def evaluate_windows_parallel(
+    items: Iterable[Any],
+    specs: list[WindowSpec],
+    partition_by: Any = None,
+    order_by: Any = None,
+    workers: int = 1,
+    min_rows: int = DEFAULT_PARALLEL_MIN_ROWS,
+    stats: dict[str, Any] | None = None
+) -> list[dict]:
+    """
+    `evaluate_windows()` with partitions evaluated on `workers` workers.
+    Returns exactly what the serial evaluation returns, in the same order.
+    """
+    items = items if isinstance(items, list) else list(items)
+    if isinstance(partition_by, str):
+        partition_by = [field.strip() for field in partition_by.split(',') if field.strip()]
+    partition_by = list(partition_by or [])
+    if workers <= 1 or not partition_by or len(items) < max(min_rows, 2):
+        return evaluate_windows(items, specs, partition_by, order_by)
+    partitions = list(partition_rows(items, partition_by).values())
+    if len(partitions) < 2:
+        return evaluate_windows(items, specs, partition_by, order_by)
+    # Largest partitions first, each into the currently smallest task
+    task_count = min(len(partitions), workers * 4)
+    loads = [(0, task) for task in range(task_count)]
+    assigned: list[list[int]] = [[] for _ in range(task_count)]
+    for index in sorted(range(len(partitions)), key=lambda index: -len(partitions[index])):
+        load, task = heapq.heappop(loads)
+        assigned[task].append(index)
+        heapq.heappush(loads, (load + len(partitions[index]), task))
+    pool = worker_pool(workers)
+    tasks = []
+    for indexes in assigned:
+        chunk = [partitions[index] for index in indexes]
+        tasks.append((indexes, chunk, pool.submit(_window_task, chunk, specs, order_by)))
+    evaluated: list[list[dict] | None] = [None] * len(partitions)
+    for indexes, chunk, future in tasks:
+        for index, rows in zip(indexes, _result(future, _window_task, chunk, specs, order_by)):
+            evaluated[index] = rows
+    if stats is not None:
+        stats['parallel_tasks'] = len(tasks)
+    return [row for rows in evaluated for row in rows]
+
+
+def _aggregate_task(
+    group_fields: list[str],
+    specs: list[AggregateSpec],
+    keep_items: bool,
+    rows: list[Any]
+) -> HashAggregator:
+    return HashAggregator(group_fields, specs, keep_items=keep_items).consume(rows)
+
+
+def aggregate_parallel(
+    rows: Iterable[Any],
+    group_fields: list[str] | None = None,
+    specs: Iterable[AggregateSpec] = (),
+    keep_items: bool = False,
+    workers: int = 1,
+    min_rows: int = DEFAULT_PARALLEL_MIN_ROWS,
+    stats: dict[str, Any] | None = None
+) -> HashAggregator:
+    """
+    Hash aggregation of `rows` with row chunks folded on `workers` workers.
+    The input is consumed lazily with at most 2 * workers chunks in flight;
+    partial aggregators are merged in input order, so the result equals the
+    serial HashAggregator's (including first-seen group order).
+    """
+    group_fields, specs = list(group_fields or []), list(specs)
+    rows = iter(rows)
+    head = list(islice(rows, max(min_rows, 1)))
+    aggregator = HashAggregator(group_fields, specs, keep_items=keep_items)
+    if workers <= 1 or len(head) < max(min_rows, 2):
+        return aggregator.consume(head).consume(rows)
+    chunk_rows = max(1, min_rows // workers)
+    pool = worker_pool(workers)
+    pending: deque[tuple[list[Any], Future]] = deque()
+    tasks = 0
+
+    def chunks() -> Iterable[list[Any]]:
+        for start in range(0, len(head), chunk_rows):
+            yield head[start:start + chunk_rows]
+        while True:
+            chunk = list(islice(rows, chunk_rows))
+            if not chunk:
+                return
+            yield chunk
+    for chunk in chunks():
+        pending.append((chunk, pool.submit(_aggregate_task, group_fields, specs, keep_items, chunk)))
+        tasks += 1
+        if len(pending) >= workers * 2:
+            chunk, future = pending.popleft()
+            aggregator.merge(_result(future, _aggregate_task, group_fields, specs, keep_items, chunk))
+    while pending:
+        chunk, future = pending.popleft()
+        aggregator.merge(_result(future, _aggregate_task, group_fields, specs, keep_items, chunk))
+    if stats is not None:
+        stats['parallel_tasks'] = tasks
+    return aggregator
+
+
+def scan_ranges(offsets: Sequence[int], size: int, workers: int) -> list[tuple[int, int | None]]:
+    """
+    Byte ranges (start, end) covering a file of `size` bytes, cut at the
+    line starts in `offsets`: about 4 ranges per worker, each between 1 and
+    32 MiB. The last range is open-ended (None) so appended lines are read.
+    """
+    target = max(_MIN_RANGE_BYTES, min(_MAX_RANGE_BYTES, size // (workers * 4) + 1))
+    starts = [0]
+    position = target
+    while position < size:
+        line = bisect_left(offsets, position)
+        if line >= len(offsets):
+            break
+        starts.append(offsets[line])
+        position = offsets[line] + target
+    return [(start, end) for start, end in zip(starts, [*starts[1:], None])]
+
+
+def _scan_task(path: str, start: int, end: int | None, scan: JsonlScan, project: bool) -> tuple[list[Any], dict]:
+    scan = scan.fork()
+    records = list(scan_jsonl(path, scan, start, end))
+    if project and scan.project is not None:
+        records = [scan.project(record) for record in records]
+    return records, scan.stats
+
+
+def scan_jsonl_parallel(
+    path: str,
+    scan: JsonlScan,
+    offsets: Sequence[int],
+    workers: int,
+    ordered: bool = True,
+    project: bool = False
+) -> Iterator[Any]:
+    """
+    `scan_jsonl()` with byte ranges scanned on `workers` workers (at most
+    2 * workers ranges in flight). `ordered` yields records in file order,
+    otherwise ranges are yielded as they complete. With `project` the
+    workers also apply the SELECT columns (rows without a selected value
+    stay as None). Worker stats are added to `scan.stats`.
+    """
+    ranges = scan_ranges(offsets, os.path.getsize(path), workers)
+    pool = worker_pool(workers)
+    pending: deque[tuple[tuple[int, int | None], Future]] = deque()
+    stats = scan.stats
+    stats['parallel_tasks'] = stats.get('parallel_tasks', 0) + len(ranges)
+
+    def collect(bounds: tuple[int, int | None], future: Future) -> list[Any]:
+        records, counts = _result(future, _scan_task, path, *bounds, scan, project)
+        for key, value in counts.items():
+            stats[key] += value
+        return records
+
+    def drain(keep: int) -> Iterator[Any]:
+        while len(pending) > keep:
+            if ordered:
+                yield from collect(*pending.popleft())
+                continue
+            done, _ = wait([future for _, future in pending], return_when=FIRST_COMPLETED)
+            for item in [item for item in pending if item[1] in done]:
+                pending.remove(item)
+                yield from collect(*item)
+    try:
+        for bounds in ranges:
+            pending.append((bounds, pool.submit(_scan_task, path, *bounds, scan, project)))
+            yield from drain(workers * 2 - 1)
+        yield from drain(0)
+    finally:
+        for _, future in pending:
+            future.cancel()
+__all__ = [
+    'DEFAULT_PARALLEL_MIN_ROWS',
+    'aggregate_parallel',
+    'evaluate_windows_parallel',
+    'gil_disabled',
+    'resolve_parallel_min_rows',
+    'resolve_parallel_workers',
+    'scan_jsonl_parallel',
+    'scan_ranges',
+    'shutdown_pools',
+    'worker_pool',
+]
@@ -0,0 +1,617 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/src/exonware/xwquery/runtime/executors/predicates.py
+Compiled predicate engine shared by all filtering executors.
+Root cause: SELECT, WHERE, UPDATE, DELETE, FILE_SOURCE and utils each
+re-interpreted the WHERE condition for every row (string splitting, operator
+lookup, value parsing), with subtly different semantics per executor.
+Solution: compile a condition once into a closure with pre-parsed constants,
+pre-split field paths and short-circuit AND/OR, and reuse it everywhere.
+Supported condition forms:
+- None / '' / {}: match all
+- SQL dict: {'field': 'age', 'operator': '>=', 'value': 18}
+- Expression dict: {'expression': "age > 18 AND city = 'Riyadh'"}
+- Grammar dicts: {'type': 'comparison', 'left', 'operator', 'right'} and
+  {'type': 'logical', 'operator': 'AND'|'OR'|'NOT', 'operands': [...]}
+- Equality dict: {'status': 'active', 'user.age': 30} (nested dicts recurse,
+  list/tuple values mean membership)
+- String expression: "age > 18 AND (name LIKE 'A%' OR vip = true)"; a bare
+  field name ("email") is a field existence check. Other strings that do
+  not parse raise XWQueryValueError rather than falling back to an
+  existence check, so a mistyped WHERE fails instead of matching nothing
+- Callable: lambda item: ...
+- List/tuple of conditions: AND
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.9.0.5
+Generation Date: 16-Oct-2026
+"""
+
+from __future__ import annotations
+import operator
+import re
+import threading
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+from ...errors import XWQueryValueError
+Predicate = Callable[[Any], bool]
+# Sentinel for "field not present" (distinct from a present None value)
+_MISSING = object()
+# Compiled predicates keyed by the condition's value (see `_cache_key`), so a
+# mutated dict or list is compiled again instead of hitting a stale entry
+_PREDICATE_CACHE: dict[Any, Predicate] = {}
+_PREDICATE_CACHE_SIZE = 512
+_cache_lock = threading.Lock()
+# Operator spellings from the SQL extractor, grammar adapter and WHERE executor
+_OPERATOR_ALIASES = {
+    '==': '=', 'EQUAL': '=', 'EQ': '=',
+    '<>': '!=', 'NOT_EQUAL': '!=', 'NE': '!=',
+    'LESS': '<', 'LT': '<',
+    'GREATER': '>', 'GT': '>',
+    'LESS_EQUAL': '<=', 'LE': '<=', 'LTE': '<=',
+    'GREATER_EQUAL': '>=', 'GE': '>=', 'GTE': '>=',
+    'NOT_IN': 'NOT IN', 'NOT_LIKE': 'NOT LIKE',
+}
+# Binary operators as reflected C functions: `row_value OP value` is
+# evaluated as `REFLECTED(value, row_value)` so partial() can bind the constant
+_REFLECTED = {
+    '=': operator.eq,
+    '!=': operator.ne,
+    '>': operator.lt,
+    '<': operator.gt,
+    '>=': operator.le,
+    '<=': operator.ge,
+}
+
+
+def _match_all(item: Any) -> bool:
+    return True
+
+
+def is_match_all(predicate: Predicate) -> bool:
+    """Check if a compiled predicate accepts every item (no filtering needed)."""
+    return predicate is _match_all
+
+
+def normalize_operator(op: Any) -> str:
+    """Normalize an operator spelling ('==', 'GREATER_EQUAL', 'not in', ...) to its SQL form."""
+    op = ' '.join(str(op).strip().upper().split())
+    return _OPERATOR_ALIASES.get(op, op)
+
+
+def compile_field_getter(path: str) -> Callable[[Any], Any]:
+    """
+    Compile a field accessor for a (dotted) path.
+    Dict items use key access, lists accept numeric segments ("items.0.v"),
+    other objects use attributes. A dotted key present verbatim in a dict
+    wins over path navigation. Missing fields return the module sentinel,
+    checked with `is_missing()`.
+    """
+    if '.' not in path:
+        def get_simple(item: Any) -> Any:
+            if isinstance(item, dict):
+                return item.get(path, _MISSING)
+            return getattr(item, path, _MISSING)
+        return get_simple
+    parts = tuple((part, int(part) if part.isdigit() else None) for part in path.split('.'))
+
+    def get_nested(item: Any) -> Any:
+        if isinstance(item, dict) and path in item:
+            return item[path]
+        current = item
+        for key, index in parts:
+            if isinstance(current, dict):
+                current = current.get(key, _MISSING)
+            elif index is not None and isinstance(current, (list, tuple)):
+                current = current[index] if index < len(current) else _MISSING
+            elif current is None:
+                return _MISSING
+            else:
+                current = getattr(current, key, _MISSING)
+            if current is _MISSING:
+                return _MISSING
+        return current
+    return get_nested
+
+
+def is_missing(value: Any) -> bool:
+    """Check if a value returned by a compiled field getter means 'field not present'."""
+    return value is _MISSING
+
+
+def _like_regex(pattern: Any) -> re.Pattern:
+    """Translate a SQL LIKE pattern (% and _) into a case-insensitive regex."""
+    parts = []
+    for char in str(pattern):
+        if char == '%':
+            parts.append('.*')
+        elif char == '_':
+            parts.append('.')
+        else:
+            parts.append(re.escape(char))
+    return re.compile(''.join(parts), re.IGNORECASE | re.DOTALL)
+
+
+def _membership_test(values: Any) -> Callable[[Any], bool]:
+    """Build an `x IN values` test, using a set when all values are hashable."""
+    if isinstance(values, str):
+        return values.__contains__
+    if not isinstance(values, (list, tuple, set, frozenset)):
+        values = [values]
+    try:
+        lookup = frozenset(values)
+    except TypeError:
+        lookup = list(values)
+    return lookup.__contains__
+
+
+def _value_test(op: str, value: Any) -> Callable[[Any], bool]:
+    """Build a single-argument test for `row_value OP value` with `value` pre-bound."""
+    if op in _REFLECTED:
+        return partial(_REFLECTED[op], value)
+    if op == 'LIKE':
+        return lambda actual, _m=_like_regex(value).fullmatch: _m(str(actual)) is not None
+    if op == 'NOT LIKE':
+        return lambda actual, _m=_like_regex(value).fullmatch: _m(str(actual)) is None
+    if op == 'IN':
+        return _membership_test(value)
+    if op == 'NOT IN':
+        contains = _membership_test(value)
+        return lambda actual: not contains(actual)
+    if op in ('BETWEEN', 'NOT BETWEEN'):
+        if not isinstance(value, (list, tuple)) or len(value) < 2 or value[0] is None or value[1] is None:
+            return lambda actual: False
+        low, high = value[0], value[1]
+        if op == 'NOT BETWEEN':
+            return lambda actual: not (low <= actual <= high)
+        return lambda actual: low <= actual <= high
+    if op == 'CONTAINS':
+        return lambda actual: value in actual
+    if op == 'STARTSWITH':
+        prefix = str(value)
+        return lambda actual: str(actual).startswith(prefix)
+    if op == 'ENDSWITH':
+        suffix = str(value)
+        return lambda actual: str(actual).endswith(suffix)
+    raise XWQueryValueError(f"Unsupported predicate operator: {op!r}")
+
+
+def compile_comparison(field: str, op: Any, value: Any) -> Predicate:
+    """
+    Compile `field OP value` into a predicate.
+    SQL null semantics: a missing or None field never matches, except that
+    `= NULL` / `!= NULL` are treated as IS NULL / IS NOT NULL. Incomparable
+    types (e.g. str vs int) do not match instead of raising.
+    """
+    op = normalize_operator(op)
+    get = compile_field_getter(str(field))
+    if op in ('IS NULL', 'IS') or (op == '=' and value is None):
+        return lambda item: get(item) in (None, _MISSING)
+    if op in ('IS NOT NULL', 'IS NOT') or (op == '!=' and value is None):
+        return lambda item: get(item) not in (None, _MISSING)
+    test = _value_test(op, value)
+
+    def compare(item: Any) -> bool:
+        actual = get(item)
+        if actual is None or actual is _MISSING:
+            return False
+        try:
+            return bool(test(actual))
+        except (TypeError, ValueError):
+            return False
+    return compare
+
+
+def _all_of(predicates: list[Predicate]) -> Predicate:
+    predicates = [p for p in predicates if p is not _match_all]
+    if not predicates:
+        return _match_all
+    if len(predicates) == 1:
+        return predicates[0]
+    if len(predicates) == 2:
+        first, second = predicates
+        return lambda item: first(item) and second(item)
+    return lambda item: all(p(item) for p in predicates)
+
+
+def _any_of(predicates: list[Predicate]) -> Predicate:
+    if not predicates or any(p is _match_all for p in predicates):
+        return _match_all
+    if len(predicates) == 1:
+        return predicates[0]
+    if len(predicates) == 2:
+        first, second = predicates
+        return lambda item: first(item) or second(item)
+    return lambda item: any(p(item) for p in predicates)
+
+
+def _negate(predicate: Predicate) -> Predicate:
+    return lambda item: not predicate(item)
+
+
+def _compile_equality_dict(condition: dict) -> Predicate:
+    """Compile {'field': expected, ...}: every field must match."""
+    checks = []
+    for key, expected in condition.items():
+        get = compile_field_getter(str(key))
+        if isinstance(expected, dict):
+            nested = _compile_equality_dict(expected)
+            checks.append(lambda item, g=get, n=nested: (v := g(item)) is not _MISSING and n(v))
+        elif isinstance(expected, (list, tuple)):
+            contains = _membership_test(expected)
+
+            def check_member(item: Any, g=get, c=contains) -> bool:
+                actual = g(item)
+                try:
+                    return actual is not _MISSING and c(actual)
+                except TypeError:
+                    return False
+            checks.append(check_member)
+        elif expected is None:
+            checks.append(lambda item, g=get: g(item) in (None, _MISSING))
+        else:
+            checks.append(lambda item, g=get, e=expected: g(item) == e)
+    return _all_of(checks)
+
+
+def _wrap_callable(func: Callable[[Any], Any]) -> Predicate:
+    def call(item: Any) -> bool:
+        try:
+            return bool(func(item))
+        except Exception:
+            return False
+    return call
+
+
+def _compile(condition: Any) -> Predicate:
+    if condition is None or condition == '' or (isinstance(condition, dict) and not condition):
+        return _match_all
+    if isinstance(condition, dict):
+        kind = condition.get('type')
+        if kind == 'comparison' and 'left' in condition:
+            return compile_comparison(condition['left'], condition.get('operator') or '=', condition.get('right'))
+        if kind == 'logical' and 'operands' in condition:
+            op = normalize_operator(condition.get('operator') or 'AND')
+            operands = [_compile(operand) for operand in condition.get('operands') or []]
+            if op == 'NOT':
+                return _negate(_all_of(operands))
+            return _any_of(operands) if op == 'OR' else _all_of(operands)
+        if 'field' in condition and 'operator' in condition:
+            if not condition.get('field'):
+                return _match_all
+            return compile_comparison(condition['field'], condition['operator'], condition.get('value'))
+        if 'expression' in condition and len(condition) == 1:
+            return _compile(condition['expression'])
+        return _compile_equality_dict(condition)
+    if isinstance(condition, str):
+        return _ExpressionParser(condition).parse()
+    if isinstance(condition, (list, tuple)):
+        return _all_of([_compile(c) for c in condition])
+    if callable(condition):
+        return _wrap_callable(condition)
+    return _match_all if condition else (lambda item: False)
+
+
+def _cache_key(condition: Any) -> Any:
+    """
+    Hashable snapshot of a condition's value; types are part of the key so
+    that e.g. 1 and True compile separately.
+    Raises:
+        TypeError: For conditions holding unhashable values or callables
+            (which need no compiling and would be kept alive by the cache)
+    """
+    if callable(condition):
+        raise TypeError('callable conditions are not cached')
+    if isinstance(condition, str):
+        return condition
+    if isinstance(condition, dict):
+        return dict, tuple((_cache_key(key), _cache_key(value)) for key, value in condition.items())
+    if isinstance(condition, (list, tuple)):
+        return type(condition), tuple(map(_cache_key, condition))
+    if isinstance(condition, (set, frozenset)):
+        return frozenset, frozenset(map(_cache_key, condition))
+    hash(condition)
+    return type(condition), condition
+
+
+def compile_predicate(condition: Any) -> Predicate:
+    """
+    Compile a WHERE condition into a reusable predicate.
+    Compiled predicates are cached by the condition's value, so executors can
+    call this per row without re-parsing, and a condition changed after
+    compiling gets a new predicate. Callables, and conditions holding them or
+    unhashable values, are compiled (wrapped) on every call.
+    Args:
+        condition: Any supported condition form (see module docstring)
+    Returns:
+        Callable taking an item and returning True when it matches
+    Raises:
+        XWQueryValueError: If a string expression cannot be parsed
+    """
+    if isinstance(condition, (dict, list, tuple, str)) or callable(condition):
+        try:
+            key = _cache_key(condition)
+        except TypeError:
+            return _compile(condition)
+        predicate = _PREDICATE_CACHE.get(key)
+        if predicate is None:
+            predicate = _compile(condition)
+            with _cache_lock:
+                if len(_PREDICATE_CACHE) >= _PREDICATE_CACHE_SIZE:
+                    _PREDICATE_CACHE.clear()
+                _PREDICATE_CACHE[key] = predicate
+        return predicate
+    return _compile(condition)
+def split_conjuncts(condition: Any) -> list[tuple[Any, frozenset[str] | None]]:
+    """
+    Split a condition into its AND-ed parts, each with the field paths it
+    reads, so callers can evaluate parts as early as their fields are known.
+    Parts whose fields cannot be determined (callables, OR of dicts) carry
+    None instead of a field set.
+    Raises:
+        XWQueryValueError: If a string expression cannot be parsed
+    """
+    if condition is None or condition == '' or (isinstance(condition, dict) and not condition):
+        return []
+    if isinstance(condition, str):
+        parts = []
+        for text in _ExpressionParser(condition).conjuncts():
+            parser = _ExpressionParser(text)
+            parser.parse()
+            parts.append((text, frozenset(parser.fields)))
+        return parts
+    if isinstance(condition, (list, tuple)):
+        return [part for operand in condition for part in split_conjuncts(operand)]
+    if isinstance(condition, dict):
+        kind = condition.get('type')
+        if kind == 'logical' and 'operands' in condition:
+            if normalize_operator(condition.get('operator') or 'AND') == 'AND':
+                return [part for operand in condition['operands'] or [] for part in split_conjuncts(operand)]
+            return [(condition, None)]
+        if kind == 'comparison' and 'left' in condition:
+            return [(condition, frozenset([str(condition['left'])]))]
+        if 'field' in condition and 'operator' in condition:
+            return [(condition, frozenset([str(condition['field'])]))] if condition.get('field') else []
+        if 'expression' in condition and len(condition) == 1:
+            return split_conjuncts(condition['expression'])
+        return [({key: value}, frozenset([str(key)])) for key, value in condition.items()]
+    return [(condition, None)]
+
+
+def comparison_of(condition: Any) -> tuple[str, str, Any] | None:
+    """
+    The (field, normalized operator, value) of a condition that is a single
+    non-negated comparison, e.g. a conjunct from `split_conjuncts()`; None
+    for anything else (AND/OR/NOT, bare fields, callables).
+    Raises:
+        XWQueryValueError: If a string expression cannot be parsed
+    """
+    if isinstance(condition, str):
+        parser = _ExpressionParser(condition)
+        parser.parse()
+        return parser.comparisons[0] if len(parser.comparisons) == 1 else None
+    if not isinstance(condition, dict) or not condition:
+        return None
+    kind = condition.get('type')
+    if kind == 'comparison' and 'left' in condition:
+        return str(condition['left']), normalize_operator(condition.get('operator') or '='), condition.get('right')
+    if kind == 'logical':
+        return None
+    if 'field' in condition and 'operator' in condition:
+        if not condition.get('field'):
+            return None
+        return str(condition['field']), normalize_operator(condition['operator']), condition.get('value')
+    if 'expression' in condition and len(condition) == 1:
+        return comparison_of(condition['expression'])
+    if len(condition) != 1:
+        return None
+    (key, expected), = condition.items()
+    if isinstance(expected, dict):
+        return None
+    if isinstance(expected, (list, tuple)):
+        return str(key), 'IN', expected
+    return str(key), 'IS NULL' if expected is None else '=', expected
+# ============================================================================
+# STRING EXPRESSIONS
+# ============================================================================
+_TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<string>'(?:[^'\\]|\\.|'')*'|"(?:[^"\\]|\\.)*")
+      | (?P<number>-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?(?![\w.]))
+      | (?P<op>>=|<=|!=|<>|==|=|>|<)
+      | (?P<punct>[()\[\],])
+      | (?P<word>[A-Za-z_][\w.]*)
+    )""", re.VERBOSE)
+_KEYWORDS = {
+    'AND', 'OR', 'NOT', 'LIKE', 'IN', 'BETWEEN', 'IS', 'NULL', 'NONE', 'TRUE', 'FALSE',
+    'CONTAINS', 'STARTSWITH', 'ENDSWITH',
+}
+_LITERAL_WORDS = {'NULL': None, 'NONE': None, 'TRUE': True, 'FALSE': False}
+
+
+class _ExpressionParser:
+    """Recursive-descent parser for string predicates (compiled once)."""
+
+    def __init__(self, text: str):
+        self._text = text
+        self._spans: list[tuple[int, int]] = []
+        self._tokens = self._tokenize(text)
+        self._pos = 0
+        self._negations = 0
+        self.fields: list[str] = []
+        # (field, operator, value) per comparison; None for negated ones and bare fields
+        self.comparisons: list[tuple[str, str, Any] | None] = []
+
+    def _tokenize(self, text: str) -> list[tuple[str, str]]:
+        tokens = []
+        pos = 0
+        text = text.rstrip()
+        while pos < len(text):
+            match = _TOKEN_RE.match(text, pos)
+            if not match or match.end() == pos:
+                raise XWQueryValueError(f"Invalid predicate expression near {text[pos:]!r}: {text!r}")
+            kind = match.lastgroup
+            tokens.append((kind, match.group(kind)))
+            self._spans.append(match.span(kind))
+            pos = match.end()
+        return tokens
+
+    def conjuncts(self) -> list[str]:
+        """Texts of the top-level AND operands (the whole text when it has a top-level OR)."""
+        depth, between, cuts = 0, False, []
+        for position, (kind, text) in enumerate(self._tokens):
+            word = text.upper() if kind == 'word' else None
+            if (kind, text) in (('punct', '('), ('punct', '[')):
+                depth += 1
+            elif (kind, text) in (('punct', ')'), ('punct', ']')):
+                depth -= 1
+            elif depth == 0 and word == 'OR':
+                return [self._text.strip()]
+            elif depth == 0 and word == 'BETWEEN':
+                between = True
+            elif depth == 0 and word == 'AND':
+                if between:
+                    between = False
+                else:
+                    cuts.append(position)
+        bounds = [-1, *cuts, len(self._tokens)]
+        return [
+            self._text[self._spans[start + 1][0]:self._spans[end - 1][1]]
+            for start, end in zip(bounds, bounds[1:]) if end > start + 1
+        ]
+
+    def _peek(self) -> tuple[str, str] | None:
+        return self._tokens[self._pos] if self._pos < len(self._tokens) else None
+
+    def _peek_keyword(self, *keywords: str) -> bool:
+        token = self._peek()
+        return token is not None and token[0] == 'word' and token[1].upper() in keywords
+
+    def _take(self) -> tuple[str, str]:
+        token = self._peek()
+        if token is None:
+            raise XWQueryValueError(f"Unexpected end of predicate expression: {self._text!r}")
+        self._pos += 1
+        return token
+
+    def _expect(self, kind: str, value: str | None = None) -> None:
+        token = self._take()
+        if token[0] != kind or (value is not None and token[1].upper() != value):
+            raise XWQueryValueError(f"Expected {value or kind} in predicate expression: {self._text!r}")
+
+    def parse(self) -> Predicate:
+        if not self._tokens:
+            return _match_all
+        predicate = self._parse_or()
+        if self._peek() is not None:
+            raise XWQueryValueError(f"Unexpected {self._peek()[1]!r} in predicate expression: {self._text!r}")
+        return predicate
+
+    def _parse_or(self) -> Predicate:
+        operands = [self._parse_and()]
+        while self._peek_keyword('OR'):
+            self._take()
+            operands.append(self._parse_and())
+        return _any_of(operands)
+
+    def _parse_and(self) -> Predicate:
+        operands = [self._parse_not()]
+        while self._peek_keyword('AND'):
+            self._take()
+            operands.append(self._parse_not())
+        return _all_of(operands)
+
+    def _parse_not(self) -> Predicate:
+        if self._peek_keyword('NOT'):
+            self._take()
+            self._negations += 1
+            predicate = _negate(self._parse_not())
+            self._negations -= 1
+            return predicate
+        if self._peek() == ('punct', '('):
+            self._take()
+            predicate = self._parse_or()
+            self._expect('punct', ')')
+            return predicate
+        return self._parse_comparison()
+
+    def _parse_comparison(self) -> Predicate:
+        kind, field = self._take()
+        if kind != 'word' or field.upper() in _KEYWORDS:
+            raise XWQueryValueError(f"Expected a field name, got {field!r}: {self._text!r}")
+        self.fields.append(field)
+        token = self._peek()
+        if token is None or token[0] == 'punct' or (token[0] == 'word' and token[1].upper() in ('AND', 'OR')):
+            # Bare field: existence check (legacy WHERE/UPDATE/DELETE semantics)
+            self.comparisons.append(None)
+            get = compile_field_getter(field)
+            return lambda item: get(item) is not _MISSING
+        if token[0] == 'op':
+            self._take()
+            return self._comparison(field, token[1], self._parse_value())
+        keyword = self._take()[1].upper()
+        negated = False
+        if keyword == 'NOT':
+            negated = True
+            keyword = self._take()[1].upper()
+        if keyword == 'IS':
+            if self._peek_keyword('NOT'):
+                self._take()
+                negated = not negated
+            if not self._peek_keyword('NULL', 'NONE'):
+                raise XWQueryValueError(f"Expected NULL after IS in predicate expression: {self._text!r}")
+            self._take()
+            return self._comparison(field, 'IS NOT NULL' if negated else 'IS NULL', None)
+        if keyword == 'BETWEEN':
+            low = self._parse_value()
+            self._expect('word', 'AND')
+            high = self._parse_value()
+            return self._comparison(field, 'NOT BETWEEN' if negated else 'BETWEEN', (low, high))
+        if keyword in ('LIKE', 'IN'):
+            return self._comparison(field, f"NOT {keyword}" if negated else keyword, self._parse_value())
+        if keyword in ('CONTAINS', 'STARTSWITH', 'ENDSWITH') and not negated:
+            return self._comparison(field, keyword, self._parse_value())
+        raise XWQueryValueError(f"Unsupported operator {keyword!r} in predicate expression: {self._text!r}")
+
+    def _comparison(self, field: str, op: str, value: Any) -> Predicate:
+        op = normalize_operator(op)
+        self.comparisons.append(None if self._negations else (field, op, value))
+        return compile_comparison(field, op, value)
+
+    def _parse_value(self) -> Any:
+        kind, text = self._take()
+        if kind == 'string':
+            quote = text[0]
+            body = text[1:-1]
+            return body.replace(quote * 2, quote) if quote == "'" else body
+        if kind == 'number':
+            return float(text) if any(c in text for c in '.eE') else int(text)
+        if kind == 'word':
+            upper = text.upper()
+            if upper in _LITERAL_WORDS:
+                return _LITERAL_WORDS[upper]
+            # Unquoted words compare as strings (e.g. status = active)
+            return text
+        if (kind, text) in (('punct', '['), ('punct', '(')):
+            closing = ']' if text == '[' else ')'
+            values = []
+            while self._peek() != ('punct', closing):
+                values.append(self._parse_value())
+                if self._peek() == ('punct', ','):
+                    self._take()
+            self._take()
+            return values
+        raise XWQueryValueError(f"Expected a value, got {text!r}: {self._text!r}")
+__all__ = [
+    'Predicate',
+    'comparison_of',
+    'compile_predicate',
+    'compile_comparison',
+    'compile_field_getter',
+    'is_match_all',
+    'is_missing',
+    'normalize_operator',
+    'split_conjuncts',
+]
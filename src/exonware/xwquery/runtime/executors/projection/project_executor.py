@@ -9,10 +9,12 @@ Version: 0.9.0.5
 Generation Date: 09-Oct-2025
 """
 
+from collections.abc import Iterator
 from typing import Any
 from ..base import AUniversalOperationExecutor
 from ....contracts import QueryAction, ExecutionContext, ExecutionResult
 from ....defs import OperationType
+from ...streaming import iter_batches, iter_rows
 # REUSE: Shared utilities
 from ..utils import extract_items, extract_field_value
 
@@ -42,6 +44,7 @@ class ProjectExecutor(AUniversalOperationExecutor):
     OPERATION_NAME = "PROJECT"
     OPERATION_TYPE = OperationType.PROJECTION
     SUPPORTED_NODE_TYPES = []  # Universal
+    SUPPORTS_STREAMING = True
 
     def _do_execute(self, action: QueryAction, context: ExecutionContext) -> ExecutionResult:
         """Execute PROJECT operation."""
@@ -59,6 +62,24 @@ class ProjectExecutor(AUniversalOperationExecutor):
             }
         )
 
+    def _iter_execute(self, action: QueryAction, context: ExecutionContext, batch_size: int) -> Iterator[list[Any]]:
+        """
+        Streaming PROJECT - yield projected rows (not the summary dict that
+        `_do_execute` returns) so downstream stages can keep pulling.
+        """
+        params = action.params
+        fields = params.get('fields', params.get('select', params.get('columns', [])))
+        rows = iter_rows(context.node)
+        if fields == '*' or fields == ['*']:
+            yield from iter_batches(rows, batch_size)
+            return
+        if isinstance(fields, str):
+            fields = [fields]
+        if not fields:
+            return
+        projected = (self._project_item(item, fields) for item in rows)
+        yield from iter_batches((item for item in projected if item), batch_size)
+
     def _execute_project(self, node: Any, params: dict, context: ExecutionContext) -> dict:
         """
         Execute PROJECT logic with field selection and aliasing.
@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/src/exonware/xwquery/runtime/executors/sorting.py
+Shared ORDER BY support: sort specs, multi-key sorting, Top-N selection and
+external (spill-to-disk) merge sort.
+Root cause: SELECT sorted every key in the direction of the first column
+(`reverse = specs[0][1] == 'DESC'`), ORDER only honored a single field, and
+ORDER BY + LIMIT fully sorted the result before throwing most of it away.
+Solution: parse ORDER BY once into SortSpec entries and
+- sort with stable multi-pass sorts (one C-level sort per key, last key
+  first), so every key keeps its own ASC/DESC direction;
+- select the first N rows with a bounded heap (O(n log k)); mixed
+  directions use a composite key where DESC values are wrapped in an
+  inverting comparator;
+- spill to disk when a streamed input exceeds the sort memory budget:
+  sorted runs are pickled to temp files and k-way merged lazily.
+NULL ordering follows PostgreSQL: NULLs sort as the largest value (last for
+ASC, first for DESC) unless NULLS FIRST / NULLS LAST is given. Keys of
+incomparable types (e.g. int vs str) are grouped by type instead of raising.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.9.0.5
+Generation Date: 17-Oct-2026
+"""
+
+from __future__ import annotations
+import heapq
+import logging
+import pickle
+import sys
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from typing import Any, NamedTuple
+from .predicates import compile_field_getter, is_missing
+logger = logging.getLogger(__name__)
+# Rows per pickled batch in a spilled run (one batch per run is read at a time)
+_SPILL_BATCH_ROWS = 1024
+# Estimate row size from every Nth buffered row
+_SIZE_SAMPLE_EVERY = 64
+
+
+class SortSpec(NamedTuple):
+    """One ORDER BY key."""
+    field: str
+    descending: bool = False
+    nulls_first: bool | None = None
+
+    @property
+    def nulls_sort_first(self) -> bool:
+        """Effective NULL placement (NULLs are the largest value by default)."""
+        return self.descending if self.nulls_first is None else self.nulls_first
+
+
+def _parse_spec_text(text: str) -> SortSpec | None:
+    """Parse "field [ASC|DESC] [NULLS FIRST|LAST]"."""
+    tokens = text.split()
+    if not tokens:
+        return None
+    descending = False
+    nulls_first = None
+    rest = [token.upper() for token in tokens[1:]]
+    if rest and rest[0] in ('ASC', 'DESC'):
+        descending = rest.pop(0) == 'DESC'
+    if len(rest) >= 2 and rest[0] == 'NULLS' and rest[1] in ('FIRST', 'LAST'):
+        nulls_first = rest[1] == 'FIRST'
+    return SortSpec(tokens[0], descending, nulls_first)
+
+
+def _parse_spec_dict(item: dict) -> SortSpec | None:
+    field = item.get('column') or item.get('field') or item.get('expression')
+    if not field:
+        return None
+    direction = str(item.get('direction') or item.get('order') or 'ASC').upper()
+    nulls = item.get('nulls')
+    nulls_first = None if nulls is None else str(nulls).upper() == 'FIRST'
+    return SortSpec(str(field), direction == 'DESC', nulls_first)
+
+
+def parse_order_by(order_by: Any, direction: str | None = None) -> list[SortSpec]:
+    """
+    Normalize an ORDER BY clause into SortSpec entries.
+    Supports:
+    - String from SQLParamExtractor: "age DESC, name ASC NULLS FIRST"
+    - List of dicts from grammar: [{"column": "age", "direction": "DESC", "nulls": "LAST"}]
+    - List of strings or (field, direction) tuples
+    Args:
+        order_by: ORDER BY clause in any supported form
+        direction: Default direction for keys that do not specify one
+    Returns:
+        List of sort specs (empty when there is nothing to sort by)
+    """
+    if not order_by:
+        return []
+    items = order_by.split(',') if isinstance(order_by, str) else order_by
+    if isinstance(items, (dict, tuple)):
+        items = [items]
+    specs = []
+    for item in items:
+        if isinstance(item, SortSpec):
+            spec = item
+        elif isinstance(item, dict):
+            spec = _parse_spec_dict(item)
+        elif isinstance(item, tuple) and item:
+            spec = SortSpec(str(item[0]), len(item) > 1 and str(item[1]).upper() == 'DESC')
+        elif isinstance(item, str):
+            spec = _parse_spec_text(item)
+            if spec and direction and len(item.split()) == 1:
+                spec = spec._replace(descending=direction.upper() == 'DESC')
+        else:
+            spec = None
+        if spec is not None:
+            specs.append(spec)
+    return specs
+
+
+def _compile_value(field: str) -> Callable[[Any], Any]:
+    """Value accessor; non-dict items sort by themselves (legacy behavior)."""
+    if '.' not in field:
+        def simple_value(item: Any) -> Any:
+            return item.get(field) if isinstance(item, dict) else item
+        return simple_value
+    get = compile_field_getter(field)
+
+    def value(item: Any) -> Any:
+        if not isinstance(item, dict):
+            return item
+        result = get(item)
+        return None if is_missing(result) else result
+    return value
+
+
+class _Descending:
+    """Inverts comparisons so DESC keys can live in an ascending composite key."""
+    __slots__ = ('value',)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __lt__(self, other: '_Descending') -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.value == other.value
+
+
+def _type_tag(value: Any) -> str:
+    """Group key for mixed-type columns: numbers compare together, others by type name."""
+    return 'number' if isinstance(value, (int, float)) else type(value).__name__
+
+
+def _pass_key(spec: SortSpec, get: Callable[[Any], Any], by_type: bool) -> Callable[[Any], tuple]:
+    """
+    Key for one sort pass run with reverse=spec.descending.
+    NULLs get a one-element tuple ranked below or above all values so they
+    are never compared with a value; by_type groups mixed types (see _type_tag).
+    """
+    # Rank in *key* order: a reversed pass flips NULL placement back
+    null_key = (0,) if spec.nulls_sort_first != spec.descending else (2,)
+    if by_type:
+        def typed_key(item: Any) -> tuple:
+            value = get(item)
+            return null_key if value is None else (1, _type_tag(value), value)
+        return typed_key
+
+    def key(item: Any) -> tuple:
+        value = get(item)
+        return null_key if value is None else (1, value)
+    return key
+
+
+def sort_rows(rows: Iterable[Any], specs: list[SortSpec]) -> list[Any]:
+    """
+    Stable multi-key sort honoring each key's direction and NULL placement.
+    Args:
+        rows: Rows to sort
+        specs: Sort specs from parse_order_by()
+    Returns:
+        New sorted list
+    """
+    result = list(rows)
+    _sort_in_place(result, specs, False)
+    return result
+
+
+def _sort_in_place(rows: list[Any], specs: list[SortSpec], by_type: bool) -> None:
+    for spec in reversed(specs):
+        get = _compile_value(spec.field)
+        if by_type:
+            rows.sort(key=_pass_key(spec, get, True), reverse=spec.descending)
+            continue
+        try:
+            rows.sort(key=_pass_key(spec, get, False), reverse=spec.descending)
+        except TypeError:
+            rows.sort(key=_pass_key(spec, get, True), reverse=spec.descending)
+
+
+def compile_sort_key(specs: list[SortSpec], by_type: bool = False) -> Callable[[Any], tuple]:
+    """
+    Compile a single ascending composite key for all specs.
+    DESC keys are wrapped so that the key can be used with heapq, bisect or
+    min/max, which have no per-key reverse flag.
+    """
+    parts = [
+        (_compile_value(spec.field), spec.descending, (0,) if spec.nulls_sort_first else (2,))
+        for spec in specs
+    ]
+
+    def key(item: Any) -> tuple:
+        out = []
+        for get, descending, null_key in parts:
+            value = get(item)
+            if value is None:
+                out.append(null_key)
+                continue
+            if by_type:
+                value = (_type_tag(value), value)
+            out.append((1, _Descending(value) if descending else value))
+        return tuple(out)
+    return key
+
+
+def _uniform_key(specs: list[SortSpec], by_type: bool) -> Callable[[Any], Any]:
+    """Composite of pass keys, for specs that all share one direction."""
+    keys = [_pass_key(spec, _compile_value(spec.field), by_type) for spec in specs]
+    if len(keys) == 1:
+        return keys[0]
+    return lambda item: tuple(key(item) for key in keys)
+
+
+def top_n(rows: Iterable[Any], specs: list[SortSpec], n: int) -> list[Any]:
+    """
+    First n rows in ORDER BY order, using a bounded heap (O(rows * log n)).
+    Equivalent to sort_rows(rows, specs)[:n], including tie order. Only n
+    rows are held at a time, so streamed input is never materialized.
+    """
+    if n <= 0:
+        return []
+    if isinstance(rows, list) and n >= len(rows):
+        return sort_rows(rows, specs)
+    # A stream cannot be replayed after a TypeError, so it is keyed by type up front
+    by_type = not isinstance(rows, list)
+    if len({spec.descending for spec in specs}) == 1:
+        # Uniform direction: nlargest is documented as sorted(reverse=True)[:n],
+        # matching the reversed passes of sort_rows() without key inversion
+        select = heapq.nlargest if specs[0].descending else heapq.nsmallest
+        try:
+            return select(n, rows, key=_uniform_key(specs, by_type))
+        except TypeError:
+            return select(n, rows, key=_uniform_key(specs, True))
+    try:
+        return heapq.nsmallest(n, rows, key=compile_sort_key(specs, by_type))
+    except TypeError:
+        return heapq.nsmallest(n, rows, key=compile_sort_key(specs, by_type=True))
+
+
+def order_rows(rows: Iterable[Any], specs: list[SortSpec], limit: int | None = None) -> list[Any]:
+    """
+    Apply ORDER BY, using Top-N selection when only the first `limit` rows are needed.
+    Args:
+        rows: Rows to order
+        specs: Sort specs from parse_order_by()
+        limit: Number of leading rows needed (offset + limit), or None for all
+    Returns:
+        Ordered list (at most `limit` rows when a limit is given)
+    """
+    if not specs:
+        rows = list(rows)
+        return rows if limit is None else rows[:limit]
+    if limit is not None:
+        return top_n(rows, specs, limit)
+    return sort_rows(rows, specs)
+# ============================================================================
+# EXTERNAL SORT (spill to disk)
+# ============================================================================
+
+
+def estimate_row_bytes(row: Any) -> int:
+    """Approximate in-memory size of a row (the dict plus its keys and values)."""
+    size = sys.getsizeof(row)
+    if isinstance(row, dict):
+        for key, value in row.items():
+            size += sys.getsizeof(key) + sys.getsizeof(value)
+    return size
+
+
+class _SpillRun:
+    """One sorted run spilled to an anonymous temp file as pickled row batches."""
+
+    def __init__(self, rows: list[Any], spill_dir: str | None = None):
+        self._file = tempfile.TemporaryFile(prefix='xwquery-sort-', dir=spill_dir or None)
+        for start in range(0, len(rows), _SPILL_BATCH_ROWS):
+            pickle.dump(rows[start:start + _SPILL_BATCH_ROWS], self._file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._file.flush()
+        self.bytes_written = self._file.tell()
+
+    def __iter__(self) -> Iterator[Any]:
+        """Read the run back lazily, one batch at a time."""
+        self._file.seek(0)
+        while True:
+            try:
+                batch = pickle.load(self._file)
+            except EOFError:
+                return
+            yield from batch
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def external_sort(
+    rows: Iterable[Any],
+    specs: list[SortSpec],
+    memory_budget: int,
+    spill_dir: str | None = None
+) -> Iterator[Any]:
+    """
+    Sort rows that may not fit in memory.
+    Rows are buffered until their estimated size reaches `memory_budget`;
+    each full buffer is sorted and spilled to a temp file as a run. The runs
+    are then k-way merged lazily (heapq.merge), so at most one batch per run
+    is in memory. Input that fits in the budget is sorted in memory.
+    Args:
+        rows: Row iterable (consumed lazily)
+        specs: Sort specs from parse_order_by()
+        memory_budget: Buffer size in bytes before a run is spilled
+        spill_dir: Directory for temp files (system default when None)
+    Yields:
+        Rows in ORDER BY order (same order and tie order as sort_rows())
+    """
+    runs: list[_SpillRun] = []
+    buffer: list[Any] = []
+    sampled_bytes = 0
+    sampled_rows = 0
+    try:
+        for row in rows:
+            buffer.append(row)
+            # Row sizes are sampled, not measured per row
+            if len(buffer) % _SIZE_SAMPLE_EVERY == 1:
+                sampled_bytes += estimate_row_bytes(row)
+                sampled_rows += 1
+                if len(buffer) * sampled_bytes >= memory_budget * sampled_rows:
+                    # Runs and merge share the type-grouped key, so merging never raises
+                    _sort_in_place(buffer, specs, True)
+                    runs.append(_SpillRun(buffer, spill_dir))
+                    buffer = []
+        if not runs:
+            yield from sort_rows(buffer, specs)
+            return
+        # The last run stays in memory
+        _sort_in_place(buffer, specs, True)
+        logger.debug(f"external_sort: merging {len(runs) + 1} runs ({sum(run.bytes_written for run in runs)} bytes spilled)")
+        sources: list[Iterable[Any]] = [*runs, buffer]
+        if len({spec.descending for spec in specs}) == 1:
+            merged = heapq.merge(*sources, key=_uniform_key(specs, True), reverse=specs[0].descending)
+        else:
+            merged = heapq.merge(*sources, key=compile_sort_key(specs, by_type=True))
+        yield from merged
+    finally:
+        for run in runs:
+            run.close()
+
+
+def iter_sorted(
+    rows: Iterable[Any],
+    specs: list[SortSpec],
+    limit: int | None = None,
+    memory_budget: int | None = None,
+    spill_dir: str | None = None
+) -> Iterator[Any]:
+    """
+    Lazily apply ORDER BY, choosing the cheapest strategy.
+    - limit: Top-N heap (only `limit` rows are kept)
+    - streamed input with a memory budget: external merge sort
+    - otherwise: in-memory sort
+    Rows that are already a list are sorted in memory; spilling them would not
+    free anything.
+    """
+    if not specs:
+        rows = iter(rows)
+        return rows if limit is None else islice(rows, limit)
+    if limit is not None:
+        return iter(top_n(rows, specs, limit))
+    if memory_budget and not isinstance(rows, list):
+        return external_sort(rows, specs, memory_budget, spill_dir)
+    return iter(sort_rows(rows, specs))
+
+
+def resolve_sort_memory_budget(options: dict[str, Any] | None = None) -> int | None:
+    """
+    Resolve the ORDER BY memory budget in bytes (None = unbounded).
+    Order of precedence: `sort_memory_budget_mb` execution option, then
+    `XWQueryConfig.sort_memory_budget_mb`. Zero disables spilling.
+    """
+    megabytes = None
+    if options and options.get('sort_memory_budget_mb') is not None:
+        megabytes = options['sort_memory_budget_mb']
+    else:
+        try:
+            from ...config import get_config
+            megabytes = get_config().sort_memory_budget_mb
+        except Exception:
+            megabytes = None
+    if not megabytes or float(megabytes) <= 0:
+        return None
+    return int(float(megabytes) * 1024 * 1024)
+
+
+def resolve_spill_directory(options: dict[str, Any] | None = None) -> str | None:
+    """Resolve the temp directory for spilled sort runs (None = system default)."""
+    if options and options.get('spill_directory'):
+        return str(options['spill_directory'])
+    try:
+        from ...config import get_config
+        return get_config().spill_directory or None
+    except Exception:
+        return None
+__all__ = [
+    'SortSpec',
+    'parse_order_by',
+    'sort_rows',
+    'compile_sort_key',
+    'top_n',
+    'order_rows',
+    'estimate_row_bytes',
+    'external_sort',
+    'iter_sorted',
+    'resolve_sort_memory_budget',
+    'resolve_spill_directory',
+]
@@ -17,7 +17,9 @@ from typing import Any
 # ============================================================================
 
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from .predicates import compile_predicate
+from .aggregates import accumulate
 def extract_items(node: Any) -> list[Any]:
     """
     Extract items from node regardless of type.
@@ -172,7 +174,8 @@ def matches_condition(item: Any, condition: Any,
     - None: Match all
     - dict: {'field': value} - all fields must match
     - Callable: lambda item: boolean
-    - String: Field existence check
+    - String: Field existence check, or a WHERE expression ("age > 30 AND ...")
+    - SQL dicts, syntax-adapter comparison/logical trees (see predicates.py)
     - Custom evaluator: For complex conditions (e.g., WHERE expressions)
     Args:
         item: Item to check
@@ -189,35 +192,8 @@ def matches_condition(item: Any, condition: Any,
             return evaluator(item, condition)
         except Exception:
             return False
-    # Handle dict-based condition (e.g., {'field': 'value'})
-    if isinstance(condition, dict):
-        if isinstance(item, dict):
-            # Check all condition fields match
-            for key, expected_value in condition.items():
-                if item.get(key) != expected_value:
-                    return False
-            return True
-        else:
-            # For non-dict items, check attributes
-            for key, expected_value in condition.items():
-                if not hasattr(item, key) or getattr(item, key) != expected_value:
-                    return False
-            return True
-    # Handle callable condition (e.g., lambda)
-    if callable(condition):
-        try:
-            return condition(item)
-        except Exception:
-            return False
-    # Handle string condition (field name check)
-    if isinstance(condition, str):
-        # Check if item has the field
-        if isinstance(item, dict):
-            return condition in item
-        else:
-            return hasattr(item, condition)
-    # Default: match all
-    return True
+    # Everything else goes through the shared compiled predicate engine
+    return compile_predicate(condition)(item)
 
 
 def make_hashable(obj: Any) -> Any:
@@ -288,7 +264,7 @@ def items_equal(item1: Any, item2: Any) -> bool:
 # ============================================================================
 
 
-def compute_aggregates(items: list[Any], field: str | None = None) -> dict[str, Any]:
+def compute_aggregates(items: Iterable[Any], field: str | None = None) -> dict[str, Any]:
     """
     Compute all common aggregates in a single pass.
     REUSE: Single-pass computation for SUM, AVG, MIN, MAX, COUNT.
@@ -296,14 +272,17 @@ def compute_aggregates(items: list[Any], field: str | None = None) -> dict[str,
     - Performance optimization: O(n) single pass vs O(4n) separate passes
     - Reduce code duplication
     - Production-grade efficiency
-    Computes: count, sum, avg, min, max in one O(n) traversal
+    Computes: count, sum, avg, min, max in one O(n) traversal. Items may be
+    any iterable (e.g. a RowStream); they are folded into a running
+    Accumulator (see aggregates.py) and never held.
     Args:
         items: Items to aggregate
         field: Optional field to aggregate on
     Returns:
         dict with all aggregate values
     """
-    if not items:
+    accumulator = accumulate(items, field)
+    if not accumulator.rows:
         return {
             'count': 0,
             'sum': 0,
@@ -311,28 +290,7 @@ def compute_aggregates(items: list[Any], field: str | None = None) -> dict[str,
             'min': None,
             'max': None
         }
-    total = 0
-    count = 0
-    min_value = None
-    max_value = None
-    for item in items:
-        value = extract_numeric_value(item, field)
-        if value is not None:
-            total += value
-            count += 1
-            if min_value is None or value < min_value:
-                min_value = value
-            if max_value is None or value > max_value:
-                max_value = value
-    avg_value = total / count if count > 0 else None
-    return {
-        'count': count,
-        'sum': total,
-        'avg': avg_value,
-        'min': min_value,
-        'max': max_value,
-        'total_items': len(items)
-    }
+    return accumulator.summary()
 # ============================================================================
 # PROJECTION UTILITIES  
 # ============================================================================
@@ -0,0 +1,653 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/src/exonware/xwquery/runtime/executors/windows.py
+Shared window function engine: frames, ranking and sliding aggregates.
+Root cause: WINDOW evaluated every function row by row over the whole
+partition - DENSE_RANK built a set over the prefix for each row (O(n^2)),
+RANK re-scanned the prefix, and SUM/AVG re-sliced and re-summed the frame
+for every row (O(n*w)).
+Solution: sort each partition once and compute every function in one pass.
+- Frames are turned into per-row [start, end) index bounds that only move
+  forward, so aggregates can slide instead of recomputing.
+- ROW_NUMBER/RANK/DENSE_RANK/PERCENT_RANK/CUME_DIST/NTILE walk the peer
+  groups (rows with equal ORDER BY values) once.
+- SUM/AVG/COUNT use prefix sums (O(1) per row for any frame); MIN/MAX use a
+  monotonic deque (amortized O(1) per row). Prefix sums are exact: floats
+  are scaled to integers by their common power-of-two denominator, so a
+  frame's SUM is the correctly rounded sum (as `math.fsum`) and integer
+  columns sum to ints.
+- RANGE frames are value based ("RANGE BETWEEN INTERVAL '30' DAY PRECEDING
+  AND CURRENT ROW", numeric offsets, peers for CURRENT ROW); their bounds
+  come from two pointers sliding over the sorted ORDER BY values.
+- Several functions over the same PARTITION BY/ORDER BY share one sort,
+  one set of frame bounds per distinct frame and one value column per field
+  (`parse_window_functions()`, `evaluate_partition()`).
+Numeric conversion matches `extract_numeric_value()`, so window aggregates
+agree with SUM/AVG/MIN/MAX/COUNT executors (NULL and text are skipped).
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.9.0.5
+Generation Date: 17-Oct-2026
+"""
+
+from __future__ import annotations
+import math
+import re
+from collections import deque
+from collections.abc import Callable, Iterable
+from datetime import date, datetime, timedelta
+from typing import Any, NamedTuple
+from ...errors import XWQueryValueError
+from .predicates import compile_field_getter, is_missing
+from .sorting import parse_order_by, sort_rows
+from .utils import extract_numeric_value
+RANKING_FUNCTIONS = frozenset({'ROW_NUMBER', 'RANK', 'DENSE_RANK', 'PERCENT_RANK', 'CUME_DIST', 'NTILE'})
+OFFSET_FUNCTIONS = frozenset({'LAG', 'LEAD', 'FIRST_VALUE', 'LAST_VALUE'})
+AGGREGATE_WINDOW_FUNCTIONS = frozenset({'SUM', 'AVG', 'COUNT', 'MIN', 'MAX'})
+WINDOW_FUNCTIONS = RANKING_FUNCTIONS | OFFSET_FUNCTIONS | AGGREGATE_WINDOW_FUNCTIONS
+_BOUND_TEXT = re.compile(
+    r"^\s*(?:INTERVAL\s+)?'?(UNBOUNDED|CURRENT|\d+(?:\.\d+)?)'?\s*"
+    r"(?:(MICROSECOND|MILLISECOND|SECOND|MINUTE|HOUR|DAY|WEEK)S?\b)?[\s_]*(PRECEDING|FOLLOWING|ROW)?\s*$",
+    re.IGNORECASE
+)
+_INTERVAL_UNITS = {
+    'MICROSECOND': timedelta(microseconds=1),
+    'MILLISECOND': timedelta(milliseconds=1),
+    'SECOND': timedelta(seconds=1),
+    'MINUTE': timedelta(minutes=1),
+    'HOUR': timedelta(hours=1),
+    'DAY': timedelta(days=1),
+    'WEEK': timedelta(weeks=1),
+}
+_FUNCTION_TEXT = re.compile(r'^\s*(\w+)\s*\(\s*(.*?)\s*\)\s*(?:AS\s+(\w+))?\s*$', re.IGNORECASE | re.DOTALL)
+_FRAME_TEXT = re.compile(r'^\s*(ROWS|RANGE)\s+(?:BETWEEN\s+(.+?)\s+AND\s+(.+?)|(.+?))\s*$', re.IGNORECASE)
+
+
+class WindowFrame(NamedTuple):
+    """
+    Frame of a window function.
+    `start`/`end` are offsets from the current row (negative = preceding,
+    positive = following, None = unbounded): row counts for ROWS frames,
+    ORDER BY value distances (numbers or timedeltas) for RANGE frames.
+    """
+    kind: str = 'ROWS'
+    start: float | timedelta | None = None
+    end: float | timedelta | None = 0
+
+
+def _parse_bound(bound: Any, is_start: bool) -> float | timedelta | None:
+    """Offset of one frame bound; a bare number counts away from the current row."""
+    if bound is None:
+        return None if is_start else 0
+    if isinstance(bound, timedelta):
+        return -abs(bound) if is_start else abs(bound)
+    if isinstance(bound, (int, float)) and not isinstance(bound, bool):
+        return -abs(bound) if is_start else abs(bound)
+    match = _BOUND_TEXT.match(str(bound))
+    if not match:
+        raise XWQueryValueError(f"Invalid window frame bound: {bound!r}")
+    amount, unit, direction = match.group(1).upper(), match.group(2), (match.group(3) or '').upper()
+    if amount == 'UNBOUNDED':
+        return None
+    if amount == 'CURRENT':
+        return 0
+    number = float(amount) if '.' in amount else int(amount)
+    if unit:
+        number = _INTERVAL_UNITS[unit.upper()] * number
+    if direction == 'PRECEDING':
+        return -number
+    if direction == 'FOLLOWING':
+        return number
+    return -number if is_start else number
+
+
+def parse_frame(frame: Any) -> WindowFrame:
+    """
+    Normalize a frame specification.
+    Accepts {'type': 'ROWS', 'start': 'UNBOUNDED_PRECEDING', 'end': 2},
+    'ROWS BETWEEN 6 PRECEDING AND CURRENT ROW',
+    "RANGE BETWEEN INTERVAL '30' DAY PRECEDING AND CURRENT ROW" (timedelta
+    offsets are accepted too) or an existing WindowFrame.
+    Default: ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW.
+    Raises:
+        XWQueryValueError: For malformed bounds or intervals in a ROWS frame
+    """
+    if isinstance(frame, WindowFrame):
+        return frame
+    if not frame:
+        return WindowFrame()
+    if isinstance(frame, str):
+        match = _FRAME_TEXT.match(frame)
+        if not match:
+            raise XWQueryValueError(f"Invalid window frame: {frame!r}")
+        kind, start, end, single = match.groups()
+        if single is not None:
+            start, end = single, 'CURRENT ROW'
+        parsed = WindowFrame(kind.upper(), _parse_bound(start, True), _parse_bound(end, False))
+    else:
+        parsed = WindowFrame(
+            str(frame.get('type', frame.get('kind', 'ROWS'))).upper(),
+            _parse_bound(frame.get('start', 'UNBOUNDED_PRECEDING'), True),
+            _parse_bound(frame.get('end', 'CURRENT_ROW'), False)
+        )
+    if parsed.kind not in ('ROWS', 'RANGE'):
+        raise XWQueryValueError(f"Invalid window frame type: {parsed.kind}")
+    if parsed.kind == 'ROWS' and (isinstance(parsed.start, timedelta) or isinstance(parsed.end, timedelta)):
+        raise XWQueryValueError("INTERVAL offsets need a RANGE frame")
+    return parsed
+
+
+class WindowSpec(NamedTuple):
+    """One window function to compute over each partition."""
+    function: str
+    field: str | None = None
+    alias: str | None = None
+    offset: int = 1
+    default: Any = None
+    frame: WindowFrame | None = None
+    buckets: int = 1
+
+    @property
+    def name(self) -> str:
+        """Output column (the alias, or 'window_<function>')."""
+        return self.alias or f'window_{self.function.lower()}'
+
+
+def window_spec_from_params(params: dict, frame: Any = None) -> WindowSpec:
+    """Build the WindowSpec of a WINDOW action's params (or one 'functions' entry)."""
+    function = str(params.get('function', 'ROW_NUMBER')).upper()
+    if function not in WINDOW_FUNCTIONS:
+        raise XWQueryValueError(f"Unsupported window function: {function}")
+    frame = params.get('frame') or frame or {}
+    offset = params.get('offset', frame.get('offset', 1) if isinstance(frame, dict) else 1)
+    return WindowSpec(
+        function=function,
+        field=params.get('field', params.get('column')),
+        alias=params.get('alias', params.get('as')),
+        offset=int(offset),
+        default=params.get('default', frame.get('default') if isinstance(frame, dict) else None),
+        frame=parse_frame(frame) if frame else None,
+        buckets=int(params.get('buckets', params.get('n', 1)) or 1)
+    )
+
+
+def _split_top_level(text: str) -> list[str]:
+    """Split on commas outside parentheses and quotes."""
+    parts, depth, quote, current = [], 0, None, []
+    for char in text:
+        if quote:
+            quote = None if char == quote else quote
+        elif char in '\'"':
+            quote = char
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            parts.append(''.join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    if ''.join(current).strip():
+        parts.append(''.join(current).strip())
+    return parts
+
+
+def _literal(text: str) -> Any:
+    text = text.strip()
+    if text.upper() == 'NULL':
+        return None
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in '\'"':
+        return text[1:-1]
+    try:
+        return int(text)
+    except ValueError:
+        try:
+            return float(text)
+        except ValueError:
+            return text
+
+
+def _function_params(text: str) -> dict:
+    """Params of one "FUNC(args) [AS alias]" entry, e.g. "LAG(amount, 1, 0) AS prev"."""
+    match = _FUNCTION_TEXT.match(text)
+    if not match:
+        raise XWQueryValueError(f"Invalid window function: {text!r}")
+    function, arguments, alias = match.group(1).upper(), _split_top_level(match.group(2)), match.group(3)
+    params: dict[str, Any] = {'function': function, 'alias': alias}
+    if function == 'NTILE':
+        params['buckets'] = int(_literal(arguments[0])) if arguments else 1
+        return params
+    if arguments and arguments[0] not in ('', '*'):
+        params['field'] = arguments[0]
+    if len(arguments) > 1:
+        params['offset'] = int(_literal(arguments[1]))
+    if len(arguments) > 2:
+        params['default'] = _literal(arguments[2])
+    return params
+
+
+def parse_window_functions(params: dict) -> list[WindowSpec]:
+    """
+    Window functions of a WINDOW action.
+    'functions' lists several functions over the same PARTITION BY/ORDER BY:
+    "ROW_NUMBER(), LAG(amount, 1, 0) AS prev, SUM(amount) AS total", or
+    dicts such as {'function': 'SUM', 'field': 'amount', 'frame': ...}.
+    Entries without their own frame use the action's 'frame'. Without
+    'functions' the single 'function' param is used.
+    """
+    functions = params.get('functions')
+    if not functions:
+        return [window_spec_from_params(params)]
+    if isinstance(functions, str):
+        functions = _split_top_level(functions)
+    specs = []
+    for entry in functions:
+        entry_params = _function_params(entry) if isinstance(entry, str) else dict(entry)
+        specs.append(window_spec_from_params(entry_params, params.get('frame')))
+    return specs
+
+
+def legacy_value(item: Any) -> Any:
+    """Value of a row when no field is named ('value', '_value', else its first field)."""
+    if isinstance(item, dict):
+        return item.get('value', item.get('_value', next(iter(item.values())) if item else None))
+    return item
+
+
+def _value_getter(field: str | None) -> Callable[[Any], Any]:
+    if not field or field == '*':
+        return legacy_value
+    get = compile_field_getter(field)
+
+    def value(item: Any) -> Any:
+        found = get(item)
+        return None if is_missing(found) else found
+    return value
+
+
+def rows_frame_bounds(size: int, frame: WindowFrame) -> tuple[list[int], list[int]]:
+    """Per-row [start, end) indexes of a ROWS frame (both non-decreasing)."""
+    starts = [0] * size if frame.start is None else [
+        min(size, max(0, index + int(frame.start))) for index in range(size)
+    ]
+    ends = [size] * size if frame.end is None else [
+        min(size, max(0, index + int(frame.end) + 1)) for index in range(size)
+    ]
+    return starts, ends
+
+
+def _range_value(value: Any, temporal: bool) -> Any:
+    """ORDER BY value usable with the frame offsets (ISO strings parse for intervals)."""
+    if temporal:
+        if isinstance(value, (datetime, date)):
+            return value
+        if isinstance(value, str):
+            try:
+                return datetime.fromisoformat(value.replace('Z', '+00:00'))
+            except ValueError:
+                pass
+        raise XWQueryValueError(f"INTERVAL frame needs date/time ORDER BY values, got {value!r}")
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    number = extract_numeric_value(value)
+    if number is None:
+        raise XWQueryValueError(f"RANGE frame offsets need numeric ORDER BY values, got {value!r}")
+    return number
+
+
+def range_frame_bounds(
+    values: list[Any],
+    frame: WindowFrame,
+    descending: bool = False
+) -> tuple[list[int], list[int]]:
+    """
+    Per-row [start, end) indexes of a value-based RANGE frame.
+    `values` are the (single) ORDER BY values of the sorted partition. Row j
+    is in the frame of row i when its value lies between value_i + start and
+    value_i + end (mirrored for DESC order). Both bounds move forward, so two
+    pointers find them in one pass. NULL values form their own peer group.
+    """
+    size = len(values)
+    temporal = isinstance(frame.start, timedelta) or isinstance(frame.end, timedelta)
+    non_null = [index for index, value in enumerate(values) if value is not None]
+    low, high = (non_null[0], non_null[-1] + 1) if non_null else (0, 0)
+    keys = [None if value is None else _range_value(value, temporal) for value in values]
+
+    def before(a: Any, b: Any) -> bool:
+        return a > b if descending else a < b
+
+    def shifted(value: Any, offset: Any) -> Any:
+        if not offset:
+            return value  # CURRENT ROW (0) also applies to date/time values
+        return value - offset if descending else value + offset
+    starts: list[int] = []
+    ends: list[int] = []
+    start_pointer = end_pointer = low
+    for index, key in enumerate(keys):
+        if key is None:
+            # NULLs are peers of each other only
+            nulls = (0, low) if index < low else (high, size)
+            starts.append(0 if frame.start is None else nulls[0])
+            ends.append(size if frame.end is None else nulls[1])
+            continue
+        if frame.start is None:
+            starts.append(0)
+        else:
+            target = shifted(key, frame.start)
+            while start_pointer < high and before(keys[start_pointer], target):
+                start_pointer += 1
+            starts.append(start_pointer)
+        if frame.end is None:
+            ends.append(size)
+        else:
+            target = shifted(key, frame.end)
+            end_pointer = max(end_pointer, start_pointer if frame.start is not None else low)
+            while end_pointer < high and not before(target, keys[end_pointer]):
+                end_pointer += 1
+            ends.append(end_pointer)
+    return starts, ends
+
+
+def peer_frame_bounds(peers: list[Any] | None, size: int, frame: WindowFrame) -> tuple[list[int], list[int]]:
+    """RANGE bounds made only of UNBOUNDED and CURRENT ROW (CURRENT ROW includes peers)."""
+    groups = _peer_groups(peers) if peers is not None else [(0, size)]
+    starts: list[int] = []
+    ends: list[int] = []
+    for start, end in groups:
+        starts.extend([0 if frame.start is None else start] * (end - start))
+        ends.extend([size if frame.end is None else end] * (end - start))
+    return starts, ends
+
+
+def frame_bounds(
+    rows: list[Any],
+    frame: WindowFrame,
+    peers: list[Any] | None = None,
+    order_values: list[Any] | None = None,
+    descending: bool = False
+) -> tuple[list[int], list[int]]:
+    """
+    Per-row [start, end) frame bounds over a sorted partition.
+    Raises:
+        XWQueryValueError: For RANGE offsets without exactly one ORDER BY key
+    """
+    if frame.kind == 'ROWS':
+        return rows_frame_bounds(len(rows), frame)
+    if frame.start in (None, 0) and frame.end in (None, 0):
+        return peer_frame_bounds(peers, len(rows), frame)
+    if order_values is None:
+        raise XWQueryValueError("RANGE frames with offsets need exactly one ORDER BY key")
+    return range_frame_bounds(order_values, frame, descending)
+
+
+def _peer_groups(peers: list[Any]) -> list[tuple[int, int]]:
+    """[start, end) index ranges of consecutive rows with equal ORDER BY values."""
+    groups = []
+    start = 0
+    for index in range(1, len(peers) + 1):
+        if index == len(peers) or peers[index] != peers[start]:
+            groups.append((start, index))
+            start = index
+    return groups
+
+
+def _ranking(function: str, size: int, peers: list[Any], buckets: int) -> list[Any]:
+    """Ranking functions in one pass over the peer groups."""
+    if function == 'ROW_NUMBER':
+        return list(range(1, size + 1))
+    if function == 'NTILE':
+        buckets = max(1, buckets)
+        base, extra = divmod(size, buckets)
+        values = []
+        for bucket in range(min(buckets, size)):
+            values.extend([bucket + 1] * (base + (1 if bucket < extra else 0)))
+        return values
+    values: list[Any] = [None] * size
+    for dense, (start, end) in enumerate(_peer_groups(peers), 1):
+        if function == 'RANK':
+            value = start + 1
+        elif function == 'DENSE_RANK':
+            value = dense
+        elif function == 'PERCENT_RANK':
+            value = start / (size - 1) if size > 1 else 0.0
+        else:  # CUME_DIST
+            value = end / size
+        for index in range(start, end):
+            values[index] = value
+    return values
+
+
+def _sliding_extreme(numbers: list[float | None], starts: list[int], ends: list[int], largest: bool) -> list[Any]:
+    """MIN/MAX over monotone frames with a monotonic deque of indexes."""
+    window: deque[int] = deque()
+    values: list[Any] = []
+    pushed = 0
+    for start, end in zip(starts, ends):
+        while pushed < end:
+            number = numbers[pushed]
+            if number is not None:
+                # Drop entries the new value dominates
+                while window and (numbers[window[-1]] <= number if largest else numbers[window[-1]] >= number):
+                    window.pop()
+                window.append(pushed)
+            pushed += 1
+        while window and window[0] < start:
+            window.popleft()
+        values.append(numbers[window[0]] if window and start < end else None)
+    return values
+
+
+def _exact_prefix_sums(numbers: list[float | int | None]) -> tuple[list[int], int] | None:
+    """
+    Integer prefix sums of `numbers` scaled by their common power-of-two
+    denominator, and that scale (1 for integers); None when a value is not
+    finite.
+    """
+    ratios = []
+    for number in numbers:
+        if number is None:
+            ratios.append((0, 1))
+        elif isinstance(number, int):
+            ratios.append((number, 1))
+        elif math.isfinite(number):
+            ratios.append(number.as_integer_ratio())
+        else:
+            return None
+    scale = max((denominator for _, denominator in ratios), default=1)
+    totals = [0]
+    for numerator, denominator in ratios:
+        totals.append(totals[-1] + numerator * (scale // denominator))
+    return totals, scale
+
+
+def _aggregate(function: str, numbers: list[float | int | None], present: list[bool],
+               starts: list[int], ends: list[int], count_rows: bool) -> list[Any]:
+    """SUM/AVG/COUNT via exact prefix sums, MIN/MAX via monotonic deques."""
+    if function in ('MIN', 'MAX'):
+        return _sliding_extreme(numbers, starts, ends, function == 'MAX')
+    counts = [0]
+    seen = [0]
+    for number, exists in zip(numbers, present):
+        counts.append(counts[-1] + (number is not None))
+        seen.append(seen[-1] + exists)
+    if function == 'COUNT':
+        return [
+            max(start, end) - start if count_rows else seen[max(start, end)] - seen[start]
+            for start, end in zip(starts, ends)
+        ]
+    exact = _exact_prefix_sums(numbers)
+    integral = all(number is None or isinstance(number, int) for number in numbers)
+    values: list[Any] = []
+    for start, end in zip(starts, ends):
+        end = max(start, end)
+        count = counts[end] - counts[start]
+        if exact is None:
+            # inf/nan: sum the frame itself
+            total = math.fsum(number for number in numbers[start:end] if number is not None)
+            values.append(total if function == 'SUM' else (total / count if count else None))
+            continue
+        totals, scale = exact
+        total = totals[end] - totals[start]
+        if function == 'SUM':
+            # int / int division is correctly rounded
+            values.append(total if integral else total / scale)
+        else:
+            values.append(total / (scale * count) if count else None)
+    return values
+
+
+class WindowPartition:
+    """
+    A sorted partition plus everything its window functions share: peer
+    keys, ORDER BY values, frame bounds per distinct frame and value columns
+    per field, each computed once however many functions use them.
+    """
+
+    def __init__(
+        self,
+        rows: list[Any],
+        peers: list[Any] | None = None,
+        order_values: list[Any] | None = None,
+        descending: bool = False
+    ):
+        self.rows = rows
+        self.peers = peers
+        self.order_values = order_values
+        self.descending = descending
+        self._bounds: dict[WindowFrame, tuple[list[int], list[int]]] = {}
+        self._values: dict[str | None, list[Any]] = {}
+        self._numbers: dict[str | None, list[float | int | None]] = {}
+
+    def bounds(self, frame: WindowFrame) -> tuple[list[int], list[int]]:
+        if frame not in self._bounds:
+            self._bounds[frame] = frame_bounds(self.rows, frame, self.peers, self.order_values, self.descending)
+        return self._bounds[frame]
+
+    def values(self, field: str | None) -> list[Any]:
+        if field not in self._values:
+            value_of = _value_getter(field)
+            self._values[field] = [value_of(row) for row in self.rows]
+        return self._values[field]
+
+    def numbers(self, field: str | None) -> list[float | int | None]:
+        """Numeric values of a column; ints stay ints so integer SUMs stay exact ints."""
+        if field not in self._numbers:
+            self._numbers[field] = [
+                value if isinstance(value, int) and not isinstance(value, bool) else extract_numeric_value(value)
+                for value in self.values(field)
+            ]
+        return self._numbers[field]
+
+
+def compute_window(rows: list[Any] | WindowPartition, spec: WindowSpec, peers: list[Any] | None = None) -> list[Any]:
+    """
+    Values of one window function for every row of a sorted partition.
+    Args:
+        rows: Partition rows in ORDER BY order (or a WindowPartition)
+        spec: Window function to compute
+        peers: ORDER BY values per row (rows with equal values are peers);
+            defaults to the function's value column
+    Returns:
+        One value per row, aligned with the partition rows
+    """
+    partition = rows if isinstance(rows, WindowPartition) else WindowPartition(rows, peers)
+    rows = partition.rows
+    size = len(rows)
+    if not size:
+        return []
+    function = spec.function
+    if function in RANKING_FUNCTIONS:
+        peers = partition.peers if partition.peers is not None else partition.values(spec.field)
+        return _ranking(function, size, peers, spec.buckets)
+    values = partition.values(spec.field)
+    if function in ('LAG', 'LEAD'):
+        shift = -spec.offset if function == 'LAG' else spec.offset
+        return [
+            values[index + shift] if 0 <= index + shift < size else spec.default
+            for index in range(size)
+        ]
+    if function in ('FIRST_VALUE', 'LAST_VALUE') and spec.frame is None:
+        # Without an explicit frame these refer to the whole partition
+        return [values[0] if function == 'FIRST_VALUE' else values[-1]] * size
+    starts, ends = partition.bounds(spec.frame or WindowFrame())
+    if function in ('FIRST_VALUE', 'LAST_VALUE'):
+        return [
+            (values[start] if function == 'FIRST_VALUE' else values[end - 1]) if start < end else None
+            for start, end in zip(starts, ends)
+        ]
+    present = [value is not None for value in values]
+    count_rows = function == 'COUNT' and (not spec.field or spec.field == '*')
+    return _aggregate(function, partition.numbers(spec.field), present, starts, ends, count_rows)
+
+
+def partition_rows(items: Iterable[Any], partition_by: list[str]) -> dict[Any, list[Any]]:
+    """Hash rows into partitions by the values of `partition_by` (insertion ordered)."""
+    if not partition_by:
+        return {None: list(items)}
+    getters = [_value_getter(field) for field in partition_by]
+    partitions: dict[Any, list[Any]] = {}
+    for item in items:
+        key = tuple(get(item) for get in getters)
+        bucket = partitions.get(key)
+        if bucket is None:
+            partitions[key] = [item]
+        else:
+            bucket.append(item)
+    return partitions
+
+
+def evaluate_partition(rows: list[Any], specs: list[WindowSpec], order_by: Any = None) -> list[dict]:
+    """
+    Sort one partition once and append every window column to its rows.
+    All specs share the sort, the frame bounds and the value columns.
+    Returns new row dicts (non-dict rows become {'value': row}).
+    """
+    sort_specs = parse_order_by(order_by)
+    partition = WindowPartition(rows)
+    if sort_specs:
+        rows = sort_rows(rows, sort_specs)
+        getters = [_value_getter(spec.field) for spec in sort_specs]
+        peers = [tuple(get(row) for get in getters) for row in rows]
+        order_values = [peer[0] for peer in peers] if len(sort_specs) == 1 else None
+        partition = WindowPartition(rows, peers, order_values, sort_specs[0].descending)
+    columns = [compute_window(partition, spec) for spec in specs]
+    results = []
+    for index, row in enumerate(rows):
+        result = row.copy() if isinstance(row, dict) else {'value': row}
+        for spec, column in zip(specs, columns):
+            result[spec.name] = column[index]
+        results.append(result)
+    return results
+
+
+def evaluate_windows(items: Iterable[Any], specs: list[WindowSpec], partition_by: Any = None, order_by: Any = None) -> list[dict]:
+    """Compute window functions over every partition of `items`."""
+    if isinstance(partition_by, str):
+        partition_by = [field.strip() for field in partition_by.split(',') if field.strip()]
+    results: list[dict] = []
+    for rows in partition_rows(items, list(partition_by or [])).values():
+        results.extend(evaluate_partition(rows, specs, order_by))
+    return results
+__all__ = [
+    'AGGREGATE_WINDOW_FUNCTIONS',
+    'OFFSET_FUNCTIONS',
+    'RANKING_FUNCTIONS',
+    'WINDOW_FUNCTIONS',
+    'WindowFrame',
+    'WindowPartition',
+    'WindowSpec',
+    'compute_window',
+    'evaluate_partition',
+    'evaluate_windows',
+    'frame_bounds',
+    'legacy_value',
+    'parse_frame',
+    'parse_window_functions',
+    'partition_rows',
+    'peer_frame_bounds',
+    'range_frame_bounds',
+    'rows_frame_bounds',
+    'window_spec_from_params',
+]
@@ -32,6 +32,7 @@ from .query_planner import QueryPlanner
 from .cost_model import SimpleCostModel
 from .statistics_manager import InMemoryStatisticsManager
 from .optimizer import QueryOptimizer
+from .pipeline import QueryPlanPipeline, get_plan_pipeline, is_optimization_enabled, optimize_action_tree
 # Use xwsystem caching directly
 from exonware.xwsystem.caching import create_cache, TTLCache
 _global_cache = None
@@ -75,6 +76,10 @@ __all__ = [
     'SimpleCostModel',
     'InMemoryStatisticsManager',
     'QueryOptimizer',
+    'QueryPlanPipeline',
+    'get_plan_pipeline',
+    'is_optimization_enabled',
+    'optimize_action_tree',
     'QueryCache',
     'get_global_cache',
     'set_global_cache',
@@ -161,19 +161,35 @@ class SimpleCostModel(ACostModel):
         self,
         left_rows: int,
         right_rows: int,
-        has_index: bool = False
+        has_index: bool = False,
+        left_sorted: bool = False,
+        right_sorted: bool = False,
+        equi_join: bool = True
     ) -> str:
         """
-        Choose the best join algorithm based on input sizes
+        Choose the best join algorithm based on input sizes and ordering
+        Range/inequality predicates can only be served by a merge (band) join.
+        Inputs already ordered on the join key merge in a single pass without
+        a hash table; an input that is not ordered is charged a sort.
         Returns:
             str: 'nested_loop', 'hash', or 'merge'
         """
+        if not equi_join:
+            return 'merge'  # Hashing cannot serve range predicates
         # Simple heuristics
         if has_index and left_rows < 1000:
             return 'nested_loop'  # Index nested loop for small outer table
         elif left_rows < 10 or right_rows < 10:
             return 'nested_loop'  # Nested loop for very small tables
-        elif left_rows > 10000 and right_rows > 10000:
-            return 'merge'  # Merge join for large sorted tables
-        else:
-            return 'hash'  # Hash join is default for medium-sized tables
+        elif left_sorted and right_sorted:
+            return 'merge'  # Streams both inputs in constant memory
+        # Merge join: sort whichever input is not ordered, then one linear pass
+        merge_cost = (left_rows + right_rows) * CostFactors.CPU_OPERATOR_COST
+        for rows, ordered in ((left_rows, left_sorted), (right_rows, right_sorted)):
+            if not ordered:
+                merge_cost += rows * math.log2(max(rows, 2)) * CostFactors.CPU_OPERATOR_COST
+                merge_cost += rows * CostFactors.SORT_MEM_COST
+        # Hash join: build on the smaller input, probe with the other
+        hash_cost = (left_rows + right_rows) * CostFactors.CPU_OPERATOR_COST
+        hash_cost += min(left_rows, right_rows) * CostFactors.HASH_MEM_COST
+        return 'merge' if merge_cost < hash_cost else 'hash'
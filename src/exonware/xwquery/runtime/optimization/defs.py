@@ -25,8 +25,9 @@ class PlanNodeType(Enum):
     # Aggregation
     AGGREGATE = auto()
     GROUP_BY = auto()
-    # Sorting
+    # Sorting and limiting
     SORT = auto()
+    LIMIT = auto()
     # Set operations
     UNION = auto()
     INTERSECT = auto()
@@ -38,6 +39,8 @@ class PlanNodeType(Enum):
     # Subquery
     SUBQUERY = auto()
     MATERIALIZED_SUBQUERY = auto()
+    # Executor-backed operation the planner does not model (optimization barrier)
+    OPERATION = auto()
 
 
 class JoinType(Enum):
@@ -20,6 +20,9 @@ from .rules import (
     PredicatePushdownRule,
     ProjectionPushdownRule,
     IndexSelectionRule,
+    TopNRule,
+    AggregateFusionRule,
+    JoinAlgorithmRule,
 )
 
 
@@ -46,8 +49,11 @@ class QueryOptimizer(AOptimizer):
             # Basic rules
             self.add_rule(PredicatePushdownRule())
             self.add_rule(ProjectionPushdownRule())
+            self.add_rule(TopNRule())
+            self.add_rule(AggregateFusionRule())
         if self._optimization_level in [OptimizationLevel.STANDARD, OptimizationLevel.AGGRESSIVE]:
             # Standard rules
+            self.add_rule(JoinAlgorithmRule(self._cost_model))
             if self._statistics_manager:
                 self.add_rule(IndexSelectionRule(self._statistics_manager))
         if self._optimization_level == OptimizationLevel.AGGRESSIVE:
@@ -0,0 +1,203 @@
+"""
+Query Plan Pipeline
+Runs a parsed QueryAction tree through planning and optimization:
+action tree -> logical plan -> optimization rules -> physical plan -> action tree.
+The lowered tree is what the execution engines run, so every optimization
+rule that rewrites the plan (e.g. predicate pushdown) changes execution order.
+**Company:** eXonware.com
+**Author:** eXonware Backend Team
+**Version:** 0.0.1.6
+**Generation Date:** 16-Oct-2026
+"""
+
+from __future__ import annotations
+import asyncio
+import logging
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+from .contracts import IExecutionPlan, IOptimizer, IQueryPlanner, IPlanNode
+from .defs import OptimizationLevel, PlanNodeType
+from .optimizer import QueryOptimizer
+from .query_planner import QueryPlanner
+from ...contracts import QueryAction
+logger = logging.getLogger(__name__)
+T = TypeVar('T')
+# Plan node types that lower to a scan action carrying a pushed-down filter
+_SCAN_TYPES = (PlanNodeType.SEQUENTIAL_SCAN.name, PlanNodeType.INDEX_SCAN.name)
+# Plan node types that lower to a JOIN action carrying the chosen algorithm
+_JOIN_TYPES = (PlanNodeType.HASH_JOIN.name, PlanNodeType.MERGE_JOIN.name)
+
+
+def _run_sync(factory: Callable[[], Awaitable[T]]) -> T:
+    """
+    Run a planner/optimizer coroutine from synchronous code.
+    Planning is CPU-only, so the coroutine normally completes on its first
+    step and no event loop is needed. If it does suspend (e.g. a statistics
+    manager doing I/O), it is re-run on an event loop - in a worker thread
+    when the caller is already inside one.
+    """
+    coro = factory()
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(factory())
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, factory()).result()
+
+
+class QueryPlanPipeline:
+    """
+    Plan-then-execute front end for the execution engines.
+    Builds a logical plan from a QueryAction tree, applies the optimizer's
+    rule set, lowers it to a physical plan and converts that back into a
+    QueryAction tree in execution order.
+    """
+
+    def __init__(
+        self,
+        planner: IQueryPlanner | None = None,
+        optimizer: IOptimizer | None = None,
+        optimization_level: OptimizationLevel = OptimizationLevel.STANDARD
+    ):
+        self._planner = planner or QueryPlanner(optimization_level=optimization_level)
+        self._optimizer = optimizer or QueryOptimizer(optimization_level=optimization_level)
+
+    async def plan(self, action_tree: QueryAction, storage_connection: Any | None = None) -> IExecutionPlan:
+        """
+        Create the optimized physical plan for an action tree.
+        Args:
+            action_tree: Parsed QueryAction tree (ROOT/PROGRAM or single action)
+            storage_connection: Optional XWStorage connection for capability-aware planning
+        Returns:
+            Physical plan; `metadata['rewritten']` tells whether any rule changed it
+        """
+        logical_plan = await self._planner.create_logical_plan(action_tree)
+        optimized_plan = await self._optimizer.optimize(logical_plan)
+        physical_plan = await self._planner.create_physical_plan(optimized_plan, storage_connection)
+        physical_plan.metadata['rewritten'] = optimized_plan is not logical_plan
+        return physical_plan
+
+    def lower(self, plan: IExecutionPlan, action_tree: QueryAction) -> QueryAction:
+        """
+        Convert a physical plan back into an executable QueryAction tree.
+        Args:
+            plan: Physical plan produced by `plan()`
+            action_tree: The tree the plan was built from (supplies the root)
+        Returns:
+            QueryAction tree whose stages follow the plan's execution order
+        """
+        stages = self._lower_node(plan.get_root_node())
+        if action_tree.type not in ("ROOT", "PROGRAM") and len(stages) == 1:
+            return stages[0]
+        lowered = QueryAction(
+            type=action_tree.type if action_tree.type in ("ROOT", "PROGRAM") else "PROGRAM",
+            params=dict(action_tree.params),
+            id=action_tree.id or 'root',
+            line_number=action_tree.line_number,
+            metadata={**action_tree.metadata, 'optimized': True, 'estimated_cost': plan.get_estimated_cost()}
+        )
+        for stage in stages:
+            lowered.add_child(stage)
+        return lowered
+
+    def optimize(self, action_tree: QueryAction) -> QueryAction:
+        """
+        Plan, optimize and lower an action tree.
+        Returns the original tree unchanged when no rule rewrote the plan.
+        """
+        plan = _run_sync(lambda: self.plan(action_tree))
+        if not plan.metadata.get('rewritten'):
+            return action_tree
+        return self.lower(plan, action_tree)
+
+    def _lower_node(self, node: IPlanNode) -> list[QueryAction]:
+        """Lower a plan node (inputs first) to the list of actions to run."""
+        stages: list[QueryAction] = []
+        for child in node.get_children():
+            stages.extend(self._lower_node(child))
+        props = node.get_properties()
+        action = props.get('action')
+        if action is None:
+            return stages
+        condition = props.get('filter')
+        if condition is not None and node.get_type() in _SCAN_TYPES:
+            action = self._with_params(action, {'where': condition}, 'pushed_filter')
+        top_n = props.get('top_n')
+        if top_n is not None and node.get_type() == PlanNodeType.SORT.name:
+            action = self._with_params(action, {'top_n': top_n}, 'fused_limit')
+        if props.get('fused_aggregates') and node.get_type() == PlanNodeType.GROUP_BY.name:
+            fused = {'aggregates': props.get('aggregates') or []}
+            if props.get('having') is not None:
+                fused['having'] = props['having']
+            action = self._with_params(action, fused, 'fused_aggregates')
+        if props.get('join_algorithm') and node.get_type() in _JOIN_TYPES:
+            algorithm = {'algorithm': props['join_algorithm'], 'presorted': list(props.get('presorted') or [])}
+            action = self._with_params(action, algorithm, 'join_algorithm')
+        stages.append(action)
+        return stages
+
+    def _with_params(self, action: QueryAction, params: dict[str, Any], flag: str) -> QueryAction:
+        """Copy an action with rewritten params, flagging the rewrite in its metadata."""
+        lowered = QueryAction(
+            type=action.type,
+            params={**action.params, **params},
+            id=action.id,
+            line_number=action.line_number,
+            metadata={**action.metadata, flag: True}
+        )
+        for child in action.get_children():
+            lowered.add_child(child)
+        return lowered
+_global_pipeline: QueryPlanPipeline | None = None
+_global_lock = threading.Lock()
+
+
+def get_plan_pipeline() -> QueryPlanPipeline:
+    """Get the global query plan pipeline instance."""
+    global _global_pipeline
+    if _global_pipeline is None:
+        with _global_lock:
+            if _global_pipeline is None:
+                _global_pipeline = QueryPlanPipeline()
+    return _global_pipeline
+
+
+def is_optimization_enabled(options: dict[str, Any] | None = None) -> bool:
+    """
+    Check whether plan optimization should run.
+    The `optimize` execution option wins; otherwise
+    `XWQueryConfig.enable_optimization` decides.
+    """
+    if options and 'optimize' in options:
+        return bool(options['optimize'])
+    try:
+        from ...config import get_config
+        return bool(get_config().enable_optimization)
+    except Exception:
+        return False
+
+
+def optimize_action_tree(action_tree: QueryAction) -> QueryAction:
+    """
+    Run an action tree through the global plan pipeline.
+    Optimization must never make a valid query fail: if planning raises,
+    the original tree is returned and executed as written.
+    """
+    try:
+        return get_plan_pipeline().optimize(action_tree)
+    except Exception as e:  # noqa: BLE001 - fall back to the unoptimized tree
+        logger.debug(f"Query plan optimization skipped: {e}")
+        return action_tree
+__all__ = [
+    'QueryPlanPipeline',
+    'get_plan_pipeline',
+    'is_optimization_enabled',
+    'optimize_action_tree',
+]
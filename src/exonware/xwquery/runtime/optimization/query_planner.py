@@ -36,7 +36,7 @@ class QueryPlanner(AQueryPlanner):
         Logical plans are database-independent and focus on WHAT to do,
         not HOW to do it.
         """
-        if not hasattr(action_tree, 'action_type'):
+        if self._get_action_type(action_tree) is None:
             raise ValueError("Invalid action tree: missing action_type")
         root_node = await self._build_logical_node(action_tree)
         plan = ExecutionPlan(
@@ -71,11 +71,69 @@ class QueryPlanner(AQueryPlanner):
         )
         return plan
 
+    def _get_action_type(self, action: Any) -> str | None:
+        """Get the action type of a QueryAction (`type`) or legacy action (`action_type`)"""
+        if isinstance(getattr(action, 'params', None), dict) and isinstance(getattr(action, 'type', None), str):
+            return action.type
+        return getattr(action, 'action_type', None)
+
+    def _get_param(self, action: Any, *names: str, default: Any = None) -> Any:
+        """
+        Get the first non-empty parameter of an action.
+        QueryActions keep parameters in `params`; legacy actions expose them
+        as attributes.
+        """
+        params = getattr(action, 'params', None)
+        for name in names:
+            if isinstance(params, dict):
+                value = params.get(name)
+            else:
+                value = getattr(action, name, None)
+            if value not in (None, '', [], {}):
+                return value
+        return default
+
+    def _get_filter_condition(self, action: Any) -> Any:
+        """
+        Get the predicate of a WHERE/FILTER action.
+        The script parser stores a standalone WHERE condition directly in
+        `params` ({'field', 'operator', 'value'}) rather than under a key.
+        """
+        condition = self._get_param(action, 'condition', 'where')
+        if condition is None:
+            params = getattr(action, 'params', None)
+            if isinstance(params, dict) and 'field' in params and 'operator' in params:
+                condition = {k: params[k] for k in ('field', 'operator', 'value') if k in params}
+        return condition
+
+    async def _build_pipeline_node(self, root: Any) -> PlanNode:
+        """
+        Build a plan for a ROOT/PROGRAM pipeline.
+        Each statement consumes the output of the previous one, so the
+        previous stage becomes the first child of the next stage's node.
+        """
+        children = root.get_children() if hasattr(root, 'get_children') else []
+        node: PlanNode | None = None
+        for stage in children:
+            stage_node = await self._build_logical_node(stage)
+            if node is not None:
+                stage_node.children.insert(0, node)
+            node = stage_node
+        if node is None:
+            return PlanNode(
+                node_type=PlanNodeType.OPERATION,
+                properties={'action': root},
+                estimated_rows=0
+            )
+        return node
+
     async def _build_logical_node(self, action: Any) -> PlanNode:
         """Build logical plan node from action"""
-        action_type = action.action_type
+        action_type = self._get_action_type(action)
         # Map action types to logical plan node types
-        if action_type == "SELECT":
+        if action_type in ("ROOT", "PROGRAM"):
+            return await self._build_pipeline_node(action)
+        elif action_type == "SELECT":
             return await self._build_select_node(action)
         elif action_type == "INSERT":
             return self._build_insert_node(action)
@@ -89,12 +147,15 @@ class QueryPlanner(AQueryPlanner):
             return await self._build_filter_node(action)
         elif action_type == "GROUP":
             return self._build_group_node(action)
-        elif action_type == "ORDER":
+        elif action_type in ("ORDER", "ORDER_BY", "ORDER BY"):
             return self._build_sort_node(action)
+        elif action_type == "LIMIT":
+            return self._build_limit_node(action)
         else:
-            # Default handling for other action types
+            # Default handling for other action types: executed as-is, and
+            # rules must not move predicates across it
             return PlanNode(
-                node_type=PlanNodeType.SEQUENTIAL_SCAN,
+                node_type=PlanNodeType.OPERATION,
                 properties={'action': action},
                 estimated_rows=1000  # Default estimate
             )
@@ -102,13 +163,22 @@ class QueryPlanner(AQueryPlanner):
     async def _build_select_node(self, action: Any) -> PlanNode:
         """Build SELECT node"""
         # Determine source (table or subquery)
-        source = getattr(action, 'source', None)
+        source = self._get_param(action, 'source', 'from', 'path', 'from_clause')
+        columns = self._get_param(action, 'columns', 'fields', 'select_list', default=['*'])
+        # A scan only absorbs a later filter when doing so cannot change the
+        # result: no own predicate, no ordering/limiting/grouping and no
+        # projection that could rename or drop the filtered field
+        accepts_filter = columns in ('*', ['*']) and not any(
+            self._get_param(action, name)
+            for name in ('where', 'where_clause', 'order_by', 'limit', 'offset', 'distinct', 'group_by', 'having')
+        )
         # Create scan node
         node = PlanNode(
             node_type=PlanNodeType.SEQUENTIAL_SCAN,
             properties={
                 'source': source,
-                'columns': getattr(action, 'columns', ['*']),
+                'columns': columns,
+                'accepts_filter': accepts_filter,
                 'action': action
             }
         )
@@ -140,8 +210,8 @@ class QueryPlanner(AQueryPlanner):
         return PlanNode(
             node_type=PlanNodeType.INSERT,
             properties={
-                'table': getattr(action, 'table', None),
-                'values': getattr(action, 'values', []),
+                'table': self._get_param(action, 'table', 'into'),
+                'values': self._get_param(action, 'values', default=[]),
                 'action': action
             },
             estimated_rows=1,
@@ -153,8 +223,8 @@ class QueryPlanner(AQueryPlanner):
         return PlanNode(
             node_type=PlanNodeType.UPDATE,
             properties={
-                'table': getattr(action, 'table', None),
-                'updates': getattr(action, 'updates', {}),
+                'table': self._get_param(action, 'table', 'target'),
+                'updates': self._get_param(action, 'updates', 'set', default={}),
                 'action': action
             },
             estimated_rows=100,  # Estimate
@@ -166,7 +236,7 @@ class QueryPlanner(AQueryPlanner):
         return PlanNode(
             node_type=PlanNodeType.DELETE,
             properties={
-                'table': getattr(action, 'table', None),
+                'table': self._get_param(action, 'table', 'target'),
                 'action': action
             },
             estimated_rows=100,  # Estimate
@@ -176,12 +246,13 @@ class QueryPlanner(AQueryPlanner):
     async def _build_join_node(self, action: Any) -> PlanNode:
         """Build JOIN node"""
         # Build child nodes for left and right sides
-        left_action = getattr(action, 'left', None)
-        right_action = getattr(action, 'right', None)
+        left_action = self._get_param(action, 'left')
+        right_action = self._get_param(action, 'right')
         children = []
-        if left_action:
+        # Sides given by name (e.g. a table) are resolved by the executor
+        if left_action is not None and self._get_action_type(left_action):
             children.append(await self._build_logical_node(left_action))
-        if right_action:
+        if right_action is not None and self._get_action_type(right_action):
             children.append(await self._build_logical_node(right_action))
         # Estimate join result size
         left_rows = children[0].estimated_rows if children else 1000
@@ -190,8 +261,8 @@ class QueryPlanner(AQueryPlanner):
         node = PlanNode(
             node_type=PlanNodeType.HASH_JOIN,
             properties={
-                'join_type': getattr(action, 'join_type', 'inner'),
-                'condition': getattr(action, 'condition', None),
+                'join_type': self._get_param(action, 'join_type', default='inner'),
+                'condition': self._get_param(action, 'condition', 'on'),
                 'action': action
             },
             children=children,
@@ -215,16 +286,17 @@ class QueryPlanner(AQueryPlanner):
     async def _build_filter_node(self, action: Any) -> PlanNode:
         """Build FILTER node"""
         # Build child node
-        child_action = getattr(action, 'source', None)
+        child_action = self._get_param(action, 'source')
+        condition = self._get_filter_condition(action)
         children = []
-        if child_action:
+        if child_action is not None and self._get_action_type(child_action):
             children.append(await self._build_logical_node(child_action))
         # Estimate selectivity
         selectivity = 0.1  # Default 10% selectivity
         if self._statistics_manager and child_action:
             try:
-                source = getattr(child_action, 'source', None)
-                predicate = getattr(action, 'condition', None)
+                source = self._get_param(child_action, 'source', 'from', 'path')
+                predicate = condition
                 if source and predicate:
                     selectivity = await self._statistics_manager.estimate_selectivity(
                         source, predicate
@@ -236,8 +308,10 @@ class QueryPlanner(AQueryPlanner):
         return PlanNode(
             node_type=PlanNodeType.FILTER,
             properties={
-                'condition': getattr(action, 'condition', None),
+                'condition': condition,
                 'selectivity': selectivity,
+                # Scan executors compile any declarative predicate (see executors/predicates.py)
+                'pushable': condition is not None and not callable(condition),
                 'action': action
             },
             children=children,
@@ -250,8 +324,8 @@ class QueryPlanner(AQueryPlanner):
         return PlanNode(
             node_type=PlanNodeType.GROUP_BY,
             properties={
-                'group_by': getattr(action, 'group_by', []),
-                'aggregates': getattr(action, 'aggregates', []),
+                'group_by': self._get_param(action, 'group_by', 'fields', default=[]),
+                'aggregates': self._get_param(action, 'aggregates', default=[]),
                 'action': action
             },
             estimated_rows=100,  # Estimate
@@ -263,14 +337,28 @@ class QueryPlanner(AQueryPlanner):
         return PlanNode(
             node_type=PlanNodeType.SORT,
             properties={
-                'order_by': getattr(action, 'order_by', []),
-                'direction': getattr(action, 'direction', 'ASC'),
+                'order_by': self._get_param(action, 'order_by', 'fields', default=[]),
+                'direction': self._get_param(action, 'direction', default='ASC'),
                 'action': action
             },
             estimated_rows=1000,  # Estimate
             estimated_cost=100.0  # Sorting is expensive
         )
 
+    def _build_limit_node(self, action: Any) -> PlanNode:
+        """Build LIMIT node"""
+        limit = self._get_param(action, 'limit', default=0)
+        return PlanNode(
+            node_type=PlanNodeType.LIMIT,
+            properties={
+                'limit': limit,
+                'offset': self._get_param(action, 'offset', default=0),
+                'action': action
+            },
+            estimated_rows=limit or 1000,
+            estimated_cost=1.0
+        )
+
     async def _build_physical_node(
         self,
         logical_node: PlanNode,
@@ -7,8 +7,10 @@ Individual optimization rules that can be applied to execution plans.
 """
 
 from copy import deepcopy
+from typing import Any
 from .base import AOptimizationRule, ExecutionPlan, PlanNode
 from .contracts import IExecutionPlan, IPlanNode, IStatisticsManager
+from .cost_model import SimpleCostModel
 from .defs import PlanNodeType, ScanType
 
 
@@ -30,7 +32,7 @@ class PredicatePushdownRule(AOptimizationRule):
         """Apply predicate pushdown"""
         root = plan.get_root_node()
         optimized_root = self._pushdown_filters(root)
-        if optimized_root != root:
+        if optimized_root is not root:
             return ExecutionPlan(
                 root=optimized_root,
                 plan_type=plan.plan_type,
@@ -40,40 +42,73 @@ class PredicatePushdownRule(AOptimizationRule):
 
     def _has_pushable_filter(self, node: IPlanNode) -> bool:
         """Check if node or its children have pushable filters"""
-        if node.get_type() == PlanNodeType.FILTER.name:
-            children = node.get_children()
-            if children and children[0].get_type() != PlanNodeType.SEQUENTIAL_SCAN.name:
-                return True
+        if node.get_type() == PlanNodeType.FILTER.name and self._can_push(node):
+            return True
         for child in node.get_children():
             if self._has_pushable_filter(child):
                 return True
         return False
 
+    def _can_push(self, node: IPlanNode) -> bool:
+        """
+        Check if a filter can move below its (single) input.
+        Filters commute with sorts, and merge into scans that accept them;
+        any other operator (limit, grouping, opaque operations) is a barrier.
+        """
+        children = node.get_children()
+        if len(children) != 1:
+            return False
+        child = children[0]
+        if child.get_type() == PlanNodeType.SORT.name:
+            return True
+        if child.get_type() == PlanNodeType.SEQUENTIAL_SCAN.name:
+            return bool(
+                node.get_properties().get('pushable', True) and
+                child.get_properties().get('accepts_filter', True)
+            )
+        return False
+
     def _pushdown_filters(self, node: IPlanNode) -> IPlanNode:
         """Recursively push down filters"""
         if not isinstance(node, PlanNode):
             return node
         # If this is a filter node
-        if node.node_type == PlanNodeType.FILTER:
-            children = node.get_children()
-            if children:
-                child = children[0]
-                # Try to merge filter with child scan
-                if isinstance(child, PlanNode) and child.node_type == PlanNodeType.SEQUENTIAL_SCAN:
-                    # Merge filter into scan
-                    merged = PlanNode(
-                        node_type=PlanNodeType.SEQUENTIAL_SCAN,
-                        properties={
-                            **child.properties,
-                            'filter': node.properties.get('condition')
-                        },
-                        estimated_rows=node.estimated_rows,
-                        estimated_cost=child.estimated_cost + node.estimated_cost
-                    )
-                    return merged
+        if node.node_type == PlanNodeType.FILTER and self._can_push(node):
+            child = node.get_children()[0]
+            if isinstance(child, PlanNode) and child.node_type == PlanNodeType.SORT:
+                # Filter before sorting: same rows, fewer of them to sort
+                pushed = self._pushdown_filters(PlanNode(
+                    node_type=PlanNodeType.FILTER,
+                    properties=node.properties.copy(),
+                    children=list(child.get_children()),
+                    estimated_rows=node.estimated_rows,
+                    estimated_cost=node.estimated_cost
+                ))
+                return PlanNode(
+                    node_type=PlanNodeType.SORT,
+                    properties=child.properties.copy(),
+                    children=[pushed],
+                    estimated_rows=node.estimated_rows,
+                    estimated_cost=child.estimated_cost * node.properties.get('selectivity', 1.0)
+                )
+            if isinstance(child, PlanNode) and child.node_type == PlanNodeType.SEQUENTIAL_SCAN:
+                # Merge filter into scan
+                condition = node.properties.get('condition')
+                existing = child.properties.get('filter')
+                if existing is not None:
+                    condition = {'type': 'logical', 'operator': 'AND', 'operands': [existing, condition]}
+                properties = {**child.properties, 'filter': condition}
+                merged = PlanNode(
+                    node_type=PlanNodeType.SEQUENTIAL_SCAN,
+                    properties=properties,
+                    children=list(child.get_children()),
+                    estimated_rows=node.estimated_rows,
+                    estimated_cost=child.estimated_cost + node.estimated_cost
+                )
+                return merged
         # Recursively process children
         new_children = [self._pushdown_filters(child) for child in node.get_children()]
-        if new_children != node.get_children():
+        if any(new is not old for new, old in zip(new_children, node.get_children())):
             new_node = PlanNode(
                 node_type=node.node_type,
                 properties=node.properties.copy(),
@@ -253,3 +288,287 @@ class JoinReorderingRule(AOptimizationRule):
         for child in node.get_children():
             count += self._count_joins(child)
         return count
+
+
+class TopNRule(AOptimizationRule):
+    """
+    Fuse LIMIT into the sort below it
+    A sort followed by LIMIT n OFFSET m only needs its first n + m rows, so
+    the sort is annotated with 'top_n' and can use a bounded heap instead of
+    fully sorting rows that the limit throws away.
+    """
+
+    def __init__(self):
+        super().__init__("TopN")
+
+    def is_applicable(self, plan: IExecutionPlan) -> bool:
+        """Check if plan has a LIMIT directly above an unfused SORT"""
+        return self._has_fusable_limit(plan.get_root_node())
+
+    async def apply(self, plan: IExecutionPlan) -> IExecutionPlan | None:
+        """Apply Top-N fusion"""
+        root = plan.get_root_node()
+        optimized_root = self._fuse_limits(root)
+        if optimized_root is not root:
+            return ExecutionPlan(
+                root=optimized_root,
+                plan_type=plan.plan_type,
+                optimization_level=plan.optimization_level
+            )
+        return None
+
+    def _top_n(self, node: IPlanNode) -> int | None:
+        """Rows the sort under this LIMIT node must produce, or None if not fusable"""
+        if node.get_type() != PlanNodeType.LIMIT.name or len(node.get_children()) != 1:
+            return None
+        child = node.get_children()[0]
+        if child.get_type() != PlanNodeType.SORT.name or 'top_n' in child.get_properties():
+            return None
+        properties = node.get_properties()
+        limit = properties.get('limit')
+        offset = properties.get('offset') or 0
+        if not isinstance(limit, int) or limit <= 0 or not isinstance(offset, int):
+            return None
+        return limit + offset
+
+    def _has_fusable_limit(self, node: IPlanNode) -> bool:
+        """Check if node or its children have a fusable LIMIT"""
+        if self._top_n(node) is not None:
+            return True
+        return any(self._has_fusable_limit(child) for child in node.get_children())
+
+    def _fuse_limits(self, node: IPlanNode) -> IPlanNode:
+        """Recursively annotate sorts under LIMIT with 'top_n'"""
+        if not isinstance(node, PlanNode):
+            return node
+        new_children = [self._fuse_limits(child) for child in node.get_children()]
+        changed = any(new is not old for new, old in zip(new_children, node.get_children()))
+        top_n = self._top_n(node)
+        if top_n is not None and isinstance(new_children[0], PlanNode):
+            sort = new_children[0]
+            new_children[0] = PlanNode(
+                node_type=sort.node_type,
+                properties={**sort.properties, 'top_n': top_n},
+                children=list(sort.get_children()),
+                estimated_rows=min(sort.estimated_rows, top_n),
+                estimated_cost=sort.estimated_cost
+            )
+            changed = True
+        if not changed:
+            return node
+        return PlanNode(
+            node_type=node.node_type,
+            properties=node.properties.copy(),
+            children=new_children,
+            estimated_rows=node.estimated_rows,
+            estimated_cost=node.estimated_cost
+        )
+
+
+class AggregateFusionRule(AOptimizationRule):
+    """
+    Fuse SUM/AVG/COUNT/MIN/MAX/HAVING stages into the GROUP BY below them
+    A GROUP followed by aggregate stages would otherwise keep every row of
+    every group so the later stages can re-scan them. Fused, the GROUP
+    computes each aggregate with running accumulators while it streams its
+    input (see executors/aggregates.py) and applies HAVING to the result.
+    """
+    AGGREGATE_STAGES = ('SUM', 'AVG', 'COUNT', 'MIN', 'MAX')
+
+    def __init__(self):
+        super().__init__("AggregateFusion")
+
+    def is_applicable(self, plan: IExecutionPlan) -> bool:
+        """Check if plan has an aggregate or HAVING stage directly above GROUP BY"""
+        return self._has_fusable_stage(plan.get_root_node())
+
+    async def apply(self, plan: IExecutionPlan) -> IExecutionPlan | None:
+        """Apply aggregate fusion"""
+        root = plan.get_root_node()
+        optimized_root = self._fuse_aggregates(root)
+        if optimized_root is not root:
+            return ExecutionPlan(
+                root=optimized_root,
+                plan_type=plan.plan_type,
+                optimization_level=plan.optimization_level
+            )
+        return None
+
+    def _stage(self, node: IPlanNode) -> tuple[str, dict] | None:
+        """(stage type, params) of a stage fusable into its GROUP BY child, or None"""
+        if node.get_type() != PlanNodeType.OPERATION.name or len(node.get_children()) != 1:
+            return None
+        if node.get_children()[0].get_type() != PlanNodeType.GROUP_BY.name:
+            return None
+        action = node.get_properties().get('action')
+        stage_type = str(getattr(action, 'type', '')).upper()
+        params = getattr(action, 'params', None) or {}
+        if stage_type in self.AGGREGATE_STAGES:
+            return stage_type, params
+        if stage_type == 'HAVING' and not node.get_children()[0].get_properties().get('having'):
+            condition = params.get('condition', params.get('having'))
+            # Callables filter the legacy group shape; keep them as their own stage
+            if condition is not None and not callable(condition):
+                return stage_type, params
+        return None
+
+    def _has_fusable_stage(self, node: IPlanNode) -> bool:
+        """Check if node or its children have a fusable aggregate stage"""
+        if self._stage(node) is not None:
+            return True
+        return any(self._has_fusable_stage(child) for child in node.get_children())
+
+    def _fuse_aggregates(self, node: IPlanNode) -> IPlanNode:
+        """Recursively replace aggregate stages with an annotated GROUP BY"""
+        if not isinstance(node, PlanNode):
+            return node
+        new_children = [self._fuse_aggregates(child) for child in node.get_children()]
+        changed = any(new is not old for new, old in zip(new_children, node.get_children()))
+        if changed:
+            node = PlanNode(
+                node_type=node.node_type,
+                properties=node.properties.copy(),
+                children=new_children,
+                estimated_rows=node.estimated_rows,
+                estimated_cost=node.estimated_cost
+            )
+        stage = self._stage(node)
+        if stage is None or not isinstance(new_children[0], PlanNode):
+            return node
+        stage_type, params = stage
+        group = new_children[0]
+        properties = {**group.properties, 'fused_aggregates': True}
+        if stage_type == 'HAVING':
+            properties['having'] = params.get('condition', params.get('having'))
+        else:
+            field = params.get('field', params.get('column'))
+            aggregate = {'function': stage_type, 'field': field, 'alias': params.get('alias')}
+            properties['aggregates'] = list(group.properties.get('aggregates') or []) + [aggregate]
+        return PlanNode(
+            node_type=group.node_type,
+            properties=properties,
+            children=list(group.get_children()),
+            estimated_rows=group.estimated_rows,
+            estimated_cost=group.estimated_cost
+        )
+
+
+class JoinAlgorithmRule(AOptimizationRule):
+    """
+    Choose the physical join algorithm from the ordering of the join inputs
+    A join input produced by an ORDER BY (or an ordered scan) on the join key
+    arrives sorted; the cost model then decides between a hash join and a
+    streaming sort-merge join (range predicates always merge). The choice and
+    the sorted sides are recorded on the join node, which becomes a
+    MERGE_JOIN when merging wins, so the executor neither re-sorts nor
+    hashes ordered inputs.
+    """
+
+    def __init__(self, cost_model: Any | None = None):
+        super().__init__("JoinAlgorithm")
+        self._cost_model = cost_model if hasattr(cost_model, 'choose_join_algorithm') else SimpleCostModel()
+
+    def is_applicable(self, plan: IExecutionPlan) -> bool:
+        """Check if plan has a join over an ordered input"""
+        return self._has_ordered_join(plan.get_root_node())
+
+    async def apply(self, plan: IExecutionPlan) -> IExecutionPlan | None:
+        """Apply join algorithm selection"""
+        root = plan.get_root_node()
+        optimized_root = self._choose_algorithms(root)
+        if optimized_root is not root:
+            return ExecutionPlan(
+                root=optimized_root,
+                plan_type=plan.plan_type,
+                optimization_level=plan.optimization_level
+            )
+        return None
+
+    def _join_fields(self, node: IPlanNode) -> tuple[list[str], list[str], bool] | None:
+        """(left order fields, right order fields, equi join) of an undecided join node"""
+        if node.get_type() != PlanNodeType.HASH_JOIN.name or 'join_algorithm' in node.get_properties():
+            return None
+        from ..executors.joins import parse_join_condition
+        action = node.get_properties().get('action')
+        params = getattr(action, 'params', None) or {}
+        condition = node.get_properties().get('condition') or params.get('on', params.get('join_on'))
+        if not condition:
+            return None
+        left_keys, right_keys, ranges = parse_join_condition(condition)
+        if ranges:
+            return [ranges[0].left_field], [ranges[0].right_field], False
+        if not left_keys:
+            return None
+        return left_keys, right_keys, True
+
+    def _ordered_on(self, node: IPlanNode, fields: list[str]) -> bool:
+        """Check if a plan node outputs rows ascending on `fields`"""
+        from ..executors.sorting import parse_order_by
+        properties = node.get_properties()
+        if node.get_type() == PlanNodeType.SORT.name:
+            order_by = properties.get('order_by')
+            if str(properties.get('direction') or 'ASC').upper().startswith('DESC'):
+                return False
+        elif node.get_type() in (PlanNodeType.SEQUENTIAL_SCAN.name, PlanNodeType.INDEX_SCAN.name):
+            order_by = (getattr(properties.get('action'), 'params', None) or {}).get('order_by')
+        else:
+            return False
+        try:
+            specs = parse_order_by(order_by)
+        except Exception:
+            return False
+        if len(specs) < len(fields):
+            return False
+        return all(spec.field == field and not spec.descending for spec, field in zip(specs, fields))
+
+    def _ordered_sides(self, node: IPlanNode) -> list[str]:
+        """Join sides ('left'/'right') whose input is ordered on the join key"""
+        fields = self._join_fields(node)
+        if fields is None:
+            return []
+        children = node.get_children()
+        sides = []
+        if children and self._ordered_on(children[0], fields[0]):
+            sides.append('left')
+        if len(children) > 1 and self._ordered_on(children[1], fields[1]):
+            sides.append('right')
+        return sides
+
+    def _has_ordered_join(self, node: IPlanNode) -> bool:
+        """Check if node or its children are a join over an ordered input"""
+        if self._ordered_sides(node):
+            return True
+        return any(self._has_ordered_join(child) for child in node.get_children())
+
+    def _choose_algorithms(self, node: IPlanNode) -> IPlanNode:
+        """Recursively annotate joins over ordered inputs with their algorithm"""
+        if not isinstance(node, PlanNode):
+            return node
+        new_children = [self._choose_algorithms(child) for child in node.get_children()]
+        changed = any(new is not old for new, old in zip(new_children, node.get_children()))
+        sides = self._ordered_sides(node)
+        if not changed and not sides:
+            return node
+        properties = node.properties.copy()
+        node_type = node.node_type
+        if sides:
+            children = node.get_children()
+            _, _, equi_join = self._join_fields(node)
+            algorithm = self._cost_model.choose_join_algorithm(
+                children[0].estimated_rows if children else 1000,
+                children[1].estimated_rows if len(children) > 1 else 1000,
+                left_sorted='left' in sides,
+                right_sorted='right' in sides,
+                equi_join=equi_join
+            )
+            algorithm = 'merge' if algorithm == 'merge' else 'hash'
+            properties.update({'join_algorithm': algorithm, 'presorted': sides})
+            if algorithm == 'merge':
+                node_type = PlanNodeType.MERGE_JOIN
+        return PlanNode(
+            node_type=node_type,
+            properties=properties,
+            children=new_children,
+            estimated_rows=node.estimated_rows,
+            estimated_cost=node.estimated_cost
+        )
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/src/exonware/xwquery/runtime/streaming.py
+Pull-based (Volcano-style) row streaming for the runtime.
+Executors that support streaming expose `iter_execute()`, which yields row
+batches instead of a fully materialized list. The execution engine chains
+those generators lazily, so a downstream LIMIT stops pulling from the scan as
+soon as it has enough rows.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.9.0.5
+Generation Date: 16-Oct-2026
+"""
+
+from __future__ import annotations
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Any
+# Default number of rows per batch when neither options nor config specify one
+DEFAULT_BATCH_SIZE = 1000
+
+
+def iter_batches(rows: Iterable[Any], batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[list[Any]]:
+    """
+    Group an iterable of rows into lists of at most `batch_size` rows.
+    Args:
+        rows: Row iterable (consumed lazily)
+        batch_size: Maximum rows per batch
+    Yields:
+        Non-empty row batches
+    """
+    if batch_size <= 0:
+        batch_size = DEFAULT_BATCH_SIZE
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+class RowStream:
+    """
+    Single-pass, lazily evaluated stream of rows backed by a batch iterator.
+    A RowStream is what a streaming stage places in `ExecutionContext.node`
+    for the next stage. Iterating it yields rows; `batches()` yields the
+    underlying batches; `materialize()` drains it into a list for stages that
+    need the whole input (e.g. ORDER BY, GROUP BY).
+    """
+    __slots__ = ('_batches', '_consumed', 'rows_produced', 'batch_size')
+
+    def __init__(self, batches: Iterable[list[Any]], batch_size: int | None = None):
+        self._batches = iter(batches)
+        self._consumed = False
+        self.rows_produced = 0
+        # Rows per batch the producer uses (None when unknown); downstream
+        # stages keep it unless the batch_size option overrides it
+        self.batch_size = batch_size
+    @classmethod
+
+    def from_rows(cls, rows: Iterable[Any], batch_size: int = DEFAULT_BATCH_SIZE) -> RowStream:
+        """Create a stream from a row iterable."""
+        return cls(iter_batches(rows, batch_size), batch_size)
+
+    def batches(self) -> Iterator[list[Any]]:
+        """Yield row batches (single pass)."""
+        if self._consumed:
+            return
+        self._consumed = True
+        for batch in self._batches:
+            if batch:
+                self.rows_produced += len(batch)
+                yield batch
+
+    def __iter__(self) -> Iterator[Any]:
+        for batch in self.batches():
+            yield from batch
+
+    def materialize(self) -> list[Any]:
+        """Drain the stream into a list."""
+        rows: list[Any] = []
+        for batch in self.batches():
+            rows.extend(batch)
+        return rows
+
+    def close(self) -> None:
+        """Release the underlying generator chain (stops upstream scans)."""
+        self._consumed = True
+        close = getattr(self._batches, 'close', None)
+        if close is not None:
+            close()
+
+    def __repr__(self) -> str:
+        state = 'consumed' if self._consumed else 'pending'
+        return f"RowStream({state}, rows_produced={self.rows_produced})"
+
+
+def iter_rows(node: Any) -> Iterator[Any]:
+    """
+    Iterate the rows of a stage input without materializing streams.
+    RowStreams and generators are consumed lazily; everything else goes
+    through the shared `extract_items()` normalization used by all executors.
+    """
+    if isinstance(node, RowStream):
+        return iter(node)
+    if isinstance(node, Iterator):
+        return node
+    # Lazy import: runtime.executors imports runtime.base, which imports us
+    from .executors.utils import extract_items
+    return iter(extract_items(node))
+
+
+def resolve_batch_size(options: dict[str, Any] | None = None, node: Any = None) -> int:
+    """
+    Resolve the batch size for a streaming execution.
+    Order of precedence: `batch_size` execution option, then the batch size
+    of the input stream `node`, then `XWQueryConfig.result_batch_size`, then
+    DEFAULT_BATCH_SIZE.
+    """
+    if options and options.get('batch_size'):
+        return int(options['batch_size'])
+    if isinstance(node, RowStream) and node.batch_size:
+        return node.batch_size
+    try:
+        from ..config import get_config
+        return get_config().result_batch_size or DEFAULT_BATCH_SIZE
+    except Exception:
+        return DEFAULT_BATCH_SIZE
+
+
+def is_streaming_enabled(options: dict[str, Any] | None = None) -> bool:
+    """
+    Check whether streaming execution is requested.
+    The `streaming` execution option wins; otherwise
+    `XWQueryConfig.enable_result_streaming` decides.
+    """
+    if options and 'streaming' in options:
+        return bool(options['streaming'])
+    try:
+        from ..config import get_config
+        return bool(get_config().enable_result_streaming)
+    except Exception:
+        return False
+__all__ = [
+    'DEFAULT_BATCH_SIZE',
+    'RowStream',
+    'iter_batches',
+    'iter_rows',
+    'resolve_batch_size',
+    'is_streaming_enabled',
+]
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/tests/0.core/test_streaming_execution.py
+Core tests for pull-based (streaming) execution.
+Validates that streaming executors yield row batches lazily and that LIMIT
+stops pulling from the source once it has enough rows.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.0.1
+Generation Date: 16-Oct-2026
+"""
+
+import pytest
+from exonware.xwquery.runtime.executors import SelectExecutor, WhereExecutor, LimitExecutor, ProjectExecutor
+from exonware.xwquery.runtime.streaming import RowStream, iter_batches, resolve_batch_size
+from exonware.xwquery.contracts import QueryAction, ExecutionContext
+
+
+def _counting_source(n, counter):
+    """Generate n rows, counting how many were actually pulled."""
+    for i in range(n):
+        counter['pulled'] += 1
+        yield {'id': i, 'age': i % 50, 'name': f'user{i}'}
+@pytest.mark.xwquery_core
+
+class TestStreamingExecution:
+    """Core tests for iter_execute() and RowStream."""
+
+    def test_iter_batches_groups_rows(self):
+        """Rows are grouped into batches of at most batch_size."""
+        batches = list(iter_batches(range(7), 3))
+        assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_row_stream_is_single_pass(self):
+        """A RowStream materializes once and is then exhausted."""
+        stream = RowStream.from_rows(range(5), batch_size=2)
+        assert stream.materialize() == [0, 1, 2, 3, 4]
+        assert stream.rows_produced == 5
+        assert stream.materialize() == []
+
+    def test_where_streams_filtered_rows(self):
+        """WHERE filters rows lazily from a stream input."""
+        counter = {'pulled': 0}
+        stream = RowStream.from_rows(_counting_source(100, counter), batch_size=10)
+        action = QueryAction(type='WHERE', params={'condition': {'age': 3}})
+        batches = WhereExecutor().iter_execute(action, ExecutionContext(node=stream))
+        first = next(batches)
+        assert all(row['age'] == 3 for row in first)
+        assert counter['pulled'] < 100
+
+    def test_batch_size_follows_input_stream(self):
+        """Stages keep the input stream's batch size unless the batch_size option is set."""
+        stream = RowStream.from_rows(range(30), batch_size=10)
+        assert resolve_batch_size({}, stream) == 10
+        assert resolve_batch_size({'batch_size': 4}, stream) == 4
+        action = QueryAction(type='PROJECT', params={'fields': ['id']})
+        rows = ({'id': i} for i in range(25))
+        batches = ProjectExecutor().iter_execute(action, ExecutionContext(node=RowStream.from_rows(rows, batch_size=10)))
+        assert [len(batch) for batch in batches] == [10, 10, 5]
+
+    def test_limit_short_circuits_source(self):
+        """LIMIT stops pulling rows from its input once satisfied."""
+        counter = {'pulled': 0}
+        stream = RowStream.from_rows(_counting_source(10_000, counter), batch_size=100)
+        action = QueryAction(type='LIMIT', params={'limit': 5, 'offset': 2})
+        rows = [row for batch in LimitExecutor().iter_execute(action, ExecutionContext(node=stream)) for row in batch]
+        assert [row['id'] for row in rows] == [2, 3, 4, 5, 6]
+        assert counter['pulled'] <= 100
+
+    def test_project_streams_rows(self):
+        """PROJECT yields projected rows rather than a summary dict."""
+        data = [{'id': 1, 'name': 'a', 'age': 10}, {'id': 2, 'name': 'b', 'age': 20}]
+        action = QueryAction(type='PROJECT', params={'fields': ['name']})
+        batches = list(ProjectExecutor().iter_execute(action, ExecutionContext(node=data)))
+        assert batches == [[{'name': 'a'}, {'name': 'b'}]]
+
+    def test_select_limit_short_circuits_scan(self):
+        """SELECT ... WHERE ... LIMIT stops scanning after enough matches."""
+        counter = {'pulled': 0}
+        source = _counting_source(10_000, counter)
+        action = QueryAction(
+            type='SELECT',
+            params={'fields': ['*'], 'where': {'field': 'age', 'operator': '>=', 'value': 10}, 'limit': 3}
+        )
+        result = SelectExecutor().execute(action, ExecutionContext(node=source))
+        assert result.success
+        assert [row['id'] for row in result.data] == [10, 11, 12]
+        assert counter['pulled'] == 13
+
+    def test_select_iter_execute_matches_execute(self):
+        """Streaming and materialized SELECT return the same rows."""
+        data = [{'id': i, 'age': i} for i in range(25)]
+        action = QueryAction(
+            type='SELECT',
+            params={'fields': ['id'], 'where': {'field': 'age', 'operator': '<', 'value': 20}, 'limit': 10, 'offset': 5}
+        )
+        expected = SelectExecutor().execute(action, ExecutionContext(node=data)).data
+        context = ExecutionContext(node=data, options={'batch_size': 4})
+        streamed = [row for batch in SelectExecutor().iter_execute(action, context) for row in batch]
+        assert streamed == expected
+        assert [row['id'] for row in streamed] == list(range(5, 15))
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/tests/1.unit/test_connected_components.py
+Unit tests for union-find and Tarjan connected components.
+Validates weakly/strongly connected components against reachability-based
+references, streaming over edge lists, deep graphs without recursion, and the
+CONNECTED_COMPONENTS executor output (ids, members, size histogram).
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.0.1
+Generation Date: 17-Oct-2026
+"""
+
+import random
+import pytest
+from exonware.xwquery.contracts import QueryAction, ExecutionContext
+from exonware.xwquery.runtime.executors.graph.connected_components_executor import ConnectedComponentsExecutor
+from exonware.xwquery.runtime.executors.graph_algorithms import (
+    UnionFind,
+    edge_list_graph,
+    stream_weakly_connected_components,
+    strongly_connected_components,
+    weakly_connected_components,
+)
+EDGES = [('a', 'b'), ('b', 'c'), ('c', 'a'), ('c', 'd'), ('d', 'e'), ('e', 'd'), ('f', 'g'), ('h', 'h')]
+
+
+class Graph:
+    def __init__(self, edges):
+        self.edges = {}
+        for source, target in edges:
+            self.edges.setdefault(source, []).append(target)
+            self.edges.setdefault(target, [])
+
+    def get_all_vertices(self):
+        return list(self.edges)
+
+    def get_neighbors(self, vertex):
+        return self.edges[vertex]
+
+
+def _reachable(adjacency, start):
+    seen, stack = {start}, [start]
+    while stack:
+        for neighbor in adjacency.get(stack.pop(), ()):
+            if neighbor not in seen:
+                seen.add(neighbor)
+                stack.append(neighbor)
+    return seen
+
+
+def _partition(vertices, labels):
+    groups = {}
+    for vertex, label in zip(vertices, labels):
+        groups.setdefault(label, set()).add(vertex)
+    return sorted(map(sorted, groups.values()))
+
+
+def _random_edges(seed, vertices=60, edges=80):
+    generator = random.Random(seed)
+    return [(generator.randrange(vertices), generator.randrange(vertices)) for _ in range(edges)]
+@pytest.mark.xwquery_unit
+
+class TestConnectedComponents:
+    """Unit tests for graph_algorithms.py and CONNECTED_COMPONENTS."""
+
+    def test_union_find_ranks_and_compresses(self):
+        """Unions report merges once; find returns one representative per set."""
+        sets = UnionFind(6)
+        assert sets.union(0, 1) and sets.union(2, 3) and sets.union(1, 3)
+        assert not sets.union(0, 2)
+        assert sets.labels() == [0, 0, 0, 0, 1, 2]
+        assert len({sets.find(position) for position in range(4)}) == 1
+
+    def test_components_match_reachability(self):
+        """WCC/SCC equal the partitions derived from plain reachability."""
+        for seed in range(5):
+            edges = _random_edges(seed)
+            graph = edge_list_graph(edges)
+            forward, undirected = {}, {}
+            for source, target in edges:
+                forward.setdefault(source, set()).add(target)
+                undirected.setdefault(source, set()).add(target)
+                undirected.setdefault(target, set()).add(source)
+            reach = {vertex: _reachable(forward, vertex) for vertex in graph.vertices}
+            strong = {frozenset(v for v in reach[vertex] if vertex in reach[v]) for vertex in graph.vertices}
+            weak = {frozenset(_reachable(undirected, vertex)) for vertex in graph.vertices}
+            assert _partition(graph.vertices, strongly_connected_components(graph)) == sorted(map(sorted, strong))
+            assert _partition(graph.vertices, weakly_connected_components(graph)) == sorted(map(sorted, weak))
+            vertices, labels = stream_weakly_connected_components(iter(edges))
+            assert _partition(vertices, labels) == sorted(map(sorted, weak))
+
+    def test_deep_cycle_is_one_strong_component(self):
+        """Tarjan's explicit stack handles cycles deeper than the recursion limit."""
+        graph = edge_list_graph([(index, (index + 1) % 20_000) for index in range(20_000)])
+        assert set(strongly_connected_components(graph)) == {0}
+
+    def test_executor_on_graph_and_edge_rows(self):
+        """Graph nodes and edge rows give the same ids, members and histogram."""
+        action = QueryAction(type='CONNECTED_COMPONENTS', params={'mode': 'strong'})
+        data = ConnectedComponentsExecutor().execute(action, ExecutionContext(node=Graph(EDGES))).data
+        assert data['components'] == [['a', 'b', 'c'], ['d', 'e'], ['f'], ['g'], ['h']]
+        assert data['size_histogram'] == {1: 3, 2: 1, 3: 1}
+        assert data['component_ids']['e'] == 1 and data['largest_component_size'] == 3
+        rows = [{'source': source, 'target': target} for source, target in EDGES]
+        weak = ConnectedComponentsExecutor().execute(
+            QueryAction(type='CONNECTED_COMPONENTS', params={'min_size': 2}), ExecutionContext(node=rows)
+        ).data
+        assert (weak['mode'], weak['component_count']) == ('weak', 3)
+        assert weak['components'] == [['a', 'b', 'c', 'd', 'e'], ['f', 'g']]
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/tests/1.unit/test_file_columnar.py
+Unit tests for CSV, Parquet and Arrow IPC file sources.
+Validates typed CSV reading, column pruning to the referenced fields,
+Parquet row groups skipped by statistics (never dropping a matching row),
+Arrow IPC files and streams, and FILE_SOURCE selects, lookups and pages on
+columnar files. Parquet/Arrow tests need pyarrow.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.0.1
+Generation Date: 17-Oct-2026
+"""
+
+import random
+import pytest
+from exonware.xwquery.contracts import QueryAction, ExecutionContext
+from exonware.xwquery.errors import UnsupportedFormatError
+from exonware.xwquery.runtime.executors import file_columnar
+from exonware.xwquery.runtime.executors.data.file_source_executor import FileSourceExecutor
+from exonware.xwquery.runtime.executors.file_columnar import columnar_format, scan_columnar, skippable_row_groups
+from exonware.xwquery.runtime.executors.file_scan import JsonlScan
+from exonware.xwquery.runtime.executors.predicates import compile_predicate
+
+
+def _events(count=2000, seed=1):
+    generator = random.Random(seed)
+    return [
+        {
+            'id': index,
+            'level': generator.choice(['info', 'warn', 'error']),
+            'size': generator.choice([None, *range(100)]),
+            'score': round(generator.random() * 10, 3),
+        }
+        for index in range(count)
+    ]
+
+
+def _write_parquet(path, rows, row_group_size=250):
+    pa = pytest.importorskip('pyarrow')
+    pq = pytest.importorskip('pyarrow.parquet')
+    pq.write_table(pa.Table.from_pylist(rows), str(path), row_group_size=row_group_size)
+    return str(path)
+
+
+def _run(path, **params):
+    action = QueryAction(type='FILE_SOURCE', params={'source': str(path), **params})
+    result = FileSourceExecutor().execute(action, ExecutionContext(node={}))
+    assert result.success, result.error
+    return result
+@pytest.mark.xwquery_unit
+
+class TestFileColumnar:
+    """Unit tests for file_columnar.py and columnar FILE_SOURCE queries."""
+
+    def test_typed_csv(self, tmp_path):
+        """CSV values get inferred (or given) types; unreferenced columns are not read."""
+        path = tmp_path / 'people.csv'
+        path.write_text('\ufeffid,zip,height,vip,name,note\n1,007,1.80,true,ann,x\n2,10115,,FALSE,bob,y\n3,99,2,true,,z\n\n')
+        rows = list(scan_columnar(str(path), JsonlScan()))
+        assert rows[1] == {'id': 2, 'zip': '10115', 'height': None, 'vip': False, 'name': 'bob', 'note': 'y'}
+        assert rows[0]['height'] == 1.8 and rows[2]['name'] == '' and len(rows) == 3
+        scan = JsonlScan(condition='vip = true AND height > 1.9', columns=['name'])
+        assert scan.fields() == {'vip', 'height', 'name'}
+        assert list(scan_columnar(str(path), scan)) == [{'height': 2, 'vip': True, 'name': ''}]
+        typed = list(scan_columnar(str(path), JsonlScan(columns=['zip']), column_types={'zip': 'int'}))
+        assert typed == [{'zip': '007'}, {'zip': 10115}, {'zip': 99}]
+        tsv = tmp_path / 'people.tsv'
+        tsv.write_text('id\tname\n1\tann, jr\n')
+        assert list(scan_columnar(str(tsv), JsonlScan())) == [{'id': 1, 'name': 'ann, jr'}]
+
+    def test_parquet_pruning_and_row_group_skipping(self, tmp_path, monkeypatch):
+        """Only referenced columns are read and row groups outside the WHERE are skipped."""
+        rows = _events()
+        path = _write_parquet(tmp_path / 'events.parquet', rows)
+        scan = JsonlScan(condition="id >= 1500 AND level = 'error'", columns=['id'])
+        found = list(scan_columnar(path, scan))
+        assert found == [{'id': row['id'], 'level': 'error'} for row in rows if row['id'] >= 1500 and row['level'] == 'error']
+        assert scan.stats['row_groups'] == 8 and scan.stats['row_groups_skipped'] == 6
+        assert scan.stats['lines'] == 2000 and scan.stats['prefiltered'] == 1500
+        assert list(scan.projected(found))[:1] == [{'id': found[0]['id']}]
+        monkeypatch.setattr(file_columnar, 'pa', None)
+        with pytest.raises(UnsupportedFormatError):
+            list(scan_columnar(path, JsonlScan()))
+
+    def test_statistics_never_skip_matches(self, tmp_path):
+        """Skipped row groups hold no matching row, for random comparisons."""
+        pq = pytest.importorskip('pyarrow.parquet')
+        rows = sorted(_events(1200, seed=3), key=lambda row: (row['level'], row['score']))
+        path = _write_parquet(tmp_path / 'sorted.parquet', rows, row_group_size=100)
+        metadata = pq.ParquetFile(path).metadata
+        generator = random.Random(5)
+        skipped = 0
+        for _ in range(200):
+            field = generator.choice(['id', 'level', 'size', 'score'])
+            op = generator.choice(['=', '>', '>=', '<', '<=', 'IN', 'BETWEEN', 'IS NULL', 'IS NOT NULL'])
+            value = generator.choice(rows)[field]
+            if op == 'IN':
+                value = [generator.choice(rows)[field] for _ in range(3)]
+            elif op == 'BETWEEN':
+                value = sorted((generator.choice(rows)[field] or 0, generator.choice(rows)[field] or 0), key=str)
+            predicate = compile_predicate({'field': field, 'operator': op, 'value': value})
+            groups = skippable_row_groups(metadata, [(field, op, value)])
+            skipped += len(groups)
+            for group in groups:
+                assert not any(predicate(row) for row in rows[group * 100:(group + 1) * 100]), (field, op, value)
+        assert skipped > 200
+
+    def test_arrow_files_and_streams(self, tmp_path):
+        """Arrow IPC files and streams read the referenced columns."""
+        pa = pytest.importorskip('pyarrow')
+        rows = _events(300)
+        table = pa.Table.from_pylist(rows)
+        for name, open_writer in (('events.arrow', pa.ipc.new_file), ('events.arrows', pa.ipc.new_stream)):
+            path = str(tmp_path / name)
+            with open_writer(path, table.schema) as writer:
+                writer.write_table(table, max_chunksize=64)
+            scan = JsonlScan(condition='size < 10', columns=['id'])
+            found = list(scan.projected(scan_columnar(path, scan)))
+            assert found == [{'id': row['id']} for row in rows if row['size'] is not None and row['size'] < 10]
+        assert columnar_format('x.feather') == 'arrow' and columnar_format('x.jsonl') is None
+
+    def test_file_source_on_columnar_files(self, tmp_path):
+        """FILE_SOURCE selects, looks up and pages Parquet and CSV files."""
+        rows = _events(600)
+        path = _write_parquet(tmp_path / 'events.parquet', rows, row_group_size=100)
+        result = _run(path, where="level = 'warn' AND id < 300", columns=['id', 'score'], order_by='score DESC', limit=5)
+        expected = sorted((row for row in rows if row['level'] == 'warn' and row['id'] < 300), key=lambda row: -row['score'])
+        assert result.data == [{'id': row['id'], 'score': row['score']} for row in expected[:5]]
+        assert result.metadata['scan_stats']['row_groups_skipped'] == 3
+        assert _run(path, operation='get_by_id', id=42).data == rows[42]
+        assert [row['id'] for row in _run(path, operation='get_by_id', ids=[420, 7]).data] == [7, 420]
+        assert [row['id'] for row in _run(path, operation='get_page', page=2, size=10).data] == list(range(20, 30))
+        csv_path = tmp_path / 'events.csv'
+        csv_path.write_text('id,level\n' + ''.join(f"{row['id']},{row['level']}\n" for row in rows))
+        assert _run(csv_path, operation='get_by_id', id=5).data == {'id': 5, 'level': rows[5]['level']}
+        assert len(_run(csv_path, where="level = 'info'", operation='stream').data) == sum(
+            row['level'] == 'info' for row in rows
+        )
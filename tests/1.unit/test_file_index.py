@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/tests/1.unit/test_file_index.py
+Unit tests for persistent JSONL indexes.
+Validates sidecar persistence and reload, incremental extension on append
+(including a completed partial last line), rebuilds on rewrites and corrupt
+sidecars, the LRU bound and in-memory fallback, and FILE_SOURCE lookups.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.0.1
+Generation Date: 17-Oct-2026
+"""
+
+import json
+import os
+import pytest
+from exonware.xwquery.contracts import QueryAction, ExecutionContext
+from exonware.xwquery.runtime.executors.data.file_source_executor import FileSourceExecutor
+from exonware.xwquery.runtime.executors.file_index import INDEX_SUFFIX, JsonlIndex, forget_index, open_index
+
+
+def _lines(records):
+    return ''.join(json.dumps(record) + '\n' for record in records)
+
+
+def _users(start, stop):
+    return [{'id': f'u{index}', 'n': index, 'pad': 'x' * (index % 7)} for index in range(start, stop)]
+
+
+def _fresh(path, index_dir=None):
+    """An index as a new process would open it."""
+    index = JsonlIndex(str(path), index_dir)
+    index.refresh()
+    return index
+
+
+def _run(path, options=None, **params):
+    action = QueryAction(type='FILE_SOURCE', params={'source': str(path), **params})
+    result = FileSourceExecutor().execute(action, ExecutionContext(node={}, options=options or {}))
+    assert result.success, result.error
+    return result
+@pytest.mark.xwquery_unit
+
+class TestFileIndex:
+    """Unit tests for file_index.py and FILE_SOURCE lookups."""
+
+    def test_persist_and_reload(self, tmp_path):
+        """A second process loads the sidecar instead of rescanning."""
+        path = tmp_path / 'users.jsonl'
+        path.write_text(_lines(_users(0, 50)).replace('\n', '\n\n', 3))
+        first = _fresh(path)
+        assert first.state == 'rebuilt' and len(first) == 50
+        assert first.get_by_id('u42')['n'] == 42 and first.get_by_id('missing') is None
+        assert os.path.exists(str(path) + INDEX_SUFFIX)
+        second = _fresh(path)
+        assert second.state == 'loaded' and second.offsets == first.offsets and 'id' in second.ids
+        assert [record['n'] for record in second.read(3, 4)] == [3, 4, 5, 6]
+        assert [record['n'] for record in second.get_page(4, 12)] == [48, 49]
+        assert second.get_by_id('u7', 'id')['n'] == 7 and second.get_by_id(9, 'n')['id'] == 'u9'
+
+    def test_append_extends(self, tmp_path):
+        """Appends (even completing a partial last line) extend offsets and id maps."""
+        path = tmp_path / 'events.jsonl'
+        text = _lines(_users(0, 30))
+        path.write_text(text[:-15])
+        index = _fresh(path)
+        index.get_by_id('u0')
+        assert len(index) == 30
+        with open(path, 'a') as handle:
+            handle.write(text[-15:] + _lines(_users(30, 45)))
+        assert index.refresh() == 'extended'
+        rebuilt = JsonlIndex(str(path), str(tmp_path / 'nowhere'))
+        rebuilt.refresh()
+        assert index.offsets == rebuilt.offsets and index.get_by_id('u44')['n'] == 44
+        assert index.get_by_id('u29')['n'] == 29
+        with open(path, 'a') as handle:
+            handle.write(_lines(_users(45, 46)))
+        reloaded = _fresh(path)
+        assert reloaded.state == 'extended' and reloaded.get_by_id('u45')['n'] == 45
+
+    def test_rewrites_and_corruption_rebuild(self, tmp_path):
+        """Same-size rewrites, touches and corrupt sidecars rebuild the index."""
+        path = tmp_path / 'data.jsonl'
+        path.write_text(_lines(_users(0, 20)))
+        index = _fresh(path)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert index.refresh() == 'rebuilt' and _fresh(path).state == 'loaded'
+        path.write_text(_lines(_users(0, 20)).replace('"u1"', '"v1"'))
+        assert index.refresh() == 'rebuilt' and index.get_by_id('v1')['n'] == 1
+        with open(str(path) + INDEX_SUFFIX, 'r+b') as handle:
+            handle.write(b'garbage')
+        assert _fresh(path).state == 'rebuilt'
+        path.write_text(_lines(_users(0, 5)))
+        assert index.refresh() == 'rebuilt' and len(index) == 5
+
+    def test_middle_rewrite_of_same_size_rebuilds(self, tmp_path):
+        """Swapping two lines mid-file keeps the size and the head/tail bytes, not the index."""
+        path = tmp_path / 'data.jsonl'
+        records = [{'id': index, 'name': f'user-{index:06d}'} for index in range(20000)]
+        path.write_text(_lines(records))
+        index = _fresh(path)
+        assert index.get_by_id(10000)['name'] == 'user-010000'
+        records[10000], records[10001] = records[10001], records[10000]
+        stat = os.stat(path)
+        path.write_text(_lines(records))
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert os.stat(path).st_size == stat.st_size
+        assert index.refresh() == 'rebuilt' and index.get_by_id(10000)['name'] == 'user-010000'
+        assert _fresh(path).state == 'loaded' and index.read(10000, 1) == [records[10000]]
+
+    def test_lru_and_in_memory_fallback(self, tmp_path):
+        """Open indexes are LRU-bounded; unwritable sidecar locations keep working in memory."""
+        forget_index()
+        paths = []
+        for number in range(4):
+            path = tmp_path / f'part{number}.jsonl'
+            path.write_text(_lines(_users(number, number + 3)))
+            paths.append(str(path))
+        options = {'max_open_file_indexes': 2}
+        first = open_index(paths[0], options)
+        assert open_index(paths[0], options) is first
+        for path in paths[1:]:
+            open_index(path, options)
+        assert open_index(paths[0], options) is not first
+        stranded = open_index(paths[1], {'file_index_directory': str(tmp_path / 'missing' / 'dir')})
+        assert not stranded.persistent and len(stranded) == 3
+        forget_index()
+
+    def test_file_source_lookups(self, tmp_path):
+        """get_by_id, get_page and LIMIT/OFFSET paging go through the shared index."""
+        path = tmp_path / 'users.jsonl'
+        path.write_text(_lines(_users(0, 25)))
+        cache = tmp_path / 'cache'
+        cache.mkdir()
+        options = {'file_index_directory': str(cache)}
+        found = _run(path, options, operation='get_by_id', id='u12')
+        assert found.data['n'] == 12 and found.metadata['index_stats']['has_id_index']
+        assert os.listdir(cache) == ['users.jsonl' + INDEX_SUFFIX]
+        assert [record['n'] for record in _run(path, options, operation='get_page', page=2, size=10).data] == list(range(20, 25))
+        paged = _run(path, options, operation='load', limit=4, offset=6)
+        assert [record['n'] for record in paged.data] == [6, 7, 8, 9]
+        assert paged.metadata['index_stats']['state'] == 'current'
+        assert _run(path, options, operation='get_by_id', id='nobody').data == []
+        forget_index()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/tests/1.unit/test_file_mmap.py
+Unit tests for memory-mapped file access.
+Validates line splitting across chunk boundaries and byte ranges, empty and
+unmappable files, the shared index mapping (reused, remapped after appends),
+multi-id lookups and the regular-read fallback of scans.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.0.1
+Generation Date: 17-Oct-2026
+"""
+
+import json
+import pytest
+from exonware.xwquery.contracts import QueryAction, ExecutionContext
+from exonware.xwquery.runtime.executors import file_mmap, file_scan
+from exonware.xwquery.runtime.executors.data.file_source_executor import FileSourceExecutor
+from exonware.xwquery.runtime.executors.file_index import JsonlIndex, forget_index
+from exonware.xwquery.runtime.executors.file_mmap import MappedFile, map_file
+from exonware.xwquery.runtime.executors.file_scan import JsonlScan, scan_jsonl
+
+
+def _lines(records):
+    return ''.join(json.dumps(record) + '\n' for record in records)
+
+
+def _users(start, stop):
+    return [{'id': f'u{index}', 'n': index, 'pad': 'x' * (index % 9)} for index in range(start, stop)]
+@pytest.mark.xwquery_unit
+
+class TestFileMmap:
+    """Unit tests for file_mmap.py and its use by file_index/file_scan."""
+
+    def test_lines_and_ranges(self, tmp_path, monkeypatch):
+        """Lines split across small chunks equal the file's lines, whole or by range."""
+        monkeypatch.setattr(file_mmap, '_CHUNK_BYTES', 7)
+        path = tmp_path / 'data.jsonl'
+        data = b'{"a": 1}\n\n  \n{"b": 22}\n{"c": 333}'
+        path.write_bytes(data)
+        with MappedFile(str(path)) as mapped:
+            assert list(mapped.lines()) == data.split(b'\n')
+            assert mapped.line(0) == b'{"a": 1}\n' and mapped.line(23) == b'{"c": 333}'
+            assert list(mapped.lines(9, 13)) == [b'', b'  ']
+            assert list(mapped.lines(13, 14)) == [b'{"b": 22}']
+        empty = tmp_path / 'empty.jsonl'
+        empty.write_bytes(b'')
+        assert list(map_file(str(empty)).lines()) == [] and map_file(str(tmp_path)) is None
+
+    def test_index_reads_from_shared_mapping(self, tmp_path):
+        """Pages and ids are sliced from one mapping, remapped once the file grows."""
+        path = tmp_path / 'users.jsonl'
+        path.write_text(_lines(_users(0, 40)))
+        index = JsonlIndex(str(path), str(tmp_path))
+        index.refresh()
+        mapped = index.mapped()
+        assert [record['n'] for record in index.read(10, 3)] == [10, 11, 12]
+        assert index.get_by_id('u33')['n'] == 33 and index.mapped() is mapped
+        with open(path, 'a') as handle:
+            handle.write(_lines(_users(40, 45)))
+        assert index.refresh() == 'extended'
+        assert index.get_by_id('u44')['n'] == 44 and index.mapped() is not mapped
+        assert len(index.mapped()) == path.stat().st_size
+
+    def test_get_many(self, tmp_path):
+        """Multi-id lookups keep the requested order and skip absent ids."""
+        path = tmp_path / 'users.jsonl'
+        path.write_text(_lines(_users(0, 100)))
+        index = JsonlIndex(str(path), str(tmp_path))
+        index.refresh()
+        found = index.get_many(['u70', 'nobody', 'u3', ['bad'], 'u70'])
+        assert [record['n'] for record in found] == [70, 3, 70]
+        assert [record['id'] for record in index.get_many([5, 9], 'n')] == ['u5', 'u9']
+
+    def test_scan_falls_back_to_reads(self, tmp_path, monkeypatch):
+        """Scans of files that cannot be mapped read the same records and stats."""
+        path = tmp_path / 'users.jsonl'
+        path.write_text(_lines(_users(0, 60)).replace('\n', '\n\n', 5))
+        mapped_scan = JsonlScan(condition="n >= 30")
+        mapped = list(scan_jsonl(str(path), mapped_scan, 0, 900))
+        monkeypatch.setattr(file_scan, 'map_file', lambda path: None)
+        read_scan = JsonlScan(condition="n >= 30")
+        assert list(scan_jsonl(str(path), read_scan, 0, 900)) == mapped
+        assert read_scan.stats == mapped_scan.stats
+        assert list(scan_jsonl(str(path), JsonlScan(condition="n >= 30"))) == _users(30, 60)
+
+    def test_file_source_multi_id_lookup(self, tmp_path):
+        """FILE_SOURCE get_by_id accepts a list of ids."""
+        path = tmp_path / 'users.jsonl'
+        path.write_text(_lines(_users(0, 50)))
+        action = QueryAction(type='FILE_SOURCE', params={
+            'source': str(path), 'operation': 'get_by_id', 'ids': ['u49', 'u1', 'missing']
+        })
+        result = FileSourceExecutor().execute(action, ExecutionContext(node={}, options={'file_index_directory': str(tmp_path)}))
+        assert result.success and [record['n'] for record in result.data] == [49, 1]
+        forget_index()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/tests/1.unit/test_file_scan.py
+Unit tests for JSONL scans with pushed-down WHERE and SELECT.
+Validates the byte pre-check literals derived from conditions, that the
+pre-check never changes results (random records and conditions against
+decode-then-filter), column narrowing with ORDER BY, invalid line handling,
+and the FILE_SOURCE streaming path.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.0.1
+Generation Date: 17-Oct-2026
+"""
+
+import json
+import random
+import pytest
+from exonware.xwquery.contracts import QueryAction, ExecutionContext
+from exonware.xwquery.errors import XWQueryExecutionError
+from exonware.xwquery.runtime.executors.data.file_source_executor import FileSourceExecutor
+from exonware.xwquery.runtime.executors.file_scan import JsonlScan, required_literals, scan_jsonl
+from exonware.xwquery.runtime.executors.predicates import comparison_of, compile_predicate
+
+
+def _write_jsonl(path, records, encoder=json.dumps):
+    path.write_text(''.join(encoder(record) + '\n' for record in records), encoding='utf-8')
+    return str(path)
+
+
+def _random_events(seed, count=400):
+    generator = random.Random(seed)
+    events = []
+    for index in range(count):
+        event = {'id': index, 'level': generator.choice(['info', 'warn', 'error', 'café', 'a/b'])}
+        if generator.random() < 0.7:
+            event['user'] = generator.choice(['ann', 'bob', None, 7, True])
+        if generator.random() < 0.5:
+            event['meta'] = {'level': generator.choice(['error', 'info']), 'size': generator.randrange(10)}
+        events.append(event)
+    return events
+@pytest.mark.xwquery_unit
+
+class TestFileScan:
+    """Unit tests for file_scan.py and FILE_SOURCE pushdown."""
+
+    def test_required_literals(self):
+        """AND-ed equalities, IN lists and field comparisons become byte literals; others do not."""
+        assert comparison_of("NOT level = 'x'") is None and comparison_of("level <> 'x'") == ('level', '!=', 'x')
+        assert comparison_of({'status': ['a', 'b']}) == ('status', 'IN', ['a', 'b'])
+        assert required_literals("level = 'error' AND size > 3") == [(b'"error"',), (b'"level"',), (b'"size"',)]
+        assert required_literals({'user': ['ann', 'bob']}) == [(b'"ann"', b'"bob"'), (b'"user"',)]
+        assert required_literals("level = 'error' OR size > 3") == []
+        assert required_literals("NOT level = 'error' AND user IS NULL") == []
+        assert required_literals("meta.level = 'error'") == [(b'"error"',)]
+        assert required_literals("level = 'café' AND path = 'a/b'") == [(b'"level"',), (b'"path"',)]
+        assert required_literals("vip = true AND age = 30") == [(b'"vip"',), (b'"age"',)]
+
+    def test_prefilter_never_changes_results(self, tmp_path):
+        """Scans equal decode-then-filter for random records, conditions and encoders."""
+        conditions = [
+            "level = 'error'", "level = 'error' AND user = 'ann'", "user IN ('ann', 'bob')",
+            "meta.level = 'error' AND meta.size >= 5", "level != 'info' AND user IS NOT NULL",
+            "level = 'café'", "level = 'a/b' OR user = 'bob'", "user = true", "user IS NULL",
+            {'level': 'warn', 'user': ['bob', 7]}, "level LIKE 'e%' AND NOT user = 'ann'",
+        ]
+        for seed in range(3):
+            events = _random_events(seed)
+            for encoder in (json.dumps, lambda record: json.dumps(record, ensure_ascii=False, separators=(',', ':'))):
+                path = _write_jsonl(tmp_path / f'events{seed}.jsonl', events, encoder)
+                for condition in conditions:
+                    predicate = compile_predicate(condition)
+                    scan = JsonlScan(predicate, condition)
+                    assert list(scan_jsonl(path, scan)) == [event for event in events if predicate(event)]
+                    assert scan.stats['lines'] == len(events)
+                    assert scan.stats['decoded'] + scan.stats['prefiltered'] == len(events)
+        scan = JsonlScan(compile_predicate("level = 'warn'"), "level = 'warn'")
+        list(scan_jsonl(path, scan))
+        assert scan.stats['decoded'] == scan.stats['matched'] < len(events) / 2
+
+    def test_columns_and_narrowing(self, tmp_path):
+        """Records are narrowed to selected columns plus sort keys, then projected."""
+        events = _random_events(4)
+        path = _write_jsonl(tmp_path / 'events.jsonl', events)
+        scan = JsonlScan(None, None, ['id', 'meta.size AS size'], keep=['level'])
+        narrowed = list(scan_jsonl(path, scan))
+        assert all(set(record) <= {'id', 'meta', 'level'} for record in narrowed)
+        rows = list(scan.projected(narrowed))
+        assert rows[:2] == [
+            {'id': event['id'], 'size': event['meta']['size'] if 'meta' in event else None} for event in events[:2]
+        ]
+        computed = JsonlScan(None, None, ['id * 2 AS double'], keep=['level'])
+        assert computed.narrow is None and JsonlScan(columns='*').project is None
+
+    def test_invalid_lines(self, tmp_path):
+        """Blank lines are skipped; invalid JSON raises only when the line must be decoded."""
+        path = tmp_path / 'broken.jsonl'
+        path.write_text('{"level": "error", "id": 1}\n\n   \nnot json at all\n{"level": "info", "id": 2}\n')
+        scan = JsonlScan(compile_predicate("level = 'error'"), "level = 'error'")
+        assert [record['id'] for record in scan_jsonl(str(path), scan)] == [1]
+        with pytest.raises(XWQueryExecutionError):
+            list(scan_jsonl(str(path), JsonlScan()))
+
+    def test_file_source_streaming(self, tmp_path):
+        """FILE_SOURCE applies WHERE, ORDER BY on an unselected key, OFFSET/LIMIT and columns."""
+        events = _random_events(5)
+        path = _write_jsonl(tmp_path / 'events.jsonl', events)
+        action = QueryAction(type='FILE_SOURCE', params={
+            'source': path, 'where': "level = 'error' AND user IN ('ann', 'bob')",
+            'columns': ['id', 'user'], 'order_by': 'level DESC, id DESC', 'offset': 1, 'limit': 3
+        })
+        rows = [row for batch in FileSourceExecutor().iter_execute(action, ExecutionContext(node={})) for row in batch]
+        expected = sorted(
+            (event for event in events if event['level'] == 'error' and event.get('user') in ('ann', 'bob')),
+            key=lambda event: event['id'], reverse=True
+        )[1:4]
+        assert rows == [{'id': event['id'], 'user': event['user']} for event in expected]
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/tests/1.unit/test_graph_adjacency.py
+Unit tests for CSR adjacency snapshots and the traversal executors using them.
+Validates snapshot layout, caching per graph version, the lazy adapter for
+unversioned graphs, and BFS/DFS/path/cycle results on top of the snapshot
+(including graphs deeper than the recursion limit).
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.0.1
+Generation Date: 17-Oct-2026
+"""
+
+import pytest
+from exonware.xwquery.contracts import QueryAction, ExecutionContext
+from exonware.xwquery.runtime.executors.adjacency import (
+    CSRGraph,
+    LazyAdjacency,
+    adjacency,
+    csr_snapshot,
+    mark_graph_changed,
+)
+from exonware.xwquery.runtime.executors.graph.all_paths_executor import AllPathsExecutor
+from exonware.xwquery.runtime.executors.graph.cycle_detection_executor import CycleDetectionExecutor
+from exonware.xwquery.runtime.executors.graph.shortest_path_executor import ShortestPathExecutor
+from exonware.xwquery.runtime.executors.graph.traversal_executor import TraversalExecutor
+
+
+class Graph:
+    """Minimal graph exposing the adjacency protocol the executors use."""
+
+    def __init__(self, edges, weights=None, versioned=True):
+        self.edges = {}
+        for source, target in edges:
+            self.edges.setdefault(source, []).append(target)
+            self.edges.setdefault(target, [])
+        self.weights = weights or {}
+        self.calls = 0
+        if versioned:
+            self.graph_version = 1
+
+    def get_all_vertices(self):
+        return list(self.edges)
+
+    def get_neighbors(self, vertex):
+        self.calls += 1
+        return self.edges.get(vertex, [])
+
+    def get_edge_weight(self, source, target):
+        return self.weights.get((source, target), 1)
+
+
+DIAMOND = [('a', 'b'), ('a', 'c'), ('b', 'd'), ('c', 'd'), ('d', 'e')]
+
+
+def _run(executor, node, **params):
+    result = executor.execute(QueryAction(type=executor.OPERATION_NAME, params=params), ExecutionContext(node=node))
+    assert result.success
+    return result.data
+@pytest.mark.xwquery_unit
+
+class TestGraphAdjacency:
+    """Unit tests for adjacency.py and the graph traversal executors."""
+
+    def test_csr_layout_and_derived_views(self):
+        """Offsets/targets hold each vertex's neighbors; transpose and symmetric derive from them."""
+        graph = CSRGraph.build(['a'], Graph(DIAMOND).get_neighbors)
+        assert graph.vertices == ['a', 'b', 'c', 'd', 'e']
+        assert list(graph.offsets) == [0, 2, 3, 4, 5, 5]
+        assert graph.neighbors('a') == ['b', 'c'] and graph.edge_count == 5
+        assert graph.transpose().neighbors('d') == ['b', 'c']
+        assert sorted(graph.symmetric().neighbors('d')) == ['b', 'c', 'e']
+
+    def test_snapshot_cached_per_version(self):
+        """The snapshot is built once per graph version and rebuilt after changes."""
+        node = Graph(DIAMOND)
+        first = csr_snapshot(node)
+        calls = node.calls
+        assert csr_snapshot(node) is first and node.calls == calls
+        node.edges['e'].append('a')
+        node.graph_version = 2
+        assert csr_snapshot(node).neighbors('e') == ['a']
+        node.edges['e'].clear()
+        mark_graph_changed(node)
+        assert csr_snapshot(node).neighbors('e') == []
+
+    def test_unversioned_graph_uses_lazy_adjacency(self):
+        """Without a version nothing is cached; neighbors are fetched once per query."""
+        node = Graph(DIAMOND, versioned=False)
+        graph = adjacency(node)
+        assert isinstance(graph, LazyAdjacency)
+        start = graph.index_of('a')
+        graph.out(start), graph.out(start)
+        assert node.calls == 1
+        assert graph.neighbors('d') == ['e']
+        mark_graph_changed(node)
+        assert isinstance(adjacency(node), LazyAdjacency)
+
+    def test_traversal_executors_on_snapshot(self):
+        """Shortest paths, BFS/DFS orders, direction and path enumeration over the snapshot."""
+        weights = {('a', 'b'): 5, ('a', 'c'): 1, ('c', 'd'): 1, ('b', 'd'): 1, ('d', 'e'): 2}
+        for node in (Graph(DIAMOND, weights), Graph(DIAMOND, weights, versioned=False)):
+            assert _run(ShortestPathExecutor(), node, source='a', target='e')['path'] == ['a', 'b', 'd', 'e']
+            weighted = _run(ShortestPathExecutor(), node, source='a', target='e', weighted=True)
+            assert (weighted['path'], weighted['distance']) == (['a', 'c', 'd', 'e'], 4)
+            bfs = _run(TraversalExecutor(), node, start='a', max_depth=2)
+            assert bfs['visit_order'] == [('a', 0), ('b', 1), ('c', 1), ('d', 2)]
+            dfs = _run(TraversalExecutor(), node, start='a', strategy='DFS', visit_order='postorder')
+            assert dfs['visited_nodes'] == ['e', 'd', 'b', 'c', 'a']
+            assert _run(AllPathsExecutor(), node, source='a', target='e')['paths'] == [
+                ['a', 'b', 'd', 'e'], ['a', 'c', 'd', 'e']
+            ]
+        incoming = _run(TraversalExecutor(), Graph(DIAMOND), start='e', direction='in')
+        assert incoming['visited_nodes'] == ['e', 'd', 'b', 'c', 'a']
+
+    def test_deep_graphs_do_not_recurse(self):
+        """DFS and cycle detection handle chains far deeper than the recursion limit."""
+        chain = [(f'v{index}', f'v{index + 1}') for index in range(5000)]
+        node = Graph(chain + [('v5000', 'v4990')])
+        dfs = _run(TraversalExecutor(), node, start='v0', strategy='DFS', max_depth=10_000)
+        assert dfs['node_count'] == 5001
+        cycle = _run(CycleDetectionExecutor(), node, return_cycle=True)
+        assert cycle['has_cycle'] and cycle['cycle'] == [f'v{index}' for index in range(4990, 5001)] + ['v4990']
+        undirected = Graph([('a', 'b'), ('b', 'a'), ('b', 'c'), ('c', 'b'), ('c', 'a'), ('a', 'c')])
+        assert _run(CycleDetectionExecutor(), undirected, directed=False, return_cycle=True)['cycle'] == ['a', 'c', 'b', 'a']
+        assert not _run(CycleDetectionExecutor(), Graph(DIAMOND))['has_cycle']
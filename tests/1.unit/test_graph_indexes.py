@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/tests/1.unit/test_graph_indexes.py
+Unit tests for graph secondary indexes.
+Validates label/property/edge type lookups against scans, index maintenance
+by the CREATE_EDGE/DELETE_EDGE/UPDATE_EDGE/SET/DETACH_DELETE executors
+(compared with freshly built indexes), MATCH lookups instead of vertex
+scans, and the HAS/OUT/IN_TRAVERSE filters.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.0.1
+Generation Date: 17-Oct-2026
+"""
+
+import random
+import pytest
+from exonware.xwquery.contracts import QueryAction, ExecutionContext
+from exonware.xwquery.runtime.executors import get_operation_registry
+from exonware.xwquery.runtime.executors.graph_indexes import GraphIndex, find_vertices, graph_index
+
+
+class Graph:
+    """Mutable property graph with typed edges and a version counter."""
+
+    def __init__(self, vertices, edges=()):
+        self.graph_version = 1
+        self.properties = {vertex: dict(values) for vertex, values in vertices.items()}
+        self.out = {vertex: [] for vertex in vertices}
+        self.edges = {}
+        self.property_reads = 0
+        for source, target, kind in edges:
+            self.add_edge(source, target, edge_type=kind)
+
+    def get_all_vertices(self):
+        return list(self.out)
+
+    def get_neighbors(self, vertex):
+        return self.out[vertex]
+
+    def get_incoming_neighbors(self, vertex):
+        return [source for source, targets in self.out.items() if vertex in targets]
+
+    def get_vertex_properties(self, vertex):
+        self.property_reads += 1
+        return self.properties[vertex]
+
+    def set_vertex_property(self, vertex, name, value):
+        self.properties[vertex][name] = value
+
+    def get_edge_properties(self, source, target):
+        return self.edges[(source, target)]
+
+    def get_edge_type(self, source, target):
+        return self.edges[(source, target)].get('type')
+
+    def add_edge(self, source, target, edge_type=None, properties=None, directed=True):
+        for vertex in (source, target):
+            self.out.setdefault(vertex, [])
+            self.properties.setdefault(vertex, {})
+        if (source, target) not in self.edges:
+            self.out[source].append(target)
+        self.edges[(source, target)] = {'type': edge_type, **(properties or {})}
+
+    def remove_edge(self, source, target):
+        self.out[source].remove(target)
+        del self.edges[(source, target)]
+
+    def remove_vertex(self, vertex):
+        del self.out[vertex], self.properties[vertex]
+
+
+def _random_graph(seed, vertices=60, edges=200):
+    generator = random.Random(seed)
+    properties = {
+        f'u{index}': {
+            'label': generator.choice(['User', 'Group']),
+            'country': generator.choice(['DE', 'FR', 'US']),
+            'age': generator.randrange(5)
+        }
+        for index in range(vertices)
+    }
+    names = list(properties)
+    return Graph(properties, [
+        (generator.choice(names), generator.choice(names), generator.choice(['FOLLOWS', 'MEMBER']))
+        for _ in range(edges)
+    ])
+
+
+def _tables(index, node):
+    """Label, property and edge type tables of `index`, forcing every table."""
+    labels = {label: set(index.vertices_with_label(label)) for label in ('User', 'Group')}
+    countries = {value: set(index.vertices_with_property('country', value)) for value in ('DE', 'FR', 'US', 'PL')}
+    types = {kind: set(index.edges_with_type(kind)) for kind in ('FOLLOWS', 'MEMBER', 'BLOCKS')}
+    return labels, countries, types
+
+
+def _fresh(node):
+    return GraphIndex(lambda: node, None)
+
+
+def _run(operation, node, **params):
+    executor = get_operation_registry().get(operation)
+    result = executor.execute(QueryAction(type=operation, params=params), ExecutionContext(node=node))
+    assert result.success, result.error
+    return result.data
+@pytest.mark.xwquery_unit
+
+class TestGraphIndexes:
+    """Unit tests for graph_indexes.py and the executors using it."""
+
+    def test_lookups_match_scans(self):
+        """Label, property value/existence and edge type lookups equal full scans."""
+        for seed in range(3):
+            node = _random_graph(seed)
+            index = graph_index(node)
+            assert graph_index(node) is index
+            for label in ('User', 'Group', 'Robot'):
+                assert index.vertices_with_label(label) == {v for v, p in node.properties.items() if p['label'] == label}
+            assert index.vertices_with_property('age', 3) == {v for v, p in node.properties.items() if p['age'] == 3}
+            assert index.vertices_with_property('country') == set(node.properties)
+            assert index.vertices_with_property('age', [3]) is None
+            assert index.edges_with_type('MEMBER') == {pair for pair, e in node.edges.items() if e['type'] == 'MEMBER'}
+            expected = sorted(v for v, p in node.properties.items() if p['label'] == 'User' and p['country'] == 'DE')
+            assert sorted(find_vertices(node, 'User', {'country': 'DE'})) == expected
+            assert sorted(find_vertices(node, 'User', {'country': 'DE'}, 'age >= 2')) == [
+                vertex for vertex in expected if node.properties[vertex]['age'] >= 2
+            ]
+        assert graph_index([]) is None and find_vertices([]) is None
+
+    def test_mutating_executors_keep_indexes_consistent(self):
+        """After each mutation the maintained tables equal a rebuilt index."""
+        node = _random_graph(7)
+        index = graph_index(node)
+        _tables(index, node)
+        source, target = 'u1', 'u2'
+        _run('CREATE_EDGE', node, source=source, target=target, edge_type='BLOCKS', properties={'since': 2020})
+        assert graph_index(node) is index and (source, target) in index.edges_with_type('BLOCKS')
+        assert _tables(index, node) == _tables(_fresh(node), node)
+        _run('UPDATE_EDGE', node, source=source, target=target, updates={'type': 'FOLLOWS'})
+        assert _tables(index, node) == _tables(_fresh(node), node)
+        updated = _run('SET', node, label='User', match={'country': 'DE'}, properties={'country': 'PL'})
+        assert updated['updated_count'] > 0 and not find_vertices(node, 'User', {'country': 'DE'})
+        assert _tables(index, node) == _tables(_fresh(node), node)
+        vertices, edge_values = {key: dict(value) for key, value in node.properties.items()}, {
+            key: dict(value) for key, value in node.edges.items()
+        }
+        assert _run('SET', node, properties={'country': 'XX'})['updated_count'] == 0
+        assert _run('SET', node, target_type='edge', properties={'weight': 0})['updated_count'] == 0
+        assert node.properties == vertices and node.edges == edge_values
+        edges = len(node.edges)
+        assert _run('DELETE_EDGE', node)['deleted_count'] == 0 and len(node.edges) == edges
+        kind = node.get_edge_type(*next(iter(node.edges)))
+        deleted = _run('DELETE_EDGE', node, edge_type=kind)
+        assert deleted['deleted_count'] > 0 and not index.edges_with_type(kind)
+        assert _tables(index, node) == _tables(_fresh(node), node)
+        victims = sorted(find_vertices(node, 'Group', {'age': 0}))
+        removed = _run('DETACH_DELETE', node, label='Group', match={'age': 0})
+        assert removed['deleted_nodes'] == len(victims) and not set(victims) & set(node.out)
+        assert _tables(index, node) == _tables(_fresh(node), node)
+        assert graph_index(node) is index
+
+    def test_changes_outside_executors_drop_index(self):
+        """A version bump not made through the executors starts a fresh index; unversioned graphs are never indexed."""
+        node = _random_graph(3)
+        index = graph_index(node)
+        _tables(index, node)
+        node.properties['u0']['label'] = 'Robot'
+        node.graph_version += 1
+        fresh = graph_index(node)
+        assert fresh is not index and fresh.vertices_with_label('Robot') == {'u0'}
+        assert not fresh.is_built('edge_types')
+        unversioned = Graph({'a': {}, 'b': {}, 'c': {}})
+        del unversioned.graph_version
+        _run('CREATE_EDGE', unversioned, source='a', target='b', edge_type='K')
+        unversioned.add_edge('b', 'c', edge_type='K')
+        found = _run('MATCH', unversioned, pattern='(p)-[:K]->(q)')
+        assert graph_index(unversioned) is None
+        assert sorted((m['p'], m['q']) for m in found['matches']) == [('a', 'b'), ('b', 'c')]
+
+    def test_match_uses_lookups(self):
+        """Once indexed, MATCH (u:User {country:'DE'}) reads only the matching vertices."""
+        vertices = {f'u{index}': {'label': 'User', 'country': 'FR'} for index in range(2000)}
+        vertices.update({f'de{index}': {'label': 'User', 'country': 'DE'} for index in range(5)})
+        node = Graph(vertices, [(f'de{index}', f'u{index}', 'FOLLOWS') for index in range(5)])
+        pattern = "(u:User {country: 'DE'})-[:FOLLOWS]->(f)"
+        _run('MATCH', node, pattern=pattern)
+        node.property_reads = 0
+        found = _run('MATCH', node, pattern=pattern)
+        assert sorted((m['u'], m['f']) for m in found['matches']) == [(f'de{i}', f'u{i}') for i in range(5)]
+        assert found['plan'][0].startswith('scan (u)') and node.property_reads < 100
+
+    def test_has_out_and_in_filters(self):
+        """HAS with value/label; OUT/IN filter by edge type and neighbor label."""
+        node = Graph(
+            {'ann': {'label': 'User', 'city': 'Rome'}, 'bob': {'label': 'User'}, 'acme': {'label': 'Company', 'city': 'Rome'}},
+            [('ann', 'bob', 'FOLLOWS'), ('ann', 'acme', 'WORKS_AT'), ('bob', 'acme', 'WORKS_AT'), ('acme', 'ann', 'OWNED_BY')]
+        )
+        assert sorted(_run('HAS', node, property='city')['items']) == ['acme', 'ann']
+        assert _run('HAS', node, property='city', value='Rome', label='User')['items'] == ['ann']
+        assert _run('OUT', node, vertex='ann', edge_type='WORKS_AT')['neighbors'] == ['acme']
+        assert _run('OUT', node, vertex='ann', label='User')['neighbors'] == ['bob']
+        graph_index(node).edges_with_type('WORKS_AT')
+        assert sorted(_run('IN_TRAVERSE', node, vertex='acme', edge_type='WORKS_AT')['neighbors']) == ['ann', 'bob']
+        assert _run('IN_TRAVERSE', node, vertex='ann', label='Company')['neighbors'] == ['acme']
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/tests/1.unit/test_graph_match.py
+Unit tests for graph pattern matching.
+Validates Cypher/structured/legacy pattern parsing, multi-hop matches with
+pushed-down WHERE conjuncts against brute-force enumeration on random
+labeled graphs, selective start vertices in the plan, variable-length edges
+with relationship uniqueness, and the MATCH executor.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.0.1
+Generation Date: 17-Oct-2026
+"""
+
+import itertools
+import random
+import pytest
+from exonware.xwquery.contracts import QueryAction, ExecutionContext
+from exonware.xwquery.errors import XWQueryValueError
+from exonware.xwquery.runtime.executors.adjacency import full_snapshot
+from exonware.xwquery.runtime.executors.graph.match_executor import MatchExecutor
+from exonware.xwquery.runtime.executors.graph_patterns import PatternMatch, match_pattern, parse_pattern
+
+
+class Graph:
+    """Labeled property graph with typed edges."""
+
+    def __init__(self, vertices, edges, versioned=True):
+        if versioned:
+            self.graph_version = 1
+        self.properties = dict(vertices)
+        self.out = {vertex: [] for vertex in vertices}
+        self.types = {}
+        for source, target, kind in edges:
+            if (source, target) not in self.types:
+                self.out[source].append(target)
+                self.types[(source, target)] = kind
+
+    def get_all_vertices(self):
+        return list(self.out)
+
+    def get_neighbors(self, vertex):
+        return self.out[vertex]
+
+    def get_vertex_properties(self, vertex):
+        return self.properties[vertex]
+
+    def get_edge_type(self, source, target):
+        return self.types[(source, target)]
+
+
+class UnversionedGraph:
+    """Graph that can only list neighbors (no vertex enumeration)."""
+
+    def __init__(self, graph):
+        self.get_neighbors = graph.get_neighbors
+
+
+def _random_graph(seed, vertices=22, edges=80):
+    generator = random.Random(seed)
+    properties = {
+        f'v{index}': {'label': generator.choice(['Person', 'City', 'Company']), 'age': generator.randrange(6)}
+        for index in range(vertices)
+    }
+    names = list(properties)
+    return Graph(properties, [
+        (generator.choice(names), generator.choice(names), generator.choice(['KNOWS', 'LIVES_IN']))
+        for _ in range(edges)
+    ])
+
+
+def _run(node, **params):
+    action = QueryAction(type='MATCH', params=params)
+    result = MatchExecutor().execute(action, ExecutionContext(node=node))
+    assert result.success, result.error
+    return result.data
+@pytest.mark.xwquery_unit
+
+class TestGraphMatch:
+    """Unit tests for graph_patterns.py and MATCH."""
+
+    def test_parse_pattern_forms(self):
+        """Cypher arrows, types, hop ranges and parameters; structured and legacy dicts."""
+        pattern = parse_pattern(
+            "MATCH (a:Person {name: $name})-[r:KNOWS|:LIKES*1..3]->(b)<-[:OWNS]-(c), (c)--(:City)",
+            {'name': 'Ann'}
+        )
+        assert list(pattern.nodes)[:3] == ['a', 'b', 'c'] and pattern.nodes['a'].properties == {'name': 'Ann'}
+        knows, owns, near = pattern.edges
+        assert (knows.var, knows.types, knows.min_hops, knows.max_hops) == ('r', ('KNOWS', 'LIKES'), 1, 3)
+        assert (owns.source, owns.target, owns.direction, owns.named) == ('c', 'b', 'out', False)
+        assert near.direction == 'both' and pattern.nodes[near.target].labels == ('City',)
+        assert parse_pattern("(a)-[*]->(b)").edges[0].max_hops is None
+        structured = parse_pattern({
+            'nodes': [{'var': 'u', 'label': 'User', 'id': 7}],
+            'edges': [{'source': 'u', 'target': 'g', 'type': 'MEMBER', 'direction': 'in'}]
+        })
+        assert structured.nodes['u'].ids == [7] and structured.edges[0].source == 'g'
+        legacy = parse_pattern({'target': 'B'})
+        assert legacy.nodes['source'].ids is None and legacy.nodes['target'].ids == ['B']
+        with pytest.raises(XWQueryValueError):
+            parse_pattern("(a)-[:KNOWS->(b)")
+
+    def test_multi_hop_matches_brute_force(self):
+        """Paths, cycles and multi-variable WHERE agree with brute-force enumeration."""
+        for seed in range(4):
+            node = _random_graph(seed)
+            graph, props, types = full_snapshot(node), node.properties, node.types
+            found = sorted(
+                (binding['a'], binding['b'], binding['c'], binding['d'])
+                for binding in match_pattern(
+                    node, graph, "(a:Person)-[:KNOWS]->(b)<-[:LIVES_IN]-(c)--(d:City)",
+                    where="a.age >= 2 AND c.age < d.age AND b <> 'v0'"
+                )
+            )
+            expected = []
+            for a, b, c, d in itertools.product(node.out, repeat=4):
+                hops = [(a, b), (c, b)]
+                last = [pair for pair in ((c, d), (d, c)) if pair in types]
+                if props[a]['label'] != 'Person' or props[d]['label'] != 'City' or b == 'v0':
+                    continue
+                if props[a]['age'] < 2 or props[c]['age'] >= props[d]['age']:
+                    continue
+                if types.get(hops[0]) != 'KNOWS' or types.get(hops[1]) != 'LIVES_IN':
+                    continue
+                expected += [(a, b, c, d)] * sum(1 for pair in last if pair not in hops and hops[0] != hops[1])
+            assert found == sorted(expected)
+            cycles = {tuple(binding[v] for v in 'abc') for binding in match_pattern(node, graph, "(a)-->(b)-->(c)-->(a)")}
+            assert cycles == {
+                (a, b, c) for a, b, c in itertools.product(node.out, repeat=3)
+                if len({(a, b), (b, c), (c, a)} & set(types)) == 3 and len({(a, b), (b, c), (c, a)}) == 3
+            }
+
+    def test_plan_starts_at_selective_vertex(self):
+        """The rare labeled vertex is scanned first wherever it appears in the pattern."""
+        generator = random.Random(5)
+        vertices = {f'p{index}': {'label': 'Person'} for index in range(3000)}
+        vertices['ceo'] = {'label': 'Chief', 'name': 'Dana'}
+        names = list(vertices)
+        edges = [(generator.choice(names), generator.choice(names), 'KNOWS') for _ in range(12000)]
+        edges += [('ceo', f'p{index}', 'MANAGES') for index in range(10)]
+        node = Graph(vertices, edges)
+        match = PatternMatch(
+            node, full_snapshot(node), "(d)<-[:KNOWS]-(c)<-[:KNOWS]-(b)<-[:MANAGES]-(a:Chief {name: 'Dana'})"
+        )
+        assert match.explain()[0].startswith('scan (a)')
+        assert [step.kind for step in match.steps] == ['scan', 'expand', 'expand', 'expand']
+        found = sorted(tuple(binding[v] for v in 'abcd') for binding in match.bindings())
+        knows = [pair for pair, kind in node.types.items() if kind == 'KNOWS']
+        expected = sorted(
+            ('ceo', b, c, d) for b in node.out['ceo'] if node.types[('ceo', b)] == 'MANAGES'
+            for c in node.out[b] for d in node.out[c] if {(b, c), (c, d)} <= set(knows) and (b, c) != (c, d)
+        )
+        assert found == expected
+
+    def test_variable_length_edges(self):
+        """Hop ranges enumerate edge-distinct walks; min 0 includes the start vertex."""
+        ring = Graph({f'r{i}': {} for i in range(4)}, [(f'r{i}', f'r{(i + 1) % 4}', 'NEXT') for i in range(4)])
+        graph = full_snapshot(ring)
+        reached = sorted(b['b'] for b in match_pattern(ring, graph, "(a)-[*0..]->(b)", where="a = 'r0'"))
+        assert reached == ['r0', 'r0', 'r1', 'r2', 'r3']
+        walks = list(match_pattern(ring, graph, "(a)-[w:NEXT*2]->(b)", where="a = 'r3'"))
+        assert [[hop['target'] for hop in walk['w']] for walk in walks] == [['r0', 'r1']]
+        assert len(list(match_pattern(ring, graph, "(a)-[*1..4]->(b)-[*1..4]->(a)", where="a = 'r0'"))) == 3
+
+    def test_match_executor(self):
+        """Legacy dicts, Cypher text with WHERE, bind, limits and unversioned graphs."""
+        node = Graph(
+            {'ann': {'label': 'Person', 'age': 41}, 'bob': {'label': 'Person', 'age': 25}, 'rome': {'label': 'City'}},
+            [('ann', 'bob', 'KNOWS'), ('bob', 'ann', 'KNOWS'), ('ann', 'rome', 'LIVES_IN'), ('bob', 'rome', 'LIVES_IN')]
+        )
+        legacy = _run(node, pattern={'source': 'ann'})
+        assert legacy['matches'][0] == {'source': 'ann', 'target': 'bob', 'edge': {}} and legacy['match_count'] == 2
+        assert {m['source'] for m in _run(node, pattern={'target': 'rome'})['matches']} == {'ann', 'bob'}
+        cypher = _run(node, pattern="(p:Person)-[:KNOWS]->(q)-[:LIVES_IN]->(c:City)", where="p.age > q.age")
+        assert [(m['p'], m['q'], m['c']) for m in cypher['matches']] == [('ann', 'bob', 'rome')]
+        bound = _run(node, pattern="(p)-[:LIVES_IN]->(c)", bind={'p': 'bob'}, limit=1)
+        assert bound['matches'] == [{'p': 'bob', 'c': 'rome'}] and bound['truncated']
+        unversioned = UnversionedGraph(node)
+        assert _run(unversioned, pattern="(p)-->(q)", bind={'p': 'ann'})['match_count'] == 2
+        result = MatchExecutor().execute(
+            QueryAction(type='MATCH', params={'pattern': "(p)-->(q)"}), ExecutionContext(node=unversioned)
+        )
+        assert not result.success
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/tests/1.unit/test_hash_aggregation.py
+Unit tests for streaming hash aggregation.
+Validates running accumulators (Welford mean/variance, merge), GROUP BY with
+aggregates over streamed input, HAVING on aggregate calls, and that the
+optimizer fuses SUM/AVG/COUNT/MIN/MAX/HAVING stages into the GROUP.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.0.1
+Generation Date: 17-Oct-2026
+"""
+
+import statistics
+import pytest
+from exonware.xwquery.contracts import QueryAction, ExecutionContext
+from exonware.xwquery.runtime.executors import GroupExecutor, HavingExecutor, SumExecutor
+from exonware.xwquery.runtime.executors.aggregates import accumulate, parse_aggregates
+from exonware.xwquery.runtime.executors.engine import NativeOperationsExecutionEngine
+from exonware.xwquery.runtime.optimization import optimize_action_tree
+ORDERS = [
+    {'team': 'a', 'amount': 10},
+    {'team': 'b', 'amount': 5},
+    {'team': 'a', 'amount': '30'},
+    {'team': 'b', 'amount': None},
+    {'team': 'a', 'amount': 20},
+]
+
+
+def _program(*stages):
+    root = QueryAction(type='PROGRAM', id='root')
+    for stage in stages:
+        root.add_child(stage)
+    return root
+
+
+def _by_team(groups):
+    return {group['key']['team']: group for group in groups}
+@pytest.mark.xwquery_unit
+
+class TestHashAggregation:
+    """Unit tests for aggregates.py and the GROUP/HAVING executors."""
+
+    def test_accumulator_matches_statistics(self):
+        """Welford mean/variance are exact and partitions merge losslessly."""
+        values = [1e9 + offset for offset in (4, 7, 13, 16)]
+        accumulator = accumulate(values)
+        assert accumulator.avg == statistics.mean(values)
+        assert accumulator.variance == pytest.approx(statistics.variance(values))
+        merged = accumulate(values[:1]).merge(accumulate(values[1:]))
+        assert merged.variance == pytest.approx(accumulator.variance)
+        assert (merged.count, merged.min, merged.max) == (4, min(values), max(values))
+
+    def test_parse_aggregates(self):
+        """Strings and dicts normalize to specs with stable output names."""
+        specs = parse_aggregates("SUM(amount) AS total, COUNT(*), avg(amount)")
+        assert [spec.name for spec in specs] == ['total', 'count', 'avg_amount']
+        assert parse_aggregates([{'function': 'max', 'field': 'amount'}])[0].name == 'max_amount'
+
+    def test_group_streams_without_items(self):
+        """GROUP with aggregates consumes a generator and keeps no row lists."""
+        action = QueryAction(type='GROUP', params={'fields': ['team'], 'aggregates': ['SUM(amount)', 'COUNT(amount)']})
+        result = GroupExecutor().execute(action, ExecutionContext(node=(row for row in ORDERS)))
+        assert result.success
+        groups = _by_team(result.data['groups'])
+        assert groups['a']['sum_amount'] == 60
+        assert (groups['b']['_count'], groups['b']['count_amount']) == (2, 1)
+        assert all('_items' not in group for group in groups.values())
+
+    def test_group_having_on_aggregate_calls(self):
+        """HAVING may name aggregates that GROUP computes on the fly."""
+        action = QueryAction(type='GROUP', params={'fields': ['team'], 'having': 'SUM(amount) > 10 AND COUNT(*) >= 3'})
+        result = GroupExecutor().execute(action, ExecutionContext(node=ORDERS))
+        assert [group['key'] for group in result.data['groups']] == [{'team': 'a'}]
+
+    def test_unfused_stages_on_legacy_groups(self):
+        """SUM and HAVING still work on GROUP output that carries '_items'."""
+        grouped = GroupExecutor().execute(QueryAction(type='GROUP', params={'fields': ['team']}), ExecutionContext(node=ORDERS))
+        sums = SumExecutor().execute(QueryAction(type='SUM', params={'field': 'amount'}), ExecutionContext(node=grouped.data))
+        assert _by_team(sums.data['groups'])['b']['sum_amount'] == 5
+        having = HavingExecutor().execute(
+            QueryAction(type='HAVING', params={'condition': 'AVG(amount) < 10'}), ExecutionContext(node=grouped.data)
+        )
+        assert [group['key'] for group in having.data['groups']] == [{'team': 'b'}]
+
+    def test_unfused_having_uses_group_aliases(self):
+        """A HAVING stage reads aliased aggregates under the alias GROUP gave them."""
+        grouped = GroupExecutor().execute(
+            QueryAction(type='GROUP', params={'fields': ['team'], 'aggregates': ['SUM(amount) AS total', 'COUNT(*) AS rows']}),
+            ExecutionContext(node=ORDERS)
+        )
+        having = HavingExecutor().execute(
+            QueryAction(type='HAVING', params={'condition': 'SUM(amount) > 5 AND COUNT(*) > 2'}),
+            ExecutionContext(node=grouped.data)
+        )
+        assert [(group['key'], group['total']) for group in having.data['groups']] == [({'team': 'a'}, 60)]
+
+    def test_aggregate_stages_fused_into_group(self):
+        """The optimizer folds SUM/AVG/HAVING stages into one GROUP."""
+        tree = _program(
+            QueryAction(type='SELECT', params={'fields': ['*'], 'from': 'orders'}),
+            QueryAction(type='GROUP', params={'fields': ['team']}),
+            QueryAction(type='SUM', params={'field': 'amount', 'alias': 'total'}),
+            QueryAction(type='AVG', params={'field': 'amount'}),
+            QueryAction(type='HAVING', params={'condition': 'total > 10'}),
+        )
+        stages = optimize_action_tree(tree).get_children()
+        assert [stage.type for stage in stages] == ['SELECT', 'GROUP']
+        assert stages[1].params['having'] == 'total > 10'
+        engine = NativeOperationsExecutionEngine()
+        result = engine.execute_tree(tree, ExecutionContext(node={'orders': ORDERS}, options={'optimize': True}))
+        assert result.success
+        assert result.data['groups'] == [{'key': {'team': 'a'}, '_count': 3, 'total': 60, 'avg_amount': 20}]
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/tests/1.unit/test_hash_join.py
+Unit tests for the shared hash join kernels.
+Validates composite join keys, build-side selection by cardinality, SEMI/ANTI
+joins (and MINUS on top of them), column-pruned merging, outer-join
+bookkeeping and the Grace (partitioned, spill-to-disk) hash join.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.0.1
+Generation Date: 17-Oct-2026
+"""
+
+import pytest
+from exonware.xwquery.contracts import QueryAction, ExecutionContext
+from exonware.xwquery.runtime.executors.advanced.join_executor import JoinExecutor
+from exonware.xwquery.runtime.executors.advanced.minus_executor import MinusExecutor
+from exonware.xwquery.runtime.executors.joins import (
+    compile_join_key,
+    hash_join,
+    iter_hash_join,
+    normalize_join_type,
+    parse_join_keys,
+)
+ORDERS = [
+    {'order_id': 1, 'customer_id': 10, 'region': 'eu', 'total': 5},
+    {'order_id': 2, 'customer_id': 10, 'region': 'us', 'total': 7},
+    {'order_id': 3, 'customer_id': 20, 'region': 'eu', 'total': 9},
+    {'order_id': 4, 'customer_id': None, 'region': 'eu', 'total': 1},
+]
+CUSTOMERS = [
+    {'id': 10, 'region': 'eu', 'name': 'Ada'},
+    {'id': 20, 'region': 'eu', 'name': 'Bob'},
+    {'id': 30, 'region': 'us', 'name': 'Cy'},
+]
+
+
+def _join(left, **params):
+    action = QueryAction(type='JOIN', params=params)
+    result = JoinExecutor().execute(action, ExecutionContext(node=left))
+    assert result.success
+    return result.data
+
+
+def _order_ids(rows, field='left_order_id'):
+    return sorted(row.get(field) for row in rows)
+
+
+def _canonical(rows):
+    return sorted(rows, key=repr)
+@pytest.mark.xwquery_unit
+
+class TestHashJoin:
+    """Unit tests for joins.py and the JOIN/MINUS executors."""
+
+    def test_parse_join_keys_forms(self):
+        """String, dict and pair forms yield aligned composite key lists."""
+        expected = (['customer_id', 'region'], ['id', 'region'])
+        assert parse_join_keys('left.customer_id = right.id AND region = region') == expected
+        assert parse_join_keys({'customer_id': 'id', 'region': 'region'}) == expected
+        assert parse_join_keys([('customer_id', 'id'), ('region', 'region')]) == expected
+        assert parse_join_keys('id') == (['id'], ['id'])
+        assert normalize_join_type('left outer join') == 'LEFT'
+        assert normalize_join_type('not exists') == 'ANTI'
+
+    def test_composite_key_inner_join(self):
+        """All key components must match; NULL keys never match."""
+        data = _join(ORDERS, right=CUSTOMERS, on='customer_id = id AND region = region')
+        assert _order_ids(data['result']) == [1, 3]
+        assert data['matched_count'] == 2
+
+    def test_build_side_follows_cardinality(self):
+        """The smaller input is hashed; the join result does not depend on it."""
+        small = _join(ORDERS[:1], right=CUSTOMERS, on={'customer_id': 'id'})
+        forced = _join(ORDERS[:1], right=CUSTOMERS, on={'customer_id': 'id'}, build_side='right')
+        assert (small['build_side'], forced['build_side']) == ('left', 'right')
+        assert small['result'] == forced['result']
+
+    def test_outer_joins_keep_unmatched_rows(self):
+        """LEFT/FULL keep unmatched rows on either build side."""
+        for build_side in ('left', 'right'):
+            left = _join(ORDERS, right=CUSTOMERS, on={'customer_id': 'id'}, type='LEFT', build_side=build_side)
+            assert _order_ids(left['result']) == [1, 2, 3, 4]
+            assert left['matched_count'] == 3
+            full = _join(ORDERS, right=CUSTOMERS, on={'customer_id': 'id'}, type='FULL OUTER', build_side=build_side)
+            unmatched = [row for row in full['result'] if row.get('_matched') is False]
+            assert sorted(map(str, (row.get('left_order_id') or row.get('right_name') for row in unmatched))) == ['4', 'Cy']
+
+    def test_semi_and_anti_return_left_rows(self):
+        """SEMI/ANTI (EXISTS/NOT EXISTS) return original left rows, each once."""
+        for build_side in ('left', 'right'):
+            semi = _join(CUSTOMERS, right=ORDERS, on={'id': 'customer_id'}, type='EXISTS', build_side=build_side)
+            assert semi['result'] == CUSTOMERS[:2]
+            anti = _join(CUSTOMERS, right=ORDERS, on={'id': 'customer_id'}, type='ANTI', build_side=build_side)
+            assert anti['result'] == CUSTOMERS[2:]
+
+    def test_columns_limit_merged_fields(self):
+        """Only requested columns are built into joined rows."""
+        data = _join(ORDERS, right=CUSTOMERS, on={'customer_id': 'id'}, columns=['left_order_id', 'right.name'])
+        assert sorted(data['result'], key=lambda row: row['left_order_id']) == [
+            {'left_order_id': 1, 'right_name': 'Ada'},
+            {'left_order_id': 2, 'right_name': 'Ada'},
+            {'left_order_id': 3, 'right_name': 'Bob'},
+        ]
+
+    def test_minus_uses_key_anti_join(self):
+        """MINUS on keys keeps NULL-keyed rows distinct from matched ones."""
+        action = QueryAction(type='MINUS', params={'subtract': [{'customer_id': 10}, {'customer_id': None}], 'on': 'customer_id'})
+        result = MinusExecutor().execute(action, ExecutionContext(node=ORDERS))
+        assert result.success
+        assert [row['order_id'] for row in result.data['items']] == [3]
+        full = MinusExecutor().execute(
+            QueryAction(type='MINUS', params={'subtract': ORDERS[1:]}), ExecutionContext(node=ORDERS)
+        )
+        assert full.data['items'] == ORDERS[:1]
+
+    def test_grace_join_matches_in_memory(self, tmp_path):
+        """Partitioned joins (incl. re-partitioning and skew) equal the in-memory join."""
+        left = [{'k': i % 50 if i % 9 else None, 'l': i} for i in range(600)]
+        right = [{'k': 7 if i % 3 == 0 else i % 70, 'r': i} for i in range(900)]
+        key = compile_join_key(['k'])
+        for join_type in ('INNER', 'LEFT', 'RIGHT', 'FULL'):
+            for build_side in ('left', 'right'):
+                expected = list(iter_hash_join(left, right, key, key, join_type, build_side))
+                stats = {}
+                spilled = list(hash_join(
+                    iter(left), iter(right), key, key, join_type, build_side, stats=stats,
+                    memory_budget=2048, spill_dir=str(tmp_path), partitions=4
+                ))
+                assert stats['spilled_partitions'] >= 4
+                assert _canonical(spilled) == _canonical(expected)
+
+    def test_join_executor_spills_over_budget(self):
+        """JOIN honors join_memory_budget_mb and streams generator inputs."""
+        left = ({'id': i % 100, 'n': i} for i in range(2000))
+        right = [{'id': i, 'name': f'c{i}'} for i in range(100)]
+        action = QueryAction(type='JOIN', params={'right': right, 'on': 'id', 'partitions': 8})
+        context = ExecutionContext(node=left, options={'join_memory_budget_mb': 0.001})
+        data = JoinExecutor().execute(action, context).data
+        assert (data['result_count'], data['left_count'], data['right_count']) == (2000, 2000, 100)
+        assert data['spilled_partitions'] >= 8
+        assert all(row['right_name'] == f"c{row['left_id']}" for row in data['result'])
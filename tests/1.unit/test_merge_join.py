@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/tests/1.unit/test_merge_join.py
+Unit tests for sort-merge and range (band) joins.
+Validates that merge joins over ordered inputs return exactly what the hash
+join returns, that range predicates match a nested-loop reference, and that
+the cost model and the optimizer select the merge join for ordered inputs.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.0.1
+Generation Date: 17-Oct-2026
+"""
+
+from datetime import datetime, timedelta
+import pytest
+from exonware.xwquery.contracts import QueryAction, ExecutionContext
+from exonware.xwquery.errors import XWQueryValueError
+from exonware.xwquery.runtime.executors.advanced.join_executor import JoinExecutor
+from exonware.xwquery.runtime.executors.joins import (
+    compile_join_key,
+    iter_hash_join,
+    iter_merge_join,
+    iter_range_join,
+    make_merger,
+    parse_join_condition,
+)
+from exonware.xwquery.runtime.optimization import SimpleCostModel, optimize_action_tree
+LEFT = sorted(
+    [{'k': None if i % 11 == 0 else i // 3, 'l': i} for i in range(60)],
+    key=lambda row: (row['k'] is None, row['k'] or 0)
+)
+RIGHT = [{'k': k, 'r': n} for k in range(5, 30, 2) for n in range(k % 3 + 1)] + [{'k': None, 'r': -1}]
+
+
+def _canonical(rows):
+    return sorted(rows, key=repr)
+
+
+def _reference(left, right, ranges, join_type):
+    """Nested-loop reference for range joins."""
+    merge = make_merger()
+    matches = lambda l, r: all(
+        l.get(c.left_field) is not None and r.get(c.right_field) is not None
+        and c.matches(l[c.left_field], r[c.right_field]) for c in ranges
+    )
+    if join_type in ('SEMI', 'ANTI'):
+        return [l for l in left if any(matches(l, r) for r in right) is (join_type == 'SEMI')]
+    rows = [merge(l, r) for l in left for r in right if matches(l, r)]
+    if join_type in ('LEFT', 'FULL'):
+        rows += [{**merge(l, None), '_matched': False} for l in left if not any(matches(l, r) for r in right)]
+    if join_type in ('RIGHT', 'FULL'):
+        rows += [{**merge(None, r), '_matched': False} for r in right if not any(matches(l, r) for l in left)]
+    return rows
+@pytest.mark.xwquery_unit
+
+class TestMergeJoin:
+    """Unit tests for iter_merge_join(), iter_range_join() and join algorithm selection."""
+
+    def test_merge_join_matches_hash_join(self):
+        """Duplicates on both sides and NULL keys join exactly like the hash join."""
+        key = compile_join_key(['k'])
+        for join_type in ('INNER', 'LEFT', 'RIGHT', 'FULL'):
+            stats = {}
+            merged = list(iter_merge_join(iter(LEFT), iter(RIGHT), key, key, join_type, stats=stats))
+            expected_stats = {}
+            expected = list(iter_hash_join(LEFT, RIGHT, key, key, join_type, stats=expected_stats))
+            assert _canonical(merged) == _canonical(expected)
+            assert stats['matched_count'] == expected_stats['matched_count']
+
+    def test_merge_join_rejects_unordered_input(self):
+        """A stream declared ordered but out of order fails loudly."""
+        key = compile_join_key(['k'])
+        with pytest.raises(XWQueryValueError):
+            list(iter_merge_join([{'k': 2}, {'k': 1}], [{'k': 1}], key, key))
+
+    def test_range_join_matches_nested_loop(self):
+        """Band and one-sided predicates return the nested-loop result for every join type."""
+        left = [{'ts': t} for t in (1, 3, 3, 8, 15, 16, 30)] + [{'ts': None}]
+        right = [{'ts': t} for t in (0, 2, 4, 9, 10, 14, 40)]
+        for condition in ('ts >= ts - 2 AND ts <= ts + 1', 'left.ts > right.ts', 'ts < ts AND ts >= ts - 6'):
+            _, _, ranges = parse_join_condition(condition)
+            for join_type in ('INNER', 'LEFT', 'RIGHT', 'FULL', 'SEMI', 'ANTI'):
+                joined = list(iter_range_join(iter(left[:-1]), iter(right), ranges, join_type))
+                assert _canonical(joined) == _canonical(_reference(left[:-1], right, ranges, join_type))
+
+    def test_range_join_on_date_time_keys(self):
+        """ISO-string and datetime keys join without offsets, datetimes with timedelta offsets."""
+        start = datetime(2026, 10, 17, 12)
+        left = [{'ts': start + timedelta(minutes=minutes)} for minutes in (0, 5, 5, 20, 31)]
+        right = [{'ts': start + timedelta(minutes=minutes)} for minutes in (-3, 5, 18, 30)]
+        text = lambda rows: [{'ts': row['ts'].isoformat()} for row in rows]
+        _, _, equal = parse_join_condition('ts >= ts AND ts <= ts')
+        for rows_left, rows_right in ((left, right), (text(left), text(right))):
+            for join_type in ('INNER', 'FULL', 'ANTI'):
+                joined = list(iter_range_join(iter(rows_left), iter(rows_right), equal, join_type))
+                assert _canonical(joined) == _canonical(_reference(rows_left, rows_right, equal, join_type))
+        _, _, band = parse_join_condition([
+            {'left': 'ts', 'op': '>=', 'right': 'ts', 'offset': timedelta(minutes=-2)},
+            {'left': 'ts', 'op': '<=', 'right': 'ts', 'offset': timedelta(minutes=2)},
+        ])
+        for join_type in ('INNER', 'LEFT', 'RIGHT', 'SEMI'):
+            joined = list(iter_range_join(iter(left), iter(right), band, join_type))
+            assert _canonical(joined) == _canonical(_reference(left, right, band, join_type))
+        assert len(list(iter_range_join(iter(left), iter(right), band))) == 4
+        _, _, numeric = parse_join_condition('ts <= ts + 5')
+        with pytest.raises(XWQueryValueError):
+            list(iter_range_join(iter(left), iter(right), numeric))
+
+    def test_cost_model_prefers_merge_for_ordered_inputs(self):
+        """Merge wins for ordered inputs and range predicates, hash otherwise."""
+        model = SimpleCostModel()
+        assert model.choose_join_algorithm(50_000, 50_000, left_sorted=True, right_sorted=True) == 'merge'
+        assert model.choose_join_algorithm(50_000, 50_000) == 'hash'
+        assert model.choose_join_algorithm(50_000, 50_000, equi_join=False) == 'merge'
+
+    def test_join_executor_selects_algorithm(self):
+        """Ordered lists merge; a range join sorts unordered input first."""
+        action = QueryAction(type='JOIN', params={'right': sorted(RIGHT[:-1], key=lambda row: row['k']), 'on': 'k'})
+        data = JoinExecutor().execute(action, ExecutionContext(node=[row for row in LEFT if row['k'] is not None])).data
+        assert data['algorithm'] == 'merge'
+        key = compile_join_key(['k'])
+        assert data['result_count'] == len(list(iter_hash_join(LEFT, RIGHT, key, key)))
+        readings = [{'ts': t, 'v': t * 10} for t in (9, 1, 5)]
+        windows = [{'ts': 4, 'w': 'a'}, {'ts': 0, 'w': 'b'}]
+        action = QueryAction(type='JOIN', params={'right': windows, 'on': 'ts >= ts AND ts < ts + 5', 'type': 'LEFT'})
+        data = JoinExecutor().execute(action, ExecutionContext(node=(row for row in readings))).data
+        assert data['algorithm'] == 'merge'
+        assert [(row['left_ts'], row.get('right_w')) for row in data['result']] == [(1, 'b'), (5, 'a'), (9, None)]
+
+    def test_optimizer_marks_join_over_order_by(self):
+        """A JOIN fed by ORDER BY on its key is lowered with the merge algorithm."""
+        root = QueryAction(type='PROGRAM', id='root')
+        root.add_child(QueryAction(type='SELECT', params={'fields': ['*'], 'from': 'readings'}))
+        root.add_child(QueryAction(type='ORDER', params={'order_by': 'ts'}))
+        root.add_child(QueryAction(type='JOIN', params={'right': [{'ts': 1}], 'on': 'ts >= ts AND ts < ts + 5'}))
+        join = optimize_action_tree(root).get_children()[-1]
+        assert join.params['algorithm'] == 'merge'
+        assert join.params['presorted'] == ['left']
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/tests/1.unit/test_parallel_execution.py
+Unit tests for partition-parallel WINDOW and GROUP BY execution.
+Validates that work split across worker processes returns exactly the serial
+result (values and order), that the config/option gates are honored and that
+tasks which cannot be pickled run in the caller.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.0.1
+Generation Date: 17-Oct-2026
+"""
+
+import pytest
+from exonware.xwquery.contracts import QueryAction, ExecutionContext
+from exonware.xwquery.runtime.executors.advanced.window_executor import WindowExecutor
+from exonware.xwquery.runtime.executors.aggregates import HashAggregator, parse_aggregates
+from exonware.xwquery.runtime.executors.aggregation.group_executor import GroupExecutor
+from exonware.xwquery.runtime.executors.parallel import (
+    aggregate_parallel,
+    evaluate_windows_parallel,
+    resolve_parallel_workers,
+)
+from exonware.xwquery.runtime.executors.windows import WindowSpec, evaluate_windows
+ROWS = [{'tenant': f't{i % 7}', 'day': (i * 13) % 31, 'amount': i % 11} for i in range(700)]
+PARALLEL = {'enable_parallel_execution': True, 'max_workers': 2, 'parallel_min_rows': 10}
+@pytest.mark.xwquery_unit
+
+class TestParallelExecution:
+    """Unit tests for parallel.py and the parallel WINDOW/GROUP executors."""
+
+    def test_resolve_parallel_workers(self):
+        """Parallelism is off unless enabled; OPTIONS' 'parallel' counts as enabling it."""
+        assert resolve_parallel_workers({'enable_parallel_execution': False, 'max_workers': 8}) == 1
+        assert resolve_parallel_workers({'parallel': True, 'max_workers': 3}) == 3
+
+    def test_parallel_windows_match_serial(self):
+        """Partitions evaluated by workers come back in the serial order."""
+        specs = [WindowSpec('RANK', alias='rank'), WindowSpec('SUM', 'amount', alias='total')]
+        stats = {}
+        parallel = evaluate_windows_parallel(ROWS, specs, 'tenant', 'day', workers=2, min_rows=0, stats=stats)
+        assert stats['parallel_tasks'] == 7
+        assert parallel == evaluate_windows(ROWS, specs, ['tenant'], 'day')
+
+    def test_parallel_aggregation_matches_serial(self):
+        """Chunk aggregators merge into the serial groups, order and items included."""
+        specs = parse_aggregates('SUM(amount) AS total, AVG(amount) AS mean, COUNT(*) AS n')
+        for keep_items in (False, True):
+            stats = {}
+            merged = aggregate_parallel(
+                (row for row in ROWS), ['tenant'], specs, keep_items, workers=2, min_rows=100, stats=stats
+            )
+            serial = HashAggregator(['tenant'], specs, keep_items=keep_items).consume(ROWS)
+            assert stats['parallel_tasks'] == 14
+            assert list(merged.groups()) == pytest.approx(list(serial.groups()))
+            assert merged.total_items == len(ROWS)
+
+    def test_executors_honor_parallel_options(self):
+        """WINDOW and GROUP return the serial result when run in parallel."""
+        window = QueryAction(type='WINDOW', params={
+            'functions': 'LAG(amount) AS prev, SUM(amount) AS total', 'partition_by': 'tenant', 'order_by': 'day'
+        })
+        group = QueryAction(type='GROUP', params={'fields': ['tenant'], 'aggregates': 'MAX(amount) AS top'})
+        for action, executor in ((window, WindowExecutor()), (group, GroupExecutor())):
+            serial = executor.execute(action, ExecutionContext(node=ROWS)).data
+            parallel = executor.execute(action, ExecutionContext(node=ROWS, options=dict(PARALLEL))).data
+            assert parallel == serial
+
+    def test_unpicklable_rows_run_serially(self):
+        """Rows that cannot be sent to a worker process are evaluated in the caller."""
+        rows = [{'tenant': i % 3, 'day': i, 'fn': (lambda: None)} for i in range(30)]
+        results = evaluate_windows_parallel(rows, [WindowSpec('ROW_NUMBER')], 'tenant', 'day', workers=2, min_rows=0)
+        assert [row['window_row_number'] for row in results[:10]] == list(range(1, 11))
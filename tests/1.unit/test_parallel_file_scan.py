@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/tests/1.unit/test_parallel_file_scan.py
+Unit tests for parallel JSONL scans.
+Validates byte ranges cut at indexed line starts, ordered and unordered
+merges against the serial scan, worker-side projection, errors raised in
+workers, serial fallback for predicates that cannot be shipped, and the
+FILE_SOURCE parallel path.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.0.1
+Generation Date: 17-Oct-2026
+"""
+
+import json
+import os
+import pytest
+from exonware.xwquery.contracts import QueryAction, ExecutionContext
+from exonware.xwquery.errors import XWQueryExecutionError
+from exonware.xwquery.runtime.executors import parallel
+from exonware.xwquery.runtime.executors.data.file_source_executor import FileSourceExecutor
+from exonware.xwquery.runtime.executors.file_index import forget_index, open_index
+from exonware.xwquery.runtime.executors.file_scan import JsonlScan, scan_jsonl
+from exonware.xwquery.runtime.executors.parallel import scan_jsonl_parallel, scan_ranges
+PARALLEL = {'enable_parallel_execution': True, 'max_workers': 2, 'parallel_min_rows': 0}
+
+
+def _write_events(path, count=3000):
+    levels = ['info', 'warn', 'error']
+    with open(path, 'w') as handle:
+        for index in range(count):
+            event = {'id': index, 'level': levels[(index * 7) % 3], 'size': (index * 13) % 50}
+            if index % 5:
+                event['user'] = f'u{index % 17}'
+            handle.write(json.dumps(event) + ('\n\n' if index % 97 == 0 else '\n'))
+    return str(path)
+
+
+@pytest.fixture
+def small_ranges(monkeypatch):
+    """Cut test-sized files into several ranges (ranges are computed by the caller)."""
+    monkeypatch.setattr(parallel, '_MIN_RANGE_BYTES', 4096)
+    yield
+    forget_index()
+@pytest.mark.xwquery_unit
+
+class TestParallelFileScan:
+    """Unit tests for parallel.scan_jsonl_parallel and the FILE_SOURCE parallel path."""
+
+    def test_ranges_start_at_lines_and_cover_file(self, tmp_path, small_ranges):
+        """Ranges are contiguous, start at indexed line starts and end open."""
+        path = _write_events(tmp_path / 'events.jsonl')
+        offsets = open_index(path).offsets
+        ranges = scan_ranges(offsets, os.path.getsize(path), 2)
+        assert len(ranges) > 4 and ranges[0][0] == 0 and ranges[-1][1] is None
+        assert all(end == following for (_, end), (following, _) in zip(ranges, ranges[1:]))
+        assert all(start in set(offsets) for start, _ in ranges)
+        assert scan_ranges(offsets[:1], 10, 8) == [(0, None)]
+        lines = [list(scan_jsonl(path, JsonlScan(), start, end)) for start, end in ranges]
+        assert [record for part in lines for record in part] == list(scan_jsonl(path, JsonlScan()))
+
+    def test_ordered_and_unordered_match_serial(self, tmp_path, small_ranges):
+        """Ordered merges equal the serial scan; unordered ones hold the same records."""
+        path = _write_events(tmp_path / 'events.jsonl')
+        offsets = open_index(path).offsets
+        condition = "level = 'error' AND size >= 10"
+        serial_scan = JsonlScan(condition=condition)
+        serial = list(scan_jsonl(path, serial_scan))
+        scan = JsonlScan(condition=condition)
+        assert list(scan_jsonl_parallel(path, scan, offsets, 2)) == serial
+        assert scan.stats['parallel_tasks'] > 4
+        assert {key: scan.stats[key] for key in serial_scan.stats} == serial_scan.stats
+        unordered = list(scan_jsonl_parallel(path, JsonlScan(condition=condition), offsets, 2, ordered=False))
+        assert sorted(record['id'] for record in unordered) == [record['id'] for record in serial]
+
+    def test_projection_in_workers(self, tmp_path, small_ranges):
+        """Workers project rows and keep None for rows without selected values."""
+        path = _write_events(tmp_path / 'events.jsonl')
+        scan = JsonlScan(condition="level = 'warn'", columns=['user'])
+        rows = list(scan_jsonl_parallel(path, scan, open_index(path).offsets, 2, project=True))
+        expected = [scan.project(record) for record in scan_jsonl(path, JsonlScan(condition="level = 'warn'"))]
+        assert rows == expected and None in rows
+
+    def test_worker_errors_and_serial_fallback(self, tmp_path, small_ranges):
+        """Invalid JSON fails the query; unpicklable predicates run in the caller."""
+        path = _write_events(tmp_path / 'events.jsonl')
+        with open(path, 'a') as handle:
+            handle.write('not json\n')
+        offsets = open_index(path).offsets
+        with pytest.raises(XWQueryExecutionError):
+            list(scan_jsonl_parallel(path, JsonlScan(), offsets, 2))
+        scan = JsonlScan(lambda record: record.get('user') == 'u3', None)
+        with pytest.raises(XWQueryExecutionError):
+            list(scan_jsonl_parallel(path, scan, offsets, 2))
+        scan = JsonlScan(lambda record: isinstance(record, dict) and record.get('user') == 'u3', "user = 'u3'")
+        found = list(scan_jsonl_parallel(path, scan, offsets, 2))
+        assert found and all(record['user'] == 'u3' for record in found)
+
+    def test_file_source_parallel(self, tmp_path, small_ranges):
+        """FILE_SOURCE returns the serial rows (in serial order under ORDER BY/OFFSET) in parallel."""
+        path = _write_events(tmp_path / 'events.jsonl')
+        queries = [
+            {'where': "level != 'info'", 'columns': ['id', 'user'], 'offset': 5, 'limit': 40},
+            {'where': "size < 20", 'order_by': 'size DESC', 'columns': ['id'], 'limit': 30},
+            {'where': "user = 'u4'"},
+        ]
+        ordered = (True, True, False)
+        for params, keeps_order in zip(queries, ordered):
+            action = QueryAction(type='FILE_SOURCE', params={'source': path, **params})
+            serial = FileSourceExecutor().execute(action, ExecutionContext(node={}))
+            result = FileSourceExecutor().execute(action, ExecutionContext(node={}, options=PARALLEL))
+            assert result.success, result.error
+            assert result.metadata['scan_stats']['parallel_tasks'] > 1
+            if keeps_order:
+                assert result.data == serial.data
+            else:
+                assert sorted(result.data, key=lambda row: row['id']) == serial.data
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/tests/1.unit/test_path_enumeration.py
+Unit tests for bounded path enumeration.
+Validates the all-shortest-paths predecessor DAG, Yen's k shortest paths and
+pruned simple path DFS against brute-force enumeration on random graphs,
+path-count and time budgets, and the ALL_SHORTEST_PATHS / ALL_PATHS /
+ALL_SIMPLE_PATHS executors built on them.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.0.1
+Generation Date: 17-Oct-2026
+"""
+
+import random
+import time
+import pytest
+from exonware.xwquery.contracts import QueryAction, ExecutionContext
+from exonware.xwquery.runtime.executors.graph.all_paths_executor import AllPathsExecutor
+from exonware.xwquery.runtime.executors.graph.all_shortest_paths_executor import AllShortestPathsExecutor
+from exonware.xwquery.runtime.executors.graph.all_simple_paths_executor import AllSimplePathsExecutor
+from exonware.xwquery.runtime.executors.graph_algorithms import (
+    collect_paths,
+    count_dag_paths,
+    dag_paths,
+    edge_list_graph,
+    k_shortest_paths,
+    shortest_path_dag,
+    simple_paths,
+)
+
+
+class Graph:
+    def __init__(self, edges, weights=None):
+        self.graph_version = 1
+        self.edges, self.weights = {}, weights or {}
+        for source, target in edges:
+            self.edges.setdefault(source, []).append(target)
+            self.edges.setdefault(target, [])
+
+    def get_all_vertices(self):
+        return list(self.edges)
+
+    def get_neighbors(self, vertex):
+        return self.edges[vertex]
+
+    def get_edge_weight(self, source, target):
+        return self.weights.get((source, target), 1)
+
+
+def _grid_edges(size):
+    """Right/down edges of a size x size grid: C(2n-2, n-1) shortest corner paths."""
+    edges = []
+    for x in range(size):
+        for y in range(size):
+            if x + 1 < size:
+                edges.append(((x, y), (x + 1, y)))
+            if y + 1 < size:
+                edges.append(((x, y), (x, y + 1)))
+    return edges
+
+
+def _all_simple(graph, start, goal, path=None):
+    path = path or [start]
+    if path[-1] == goal:
+        yield list(path)
+        return
+    for neighbor in graph.out(path[-1]):
+        if neighbor not in path:
+            yield from _all_simple(graph, start, goal, path + [neighbor])
+
+
+def _random_case(seed):
+    generator = random.Random(seed)
+    edges = list({(generator.randrange(9), generator.randrange(9)) for _ in range(24)})
+    costs = {edge: generator.randint(1, 4) for edge in edges}
+    graph = edge_list_graph(edges)
+    weight = lambda source, target: costs[(source, target)]
+    cost = lambda path: sum(costs[(graph.vertices[a], graph.vertices[b])] for a, b in zip(path, path[1:]))
+    return graph, weight, cost
+
+
+def _run(executor, node, **params):
+    result = executor.execute(QueryAction(type=executor.OPERATION_NAME, params=params), ExecutionContext(node=node))
+    assert result.success
+    return result.data
+@pytest.mark.xwquery_unit
+
+class TestPathEnumeration:
+    """Unit tests for the path enumeration kernels in graph_algorithms.py."""
+
+    def test_shortest_path_dag_matches_brute_force(self):
+        """The DAG lists exactly the minimum-hop and minimum-cost simple paths."""
+        for seed in range(8):
+            graph, weight, cost = _random_case(seed)
+            for start, goal in ((0, len(graph) - 1), (1, 2)):
+                reference = list(_all_simple(graph, start, goal))
+                if not reference:
+                    assert shortest_path_dag(graph, start, goal)[1] == float('inf')
+                    continue
+                fewest = min(len(path) for path in reference)
+                predecessors, distance = shortest_path_dag(graph, start, goal)
+                assert distance == fewest - 1
+                assert sorted(dag_paths(predecessors, goal)) == sorted(p for p in reference if len(p) == fewest)
+                cheapest = min(map(cost, reference))
+                predecessors, distance = shortest_path_dag(graph, start, goal, weight, weighted=True)
+                expected = sorted(p for p in reference if cost(p) == cheapest)
+                assert distance == cheapest
+                assert sorted(dag_paths(predecessors, goal)) == expected
+                assert count_dag_paths(predecessors, goal) == len(expected)
+
+    def test_yen_matches_brute_force_costs(self):
+        """Yen's paths come out cheapest first, distinct, and with brute-force costs."""
+        for seed in range(8):
+            graph, weight, cost = _random_case(seed)
+            reference = sorted(map(cost, _all_simple(graph, 0, len(graph) - 1)))
+            found = list(k_shortest_paths(graph, 0, len(graph) - 1, weight))
+            assert [distance for _, distance in found] == reference
+            assert all(cost(path) == distance for path, distance in found)
+            assert len({tuple(path) for path, _ in found}) == len(found)
+
+    def test_simple_paths_bounded_and_pruned(self):
+        """Explicit-stack DFS honors max_length, prunes dead ends and handles deep chains."""
+        for seed in range(8):
+            graph, _, _ = _random_case(seed)
+            reference = sorted(p for p in _all_simple(graph, 0, 1) if len(p) <= 5)
+            assert sorted(simple_paths(graph, 0, 1, max_length=4)) == reference
+            assert sorted(simple_paths(graph, 0, 1, max_length=4, reverse=graph.transpose())) == reference
+        chain = edge_list_graph([(index, index + 1) for index in range(5000)])
+        assert len(next(simple_paths(chain, 0, 5000, reverse=chain.transpose()))) == 5001
+
+    def test_budgets_bound_exponential_enumerations(self):
+        """Path counts stay exact on huge DAGs; max_paths and timeouts cut enumeration short."""
+        graph = edge_list_graph(_grid_edges(30))
+        predecessors, distance = shortest_path_dag(graph, 0, len(graph) - 1)
+        assert distance == 58 and count_dag_paths(predecessors, len(graph) - 1) == 30067266499541040
+        paths, truncated = collect_paths(dag_paths(predecessors, len(graph) - 1), 5)
+        assert len(paths) == 5 and truncated
+        complete = edge_list_graph([(a, b) for a in range(14) for b in range(14) if a != b])
+        began = time.monotonic()
+        paths, truncated = collect_paths(simple_paths(complete, 0, 13, deadline=began + 0.05), None, began + 0.05)
+        assert truncated and paths and time.monotonic() - began < 1
+
+    def test_executors(self):
+        """ALL_SHORTEST_PATHS counts and lists paths; ALL_PATHS/ALL_SIMPLE_PATHS rank k routes."""
+        node = Graph(_grid_edges(4), {((0, 0), (1, 0)): 3})
+        data = _run(AllShortestPathsExecutor(), node, source=(0, 0), target=(3, 3), max_paths=5)
+        assert (data['shortest_distance'], data['total_path_count'], data['path_count']) == (6, 20, 5)
+        assert data['truncated']
+        weighted = _run(AllShortestPathsExecutor(), node, source=(0, 0), target=(3, 3), weighted=True)
+        assert (weighted['shortest_distance'], weighted['path_count'], weighted['truncated']) == (6, 10, False)
+        for executor in (AllPathsExecutor(), AllSimplePathsExecutor()):
+            routes = _run(executor, node, source=(0, 0), target=(3, 3), k=12, weighted=True)
+            assert routes['costs'] == [6] * 10 + [8, 8] and not routes['truncated']
+            assert all(path[1] == (0, 1) for path in routes['paths'][:10])
+            bounded = _run(executor, node, source=(0, 0), target=(3, 3), max_paths=7)
+            assert bounded['path_count'] == 7 and bounded['truncated']
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/tests/1.unit/test_predicate_compiler.py
+Unit tests for the compiled predicate engine.
+Validates that every supported WHERE condition form compiles to the same
+semantics (SQL nulls, LIKE, IN, BETWEEN) and that compiled predicates are
+reused across executors.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.0.1
+Generation Date: 16-Oct-2026
+"""
+
+import pytest
+from exonware.xwquery.errors import XWQueryValueError
+from exonware.xwquery.contracts import QueryAction, ExecutionContext
+from exonware.xwquery.runtime.executors import WhereExecutor
+from exonware.xwquery.runtime.executors.predicates import compile_predicate, is_match_all
+ROWS = [
+    {'name': 'Alice', 'age': 30, 'city': 'Riyadh', 'profile': {'age': 30}},
+    {'name': 'bob', 'age': None},
+    {'name': "O'Brien", 'age': 'unknown'},
+    {'age': 17, 'vip': True},
+]
+
+
+def _names(condition):
+    predicate = compile_predicate(condition)
+    return [row.get('name') for row in ROWS if predicate(row)]
+@pytest.mark.xwquery_unit
+
+class TestPredicateCompiler:
+    """Unit tests for compile_predicate()."""
+
+    def test_sql_dict_uses_null_semantics(self):
+        """Comparisons never match NULL or incomparable values."""
+        assert _names({'field': 'age', 'operator': '>=', 'value': 18}) == ['Alice']
+        assert _names({'field': 'age', 'operator': '!=', 'value': 30}) == ["O'Brien", None]
+
+    def test_string_expression_with_and_or(self):
+        """String expressions support AND/OR/NOT with parentheses."""
+        assert _names("age > 18 AND (name LIKE 'a%' OR vip = true)") == ['Alice']
+        assert _names("age < 18 OR name = 'bob'") == ['bob', None]
+        assert _names("age NOT BETWEEN 10 AND 20") == ['Alice']
+
+    def test_null_in_and_like(self):
+        """IS NULL, IN lists and LIKE patterns."""
+        assert _names('age IS NULL') == ['bob']
+        assert _names("name IN ('bob', 'Alice')") == ['Alice', 'bob']
+        assert _names("name LIKE 'o''b%'") == ["O'Brien"]
+
+    def test_grammar_and_equality_dicts(self):
+        """Syntax-adapter trees and equality dicts compile to the same predicates."""
+        logical = {
+            'type': 'logical', 'operator': 'OR', 'operands': [
+                {'type': 'comparison', 'left': 'age', 'operator': 'LESS', 'right': 18},
+                {'type': 'comparison', 'left': 'name', 'operator': 'EQUAL', 'right': 'bob'},
+            ]
+        }
+        assert _names(logical) == ['bob', None]
+        assert _names({'profile.age': 30}) == ['Alice']
+        assert _names({'name': ['bob', 'Alice']}) == ['Alice', 'bob']
+
+    def test_match_all_and_bare_field(self):
+        """Empty conditions match everything; a bare field checks existence."""
+        assert is_match_all(compile_predicate(None))
+        assert is_match_all(compile_predicate({}))
+        assert _names('vip') == [None]
+
+    def test_invalid_expression_raises(self):
+        """Malformed expressions are reported, not silently matched."""
+        with pytest.raises(XWQueryValueError):
+            compile_predicate('age >')
+        for condition in ('is active', 'age > 5 AND'):
+            result = WhereExecutor().execute(QueryAction(type='WHERE', params={'condition': condition}), ExecutionContext(node=ROWS))
+            assert not result.success and condition in result.error
+
+    def test_compiled_once_per_condition(self):
+        """The same condition object yields the cached predicate."""
+        condition = {'field': 'age', 'operator': '>', 'value': 1}
+        assert compile_predicate(condition) is compile_predicate(condition)
+        assert compile_predicate(dict(condition)) is compile_predicate(condition)
+
+    def test_mutated_conditions_compile_again(self):
+        """A condition changed after compiling (or a new one at a recycled id) is not served stale."""
+        condition = {'field': 'age', 'operator': '>', 'value': 40}
+        assert _names(condition) == []
+        condition['value'] = 20
+        assert _names(condition) == ['Alice']
+        for value in range(600):
+            predicate = compile_predicate({'field': 'age', 'operator': '=', 'value': value})
+            assert predicate({'age': value}) and not predicate({'age': value + 1})
+
+    def test_callables_are_not_cached(self):
+        """Callable conditions are wrapped per call, so the cache keeps no closure alive."""
+        import gc
+        import weakref
+        condition = lambda row: row.get('vip')
+        assert _names(condition) == [None]
+        alive = weakref.ref(condition)
+        del condition
+        gc.collect()
+        assert alive() is None
+
+    def test_where_script_condition_in_params(self):
+        """A script WHERE line carries its condition directly in params."""
+        action = QueryAction(type='WHERE', params={'field': 'age', 'operator': '<', 'value': 18})
+        result = WhereExecutor().execute(action, ExecutionContext(node=ROWS))
+        assert result.success
+        assert result.data == [ROWS[3]]
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/tests/1.unit/test_projection_expressions.py
+Unit tests for compiled projection expressions.
+Validates arithmetic, string functions, CASE and COALESCE in SELECT columns,
+SQL NULL propagation, and that values with spaces or quotes are safe.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.0.1
+Generation Date: 17-Oct-2026
+"""
+
+import pytest
+from exonware.xwquery.errors import XWQueryValueError
+from exonware.xwquery.contracts import QueryAction, ExecutionContext
+from exonware.xwquery.runtime.executors import SelectExecutor
+from exonware.xwquery.runtime.executors.expressions import (
+    compile_expression,
+    compile_projection,
+    split_alias,
+)
+ROW = {'name': "O'Brien Smith", 'age': 30, 'price': 2.5, 'qty': 4, 'city': None, 'address': {'zip': '11564'}}
+@pytest.mark.xwquery_unit
+
+class TestProjectionExpressions:
+    """Unit tests for compile_expression() and compile_projection()."""
+
+    def test_arithmetic_and_precedence(self):
+        """Arithmetic follows standard precedence; constants are folded."""
+        assert compile_expression('age - 5')(ROW) == 25
+        assert compile_expression('price * qty + 1')(ROW) == 11.0
+        assert compile_expression('(1 + 2) * 3')(None) == 9
+
+    def test_values_with_quotes_and_spaces(self):
+        """Field values are never spliced into the expression text."""
+        assert compile_expression('UPPER(name)')(ROW) == "O'BRIEN SMITH"
+        assert compile_expression("REPLACE(name, ' ', '_')")(ROW) == "O'Brien_Smith"
+        assert compile_expression("name || '!'")(ROW) == "O'Brien Smith!"
+
+    def test_null_propagation(self):
+        """NULL (or a missing field) propagates; COALESCE picks the first value."""
+        assert compile_expression('city + 1')(ROW) is None
+        assert compile_expression('missing * 2')(ROW) is None
+        assert compile_expression('age / 0')(ROW) is None
+        assert compile_expression('NOT NULL')(ROW) is None and compile_expression('NOT city')(ROW) is None
+        assert compile_expression('NOT (age > 40)')(ROW) is True
+        assert compile_expression("COALESCE(city, 'unknown')")(ROW) == 'unknown'
+
+    def test_case_expressions(self):
+        """Searched and simple CASE forms."""
+        searched = compile_expression("CASE WHEN age >= 18 THEN 'adult' ELSE 'minor' END")
+        simple = compile_expression("CASE qty WHEN 1 THEN 'one' WHEN 4 THEN 'four' END")
+        assert searched(ROW) == 'adult'
+        assert searched({'age': 10}) == 'minor'
+        assert simple(ROW) == 'four'
+
+    def test_invalid_expression_raises(self):
+        """Malformed expressions and unknown functions are reported."""
+        with pytest.raises(XWQueryValueError):
+            compile_expression('age +')
+        with pytest.raises(XWQueryValueError):
+            compile_expression('NOPE(age)')
+
+    def test_split_alias(self):
+        """Only a trailing top-level AS is an alias."""
+        assert split_alias('age - 5 AS perfect_age') == ('age - 5', 'perfect_age')
+        assert split_alias('CAST(age AS TEXT)') == ('CAST(age AS TEXT)', None)
+
+    def test_projection_is_cached(self):
+        """A column list compiles to one cached projector."""
+        columns = ['name', 'age - 5 AS perfect_age', 'address.zip']
+        project = compile_projection(columns)
+        assert project is compile_projection(list(columns))
+        assert project(ROW) == {'name': "O'Brien Smith", 'perfect_age': 25, 'address.zip': '11564'}
+        assert compile_projection(['missing'])(ROW) is None
+
+    def test_select_computed_columns(self):
+        """SELECT evaluates computed columns through the compiled projector."""
+        data = [{'name': 'a b', 'age': 20}, {'name': "c'd", 'age': 40}]
+        action = QueryAction(type='SELECT', params={'fields': ['name', 'age * 2 AS double_age']})
+        result = SelectExecutor().execute(action, ExecutionContext(node=data))
+        assert result.success
+        assert result.data == [{'name': 'a b', 'double_age': 40}, {'name': "c'd", 'double_age': 80}]
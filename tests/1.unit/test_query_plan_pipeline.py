@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/tests/1.unit/test_query_plan_pipeline.py
+Unit tests for the plan-then-execute pipeline.
+Validates that QueryAction trees are planned, rewritten by the optimization
+rules, lowered back to executable trees, and that the config flag is honored.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.0.1
+Generation Date: 16-Oct-2026
+"""
+
+import pytest
+from exonware.xwquery.contracts import QueryAction, ExecutionContext
+from exonware.xwquery.runtime.optimization import (
+    QueryPlanPipeline,
+    PlanNodeType,
+    is_optimization_enabled,
+    optimize_action_tree,
+)
+from exonware.xwquery.runtime.executors.engine import NativeOperationsExecutionEngine
+
+
+def _program(*stages):
+    """Build a PROGRAM pipeline from stages."""
+    root = QueryAction(type='PROGRAM', id='root')
+    for stage in stages:
+        root.add_child(stage)
+    return root
+
+
+def _users():
+    return {'users': [{'name': f'u{i}', 'age': 20 + i} for i in range(20)]}
+@pytest.mark.xwquery_unit
+
+class TestQueryPlanPipeline:
+    """Unit tests for QueryPlanPipeline and engine integration."""
+
+    def test_filter_pushed_below_sort_into_scan(self):
+        """WHERE after ORDER is moved before the sort and merged into the scan."""
+        tree = _program(
+            QueryAction(type='SELECT', params={'fields': ['*'], 'from': 'users'}),
+            QueryAction(type='ORDER', params={'order_by': 'age DESC'}),
+            QueryAction(type='WHERE', params={'field': 'age', 'operator': '>', 'value': 30}),
+        )
+        optimized = optimize_action_tree(tree)
+        stages = optimized.get_children()
+        assert [stage.type for stage in stages] == ['SELECT', 'ORDER']
+        assert stages[0].params['where'] == {'field': 'age', 'operator': '>', 'value': 30}
+        assert optimized.metadata.get('optimized') is True
+
+    def test_filter_not_pushed_across_limit(self):
+        """A LIMIT is a barrier: the plan must stay as written."""
+        tree = _program(
+            QueryAction(type='SELECT', params={'fields': ['*'], 'from': 'users'}),
+            QueryAction(type='LIMIT', params={'limit': 5}),
+            QueryAction(type='WHERE', params={'field': 'age', 'operator': '>', 'value': 30}),
+        )
+        assert optimize_action_tree(tree) is tree
+
+    def test_filter_not_merged_into_projecting_scan(self):
+        """A scan that projects columns does not absorb later filters."""
+        tree = _program(
+            QueryAction(type='SELECT', params={'fields': ['name'], 'from': 'users'}),
+            QueryAction(type='WHERE', params={'field': 'age', 'operator': '>', 'value': 30}),
+        )
+        assert optimize_action_tree(tree) is tree
+
+    def test_physical_plan_shape(self):
+        """The physical plan models pipeline stages as a chain of plan nodes."""
+        import asyncio
+        tree = _program(
+            QueryAction(type='SELECT', params={'fields': ['*'], 'from': 'users'}),
+            QueryAction(type='LIMIT', params={'limit': 5}),
+        )
+        plan = asyncio.run(QueryPlanPipeline().plan(tree))
+        root = plan.get_root_node()
+        assert root.get_type() == PlanNodeType.LIMIT.name
+        assert root.get_children()[0].get_type() == PlanNodeType.SEQUENTIAL_SCAN.name
+        assert plan.metadata['rewritten'] is False
+
+    def test_optimize_option_overrides_config(self):
+        """The 'optimize' execution option wins over the config flag."""
+        assert is_optimization_enabled({'optimize': False}) is False
+        assert is_optimization_enabled({'optimize': True}) is True
+
+    def test_engine_executes_optimized_plan(self):
+        """Optimized and unoptimized execution return the same rows."""
+        tree = _program(
+            QueryAction(type='SELECT', params={'fields': ['*'], 'from': 'users'}),
+            QueryAction(type='WHERE', params={'field': 'age', 'operator': '>=', 'value': 35}),
+        )
+        engine = NativeOperationsExecutionEngine()
+        optimized = engine.execute_tree(tree, ExecutionContext(node=_users(), options={'optimize': True}))
+        assert optimized.success
+        assert [row['age'] for row in optimized.data] == [35, 36, 37, 38, 39]
+
+    def test_filter_pushed_into_key_value_scan(self):
+        """A WHERE merged into a scan of a key-value source filters like the unoptimized plan."""
+        tree = _program(
+            QueryAction(type='SELECT', params={'fields': ['*'], 'from': 'cfg'}),
+            QueryAction(type='WHERE', params={'field': 'value', 'operator': '>', 'value': 1}),
+        )
+        engine = NativeOperationsExecutionEngine()
+        results = [
+            engine.execute_tree(tree, ExecutionContext(node={'cfg': {'a': 1, 'b': 2, 'c': 3}}, options={'optimize': optimize}))
+            for optimize in (True, False)
+        ]
+        assert all(result.success for result in results)
+        assert results[0].data == results[1].data == [{'key': 'b', 'value': 2}, {'key': 'c', 'value': 3}]
+
+    def test_limit_fused_into_sort(self):
+        """ORDER followed by LIMIT lowers to a Top-N sort plus the LIMIT."""
+        tree = _program(
+            QueryAction(type='SELECT', params={'fields': ['*'], 'from': 'users'}),
+            QueryAction(type='ORDER', params={'order_by': 'age DESC'}),
+            QueryAction(type='LIMIT', params={'limit': 3, 'offset': 2}),
+        )
+        optimized = optimize_action_tree(tree)
+        stages = optimized.get_children()
+        assert [stage.type for stage in stages] == ['SELECT', 'ORDER', 'LIMIT']
+        assert stages[1].params['top_n'] == 5
+        engine = NativeOperationsExecutionEngine()
+        result = engine.execute_tree(tree, ExecutionContext(node=_users(), options={'optimize': True}))
+        assert result.success
+        assert [row['age'] for row in result.data] == [37, 36, 35]
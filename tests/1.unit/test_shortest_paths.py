@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/tests/1.unit/test_shortest_paths.py
+Unit tests for point-to-point shortest path search.
+Validates bidirectional BFS, bidirectional Dijkstra and A* against a plain
+Dijkstra reference on random graphs, that bidirectional search explores far
+fewer vertices on large grids, and the SHORTEST_PATH executor's algorithm
+selection and A* coordinate heuristics.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.0.1
+Generation Date: 17-Oct-2026
+"""
+
+import heapq
+import random
+import pytest
+from exonware.xwquery.contracts import QueryAction, ExecutionContext
+from exonware.xwquery.errors import XWQueryValueError
+from exonware.xwquery.runtime.executors.graph.shortest_path_executor import ShortestPathExecutor
+from exonware.xwquery.runtime.executors.graph_algorithms import (
+    bfs_path,
+    bidirectional_bfs,
+    bidirectional_dijkstra,
+    dijkstra_path,
+    edge_list_graph,
+)
+
+
+class Graph:
+    """Versioned graph with weighted edges and (x, y) vertex coordinates."""
+
+    def __init__(self, edges, points=None):
+        self.graph_version = 1
+        self.out, self.weights, self.points = {}, {}, points or {}
+        for source, target, weight in edges:
+            self.out.setdefault(source, []).append(target)
+            self.out.setdefault(target, [])
+            self.weights[(source, target)] = weight
+
+    def get_all_vertices(self):
+        return list(self.out)
+
+    def get_neighbors(self, vertex):
+        return self.out[vertex]
+
+    def get_edge_weight(self, source, target):
+        return self.weights[(source, target)]
+
+    def get_vertex_properties(self, vertex):
+        return {'x': self.points[vertex][0], 'y': self.points[vertex][1]}
+
+
+def _grid(size, seed=0):
+    """Directed grid (both directions) with weights >= the euclidean step length."""
+    generator = random.Random(seed)
+    edges, points = [], {}
+    for x in range(size):
+        for y in range(size):
+            points[(x, y)] = (x, y)
+            for dx, dy in ((1, 0), (0, 1), (-1, 0), (0, -1)):
+                if 0 <= x + dx < size and 0 <= y + dy < size:
+                    edges.append(((x, y), (x + dx, y + dy), 1 + generator.randint(0, 3)))
+    return Graph(edges, points)
+
+
+def _reference(graph, start, goal, weight):
+    distances, queue = {start: 0}, [(0, start)]
+    while queue:
+        distance, current = heapq.heappop(queue)
+        if current == goal:
+            return distance
+        if distance > distances[current]:
+            continue
+        for neighbor in graph.out(current):
+            candidate = distance + weight(current, neighbor)
+            if candidate < distances.get(neighbor, float('inf')):
+                distances[neighbor] = candidate
+                heapq.heappush(queue, (candidate, neighbor))
+    return float('inf')
+
+
+def _shortest(node, **params):
+    action = QueryAction(type='SHORTEST_PATH', params=params)
+    result = ShortestPathExecutor().execute(action, ExecutionContext(node=node))
+    assert result.success
+    return result.data
+@pytest.mark.xwquery_unit
+
+class TestShortestPaths:
+    """Unit tests for the search kernels in graph_algorithms.py and SHORTEST_PATH."""
+
+    def test_searches_match_reference(self):
+        """Every algorithm finds the reference distance on random graphs."""
+        for seed in range(6):
+            generator = random.Random(seed)
+            edges = [(generator.randrange(40), generator.randrange(40)) for _ in range(120)]
+            costs = {edge: generator.randint(1, 9) for edge in edges}
+            graph = edge_list_graph(edges)
+            weight = lambda source, target: costs[(graph.vertices[source], graph.vertices[target])]
+            named = lambda source, target: costs[(source, target)]
+            for _ in range(10):
+                start, goal = generator.randrange(len(graph)), generator.randrange(len(graph))
+                hops = _reference(graph, start, goal, lambda *_: 1)
+                expected = _reference(graph, start, goal, weight)
+                for path in (bfs_path(graph, start, goal), bidirectional_bfs(graph, graph.transpose(), start, goal)):
+                    assert (len(path) - 1 if path else float('inf')) == hops
+                for path, distance in (
+                    dijkstra_path(graph, start, goal, named),
+                    bidirectional_dijkstra(graph, graph.transpose(), start, goal, named),
+                ):
+                    assert distance == expected
+                    if path:
+                        assert path[0] == start and path[-1] == goal
+                        assert sum(weight(a, b) for a, b in zip(path, path[1:])) == expected
+
+    def test_bidirectional_search_explores_less(self):
+        """On a large sparse graph both bidirectional searches settle a fraction of the vertices."""
+        generator, edges = random.Random(1), []
+        for vertex in range(5000):
+            for _ in range(2):
+                other, weight = generator.randrange(5000), generator.randint(1, 5)
+                edges += [(f'v{vertex}', f'v{other}', weight), (f'v{other}', f'v{vertex}', weight)]
+        node = Graph(edges)
+        one_way = _shortest(node, source='v1', target='v4999', algorithm='bfs')
+        both_ways = _shortest(node, source='v1', target='v4999')
+        assert both_ways['algorithm'] == 'bidirectional_bfs'
+        assert both_ways['distance'] == one_way['distance']
+        assert both_ways['visited_count'] * 4 < one_way['visited_count']
+        dijkstra = _shortest(node, source='v1', target='v4999', weighted=True, algorithm='dijkstra')
+        bidirectional = _shortest(node, source='v1', target='v4999', weighted=True)
+        assert bidirectional['algorithm'] == 'bidirectional_dijkstra'
+        assert bidirectional['distance'] == dijkstra['distance']
+        assert bidirectional['visited_count'] * 4 < dijkstra['visited_count']
+
+    def test_weights_evaluated_for_expanded_vertices_once(self):
+        """Weighted searches read only the expanded vertices' edge weights, once per snapshot."""
+        generator, edges = random.Random(2), []
+        for vertex in range(3000):
+            for _ in range(3):
+                other, weight = generator.randrange(3000), generator.randint(1, 5)
+                edges += [(vertex, other, weight), (other, vertex, weight)]
+        node, calls = Graph(edges), []
+        get_edge_weight = node.get_edge_weight
+        node.get_edge_weight = lambda source, target: calls.append(source) or get_edge_weight(source, target)
+        node.get_edge_property = lambda source, target, name: calls.append(source) or get_edge_weight(source, target)
+        for params in ({}, {'weight_property': 'cost'}):
+            first = _shortest(node, source=1, target=2, weighted=True, **params)
+            assert first['algorithm'] == 'bidirectional_dijkstra'
+            assert 0 < len(calls) < len(edges) // 10
+            calls.clear()
+            assert _shortest(node, source=1, target=2, weighted=True, **params)['distance'] == first['distance']
+            assert calls == []
+
+    def test_astar_with_coordinates(self):
+        """A* with a euclidean heuristic over vertex properties stays optimal and explores less."""
+        node = _grid(40, seed=3)
+        dijkstra = _shortest(node, source=(0, 0), target=(30, 25), weighted=True, algorithm='dijkstra')
+        astar = _shortest(node, source=(0, 0), target=(30, 25), heuristic='euclidean', coordinates=['x', 'y'])
+        assert astar['algorithm'] == 'astar'
+        assert astar['distance'] == dijkstra['distance']
+        assert astar['visited_count'] < dijkstra['visited_count']
+        custom = _shortest(node, source=(0, 0), target=(30, 25), heuristic=lambda v, t: abs(v[0] - t[0]))
+        assert custom['distance'] == dijkstra['distance']
+
+    def test_negative_weights_raise(self):
+        """Dijkstra-based searches refuse negative edge weights instead of returning wrong paths."""
+        graph = edge_list_graph([('a', 'b'), ('b', 'c')])
+        with pytest.raises(XWQueryValueError):
+            dijkstra_path(graph, 0, 2, lambda source, target: -1)
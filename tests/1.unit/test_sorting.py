@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/tests/1.unit/test_sorting.py
+Unit tests for shared ORDER BY support.
+Validates per-key ASC/DESC, NULLS FIRST/LAST, and that Top-N selection and
+the external (spill-to-disk) merge sort return exactly what a full in-memory
+sort returns (including ties).
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.0.1
+Generation Date: 17-Oct-2026
+"""
+
+import pytest
+from exonware.xwquery.contracts import QueryAction, ExecutionContext
+from exonware.xwquery.runtime.executors import SelectExecutor, OrderExecutor
+from exonware.xwquery.runtime.executors.sorting import (
+    SortSpec,
+    external_sort,
+    iter_sorted,
+    parse_order_by,
+    sort_rows,
+    top_n,
+)
+ROWS = [
+    {'id': 1, 'team': 'b', 'score': 10},
+    {'id': 2, 'team': 'a', 'score': None},
+    {'id': 3, 'team': 'a', 'score': 30},
+    {'id': 4, 'team': 'b', 'score': 30},
+    {'id': 5, 'team': 'a', 'score': 20},
+]
+
+
+def _ids(rows):
+    return [row['id'] for row in rows]
+@pytest.mark.xwquery_unit
+
+class TestSorting:
+    """Unit tests for parse_order_by(), sort_rows() and top_n()."""
+
+    def test_parse_order_by_forms(self):
+        """Strings, grammar dicts and NULLS clauses normalize to SortSpec."""
+        assert parse_order_by('score DESC NULLS LAST, team') == [
+            SortSpec('score', True, False), SortSpec('team', False, None)
+        ]
+        assert parse_order_by([{'column': 'team', 'direction': 'desc'}]) == [SortSpec('team', True, None)]
+
+    def test_mixed_directions(self):
+        """Each key keeps its own direction."""
+        assert _ids(sort_rows(ROWS, parse_order_by('team ASC, score DESC'))) == [2, 3, 5, 4, 1]
+        assert _ids(sort_rows(ROWS, parse_order_by('team DESC, score ASC'))) == [1, 4, 5, 3, 2]
+
+    def test_null_placement(self):
+        """NULLs are largest by default; NULLS FIRST/LAST overrides."""
+        assert _ids(sort_rows(ROWS, parse_order_by('score')))[-1] == 2
+        assert _ids(sort_rows(ROWS, parse_order_by('score DESC')))[0] == 2
+        assert _ids(sort_rows(ROWS, parse_order_by('score DESC NULLS LAST')))[-1] == 2
+
+    def test_top_n_matches_full_sort(self):
+        """Top-N returns the same rows, in the same tie order, as sort + slice."""
+        rows = [{'id': i, 'a': i % 3, 'b': (i * 7) % 5} for i in range(200)]
+        for clause in ('a DESC', 'a, b DESC', 'b DESC, a DESC', 'a NULLS FIRST'):
+            specs = parse_order_by(clause)
+            assert top_n(rows, specs, 15) == sort_rows(rows, specs)[:15]
+
+    def test_select_order_by_limit(self):
+        """SELECT ORDER BY ... LIMIT honors every key and the offset."""
+        action = QueryAction(
+            type='SELECT',
+            params={'fields': ['*'], 'order_by': 'team ASC, score DESC', 'limit': 2, 'offset': 1}
+        )
+        result = SelectExecutor().execute(action, ExecutionContext(node=ROWS))
+        assert result.success
+        assert _ids(result.data) == [3, 5]
+
+    def test_order_executor_multi_key_top_n(self):
+        """ORDER sorts by several keys and honors a fused top_n."""
+        action = QueryAction(type='ORDER', params={'order_by': 'score DESC, id', 'top_n': 3})
+        result = OrderExecutor().execute(action, ExecutionContext(node=list(ROWS)))
+        assert result.success
+        assert _ids(result.data) == [2, 3, 4]
+
+    def test_external_sort_matches_in_memory(self, tmp_path):
+        """Spilled runs merge back into the same order as an in-memory sort."""
+        rows = [{'id': i, 'a': (i * 37) % 11, 'b': None if i % 7 == 0 else i % 4} for i in range(3000)]
+        for clause in ('a', 'a DESC, b', 'b DESC NULLS LAST, a DESC'):
+            specs = parse_order_by(clause)
+            spilled = list(external_sort(iter(rows), specs, memory_budget=16_384, spill_dir=str(tmp_path)))
+            assert spilled == sort_rows(rows, specs)
+
+    def test_iter_sorted_streams_input(self):
+        """Streamed input with a LIMIT is reduced by the heap, not materialized."""
+        specs = parse_order_by('n DESC')
+        rows = ({'n': i} for i in range(10_000))
+        assert [row['n'] for row in iter_sorted(rows, specs, limit=3, memory_budget=1024)] == [9999, 9998, 9997]
+
+    def test_order_executor_spills_streamed_input(self):
+        """ORDER over a generator honors the sort memory budget option."""
+        rows = ({'n': (i * 7919) % 5000} for i in range(5000))
+        action = QueryAction(type='ORDER', params={'order_by': 'n'})
+        context = ExecutionContext(node=rows, options={'sort_memory_budget_mb': 0.01})
+        batches = list(OrderExecutor().iter_execute(action, context))
+        assert [row['n'] for batch in batches for row in batch] == list(range(5000))
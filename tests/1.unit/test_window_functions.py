@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+#exonware/xwquery/tests/1.unit/test_window_functions.py
+Unit tests for the shared window function engine.
+Validates one-pass ranking over peer groups and sliding ROWS/RANGE frames
+(prefix sums, monotonic deques, two-pointer value bounds) against a naive
+per-row recomputation, plus frame parsing and multi-function WINDOW actions.
+Company: eXonware.com
+Author: eXonware Backend Team
+Email: connect@exonware.com
+Version: 0.0.1
+Generation Date: 17-Oct-2026
+"""
+
+import math
+import random
+from datetime import timedelta
+import pytest
+from exonware.xwquery.contracts import QueryAction, ExecutionContext
+from exonware.xwquery.errors import XWQueryValueError
+from exonware.xwquery.runtime.executors.advanced.window_executor import WindowExecutor
+from exonware.xwquery.runtime.executors.windows import (
+    WindowFrame,
+    WindowSpec,
+    compute_window,
+    evaluate_windows,
+    parse_frame,
+    parse_window_functions,
+)
+FRAMES = [
+    WindowFrame(),
+    WindowFrame('ROWS', -2, 0),
+    WindowFrame('ROWS', -3, 1),
+    WindowFrame('ROWS', 0, None),
+    WindowFrame('ROWS', 1, 3),
+    WindowFrame('ROWS', -4, -2),
+]
+
+
+def _rows(count=40, seed=7):
+    generator = random.Random(seed)
+    return [
+        {'day': generator.randint(0, 12), 'amount': None if generator.random() < 0.15 else generator.randint(-5, 20)}
+        for _ in range(count)
+    ]
+
+
+def _naive(rows, function, frame, total=sum):
+    """Per-row recomputation of a ROWS frame aggregate."""
+    values = []
+    for index in range(len(rows)):
+        start = 0 if frame.start is None else max(0, index + frame.start)
+        end = len(rows) if frame.end is None else max(0, min(len(rows), index + frame.end + 1))
+        numbers = [float(row['amount']) for row in rows[start:end] if row['amount'] is not None]
+        if function == 'SUM':
+            values.append(total(numbers))
+        elif function == 'AVG':
+            values.append(sum(numbers) / len(numbers) if numbers else None)
+        elif function == 'COUNT':
+            values.append(len(numbers))
+        else:
+            values.append((min if function == 'MIN' else max)(numbers) if numbers else None)
+    return values
+
+
+def _naive_range_sum(rows, frame, descending):
+    """Per-row value-range SUM; NULL order values are only peers of each other."""
+    sums = []
+    for row in rows:
+        day = row['day']
+        if day is None:
+            members = [other for other in rows if other['day'] is None]
+        else:
+            sign = -1 if descending else 1
+            low = float('-inf') if frame.start is None else day + sign * frame.start
+            high = float('inf') if frame.end is None else day + sign * frame.end
+            low, high = min(low, high), max(low, high)
+            members = [other for other in rows if other['day'] is not None and low <= other['day'] <= high]
+        sums.append(sum(float(other['amount']) for other in members if other['amount'] is not None))
+    return sums
+@pytest.mark.xwquery_unit
+
+class TestWindowFunctions:
+    """Unit tests for windows.py and the WINDOW executor."""
+
+    def test_parse_frame_forms(self):
+        """Dict (legacy), SQL text and bare numbers normalize to offsets."""
+        assert parse_frame({'type': 'ROWS', 'start': 2, 'end': 'CURRENT_ROW'}) == WindowFrame('ROWS', -2, 0)
+        assert parse_frame('ROWS BETWEEN 6 PRECEDING AND 1 FOLLOWING') == WindowFrame('ROWS', -6, 1)
+        assert parse_frame('ROWS UNBOUNDED PRECEDING') == WindowFrame('ROWS', None, 0)
+        assert parse_frame({'start': 'CURRENT_ROW', 'end': 'UNBOUNDED_FOLLOWING'}) == WindowFrame('ROWS', 0, None)
+
+    def test_sliding_aggregates_match_naive(self):
+        """Prefix sums and monotonic deques equal per-row recomputation for every frame."""
+        rows = _rows()
+        for frame in FRAMES:
+            for function in ('SUM', 'AVG', 'COUNT', 'MIN', 'MAX'):
+                values = compute_window(rows, WindowSpec(function, 'amount', frame=frame))
+                assert values == pytest.approx(_naive(rows, function, frame)), (function, frame)
+
+    def test_frame_sums_are_exact(self):
+        """Frame SUM/AVG equal math.fsum of the frame (no prefix-sum cancellation); int columns sum to ints."""
+        preceding = WindowFrame('ROWS', -1, 0)
+        rows = [{'amount': amount} for amount in (1e17, 1.0, 1.0, 1.0)]
+        assert compute_window(rows, WindowSpec('SUM', 'amount', frame=preceding)) == [1e17, 1e17 + 1, 2.0, 2.0]
+        assert compute_window(rows, WindowSpec('AVG', 'amount', frame=preceding))[2:] == [1.0, 1.0]
+        tenths = [{'amount': 0.1}, {'amount': 0.2}, {'amount': 0.3}]
+        assert compute_window(tenths, WindowSpec('SUM', 'amount', frame=WindowFrame('ROWS', 0, 0))) == [0.1, 0.2, 0.3]
+        generator = random.Random(11)
+        noisy = [{'amount': generator.uniform(-1, 1) * 10 ** generator.randint(-8, 12)} for _ in range(200)]
+        for frame in FRAMES:
+            sums = compute_window(noisy, WindowSpec('SUM', 'amount', frame=frame))
+            assert sums == _naive(noisy, 'SUM', frame, total=math.fsum), frame
+        integers = [{'amount': amount} for amount in (10 ** 17, 1, 1, None, 1)]
+        totals = compute_window(integers, WindowSpec('SUM', 'amount', frame=preceding))
+        assert totals == [10 ** 17, 10 ** 17 + 1, 2, 1, 1] and all(type(total) is int for total in totals)
+
+    def test_range_frame_sums_are_exact(self):
+        """RANGE frames sum exactly too, and keep int columns int."""
+        frame = parse_frame('RANGE BETWEEN 1 PRECEDING AND CURRENT ROW')
+        rows = [{'day': day, 'amount': amount} for day, amount in enumerate((1e17, 1.0, 1.0, 0.2), 1)]
+        results = evaluate_windows(rows, [WindowSpec('SUM', 'amount', alias='total', frame=frame)], order_by='day')
+        assert [row['total'] for row in results] == [1e17, 1e17 + 1, 2.0, 1.2]
+        rows = [{'day': day, 'amount': 10 ** 17 if day == 1 else 1} for day in (1, 2, 3, 3)]
+        results = evaluate_windows(rows, [WindowSpec('SUM', 'amount', alias='total', frame=frame)], order_by='day')
+        assert [row['total'] for row in results] == [10 ** 17, 10 ** 17 + 1, 3, 3]
+        assert all(type(row['total']) is int for row in results)
+
+    def test_ranking_over_peer_groups(self):
+        """RANK leaves gaps after ties, DENSE_RANK does not; peers share CUME_DIST."""
+        rows = [{'score': score} for score in (10, 20, 20, 30, 30, 30, 40)]
+        results = evaluate_windows(
+            rows, [WindowSpec('RANK', alias='rank')], order_by='score'
+        )
+        assert [row['rank'] for row in results] == [1, 2, 2, 4, 4, 4, 7]
+        peers = [(row['score'],) for row in rows]
+        assert compute_window(rows, WindowSpec('DENSE_RANK'), peers) == [1, 2, 2, 3, 3, 3, 4]
+        assert compute_window(rows, WindowSpec('CUME_DIST'), peers)[1:3] == [3 / 7, 3 / 7]
+        assert compute_window(rows, WindowSpec('NTILE', buckets=3), peers) == [1, 1, 1, 2, 2, 3, 3]
+
+    def test_window_executor_partitions(self):
+        """WINDOW sorts each partition once and ranks by its ORDER BY."""
+        rows = [
+            {'customer': 'a', 'day': 3, 'amount': 5},
+            {'customer': 'b', 'day': 1, 'amount': 7},
+            {'customer': 'a', 'day': 1, 'amount': 2},
+            {'customer': 'a', 'day': 2, 'amount': 4},
+        ]
+        action = QueryAction(type='WINDOW', params={
+            'function': 'SUM', 'field': 'amount', 'partition_by': ['customer'], 'order_by': 'day',
+            'frame': {'type': 'ROWS', 'start': 1, 'end': 'CURRENT_ROW'}
+        })
+        result = WindowExecutor()._do_execute(action, ExecutionContext(node=rows))
+        assert result.success
+        assert [(row['customer'], row['day'], row['window_sum']) for row in result.data['results']] == [
+            ('a', 1, 2), ('a', 2, 6), ('a', 3, 9), ('b', 1, 7)
+        ]
+
+    def test_lag_lead_and_partition_first_last(self):
+        """LAG/LEAD honor offset/default; FIRST/LAST_VALUE without a frame span the partition."""
+        rows = [{'value': value} for value in (1, 2, 3, 4)]
+        assert compute_window(rows, WindowSpec('LAG', offset=2, default=0)) == [0, 0, 1, 2]
+        assert compute_window(rows, WindowSpec('LEAD')) == [2, 3, 4, None]
+        assert compute_window(rows, WindowSpec('LAST_VALUE')) == [4, 4, 4, 4]
+        assert compute_window(rows, WindowSpec('LAST_VALUE', frame=WindowFrame())) == [1, 2, 3, 4]
+
+    def test_range_frames_match_value_reference(self):
+        """Numeric RANGE offsets include every row within the value distance, ASC and DESC."""
+        rows = _rows(60, seed=3)
+        for frame in (WindowFrame('RANGE', -2, 0), WindowFrame('RANGE', -3, 1), WindowFrame('RANGE', 1, 4)):
+            for direction in ('ASC', 'DESC'):
+                results = evaluate_windows(
+                    rows, [WindowSpec('SUM', 'amount', alias='total', frame=frame)], order_by=f'day {direction}'
+                )
+                assert [row['total'] for row in results] == pytest.approx(
+                    _naive_range_sum(results, frame, direction == 'DESC')
+                ), (frame, direction)
+
+    def test_range_current_row_includes_peers(self):
+        """RANGE ... CURRENT ROW ends after the last peer; ROWS ends at the row."""
+        rows = [{'day': day, 'amount': 1} for day in (1, 2, 2, 3)]
+        range_sum = WindowSpec('SUM', 'amount', alias='total', frame=parse_frame('RANGE UNBOUNDED PRECEDING'))
+        assert [row['total'] for row in evaluate_windows(rows, [range_sum], order_by='day')] == [1, 3, 3, 4]
+        rows_sum = range_sum._replace(frame=WindowFrame())
+        assert [row['total'] for row in evaluate_windows(rows, [rows_sum], order_by='day')] == [1, 2, 3, 4]
+
+    def test_interval_range_frame(self):
+        """INTERVAL offsets slide over ISO timestamps; ROWS frames reject them."""
+        frame = parse_frame("RANGE BETWEEN INTERVAL '2' DAY PRECEDING AND CURRENT ROW")
+        assert frame == WindowFrame('RANGE', -timedelta(days=2), 0)
+        assert parse_frame('RANGE BETWEEN 1 HOUR PRECEDING AND 30 MINUTES FOLLOWING').end == timedelta(minutes=30)
+        rows = [{'ts': f'2026-01-{day:02d}T00:00:00', 'amount': day} for day in (1, 2, 3, 5, 6, 9)]
+        results = evaluate_windows(rows, [WindowSpec('SUM', 'amount', alias='recent', frame=frame)], order_by='ts')
+        assert [row['recent'] for row in results] == [1, 3, 6, 8, 11, 9]
+        with pytest.raises(XWQueryValueError):
+            parse_frame("ROWS BETWEEN INTERVAL '2' DAY PRECEDING AND CURRENT ROW")
+
+    def test_several_functions_in_one_window_action(self):
+        """LAG, a framed SUM and RANK share one PARTITION BY/ORDER BY pass."""
+        specs = parse_window_functions({'functions': 'LAG(amount, 1, 0) AS prev, SUM(amount) AS total, RANK() AS rank'})
+        assert [(spec.function, spec.field, spec.name) for spec in specs] == [
+            ('LAG', 'amount', 'prev'), ('SUM', 'amount', 'total'), ('RANK', None, 'rank')
+        ]
+        assert specs[0].default == 0
+        rows = [
+            {'customer': 'a', 'day': 2, 'amount': 4},
+            {'customer': 'a', 'day': 1, 'amount': 2},
+            {'customer': 'b', 'day': 1, 'amount': 7},
+            {'customer': 'a', 'day': 2, 'amount': 1},
+        ]
+        action = QueryAction(type='WINDOW', params={
+            'functions': ['LAG(amount, 1, 0) AS prev', {'function': 'SUM', 'field': 'amount', 'alias': 'total'}, 'RANK() AS rank'],
+            'partition_by': 'customer', 'order_by': 'day', 'frame': 'RANGE UNBOUNDED PRECEDING'
+        })
+        data = WindowExecutor()._do_execute(action, ExecutionContext(node=rows)).data
+        assert data['functions'] == ['prev', 'total', 'rank']
+        assert [(row['customer'], row['prev'], row['total'], row['rank']) for row in data['results']] == [
+            ('a', 0, 2, 1), ('a', 2, 7, 2), ('a', 4, 7, 2), ('b', 0, 7, 1)
+        ]